@@ -5,6 +5,7 @@
 import os
 import sys
 import json
+import time
 import yaml
 import logging
 from datetime import datetime, timedelta
@@ -16,6 +17,8 @@ from collections import defaultdict
 from data_fetcher import DataFetcher
 from technical_indicators import SignalAnalyzer
 from db_manager import DBManager
+from backtest_engine import BacktestEngine, load_range
+from price_store import PriceStore
 from utils import setup_logger
 
 
@@ -140,17 +143,17 @@ class BacktestAnalyzer:
                 LIMIT 100
             """
             
-            self.db_manager.connect()
-            cursor = self.db_manager.connection.cursor()
-            cursor.execute(query, (code, end_date.strftime('%Y-%m-%d')))
-            
-            rows = cursor.fetchall()
+            # 커넥션 풀에서 연결 재사용 (매 조회마다 연결/해제하지 않음)
+            with self.db_manager.session() as db:
+                db.cursor.execute(query, (code, end_date.strftime('%Y-%m-%d')))
+                rows = db.cursor.fetchall()
             
             if not rows:
                 return None
             
             # DataFrame 생성 (기존 컬럼명으로 변환)
-            df = pd.DataFrame(rows, columns=['trade_date', 'stck_clpr', 'stck_hgpr', 'stck_lwpr', 'acml_vol'])
+            df = pd.DataFrame(rows)[['trade_date', 'close_price', 'high_price', 'low_price', 'volume']]
+            df.columns = ['trade_date', 'stck_clpr', 'stck_hgpr', 'stck_lwpr', 'acml_vol']
             
             # 데이터 타입 변환
             numeric_cols = ['stck_clpr', 'stck_hgpr', 'stck_lwpr', 'acml_vol']
@@ -169,8 +172,6 @@ class BacktestAnalyzer:
         except Exception as e:
             self.logger.debug(f"⚠️ {code} 과거 데이터 조회 실패: {e}")
             return None
-        finally:
-            self.db_manager.disconnect()
     
     def get_foreign_data_until(self, code: str, end_date: datetime) -> List[int]:
         """특정 날짜까지의 외국인 순매수 데이터"""
@@ -184,24 +185,20 @@ class BacktestAnalyzer:
                 LIMIT 5
             """
             
-            self.db_manager.connect()
-            cursor = self.db_manager.connection.cursor()
-            cursor.execute(query, (code, end_date.strftime('%Y-%m-%d')))
-            
-            rows = cursor.fetchall()
+            with self.db_manager.session() as db:
+                db.cursor.execute(query, (code, end_date.strftime('%Y-%m-%d')))
+                rows = db.cursor.fetchall()
             
             if not rows:
                 return []
             
             # 순매수량 리스트
-            netbuy_list = [int(row[0]) if row[0] else 0 for row in rows]
+            netbuy_list = [int(row['foreign_net_qty']) if row['foreign_net_qty'] else 0 for row in rows]
             
             return netbuy_list
             
         except Exception as e:
             return []
-        finally:
-            self.db_manager.disconnect()
     
     def calculate_future_returns(self, code: str, buy_date: datetime, buy_price: float, 
                                  holding_periods: List[int]) -> Dict[int, float]:
@@ -247,93 +244,119 @@ class BacktestAnalyzer:
                 LIMIT 1
             """
             
-            self.db_manager.connect()
-            cursor = self.db_manager.connection.cursor()
-            cursor.execute(query, (code, target_date.strftime('%Y-%m-%d')))
-            
-            row = cursor.fetchone()
+            with self.db_manager.session() as db:
+                db.cursor.execute(query, (code, target_date.strftime('%Y-%m-%d')))
+                row = db.cursor.fetchone()
             
             if row:
-                return float(row[0])
+                return float(row['close_price'])
             
             return None
             
         except Exception as e:
             return None
-        finally:
-            self.db_manager.disconnect()
     
-    def run_backtest(self, start_date: str, end_date: str, interval_days: int = 7):
+    def load_engine(self, stock_list: Dict[str, str], start_date: str, end_date: str,
+                    holding_periods: List[int], use_price_store: bool = False) -> Optional[BacktestEngine]:
+        """
+        분석 기간 전 종목 가격/외국인 순매수 패널을 한 번에 적재
+        
+        Args:
+            stock_list: {종목명: 종목코드}
+            start_date: 시작일 (YYYY-MM-DD)
+            end_date: 종료일 (YYYY-MM-DD)
+            holding_periods: 보유기간 리스트 (매도일까지 함께 적재)
+            use_price_store: True면 로컬 가격 저장소(PriceStore)에서 적재
+            
+        Returns:
+            BacktestEngine 또는 None
+        """
+        names = {code: name for name, code in stock_list.items()}
+        codes = list(names.keys())
+        load_start, load_end = load_range(start_date, end_date, holding_periods)
+        
+        try:
+            if use_price_store:
+                store = PriceStore(logger=self.logger)
+                if not store.available:
+                    self.logger.warning("⚠️ pyarrow 미설치 - DB에서 적재")
+                else:
+                    return BacktestEngine.from_price_store(store, codes, load_start, load_end, names)
+            
+            with self.db_manager.session() as db:
+                df = db.get_daily_prices_bulk(codes, load_start, load_end)
+            return BacktestEngine.from_daily_frame(df, names)
+            
+        except Exception as e:
+            self.logger.error(f"❌ 가격 패널 적재 실패: {e}")
+            return None
+    
+    def run_backtest(self, start_date: str, end_date: str, interval_days: int = 7,
+                     use_price_store: bool = False):
         """
-        백테스팅 실행
+        백테스팅 실행 (전 종목 패널 1회 적재 후 벡터 연산으로 평가)
         
         Args:
             start_date: 시작일 (YYYY-MM-DD)
             end_date: 종료일 (YYYY-MM-DD)
             interval_days: 테스트 간격 (일)
+            use_price_store: 로컬 가격 저장소 사용 여부
         """
         self.logger.info("="*70)
         self.logger.info(f"🚀 백테스팅 시작: {start_date} ~ {end_date}")
         self.logger.info("="*70)
         
-        # 날짜 범위 생성
-        start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-        end_dt = datetime.strptime(end_date, '%Y-%m-%d')
+        holding_periods = self.backtest_config.get('performance', {}).get('holding_periods', [5, 10, 20])
         
-        current_date = start_dt
-        test_count = 0
-        total_discoveries = 0
+        # 종목 리스트 (현재 시가총액 상위 종목 전체)
+        stock_list = self.get_historical_stock_list(start_date)
+        if not stock_list:
+            self.logger.error("❌ 종목 리스트가 비어 있습니다.")
+            return
         
-        holding_periods = self.backtest_config.get('performance', {}).get('holding_periods', [5, 10, 20])
+        started = time.perf_counter()
+        engine = self.load_engine(stock_list, start_date, end_date, holding_periods, use_price_store)
+        if engine is None or not engine.codes:
+            self.logger.error("❌ 백테스트할 가격 데이터가 없습니다.")
+            return
         
-        while current_date <= end_dt:
-            self.logger.info(f"\n📅 분석일: {current_date.strftime('%Y-%m-%d')}")
-            
-            # 해당 날짜의 종목 리스트
-            stock_list = self.get_historical_stock_list(current_date.strftime('%Y-%m-%d'))
-            
-            daily_discoveries = []
-            
-            # 각 종목 분석
-            for name, code in list(stock_list.items())[:50]:  # 테스트: 상위 50개만
-                result = self.simulate_stock_analysis(name, code, current_date)
-                
-                if result and result['score'] >= 3:  # 3점 이상만
-                    # 향후 수익률 계산
-                    returns = self.calculate_future_returns(
-                        code, current_date, result['price'], holding_periods
-                    )
-                    
-                    result['returns'] = returns
-                    daily_discoveries.append(result)
-                    
-                    # 신호별 성과 기록
-                    for signal in result['signals']:
-                        for period, return_pct in returns.items():
-                            if return_pct is not None:
-                                self.signal_performance[signal]['total'] += 1
-                                self.signal_performance[signal]['total_return'] += return_pct
-                                self.signal_performance[signal]['returns'].append(return_pct)
-                                
-                                if return_pct > 0:
-                                    self.signal_performance[signal]['success'] += 1
-            
-            if daily_discoveries:
-                self.logger.info(f"✅ 발굴: {len(daily_discoveries)}개")
-                total_discoveries += len(daily_discoveries)
-                
-                # 결과 저장
-                self.backtest_results.extend(daily_discoveries)
+        loaded = time.perf_counter()
+        self.logger.info(f"📊 가격 패널: {len(engine.dates)}일 × {len(engine.codes)}종목 "
+                         f"(적재 {loaded - started:.2f}초)")
+        
+        # 신호 기준값 (param_sweep.py로 찾은 값을 backtest_analysis.signal_params에 지정, 없으면 기본값)
+        signal_params = self.backtest_config.get('signal_params', {})
+        result = engine.run(start_date, end_date, interval_days, holding_periods, signal_params)
+        
+        # 분석일별 발굴 현황
+        discoveries_by_date = defaultdict(int)
+        for discovery in result['discoveries']:
+            discoveries_by_date[discovery['analysis_date']] += 1
+        
+        for analysis_date in result['analysis_dates']:
+            count = discoveries_by_date.get(analysis_date, 0)
+            if count:
+                self.logger.info(f"📅 {analysis_date}: ✅ 발굴 {count}개")
             else:
-                self.logger.info("❌ 발굴 종목 없음")
-            
-            test_count += 1
-            current_date += timedelta(days=interval_days)
+                self.logger.debug(f"📅 {analysis_date}: ❌ 발굴 종목 없음")
+        
+        self.backtest_results.extend(result['discoveries'])
+        for signal, perf in result['signal_performance'].items():
+            stats = self.signal_performance[signal]
+            stats['total'] += perf['total']
+            stats['success'] += perf['success']
+            stats['total_return'] += perf['total_return']
+            stats['returns'].extend(perf['returns'])
         
         self.logger.info("\n" + "="*70)
         self.logger.info(f"✅ 백테스팅 완료")
-        self.logger.info(f"   총 테스트: {test_count}회")
-        self.logger.info(f"   총 발굴: {total_discoveries}개")
+        self.logger.info(f"   총 테스트: {len(result['rows'])}회")
+        self.logger.info(f"   총 발굴: {len(result['discoveries'])}개")
+        self.logger.info(f"   소요 시간: 적재 {loaded - started:.2f}초, 평가 {time.perf_counter() - loaded:.2f}초")
+        
+        pool_metrics = self.db_manager.get_pool_metrics()
+        self.logger.info(f"   DB 풀: 대여 {pool_metrics['checkouts']}회, 연결 생성 {pool_metrics['created']}회, "
+                         f"재연결 {pool_metrics['reconnects']}회, 대기 {pool_metrics['wait_time']:.2f}초")
         self.logger.info("="*70)
         
         # 결과 분석 및 저장
@@ -427,12 +450,13 @@ def main():
     parser.add_argument('--start', type=str, required=True, help='시작일 (YYYY-MM-DD)')
     parser.add_argument('--end', type=str, required=True, help='종료일 (YYYY-MM-DD)')
     parser.add_argument('--interval', type=int, default=7, help='테스트 간격 (일)')
+    parser.add_argument('--price-store', action='store_true', help='로컬 가격 저장소에서 데이터 적재')
     
     args = parser.parse_args()
     
     try:
         analyzer = BacktestAnalyzer()
-        analyzer.run_backtest(args.start, args.end, args.interval)
+        analyzer.run_backtest(args.start, args.end, args.interval, use_price_store=args.price_store)
         
         print("\n✅ 백테스팅 완료!")
         
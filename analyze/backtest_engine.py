@@ -0,0 +1,355 @@
+"""
+벡터화 백테스트 엔진
+전 종목 가격/외국인 순매수 패널을 한 번 적재한 뒤
+SignalAnalyzer.calculate_buy_signal_score와 같은 규칙을 (날짜 × 종목) 행렬로 평가하고
+보유기간별 수익률을 배열 인덱싱으로 계산 (종목·날짜별 SQL 조회 없음)
+
+시점 기준 (미래 데이터 누출 방지):
+  - 지표/신호는 각 행까지의 데이터만으로 계산되는 누적(expanding) 방식
+    (이동평균·RSI는 창 단위, MACD 지수이동평균은 종목의 첫 데이터부터 누적)
+  - 지표는 종목별 거래일만 이어 붙여 계산 (거래정지일은 건너뜀, 종목별 DataFrame과 동일)
+  - 분석일은 그 날짜 이전 마지막 거래일 행으로 매핑
+  - 매도가는 (분석일 + 보유기간 달력일) 이후 해당 종목의 첫 거래일 종가
+    (BacktestAnalyzer.get_price_on_date와 같은 기준)
+  - 외국인 순매수 데이터가 없는 종목은 절대조건 미통과
+    (calculate_buy_signal_score가 빈 외국인 리스트에서 계산 오류로 제외하는 것과 같은 결과)
+
+사용 예:
+  engine = BacktestEngine.from_daily_frame(db_manager.get_daily_prices_bulk(codes, start))
+  results = engine.run(start, end, interval_days=1, holding_periods=[5, 10, 20])
+"""
+import json
+import os
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from indicator_engine import IndicatorPanel, shift
+
+
+# calculate_buy_signal_score의 상세 신호 (신호명 → 규칙, 파라미터 키)
+SCORE_SIGNALS = (
+    ("골든크로스", 'golden_cross', ()),
+    ("볼린저밴드복귀", 'bollinger_rebound', ()),
+    ("거래량급증", 'volume_breakout', ('volume_multiplier',)),
+    ("5일선20일선돌파", 'ma5_crossing_above_ma20', ()),
+    ("RSI매수신호", 'rsi_buy_signal', ('oversold_threshold',)),
+    ("MACD골든크로스", 'macd_golden_cross', ()),
+    ("MACD돌파직전", 'macd_near_golden_cross', ('threshold',)),
+    ("볼린저밴드내위치", 'above_bollinger_lower', ('num_std',)),
+)
+FOREIGN_STRONG_SIGNAL = "외국인강력매수"
+
+# TechnicalIndicators 기본값과 같은 신호 파라미터
+DEFAULT_PARAMS = {
+    'oversold_threshold': 30,
+    'volume_multiplier': 2.0,
+    'threshold': 0.05,
+    'num_std': 2,
+    'min_score': 3,
+}
+
+# 분석에 필요한 최소 거래일 수 (BacktestAnalyzer.simulate_stock_analysis의 len(df) < 30 제외와 동일)
+MIN_HISTORY = 30
+
+# 분석 시작일 이전에 함께 적재할 지표 계산용 기간 (달력일)
+WARMUP_DAYS = 200
+
+
+def backfill(values: np.ndarray) -> np.ndarray:
+    """열 단위로 각 행 이후의 첫 유효값 (NaN은 다음 유효값으로 채움, 뒤에 없으면 NaN)"""
+    num_rows = values.shape[0]
+    valid = ~np.isnan(values)
+    index = np.where(valid, np.arange(num_rows).reshape(-1, 1), num_rows)
+    next_valid = np.minimum.accumulate(index[::-1], axis=0)[::-1]
+
+    padded = np.vstack([values, np.full((1,) + values.shape[1:], np.nan)])
+    return np.take_along_axis(padded, next_valid, axis=0)
+
+
+def forward_fill(values: np.ndarray) -> np.ndarray:
+    """열 단위로 NaN을 이전 유효값으로 채움 (앞에 없으면 NaN)"""
+    valid = ~np.isnan(values)
+    index = np.where(valid, np.arange(values.shape[0]).reshape(-1, 1), 0)
+    last_valid = np.maximum.accumulate(index, axis=0)
+    return np.take_along_axis(values, last_valid, axis=0)
+
+
+class BacktestEngine:
+    """(날짜 × 종목) 패널 기반 매수 신호 백테스트"""
+
+    def __init__(self, dates, codes: List[str], close: np.ndarray, volume: np.ndarray,
+                 foreign_net: Optional[np.ndarray] = None, names: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            dates: 거래일 배열 (오름차순, datetime64[D]로 변환 가능한 값)
+            codes: 종목코드 리스트 (열 라벨)
+            close: 종가 행렬 (날짜 × 종목, 거래 없는 날 NaN)
+            volume: 거래량 행렬 (같은 모양)
+            foreign_net: 외국인 순매수량 행렬 (같은 모양, 없으면 외국인 조건 미통과)
+            names: {종목코드: 종목명}
+        """
+        self.dates = np.asarray(dates, dtype='datetime64[D]')
+        self.codes = list(codes)
+        self.names = names or {}
+        self.close = np.asarray(close, dtype='float64')
+        self.volume = np.asarray(volume, dtype='float64').reshape(self.close.shape)
+        self.has_foreign = foreign_net is not None
+        if foreign_net is None:
+            foreign_net = np.full(self.close.shape, np.nan)
+        self.foreign_net = np.asarray(foreign_net, dtype='float64').reshape(self.close.shape)
+
+        # 종목별 거래 행만 위로 모은 배열에서 지표 계산
+        # (거래정지일이 이동평균 창에 NaN으로 끼지 않도록 - 종목별 DataFrame과 같은 결과)
+        self.present = ~np.isnan(self.close) | ~np.isnan(self.volume)
+        self.rank = np.cumsum(self.present, axis=0) - 1
+        self.panel = IndicatorPanel(self._compress(self.close), self._compress(self.volume),
+                                    codes=self.codes)
+        self._foreign_rows = self._compress(self.foreign_net)
+
+        # 매수가(분석일 기준 마지막 종가) / 매도가(기준일 이후 첫 거래일 종가)
+        self.entry_close = forward_fill(self.close)
+        self.exit_close = backfill(self.close)
+
+    def _compress(self, values: np.ndarray) -> np.ndarray:
+        """날짜 격자 → 종목별 거래 행을 위로 모은 배열 (행 수는 종목별 최대 거래일 수)"""
+        num_rows = int(self.present.sum(axis=0).max()) if self.present.size else 0
+        result = np.full((num_rows, values.shape[1]), np.nan)
+        rows, cols = np.nonzero(self.present)
+        result[self.rank[rows, cols], cols] = values[rows, cols]
+        return result
+
+    def _to_grid(self, values: np.ndarray) -> np.ndarray:
+        """_compress 배열 → 날짜 격자 (거래 없는 날 False/0)"""
+        result = np.zeros(self.close.shape, dtype=values.dtype)
+        rows, cols = np.nonzero(self.present)
+        result[rows, cols] = values[self.rank[rows, cols], cols]
+        return result
+
+    # ------------------------------------------------------------
+    # 생성
+    # ------------------------------------------------------------
+    @classmethod
+    def from_daily_frame(cls, df: pd.DataFrame, names: Optional[Dict[str, str]] = None) -> 'BacktestEngine':
+        """DBManager.get_daily_prices_bulk 결과(long format) → 엔진"""
+        if df is None or df.empty:
+            empty = np.empty((0, 0))
+            return cls(np.array([], dtype='datetime64[D]'), [], empty, empty, empty, names)
+
+        df = df.drop_duplicates(subset=['stock_code', 'stck_bsop_date'], keep='last')
+        dates = pd.to_datetime(df['stck_bsop_date'], format='%Y%m%d')
+
+        def pivot(column):
+            values = pd.to_numeric(df[column], errors='coerce').astype('float64')
+            return values.groupby([dates.values, df['stock_code'].values]).last().unstack()
+
+        close = pivot('stck_clpr')
+        volume = pivot('acml_vol').reindex(index=close.index, columns=close.columns)
+        foreign = pivot('foreign_net_qty').reindex(index=close.index, columns=close.columns)
+
+        return cls(close.index.values, list(close.columns), close.to_numpy(),
+                   volume.to_numpy(), foreign.to_numpy(), names)
+
+    @classmethod
+    def from_price_store(cls, price_store, codes: List[str], start_date=None, end_date=None,
+                         names: Optional[Dict[str, str]] = None) -> 'BacktestEngine':
+        """로컬 가격 저장소(PriceStore) → 엔진"""
+        dates, store_codes, close = price_store.read_panel(codes, 'close_price', start_date, end_date)
+        _, _, volume = price_store.read_panel(store_codes, 'volume', start_date, end_date)
+        _, _, foreign = price_store.read_panel(store_codes, 'foreign_net_qty', start_date, end_date)
+        return cls(dates, store_codes, close, volume, foreign, names)
+
+    def save_arrays(self, path: str):
+        """패널 배열을 .npy 파일로 저장 (다른 프로세스가 from_arrays로 메모리 맵 공유)"""
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, 'dates.npy'), self.dates)
+        np.save(os.path.join(path, 'close.npy'), self.close)
+        np.save(os.path.join(path, 'volume.npy'), self.volume)
+        np.save(os.path.join(path, 'foreign_net.npy'), self.foreign_net)
+        with open(os.path.join(path, 'codes.json'), 'w', encoding='utf-8') as f:
+            json.dump({'codes': self.codes, 'names': self.names}, f, ensure_ascii=False)
+
+    @classmethod
+    def from_arrays(cls, path: str, mmap_mode: Optional[str] = 'r') -> 'BacktestEngine':
+        """save_arrays로 저장한 패널 → 엔진 (기본은 읽기 전용 메모리 맵)"""
+        with open(os.path.join(path, 'codes.json'), 'r', encoding='utf-8') as f:
+            labels = json.load(f)
+
+        def load(name):
+            return np.load(os.path.join(path, f'{name}.npy'), mmap_mode=mmap_mode)
+
+        return cls(load('dates'), labels['codes'], load('close'), load('volume'),
+                   load('foreign_net'), labels['names'])
+
+    # ------------------------------------------------------------
+    # 평가
+    # ------------------------------------------------------------
+    def foreign_consecutive_days(self) -> np.ndarray:
+        """외국인 연속 순매수 일수 (최근 3일 기준, 0~3) - check_foreign_consecutive_buying과 같은 기준"""
+        buying = np.nan_to_num(self._foreign_rows) > 0
+        history = self.panel.history_length
+
+        day1 = buying & (history >= 1)
+        day2 = day1 & (shift(buying.astype(float)) > 0) & (history >= 2)
+        day3 = day2 & (shift(buying.astype(float), 2) > 0) & (history >= 3)
+        return day1.astype(int) + day2 + day3
+
+    def evaluate(self, params: Optional[Dict] = None) -> Dict:
+        """전 구간 절대조건/신호 점수 행렬
+
+        Args:
+            params: DEFAULT_PARAMS 중 변경할 값
+
+        Returns:
+            dict: {
+                'passes': (날짜 × 종목) bool - 절대조건 통과,
+                'score': (날짜 × 종목) int - 통과 시 신호 점수 (미통과 0),
+                'signals': {신호명: (날짜 × 종목) bool}
+            }
+        """
+        params = {**DEFAULT_PARAMS, **(params or {})}
+        panel = self.panel
+        num_std = params['num_std']
+
+        consecutive = self.foreign_consecutive_days()
+        # 외국인 데이터가 없으면 미통과 (종목별 경로에서는 빈 외국인 리스트가 계산 오류로 제외됨)
+        foreign_ok = consecutive >= 2 if self.has_foreign else np.zeros(consecutive.shape, dtype=bool)
+        passes = ((panel.history_length >= MIN_HISTORY)
+                  & panel.signal('price_below_ma20')
+                  & panel.signal('volume_sufficient')
+                  & panel.signal('above_bollinger_lower', num_std=num_std)
+                  & foreign_ok)
+
+        signals = {}
+        for signal_name, rule, keys in SCORE_SIGNALS:
+            signals[signal_name] = self._to_grid(panel.signal(rule, **{key: params[key] for key in keys}))
+        signals[FOREIGN_STRONG_SIGNAL] = self._to_grid(consecutive >= 3)
+
+        score = np.zeros(self.close.shape, dtype=int)
+        for matrix in signals.values():
+            score += matrix
+        passes = self._to_grid(passes)
+        score[~passes] = 0
+
+        return {'passes': passes, 'score': score, 'signals': signals}
+
+    def analysis_points(self, start_date, end_date, interval_days: int = 7) -> tuple:
+        """분석일(시작일부터 interval_days 간격) → (거래일 행, 분석일)
+
+        각 분석일은 그 날짜 이전 마지막 거래일 행으로 매핑되고, 같은 행으로 매핑되는
+        분석일은 첫 날짜 하나만 남김 (interval 1에서 주말이 중복 집계되지 않도록)
+        """
+        start = np.datetime64(pd.Timestamp(start_date).date(), 'D')
+        end = np.datetime64(pd.Timestamp(end_date).date(), 'D')
+        calendar = np.arange(start, end + 1, np.timedelta64(max(1, interval_days), 'D'))
+
+        rows = np.searchsorted(self.dates, calendar, side='right') - 1
+        valid = rows >= 0
+        rows, first = np.unique(rows[valid], return_index=True)
+        return rows, calendar[valid][first]
+
+    def analysis_rows(self, start_date, end_date, interval_days: int = 7) -> np.ndarray:
+        """분석일 → 그 날짜 이전 마지막 거래일 행 (중복 제거)"""
+        return self.analysis_points(start_date, end_date, interval_days)[0]
+
+    def forward_returns(self, rows: np.ndarray, holding_periods: List[int],
+                        base_dates: Optional[np.ndarray] = None) -> Dict[int, np.ndarray]:
+        """분석 행별 보유기간 수익률(%) ({보유기간: (분석 행 × 종목) 배열, 매도가 없으면 NaN})
+
+        Args:
+            rows: 매수가를 읽을 거래일 행
+            holding_periods: 보유기간 (달력일)
+            base_dates: 보유기간을 더할 기준일 (분석일, 없으면 거래일 행의 날짜)
+        """
+        entry = self.entry_close[rows]
+        if base_dates is None:
+            base_dates = self.dates[rows]
+        base_dates = np.asarray(base_dates, dtype='datetime64[D]')
+        returns = {}
+
+        for days in holding_periods:
+            target = base_dates + np.timedelta64(days, 'D')
+            exit_rows = np.searchsorted(self.dates, target, side='left')
+            padded = np.vstack([self.exit_close, np.full((1, self.close.shape[1]), np.nan)])
+            exit_price = padded[exit_rows]
+
+            with np.errstate(invalid='ignore', divide='ignore'):
+                pct = (exit_price - entry) / entry * 100
+            pct[~(exit_price > 0) | ~(entry > 0)] = np.nan
+            returns[days] = np.round(pct, 2)
+
+        return returns
+
+    def run(self, start_date, end_date, interval_days: int = 7,
+            holding_periods: List[int] = (5, 10, 20), params: Optional[Dict] = None) -> Dict:
+        """백테스트 실행
+
+        Returns:
+            dict: {
+                'rows': 분석 행 인덱스,
+                'analysis_dates': 분석일 리스트 (YYYY-MM-DD, rows와 같은 순서),
+                'discoveries': 발굴 결과 리스트 (BacktestAnalyzer.backtest_results 형식),
+                'signal_performance': {신호명: {'total', 'success', 'total_return', 'returns'}}
+            }
+        """
+        params = {**DEFAULT_PARAMS, **(params or {})}
+        holding_periods = list(holding_periods)
+
+        rows, base_dates = self.analysis_points(start_date, end_date, interval_days)
+        analysis_dates = pd.to_datetime(base_dates).strftime('%Y-%m-%d')
+        if len(rows) == 0 or not self.codes:
+            return {'rows': rows, 'analysis_dates': list(analysis_dates),
+                    'discoveries': [], 'signal_performance': {}}
+
+        evaluation = self.evaluate(params)
+        score = evaluation['score'][rows]
+        selected = evaluation['passes'][rows] & (score >= params['min_score'])
+        row_idx, col_idx = np.nonzero(selected)
+
+        returns = self.forward_returns(rows, holding_periods, base_dates)
+        picked_returns = {days: returns[days][row_idx, col_idx] for days in holding_periods}
+        picked_signals = {name: matrix[rows][row_idx, col_idx]
+                          for name, matrix in evaluation['signals'].items()}
+
+        # 신호별 성과 (발굴 종목의 보유기간별 수익률을 모두 누적)
+        signal_performance = {}
+        for signal_name, active in picked_signals.items():
+            values = np.concatenate([picked_returns[days][active] for days in holding_periods])
+            values = values[~np.isnan(values)]
+            if len(values) == 0:
+                continue
+            signal_performance[signal_name] = {
+                'total': int(len(values)),
+                'success': int((values > 0).sum()),
+                'total_return': float(values.sum()),
+                'returns': values.tolist()
+            }
+
+        entry = self.entry_close[rows]
+        discoveries = []
+        for i, (r, c) in enumerate(zip(row_idx, col_idx)):
+            code = self.codes[c]
+            discoveries.append({
+                'name': self.names.get(code, code),
+                'code': code,
+                'analysis_date': analysis_dates[r],
+                'score': int(score[r, c]),
+                'signals': [name for name, active in picked_signals.items() if active[i]],
+                'price': float(entry[r, c]),
+                'passes_absolute': True,
+                'returns': {days: (None if np.isnan(picked_returns[days][i]) else float(picked_returns[days][i]))
+                            for days in holding_periods}
+            })
+
+        return {'rows': rows, 'analysis_dates': list(analysis_dates),
+                'discoveries': discoveries, 'signal_performance': signal_performance}
+
+
+def load_range(start_date: str, end_date: str, holding_periods: List[int]) -> tuple:
+    """분석 기간 → 적재할 데이터 기간 (지표 계산 여유 + 최장 보유기간 이후 매도일 포함)"""
+    start_dt = datetime.strptime(start_date, '%Y-%m-%d').date()
+    end_dt = datetime.strptime(end_date, '%Y-%m-%d').date()
+    load_end = min(end_dt + timedelta(days=max(holding_periods, default=0) + 14), date.today())
+    return start_dt - timedelta(days=WARMUP_DAYS), max(load_end, end_dt)
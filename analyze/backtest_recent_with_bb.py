@@ -70,12 +70,13 @@ def backtest_with_foreign_data():
         }
         
         for name, code in test_stocks:
+            conn = None
             try:
                 stats['total'] += 1
                 
-                # DB에서 데이터 조회
-                db_manager.connect()
-                cursor = db_manager.connection.cursor()
+                # DB에서 데이터 조회 (커넥션 풀에서 연결 재사용)
+                conn = db_manager.pool.acquire()
+                cursor = conn.cursor()
                 
                 query = """
                     SELECT trade_date, close_price, high_price, low_price, volume
@@ -180,7 +181,14 @@ def backtest_with_foreign_data():
             except Exception as e:
                 logger.debug(f"   ⚠️ {name}({code}) 오류: {e}")
             finally:
-                db_manager.disconnect()
+                if conn:
+                    # 읽기 트랜잭션 종료 후 반납 (rollback 실패한 연결은 버림)
+                    discard = False
+                    try:
+                        conn.rollback()
+                    except Exception:
+                        discard = True
+                    db_manager.pool.release(conn, discard=discard)
         
         # 통계
         print(f"\n   📊 통계:")
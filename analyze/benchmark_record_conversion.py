@@ -0,0 +1,190 @@
+"""
+일봉 레코드 변환 마이크로 벤치마크
+기존 행 단위 변환(iterrows + strptime + 레코드별 dict 업데이트)과
+컬럼 단위 변환(price_records)의 속도를 합성 데이터로 비교
+
+사용법:
+  python benchmark_record_conversion.py                       # 300종목 × 365일
+  python benchmark_record_conversion.py --stocks 50 --days 100 --repeat 5
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from db_manager import DBManager
+from price_records import build_price_frame, merge_investor_frame, frame_to_rows
+
+
+# ------------------------------------------------------------
+# 기존 방식 (DailyDataCollector의 이전 구현)
+# ------------------------------------------------------------
+def legacy_convert_df_to_records(stock_code: str, df: pd.DataFrame) -> List[Dict]:
+    """DataFrame을 레코드 리스트로 변환 (행 단위)"""
+    records = []
+
+    for _, row in df.iterrows():
+        try:
+            trade_date = None
+            if 'stck_bsop_date' in row:
+                date_str = str(row['stck_bsop_date'])
+                if len(date_str) == 8:
+                    trade_date = datetime.strptime(date_str, '%Y%m%d').date()
+
+            if not trade_date:
+                continue
+
+            close_col = 'stck_clpr' if 'stck_clpr' in row else 'stck_prpr'
+            volume_col = 'acml_vol' if 'acml_vol' in row else 'cntg_vol'
+
+            records.append({
+                'stock_code': stock_code,
+                'trade_date': trade_date,
+                'open_price': int(float(row.get('stck_oprc', 0))) if pd.notna(row.get('stck_oprc')) else None,
+                'high_price': int(float(row.get('stck_hgpr', 0))) if pd.notna(row.get('stck_hgpr')) else None,
+                'low_price': int(float(row.get('stck_lwpr', 0))) if pd.notna(row.get('stck_lwpr')) else None,
+                'close_price': int(float(row.get(close_col, 0))) if pd.notna(row.get(close_col)) else None,
+                'volume': int(float(row.get(volume_col, 0))) if pd.notna(row.get(volume_col)) else None,
+                'trading_value': int(float(row.get('acml_tr_pbmn', 0))) if pd.notna(row.get('acml_tr_pbmn')) else None
+            })
+        except Exception:
+            continue
+
+    return records
+
+
+def legacy_enrich(records: List[Dict], investor_data: List[Dict]) -> List[Dict]:
+    """투자자별 매매 데이터로 레코드 보강 (레코드별 dict 업데이트)"""
+    investor_map = {data['trade_date']: data for data in investor_data}
+
+    for record in records:
+        inv_data = investor_map.get(record['trade_date'])
+        if inv_data:
+            record.update({
+                'foreign_buy_qty': inv_data.get('foreign_buy_qty'),
+                'foreign_sell_qty': inv_data.get('foreign_sell_qty'),
+                'foreign_net_qty': inv_data.get('foreign_net_qty'),
+                'institution_buy_qty': inv_data.get('institution_buy_qty'),
+                'institution_sell_qty': inv_data.get('institution_sell_qty'),
+                'institution_net_qty': inv_data.get('institution_net_qty'),
+                'individual_buy_qty': inv_data.get('individual_buy_qty'),
+                'individual_sell_qty': inv_data.get('individual_sell_qty'),
+                'individual_net_qty': inv_data.get('individual_net_qty')
+            })
+
+    unique_records = {}
+    for record in records:
+        key = (record['stock_code'], record['trade_date'])
+        if key not in unique_records:
+            unique_records[key] = record
+
+    final_records = list(unique_records.values())
+    final_records.sort(key=lambda x: x['trade_date'])
+    return final_records
+
+
+def legacy_pipeline(stock_code: str, df: pd.DataFrame, investor_data: List[Dict]) -> List[tuple]:
+    records = legacy_enrich(legacy_convert_df_to_records(stock_code, df), investor_data)
+    # DBManager.bulk_insert_daily_prices의 dict → tuple 변환
+    return [tuple(r.get(col) for col in DBManager.DAILY_PRICE_COLUMNS) for r in records]
+
+
+# ------------------------------------------------------------
+# 컬럼 단위 방식
+# ------------------------------------------------------------
+def columnar_pipeline(stock_code: str, df: pd.DataFrame, investor_data: List[Dict]) -> List[tuple]:
+    price_frame = build_price_frame(stock_code, df)
+    price_frame = price_frame.drop_duplicates(subset='trade_date', keep='first')
+    price_frame = price_frame.sort_values('trade_date').reset_index(drop=True)
+    return frame_to_rows(merge_investor_frame(price_frame, investor_data), stock_code)
+
+
+# ------------------------------------------------------------
+# 합성 데이터
+# ------------------------------------------------------------
+def make_synthetic_dataset(num_stocks: int, num_days: int, seed: int = 42) -> List[tuple]:
+    """KIS 일봉 응답 형태의 합성 데이터 생성
+
+    Returns:
+        List[tuple]: [(종목코드, 일봉 DataFrame, 투자자 레코드 리스트), ...]
+    """
+    rng = np.random.default_rng(seed)
+    end = datetime(2025, 12, 31)
+    dates = [(end - timedelta(days=i)).strftime('%Y%m%d') for i in range(num_days)][::-1]
+
+    dataset = []
+    for i in range(num_stocks):
+        stock_code = f"{i:06d}"
+        close = np.maximum(100, 10000 + rng.normal(0, 150, num_days).cumsum()).astype(int)
+        volume = rng.integers(1_000, 5_000_000, num_days)
+
+        # _fetch_data_by_date_range 반환 형태: 종가/고가/저가/거래량만 숫자, 나머지는 문자열
+        df = pd.DataFrame({
+            'stck_bsop_date': dates,
+            'stck_oprc': (close + rng.integers(-100, 100, num_days)).astype(str),
+            'stck_clpr': close.astype(float),
+            'stck_hgpr': (close + rng.integers(0, 200, num_days)).astype(float),
+            'stck_lwpr': (close - rng.integers(0, 200, num_days)).astype(float),
+            'acml_vol': volume.astype(float),
+            'acml_tr_pbmn': (close * volume).astype(str)
+        })
+
+        # 투자자 데이터는 최근 30일만 제공
+        investor_data = []
+        for date_str in dates[-30:]:
+            net = int(rng.integers(-100_000, 100_000))
+            investor_data.append({
+                'trade_date': datetime.strptime(date_str, '%Y%m%d').date(),
+                'foreign_buy_qty': net, 'foreign_sell_qty': 0, 'foreign_net_qty': net,
+                'institution_buy_qty': -net, 'institution_sell_qty': 0, 'institution_net_qty': -net,
+                'individual_buy_qty': 0, 'individual_sell_qty': 0, 'individual_net_qty': 0
+            })
+
+        dataset.append((stock_code, df, investor_data))
+
+    return dataset
+
+
+def run_benchmark(pipeline, dataset, repeat: int) -> tuple:
+    """파이프라인 실행 시간 측정 (최소값, 결과)"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = [pipeline(code, df, investor) for code, df, investor in dataset]
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='일봉 레코드 변환 벤치마크 (행 단위 vs 컬럼 단위)')
+    parser.add_argument('--stocks', type=int, default=300, help='종목 수 (기본값: 300)')
+    parser.add_argument('--days', type=int, default=365, help='종목당 일수 (기본값: 365)')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수, 최소값 사용 (기본값: 3)')
+    args = parser.parse_args()
+
+    print(f"📊 합성 데이터 생성: {args.stocks}종목 × {args.days}일")
+    dataset = make_synthetic_dataset(args.stocks, args.days)
+
+    legacy_time, legacy_rows = run_benchmark(legacy_pipeline, dataset, args.repeat)
+    columnar_time, columnar_rows = run_benchmark(columnar_pipeline, dataset, args.repeat)
+
+    total_rows = sum(len(rows) for rows in columnar_rows)
+    print(f"  행 단위 (iterrows)  : {legacy_time:8.3f}초 ({total_rows / legacy_time:,.0f} 행/초)")
+    print(f"  컬럼 단위 (vectorized): {columnar_time:8.3f}초 ({total_rows / columnar_time:,.0f} 행/초)")
+    print(f"  속도 향상: {legacy_time / columnar_time:.1f}배")
+
+    if legacy_rows == columnar_rows:
+        print(f"✅ 결과 일치 ({total_rows:,}행)")
+    else:
+        print("❌ 결과 불일치")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
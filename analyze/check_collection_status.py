@@ -125,7 +125,7 @@ class CollectionStatusChecker:
             self.cursor.execute("""
                 SELECT COUNT(*) as today_count
                 FROM minute_stock_prices
-                WHERE DATE(trade_datetime) = CURDATE()
+                WHERE trade_datetime >= CURDATE() AND trade_datetime < CURDATE() + INTERVAL 1 DAY
             """)
             today = self.cursor.fetchone()
             overview['today_count'] = today['today_count']
@@ -203,7 +203,7 @@ class CollectionStatusChecker:
                     MAX(m.trade_datetime) as last_datetime
                 FROM minute_stock_prices m
                 LEFT JOIN stock_info s ON m.stock_code COLLATE utf8mb4_unicode_ci = s.stock_code
-                WHERE DATE(m.trade_datetime) = CURDATE()
+                WHERE m.trade_datetime >= CURDATE() AND m.trade_datetime < CURDATE() + INTERVAL 1 DAY
                 GROUP BY m.stock_code, s.stock_name
                 ORDER BY record_count DESC
                 LIMIT 20
@@ -320,7 +320,7 @@ class CollectionStatusChecker:
                 SELECT COUNT(*) as today_minute_count
                 FROM minute_stock_prices
                 WHERE stock_code COLLATE utf8mb4_unicode_ci = %s
-                  AND DATE(trade_datetime) = CURDATE()
+                  AND trade_datetime >= CURDATE() AND trade_datetime < CURDATE() + INTERVAL 1 DAY
             """, (stock_code,))
             result['minute']['today_count'] = self.cursor.fetchone()['today_minute_count']
 
@@ -7,6 +7,9 @@
   python daily_collector.py --test          # 테스트 모드 (5종목, 30일)
   python daily_collector.py --stocks 10     # 10종목
   python daily_collector.py --days 60       # 60일 데이터
+  python daily_collector.py --workers 4     # 4개 스레드 병렬 수집
+  python daily_collector.py --incremental   # DB 마지막 거래일 이후만 수집
+  python daily_collector.py --indicators-only  # 수집 없이 일봉 지표(daily_indicators)만 갱신
   python daily_collector.py                 # 전체 실행 (300종목)
 """
 import sys
@@ -14,6 +17,9 @@ import os
 import time
 import pandas as pd
 import argparse
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import Dict, List
 import logging
@@ -21,6 +27,10 @@ import logging
 # 현재 디렉토리(analyze)의 모듈들 import
 from data_fetcher import DataFetcher
 from db_manager import DBManager
+from rate_limiter import TokenBucket
+from price_records import build_price_frame, merge_investor_frame, frame_to_rows
+from price_store import PriceStore
+from daily_indicators import DailyIndicatorBuilder
 
 try:
     import yaml
@@ -81,14 +91,22 @@ database:
             'data_days': 365,
             'retry_count': 3,
             'api_delay': 0.2,
-            'bulk_insert_size': 100
+            'api_rate_limit': 15,
+            'incremental_overlap_days': 3,
+            'bulk_insert_size': 100,
+            'bulk_write_method': 'executemany',  # executemany / multi_row / load_data
+            'bulk_load_size': 5000,
+            'price_store': True,  # 로컬 컬럼 저장소(data/price_store)에도 저장 (pyarrow 필요)
+            'price_store_dir': None,
+            'daily_indicators': True  # 수집 후 daily_indicators 테이블 갱신
         })
 
 
 class DailyDataCollector:
     """일봉 데이터 수집 클래스"""
     
-    def __init__(self, max_stocks: int = None, data_days: int = None, test_mode: bool = False):
+    def __init__(self, max_stocks: int = None, data_days: int = None, test_mode: bool = False,
+                 workers: int = 1, incremental: bool = False, overlap_days: int = None):
         """
         초기화
         
@@ -96,6 +114,9 @@ class DailyDataCollector:
             max_stocks: 수집할 최대 종목 수 (None이면 전체)
             data_days: 수집할 일수 (None이면 config 값 사용)
             test_mode: 테스트 모드 (True면 5종목, 30일)
+            workers: 병렬 수집 스레드 수 (1이면 순차 실행)
+            incremental: 증분 모드 (DB 마지막 거래일 이후만 수집)
+            overlap_days: 증분 모드에서 마지막 거래일 이전으로 다시 받을 일수 (정정 반영용)
         """
         # 로거 설정
         self.setup_logger()
@@ -109,6 +130,8 @@ class DailyDataCollector:
             self.max_stocks = max_stocks
             self.data_days = data_days
         
+        self.workers = max(1, workers or 1)
+        
         # 설정 로드
         self.config_manager = ConfigManager()
         self.kis_config = self.config_manager.get_kis_config()
@@ -124,12 +147,36 @@ class DailyDataCollector:
         if self.data_days is None:
             self.data_days = self.batch_config.get('data_days', 365)
         
+        # 증분 모드 설정
+        self.incremental = incremental
+        if overlap_days is None:
+            overlap_days = self.batch_config.get('incremental_overlap_days', 3)
+        self.overlap_days = max(0, overlap_days)
+        self.last_trade_dates = {}  # {종목코드: DB 마지막 거래일}
+        
         # DataFetcher 초기화 (analyze 방식)
         self.data_fetcher = DataFetcher()
         
+        # API 호출 속도 제한 (KIS 초당 호출 한도, 모든 수집 스레드가 공유)
+        api_rate_limit = self.batch_config.get('api_rate_limit', 15)
+        self.rate_limiter = TokenBucket(api_rate_limit)
+        self.data_fetcher.set_rate_limiter(self.rate_limiter)
+        
         # DB 매니저 초기화
         self.db_manager = DBManager(self.db_config, self.logger)
         
+        # 로컬 컬럼 저장소 (DB 저장 성공한 종목만 병합)
+        self.price_store = None
+        if self.batch_config.get('price_store', True):
+            price_store = PriceStore(self.batch_config.get('price_store_dir'), self.logger)
+            if price_store.available:
+                self.price_store = price_store
+            else:
+                self.logger.info("💡 pyarrow 미설치 - 로컬 가격 저장소 갱신 생략")
+        
+        # 수집 후 지표 적재 대상 {종목코드: 이번에 저장한 첫 거래일}
+        self.indicator_targets = {}
+        
         # 통계
         self.stats = {
             'total_stocks': 0,
@@ -251,19 +298,28 @@ class DailyDataCollector:
             self.logger.error(f"❌ 종목 리스트 조회 실패: {e}")
             return {}
     
-    def collect_daily_data(self, stock_code: str, stock_name: str) -> List[Dict]:
-        """종목별 일봉 데이터 수집 (365일 이상 대응 + 투자자별 매매)"""
+    def collect_daily_data(self, stock_code: str, stock_name: str) -> List[tuple]:
+        """종목별 일봉 데이터 수집 (365일 이상 대응 + 투자자별 매매)
+        
+        Returns:
+            List[tuple]: DB 저장용 행 리스트 (price_records.DAILY_PRICE_COLUMNS 순서, 날짜 오름차순)
+        """
         try:
-            all_records = []
+            frames = []
+            
+            incremental_start = self._get_incremental_start(stock_code)
             
+            if incremental_start is not None:
+                # 증분 모드: 마지막 거래일(- overlap) ~ 오늘만 조회
+                self.logger.debug(f"📅 {stock_name}: {incremental_start} 이후 데이터만 조회 (증분)")
+                frames = self._collect_date_range(stock_code, incremental_start, datetime.now().date())
+                
             # API는 한 번에 최대 100일치만 반환
             # 365일 수집 시 여러 번 호출 필요
-            if self.data_days > 100:
+            elif self.data_days > 100:
                 self.logger.debug(f"📅 {stock_name}: {self.data_days}일 데이터를 여러 번 나눠서 조회")
                 
                 # 오늘부터 과거로 100일씩 조회
-                from datetime import datetime, timedelta
-                
                 end_date = datetime.now()
                 total_collected = 0
                 
@@ -283,87 +339,93 @@ class DailyDataCollector:
                     
                     if df is not None and not df.empty:
                         # 데이터 변환
-                        chunk_records = self._convert_df_to_records(stock_code, df)
-                        all_records.extend(chunk_records)
-                        total_collected += len(chunk_records)
+                        chunk_frame = build_price_frame(stock_code, df)
+                        frames.append(chunk_frame)
+                        total_collected += len(chunk_frame)
                         
-                        self.logger.debug(f"  ✅ 청크 {chunk_idx+1}: {len(chunk_records)}건 수집 (누적: {total_collected}건)")
-                    
-                    # API 호출 간격
-                    if chunk_idx < (self.data_days // 100):
-                        time.sleep(0.3)
+                        self.logger.debug(f"  ✅ 청크 {chunk_idx+1}: {len(chunk_frame)}건 수집 (누적: {total_collected}건)")
                 
             else:
                 # 100일 이하는 한 번에 조회
                 df = self.data_fetcher.get_period_price_data(stock_code, days=self.data_days)
                 
                 if df is not None and not df.empty:
-                    all_records = self._convert_df_to_records(stock_code, df)
+                    frames = [build_price_frame(stock_code, df)]
             
-            if not all_records:
+            frames = [frame for frame in frames if not frame.empty]
+            if not frames:
                 self.logger.warning(f"⚠️ {stock_name}({stock_code}): 데이터 없음")
                 return []
             
-            # 투자자별 매매 데이터 추가 수집
-            all_records = self._enrich_with_investor_data(stock_code, stock_name, all_records)
-            
-            # 날짜순 정렬 및 중복 제거
-            unique_records = {}
-            for record in all_records:
-                key = (record['stock_code'], record['trade_date'])
-                if key not in unique_records:
-                    unique_records[key] = record
+            # 중복 제거(먼저 조회된 최근 청크 우선) 및 날짜순 정렬
+            price_frame = pd.concat(frames, ignore_index=True)
+            price_frame = price_frame.drop_duplicates(subset='trade_date', keep='first')
+            price_frame = price_frame.sort_values('trade_date').reset_index(drop=True)
             
-            final_records = list(unique_records.values())
-            final_records.sort(key=lambda x: x['trade_date'])
+            # 투자자별 매매 데이터 추가 수집
+            merged = self._enrich_with_investor_data(stock_code, stock_name, price_frame)
+            rows = frame_to_rows(merged, stock_code)
             
-            self.logger.info(f"✅ {stock_name}({stock_code}): {len(final_records)}건 수집 (투자자 데이터 포함)")
-            return final_records
+            self.logger.info(f"✅ {stock_name}({stock_code}): {len(rows)}건 수집 (투자자 데이터 포함)")
+            return rows
             
         except Exception as e:
             self.logger.error(f"❌ {stock_name}({stock_code}) 데이터 수집 실패: {e}")
             return []
     
-    def _enrich_with_investor_data(self, stock_code: str, stock_name: str, records: List[Dict]) -> List[Dict]:
-        """투자자별 매매 데이터로 레코드 보강"""
+    def _get_incremental_start(self, stock_code: str):
+        """증분 모드 조회 시작일 (증분 모드가 아니거나 DB에 데이터가 없으면 None)"""
+        if not self.incremental:
+            return None
+        
+        last_date = self.last_trade_dates.get(stock_code)
+        if not last_date:
+            return None
+        
+        start_date = last_date - timedelta(days=self.overlap_days)
+        
+        # 오래 비어 있던 종목은 전체 수집 기간을 넘지 않도록 제한
+        earliest = datetime.now().date() - timedelta(days=int(self.data_days * 1.5) + 10)
+        return max(start_date, earliest)
+    
+    def _collect_date_range(self, stock_code: str, start_date, end_date) -> List[pd.DataFrame]:
+        """날짜 범위 데이터 수집 (API 1회 최대 100일이므로 최근부터 100일 단위로 나눠서 조회)"""
+        frames = []
+        chunk_end = end_date
+        
+        while chunk_end >= start_date:
+            chunk_start = max(start_date, chunk_end - timedelta(days=99))
+            
+            df = self._fetch_data_by_date_range(stock_code, chunk_start, chunk_end)
+            if df is not None and not df.empty:
+                frames.append(build_price_frame(stock_code, df))
+            
+            chunk_end = chunk_start - timedelta(days=1)
+        
+        return frames
+    
+    def _enrich_with_investor_data(self, stock_code: str, stock_name: str,
+                                   price_frame: pd.DataFrame) -> pd.DataFrame:
+        """투자자별 매매 데이터를 trade_date 기준으로 병합"""
+        investor_data = []
         try:
             # 투자자별 매매 데이터 조회 (최근 100일)
             investor_data = self._fetch_investor_data(stock_code)
             
             if not investor_data:
                 self.logger.debug(f"  ⚠️ {stock_name}: 투자자 데이터 없음")
-                return records
-            
-            # 날짜별 매핑
-            investor_map = {data['trade_date']: data for data in investor_data}
-            
-            # 기존 레코드에 투자자 데이터 추가
-            enriched_count = 0
-            for record in records:
-                trade_date = record['trade_date']
-                if trade_date in investor_map:
-                    inv_data = investor_map[trade_date]
-                    record.update({
-                        'foreign_buy_qty': inv_data.get('foreign_buy_qty'),
-                        'foreign_sell_qty': inv_data.get('foreign_sell_qty'),
-                        'foreign_net_qty': inv_data.get('foreign_net_qty'),
-                        'institution_buy_qty': inv_data.get('institution_buy_qty'),
-                        'institution_sell_qty': inv_data.get('institution_sell_qty'),
-                        'institution_net_qty': inv_data.get('institution_net_qty'),
-                        'individual_buy_qty': inv_data.get('individual_buy_qty'),
-                        'individual_sell_qty': inv_data.get('individual_sell_qty'),
-                        'individual_net_qty': inv_data.get('individual_net_qty')
-                    })
-                    enriched_count += 1
             
+            merged = merge_investor_frame(price_frame, investor_data)
+            
+            enriched_count = int(merged['foreign_net_qty'].notna().sum())
             if enriched_count > 0:
                 self.logger.debug(f"  💰 {stock_name}: 투자자 데이터 {enriched_count}건 추가")
             
-            return records
+            return merged
             
         except Exception as e:
             self.logger.warning(f"  ⚠️ {stock_name}: 투자자 데이터 추가 실패: {e}")
-            return records
+            return merge_investor_frame(price_frame, [])
     
     def _fetch_investor_data(self, stock_code: str) -> List[Dict]:
         """투자자별 매매 데이터 조회"""
@@ -383,10 +445,7 @@ class DailyDataCollector:
                 "fid_input_iscd": stock_code
             }
             
-            time.sleep(0.15)
-            
-            import requests
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self.data_fetcher.http.get(url, headers=headers, params=params, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -457,10 +516,7 @@ class DailyDataCollector:
                 "fid_org_adj_prc": "0"
             }
             
-            time.sleep(0.1)
-            
-            import requests
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self.data_fetcher.http.get(url, headers=headers, params=params, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -485,48 +541,8 @@ class DailyDataCollector:
             self.logger.error(f"❌ 날짜 범위 조회 실패 ({stock_code}): {e}")
             return pd.DataFrame()
     
-    def _convert_df_to_records(self, stock_code: str, df: pd.DataFrame) -> List[Dict]:
-        """DataFrame을 레코드 리스트로 변환"""
-        records = []
-        
-        for _, row in df.iterrows():
-            try:
-                # 날짜 변환
-                trade_date = None
-                if 'stck_bsop_date' in row:
-                    date_str = str(row['stck_bsop_date'])
-                    if len(date_str) == 8:
-                        trade_date = datetime.strptime(date_str, '%Y%m%d').date()
-                
-                if not trade_date:
-                    continue
-                
-                # 컬럼명 확인
-                close_col = 'stck_clpr' if 'stck_clpr' in row else 'stck_prpr'
-                volume_col = 'acml_vol' if 'acml_vol' in row else 'cntg_vol'
-                
-                # 가격 데이터 변환
-                record = {
-                    'stock_code': stock_code,
-                    'trade_date': trade_date,
-                    'open_price': int(float(row.get('stck_oprc', 0))) if pd.notna(row.get('stck_oprc')) else None,
-                    'high_price': int(float(row.get('stck_hgpr', 0))) if pd.notna(row.get('stck_hgpr')) else None,
-                    'low_price': int(float(row.get('stck_lwpr', 0))) if pd.notna(row.get('stck_lwpr')) else None,
-                    'close_price': int(float(row.get(close_col, 0))) if pd.notna(row.get(close_col)) else None,
-                    'volume': int(float(row.get(volume_col, 0))) if pd.notna(row.get(volume_col)) else None,
-                    'trading_value': int(float(row.get('acml_tr_pbmn', 0))) if pd.notna(row.get('acml_tr_pbmn')) else None
-                }
-                
-                records.append(record)
-                
-            except Exception as e:
-                self.logger.debug(f"⚠️ 레코드 변환 오류: {e}")
-                continue
-        
-        return records
-    
-    def save_to_db(self, stock_code: str, stock_name: str, records: List[Dict]) -> bool:
-        """DB에 데이터 저장"""
+    def save_to_db(self, stock_code: str, stock_name: str, records: List[tuple]) -> bool:
+        """DB에 데이터 저장 (records: collect_daily_data가 반환한 행 튜플 리스트)"""
         try:
             if not records:
                 return False
@@ -535,12 +551,30 @@ class DailyDataCollector:
             if not self.db_manager.upsert_stock_info(stock_code, stock_name):
                 return False
             
-            # 일봉 데이터 저장 (bulk insert)
+            # 일봉 데이터 저장
+            write_method = self.batch_config.get('bulk_write_method', 'executemany')
+            
+            if write_method in ('multi_row', 'load_data'):
+                # 임시 테이블 적재 후 한 번에 병합
+                result = self.db_manager.bulk_upsert_daily_price_rows(
+                    records,
+                    batch_size=self.batch_config.get('bulk_load_size', 5000),
+                    use_load_data=(write_method == 'load_data')
+                )
+                self.stats['success_records'] += result['success']
+                self.stats['fail_records'] += result['fail']
+                self.logger.debug(f"  💾 {stock_code}: {result['success']}건 저장 "
+                                  f"({result['method']}, {len(result['batches'])}배치, {result['elapsed']:.3f}초)")
+                
+                self.db_manager.commit()
+                return result['fail'] == 0
+            
+            # bulk insert (executemany)
             bulk_size = self.batch_config.get('bulk_insert_size', 100)
             
             for i in range(0, len(records), bulk_size):
                 batch = records[i:i+bulk_size]
-                success, fail = self.db_manager.bulk_insert_daily_prices(batch)
+                success, fail = self.db_manager.bulk_insert_daily_price_rows(batch)
                 
                 self.stats['success_records'] += success
                 self.stats['fail_records'] += fail
@@ -580,39 +614,27 @@ class DailyDataCollector:
             
             self.stats['total_stocks'] = len(stock_list)
             
-            # 각 종목별 데이터 수집
-            api_delay = self.batch_config.get('api_delay', 0.2)
+            self.logger.info(f"📈 수집 설정: {len(stock_list)}개 종목 × {self.data_days}일 "
+                             f"(workers={self.workers})")
             
-            self.logger.info(f"📈 수집 설정: {len(stock_list)}개 종목 × {self.data_days}일")
+            # 증분 모드: 종목별 마지막 거래일을 한 번에 조회
+            if self.incremental:
+                self.last_trade_dates = self.db_manager.get_latest_trade_dates(list(stock_list.keys()))
+                self.logger.info(f"📅 증분 모드: {len(self.last_trade_dates)}/{len(stock_list)}개 종목 기존 데이터 있음 "
+                                 f"(overlap {self.overlap_days}일, 신규 종목은 {self.data_days}일 수집)")
             
-            for idx, (stock_code, stock_name) in enumerate(stock_list.items(), 1):
-                try:
-                    self.logger.info(f"\n[{idx}/{len(stock_list)}] {stock_name}({stock_code}) 처리 중...")
-                    
-                    # 일봉 데이터 수집
-                    records = self.collect_daily_data(stock_code, stock_name)
-                    
-                    if records:
-                        # DB 저장
-                        if self.save_to_db(stock_code, stock_name, records):
-                            self.stats['success_stocks'] += 1
-                            self.stats['total_records'] += len(records)
-                        else:
-                            self.stats['fail_stocks'] += 1
-                    else:
-                        self.stats['fail_stocks'] += 1
-                    
-                    # API 호출 제한
-                    time.sleep(api_delay)
-                    
-                    # 진행상황 출력
-                    if idx % 10 == 0:
-                        self.logger.info(f"📊 진행률: {idx}/{len(stock_list)} ({idx/len(stock_list)*100:.1f}%)")
-                    
-                except Exception as e:
-                    self.logger.error(f"❌ {stock_name}({stock_code}) 처리 실패: {e}")
-                    self.stats['fail_stocks'] += 1
-                    continue
+            # 토큰을 미리 로드 (여러 스레드가 동시에 재발급하지 않도록)
+            self.data_fetcher.load_token()
+            
+            # 각 종목별 데이터 수집
+            if self.workers > 1:
+                self.collect_concurrent(stock_list)
+            else:
+                self.collect_sequential(stock_list)
+            
+            # 수집 후 단계: 저장한 종목의 일봉 지표 갱신
+            if self.batch_config.get('daily_indicators', True):
+                self.update_indicators()
             
             # 결과 출력
             self.print_summary(start_time)
@@ -644,6 +666,148 @@ class DailyDataCollector:
         finally:
             self.db_manager.disconnect()
     
+    def collect_sequential(self, stock_list: Dict[str, str]):
+        """종목별 순차 수집 (수집 → 저장)"""
+        api_delay = self.batch_config.get('api_delay', 0.2)
+        
+        for idx, (stock_code, stock_name) in enumerate(stock_list.items(), 1):
+            try:
+                self.logger.info(f"\n[{idx}/{len(stock_list)}] {stock_name}({stock_code}) 처리 중...")
+                
+                # 일봉 데이터 수집
+                records = self.collect_daily_data(stock_code, stock_name)
+                self._store_result(stock_code, stock_name, records)
+                
+                # API 호출 제한
+                time.sleep(api_delay)
+                
+                # 진행상황 출력
+                if idx % 10 == 0:
+                    self.logger.info(f"📊 진행률: {idx}/{len(stock_list)} ({idx/len(stock_list)*100:.1f}%)")
+                
+            except Exception as e:
+                self.logger.error(f"❌ {stock_name}({stock_code}) 처리 실패: {e}")
+                self.stats['fail_stocks'] += 1
+                continue
+    
+    def collect_concurrent(self, stock_list: Dict[str, str]):
+        """종목별 병렬 수집
+        
+        수집 스레드(workers개)가 API를 호출하고, 결과는 큐를 통해
+        단일 DB 저장 스레드로 전달되어 네트워크/DB 작업이 겹쳐서 진행됨.
+        API 호출 속도는 공유 TokenBucket이 제한함.
+        """
+        write_queue = queue.Queue(maxsize=self.workers * 2)
+        writer = threading.Thread(
+            target=self._db_writer_loop,
+            args=(write_queue, len(stock_list)),
+            name='db-writer',
+            daemon=True
+        )
+        writer.start()
+        
+        def fetch_job(stock_code: str, stock_name: str):
+            records = []
+            try:
+                records = self.collect_daily_data(stock_code, stock_name)
+            finally:
+                write_queue.put((stock_code, stock_name, records))
+        
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='fetch') as executor:
+                futures = {
+                    executor.submit(fetch_job, stock_code, stock_name): stock_code
+                    for stock_code, stock_name in stock_list.items()
+                }
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        self.logger.error(f"❌ {futures[future]} 수집 스레드 오류: {e}")
+        finally:
+            # 저장 스레드 종료 신호
+            write_queue.put(None)
+            writer.join()
+    
+    def _db_writer_loop(self, write_queue: queue.Queue, total: int):
+        """DB 저장 스레드 (DB 연결은 이 스레드에서만 사용)"""
+        processed = 0
+        
+        while True:
+            item = write_queue.get()
+            if item is None:
+                break
+            
+            stock_code, stock_name, records = item
+            processed += 1
+            
+            try:
+                self._store_result(stock_code, stock_name, records)
+            except Exception as e:
+                self.logger.error(f"❌ {stock_name}({stock_code}) 저장 실패: {e}")
+                self.stats['fail_stocks'] += 1
+            
+            if processed % 10 == 0:
+                self.logger.info(f"📊 진행률: {processed}/{total} ({processed/total*100:.1f}%)")
+    
+    def _store_result(self, stock_code: str, stock_name: str, records: List[tuple]):
+        """수집 결과 저장 및 통계 반영"""
+        if records:
+            # DB 저장
+            if self.save_to_db(stock_code, stock_name, records):
+                self.stats['success_stocks'] += 1
+                self.stats['total_records'] += len(records)
+                self._update_price_store(stock_code, records)
+                self.indicator_targets[stock_code] = min(record[1] for record in records)
+            else:
+                self.stats['fail_stocks'] += 1
+        else:
+            self.stats['fail_stocks'] += 1
+    
+    def _update_price_store(self, stock_code: str, records: List[tuple]):
+        """로컬 가격 저장소에 수집 결과 병합 (실패해도 배치는 계속)"""
+        if not self.price_store:
+            return
+        
+        try:
+            self.price_store.write_rows(stock_code, records)
+        except Exception as e:
+            self.logger.warning(f"⚠️ 가격 저장소 갱신 실패 ({stock_code}): {e}")
+    
+    def update_indicators(self, targets: Dict = None) -> Dict:
+        """일봉 지표 증분 갱신 (실패해도 배치는 계속)
+        
+        Args:
+            targets: {종목코드: 가격이 저장된 첫 거래일} (None이면 이번 배치 저장분)
+        """
+        targets = self.indicator_targets if targets is None else targets
+        if not targets:
+            return {}
+        
+        try:
+            builder = DailyIndicatorBuilder(self.db_manager, self.logger)
+            return builder.update(targets, self.batch_config.get('bulk_load_size', 5000))
+        except Exception as e:
+            self.logger.warning(f"⚠️ 일봉 지표 갱신 실패: {e}")
+            self.db_manager.rollback()
+            return {}
+    
+    def run_indicators_only(self) -> bool:
+        """수집 없이 DB의 전 종목 지표를 마지막 지표 행 이후만 갱신"""
+        try:
+            if not self.db_manager.connect():
+                raise Exception("데이터베이스 연결 실패")
+            
+            self.db_manager.create_tables()
+            stock_codes = list(self.db_manager.get_latest_trade_dates().keys())
+            self.logger.info(f"📐 일봉 지표 갱신 대상: {len(stock_codes)}개 종목")
+            
+            result = self.update_indicators({code: None for code in stock_codes})
+            return bool(result) and result['fail'] == 0
+        
+        finally:
+            self.db_manager.disconnect()
+    
     def print_summary(self, start_time: datetime):
         """결과 요약 출력"""
         elapsed = datetime.now() - start_time
@@ -660,6 +824,23 @@ class DailyDataCollector:
         self.logger.info(f"✅ 저장 성공: {self.stats['success_records']}건")
         self.logger.info(f"❌ 저장 실패: {self.stats['fail_records']}건")
         
+        # 처리량
+        elapsed_sec = elapsed.total_seconds()
+        if elapsed_sec > 0:
+            processed = self.stats['success_stocks'] + self.stats['fail_stocks']
+            api_stats = self.rate_limiter.get_stats()
+            self.logger.info(f"🚀 처리량: {processed / elapsed_sec * 60:.1f} 종목/분, "
+                             f"API {api_stats['calls'] / elapsed_sec:.2f} 회/초 "
+                             f"(총 {api_stats['calls']}회, 한도 대기 {api_stats['total_wait']:.1f}초, "
+                             f"workers={self.workers})")
+
+        # 엔드포인트(TR ID)별 응답 시간
+        latency_lines = self.data_fetcher.http.format_latency_stats()
+        if latency_lines:
+            self.logger.info("⏱️  API 응답 시간:")
+            for line in latency_lines:
+                self.logger.info(line)
+
         if self.stats['total_stocks'] > 0:
             success_rate = self.stats['success_stocks'] / self.stats['total_stocks'] * 100
             self.logger.info(f"📊 성공률: {success_rate:.1f}%")
@@ -690,6 +871,15 @@ def main():
   # 10종목, 60일 수집
   python daily_collector.py --stocks 10 --days 60
 
+  # 4개 스레드로 병렬 수집 (API 호출은 config.yaml의 api_rate_limit 이내)
+  python daily_collector.py --days 365 --workers 4
+
+  # 증분 수집 (DB 마지막 거래일 - 3일 이후만 조회, 신규 종목은 --days 만큼)
+  python daily_collector.py --incremental --overlap 3 -y
+
+  # 일봉 지표(daily_indicators)만 갱신 (API 수집 없음)
+  python daily_collector.py --indicators-only
+
   # 전체 실행 (300종목, config.yaml 설정값)
   python daily_collector.py
         """
@@ -727,9 +917,46 @@ def main():
         help='일일 배치 모드 (300종목, 최근 7일만 수집, 투자자 데이터 포함)'
     )
 
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        metavar='N',
+        help='병렬 수집 스레드 수 (기본값: 1, 순차 실행)'
+    )
+
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='증분 모드 (DB에 저장된 마지막 거래일 이후만 수집)'
+    )
+
+    parser.add_argument(
+        '--overlap',
+        type=int,
+        metavar='N',
+        help='증분 모드에서 마지막 거래일 이전으로 다시 수집할 일수 (기본값: config.yaml의 incremental_overlap_days)'
+    )
+
+    parser.add_argument(
+        '--indicators-only',
+        action='store_true',
+        help='수집 없이 DB 일봉으로 기술적 지표(daily_indicators)만 증분 갱신'
+    )
+
     args = parser.parse_args()
     
     try:
+        # 지표만 갱신
+        if args.indicators_only:
+            print("\n📐 일봉 지표(daily_indicators)만 갱신합니다.")
+            collector = DailyDataCollector()
+            if collector.run_indicators_only():
+                print("\n✅ 지표 갱신 완료!")
+                return 0
+            print("\n❌ 지표 갱신 실패!")
+            return 1
+
         # 일일 배치 모드 처리
         if args.daily:
             print("\n📅 일일 배치 모드로 실행합니다.")
@@ -752,6 +979,9 @@ def main():
             print(f"   - 종목 수: {stocks_msg}")
             print(f"   - 데이터 기간: {days_msg}")
 
+        if args.incremental:
+            print("   - 증분 모드: DB 마지막 거래일 이후만 수집")
+
         # 확인 프롬프트 (테스트 모드나 --yes 옵션이 아닐 때만)
         if not args.test and not args.yes:
             print("\n시작하려면 Enter를 누르세요 (취소: Ctrl+C)...")
@@ -761,7 +991,10 @@ def main():
         collector = DailyDataCollector(
             max_stocks=args.stocks,
             data_days=args.days,
-            test_mode=args.test
+            test_mode=args.test,
+            workers=args.workers,
+            incremental=args.incremental,
+            overlap_days=args.overlap
         )
         
         success = collector.run()
@@ -0,0 +1,178 @@
+"""
+일봉 기술적 지표 적재 모듈
+종목·거래일별 MA5/MA20/MA60, 볼린저밴드(20일, 2σ), RSI(14), MACD(12/26/9), 20일 평균 거래량을
+한 번 계산하여 daily_indicators 테이블에 저장 (읽는 쪽은 DBManager.get_daily_indicators /
+get_latest_indicators_bulk로 재계산 없이 사용)
+
+증분 계산:
+  - 새로 저장된(정정 포함) 첫 거래일 직전의 지표 행을 시작 상태로 사용
+  - 지수이동평균(EMA12/EMA26/Signal)은 저장된 값에서 이어서 계산하고,
+    이동평균/표준편차/RSI 창은 시작 상태 포함 직전 59개 거래일 종가만 다시 읽어서 채움
+  - 시작 상태가 없으면 종목 전체 이력으로 계산
+
+계산식은 indicator_engine.IndicatorPanel과 같음 (RSI는 단순 이동평균 방식, 이력 부족 구간은 NULL)
+
+사용 예:
+  builder = DailyIndicatorBuilder(db_manager)
+  builder.update({'005930': date(2025, 1, 6), '000660': None})   # {종목코드: 변경된 첫 거래일}
+"""
+import logging
+import time
+from datetime import date
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from indicator_engine import rolling_mean, rolling_std, ewm_mean, shift
+
+
+INDICATOR_WINDOW = 60  # 가장 긴 창 (MA60)
+
+
+def compute_indicators(close: np.ndarray, volume: np.ndarray, start: int = 0,
+                       state: Optional[Dict] = None) -> Dict[str, np.ndarray]:
+    """종목 하나의 지표 계산 (start 이후 행만 반환)
+
+    Args:
+        close: 종가 배열 (거래일 오름차순)
+        volume: 거래량 배열 (같은 길이, 결측 NaN)
+        start: 결과를 만들 첫 행 (이전 행은 이동평균 창 채우기용)
+        state: start 직전 행의 저장된 지표 (ema12, ema26, macd_signal), None이면 처음부터 계산
+
+    Returns:
+        Dict[str, np.ndarray]: {지표명: start 이후 값 배열} (DAILY_INDICATOR_COLUMNS 이름)
+    """
+    close = np.asarray(close, dtype='float64').reshape(-1, 1)
+    volume = np.asarray(volume, dtype='float64').reshape(-1, 1)
+    state = state or {}
+
+    def initial(key):
+        value = state.get(key)
+        return np.array([np.nan if value is None else float(value)])
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        ma20 = rolling_mean(close, 20)
+        std20 = rolling_std(close, 20)
+
+        delta = close - shift(close)
+        gain = rolling_mean(np.where(delta > 0, delta, 0.0), 14)
+        loss = rolling_mean(np.where(delta < 0, -delta, 0.0), 14)
+        rsi = 100 - (100 / (1 + gain / np.where(loss == 0, 0.0001, loss)))
+
+        # 지수이동평균은 저장된 상태에서 이어서 계산 (start 이전 행 불필요)
+        tail = close[start:]
+        ema12 = ewm_mean(tail, 12, initial('ema12'))
+        ema26 = ewm_mean(tail, 26, initial('ema26'))
+        macd = ema12 - ema26
+        macd_signal = ewm_mean(macd, 9, initial('macd_signal'))
+
+    indicators = {
+        'close_price': close,
+        'ma5': rolling_mean(close, 5),
+        'ma20': ma20,
+        'ma60': rolling_mean(close, INDICATOR_WINDOW),
+        'bb_upper': ma20 + 2 * std20,
+        'bb_lower': ma20 - 2 * std20,
+        'rsi14': rsi,
+        'volume_ma20': rolling_mean(volume, 20),
+    }
+    result = {key: values[start:, 0] for key, values in indicators.items()}
+    result.update({
+        'ema12': ema12[:, 0],
+        'ema26': ema26[:, 0],
+        'macd': macd[:, 0],
+        'macd_signal': macd_signal[:, 0],
+        'macd_hist': (macd - macd_signal)[:, 0],
+    })
+    return result
+
+
+def _to_value(value):
+    return None if value is None or np.isnan(value) else float(value)
+
+
+class DailyIndicatorBuilder:
+    """daily_indicators 증분 적재기 (DB 연결은 호출 스레드에서만 사용)"""
+
+    def __init__(self, db_manager, logger=None):
+        """
+        Args:
+            db_manager: DBManager (연결된 상태)
+            logger: 로거 객체
+        """
+        self.db_manager = db_manager
+        self.logger = logger or logging.getLogger(__name__)
+
+    def build_rows(self, stock_code: str, since: Optional[date] = None) -> List[tuple]:
+        """종목 하나의 갱신할 지표 행 계산
+
+        Args:
+            stock_code: 종목코드
+            since: 가격이 새로 저장/정정된 첫 거래일 (None이면 마지막 지표 행 이후만)
+
+        Returns:
+            List[tuple]: DAILY_INDICATOR_COLUMNS 순서 튜플 리스트
+        """
+        state = self.db_manager.get_indicator_state(stock_code, since)
+
+        if state:
+            prices = self.db_manager.get_daily_closes(stock_code, state['trade_date'], INDICATOR_WINDOW - 1)
+            start = sum(1 for row in prices if row['trade_date'] <= state['trade_date'])
+        else:
+            prices = self.db_manager.get_daily_closes(stock_code)
+            start = 0
+
+        if start >= len(prices):
+            return []
+
+        close = np.array([row['close_price'] for row in prices], dtype='float64')
+        volume = np.array([np.nan if row['volume'] is None else row['volume'] for row in prices],
+                          dtype='float64')
+        indicators = compute_indicators(close, volume, start, state)
+
+        columns = self.db_manager.DAILY_INDICATOR_COLUMNS[2:]
+        rows = []
+        for offset, row in enumerate(prices[start:]):
+            values = [_to_value(indicators[col][offset]) for col in columns]
+            values[0] = int(row['close_price'])
+            rows.append((stock_code, row['trade_date'], *values))
+        return rows
+
+    def update(self, targets: Dict[str, Optional[date]], batch_size: int = 5000) -> Dict:
+        """여러 종목 지표 갱신 후 한 번에 저장
+
+        Args:
+            targets: {종목코드: 가격이 새로 저장된 첫 거래일 (None이면 마지막 지표 행 이후)}
+            batch_size: 저장 배치당 행 수
+
+        Returns:
+            Dict: {'stocks': 갱신 종목 수, 'rows': 저장 행 수, 'fail': 실패 종목/행 수, 'elapsed': 초}
+        """
+        started = time.perf_counter()
+        rows = []
+        stocks = 0
+        fail = 0
+
+        for stock_code, since in targets.items():
+            try:
+                stock_rows = self.build_rows(stock_code, since)
+            except Exception as e:
+                self.logger.warning(f"⚠️ 지표 계산 실패 ({stock_code}): {e}")
+                fail += 1
+                continue
+
+            if stock_rows:
+                rows.extend(stock_rows)
+                stocks += 1
+
+        saved = 0
+        if rows:
+            result = self.db_manager.bulk_upsert_daily_indicators(rows, batch_size)
+            saved = result['success']
+            fail += result['fail']
+            self.db_manager.commit()
+
+        elapsed = time.perf_counter() - started
+        self.logger.info(f"📐 일봉 지표 갱신: {stocks}/{len(targets)}종목, {saved}행 "
+                         f"(실패 {fail}, {elapsed:.1f}초)")
+        return {'stocks': stocks, 'rows': saved, 'fail': fail, 'elapsed': elapsed}
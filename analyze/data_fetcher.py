@@ -16,11 +16,84 @@ class DataFetcher(KISAPIClient):
     def __init__(self):
         super().__init__()
         self.db_manager = None  # DB 매니저는 필요시 외부에서 설정
+        self.daily_data_cache = None  # preload_daily_data로 일괄 적재한 {종목코드: 일봉 DataFrame}
+        self.daily_cache_days = 0
+        self.quote_snapshot = None  # QuoteSnapshot 설정 시 실시간 현재가는 스냅샷에서 조회
 
     def set_db_manager(self, db_manager):
         """DB 매니저 설정"""
         self.db_manager = db_manager
 
+    def set_quote_snapshot(self, quote_snapshot):
+        """현재가 스냅샷(QuoteSnapshot) 설정"""
+        self.quote_snapshot = quote_snapshot
+
+    def get_realtime_quote(self, stock_code):
+        """일봉에 붙일 실시간 현재가 (스냅샷 우선, 없거나 만료되면 개별 조회)
+
+        Returns:
+            tuple: (현재가, 거래량, 전일종가)
+        """
+        if self.quote_snapshot:
+            quote = self.quote_snapshot.get(stock_code)
+            if quote:
+                return quote
+
+        current_price, current_volume, prev_close = self.get_current_price(stock_code)
+        if self.quote_snapshot:
+            self.quote_snapshot.put(stock_code, current_price, current_volume, prev_close)
+        return current_price, current_volume, prev_close
+
+    def preload_daily_data(self, stock_codes, days=90):
+        """여러 종목 일봉 데이터를 DB에서 한 번에 조회하여 메모리에 적재
+
+        이후 get_daily_data_from_db / get_foreign_netbuy_trend_from_db는
+        종목별 DB 쿼리 대신 적재된 데이터를 사용
+
+        Args:
+            stock_codes: 종목코드 리스트
+            days: 조회 일수 (기본 90일, 종목별 조회 일수 이상이어야 함)
+
+        Returns:
+            int: 데이터가 적재된 종목 수
+        """
+        if not self.db_manager:
+            logger.warning("⚠️ DB 매니저가 설정되지 않음 - 일봉 일괄 적재 생략")
+            return 0
+
+        start_date = (datetime.now() - timedelta(days=days)).date()
+        panel = self.db_manager.get_daily_prices_bulk(stock_codes, start_date)
+
+        self.daily_data_cache = {
+            code: frame.reset_index(drop=True)
+            for code, frame in panel.groupby('stock_code', sort=False)
+        }
+        self.daily_cache_days = days
+
+        logger.info(f"💾 일봉 일괄 적재: {len(self.daily_data_cache)}/{len(stock_codes)}종목, {len(panel)}행")
+        return len(self.daily_data_cache)
+
+    def clear_daily_data_cache(self):
+        """일괄 적재한 일봉 데이터 해제"""
+        self.daily_data_cache = None
+
+    def _get_cached_daily_rows(self, stock_code, days):
+        """적재된 일봉 데이터에서 최근 days일 조회
+
+        Returns:
+            DataFrame: 적재 데이터 (해당 종목 데이터가 없으면 빈 DataFrame)
+            None: 적재되지 않았거나 적재 기간이 요청 기간보다 짧음 (종목별 DB 조회 필요)
+        """
+        if self.daily_data_cache is None or days > self.daily_cache_days:
+            return None
+
+        frame = self.daily_data_cache.get(stock_code)
+        if frame is None:
+            return pd.DataFrame()
+
+        since = (datetime.now() - timedelta(days=days)).strftime("%Y%m%d")
+        return frame[frame["stck_bsop_date"] >= since].reset_index(drop=True)
+
     def get_current_price(self, stock_code):
         """실시간 현재가 조회 (전일 종가 포함)"""
         url = "https://openapi.koreainvestment.com:9443/uapi/domestic-stock/v1/quotations/inquire-price"
@@ -105,7 +178,7 @@ class DataFetcher(KISAPIClient):
             return None
 
         # 실시간 현재가 추가
-        current_price, current_volume, prev_close = self.get_current_price(stock_code)
+        current_price, current_volume, prev_close = self.get_realtime_quote(stock_code)
 
         if current_price and current_volume:
             today = datetime.now().strftime("%Y%m%d")
@@ -143,16 +216,16 @@ class DataFetcher(KISAPIClient):
             return None
 
         try:
-            # DB에서 일봉 데이터 조회
-            data_list = self.db_manager.get_daily_prices(stock_code, days)
+            # 일괄 적재된 데이터 우선, 없으면 DB에서 일봉 데이터 조회
+            df = self._get_cached_daily_rows(stock_code, days)
+            if df is None:
+                data_list = self.db_manager.get_daily_prices(stock_code, days)
+                df = pd.DataFrame(data_list) if data_list else pd.DataFrame()
 
-            if not data_list:
+            if df.empty:
                 logger.debug(f"⚠️ {stock_code}: DB에 데이터 없음")
                 return None
 
-            # DataFrame으로 변환
-            df = pd.DataFrame(data_list)
-
             # 데이터 타입 변환
             numeric_cols = ["stck_clpr", "stck_hgpr", "stck_lwpr", "acml_vol"]
             for col in numeric_cols:
@@ -160,7 +233,7 @@ class DataFetcher(KISAPIClient):
                     df[col] = pd.to_numeric(df[col], errors="coerce")
 
             # 실시간 현재가 추가
-            current_price, current_volume, prev_close = self.get_current_price(stock_code)
+            current_price, current_volume, prev_close = self.get_realtime_quote(stock_code)
 
             if current_price and current_volume:
                 today = datetime.now().strftime("%Y%m%d")
@@ -244,8 +317,12 @@ class DataFetcher(KISAPIClient):
             return [], "unknown"
 
         try:
-            # DB에서 최근 일봉 데이터 조회
-            data_list = self.db_manager.get_daily_prices(stock_code, days=days)
+            # 최근 일봉 데이터 조회 (일괄 적재된 데이터 우선)
+            cached = self._get_cached_daily_rows(stock_code, days)
+            if cached is not None:
+                data_list = cached.to_dict('records')
+            else:
+                data_list = self.db_manager.get_daily_prices(stock_code, days=days)
 
             if not data_list or len(data_list) < 3:
                 logger.debug(f"⚠️ {stock_code}: DB에 외국인 데이터 부족 (최소 3일 필요)")
@@ -258,7 +335,7 @@ class DataFetcher(KISAPIClient):
             netbuy_list = []
             for data in data_list[:days]:
                 foreign_net_qty = data.get('foreign_net_qty')
-                if foreign_net_qty is not None:
+                if pd.notna(foreign_net_qty):
                     netbuy_list.append(int(foreign_net_qty))
 
             if len(netbuy_list) < 3:
@@ -510,8 +587,6 @@ class DataFetcher(KISAPIClient):
                 if last_time < '090000':
                     break
 
-                time.sleep(0.15)  # API 호출 제한 고려
-
             except Exception as e:
                 logger.error(f"❌ {stock_code}: 분봉 확장 조회 오류: {e}")
                 break
@@ -4,10 +4,274 @@ analyze 디렉토리용
 """
 import pymysql
 import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
 from typing import Dict, List, Optional, Any
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 import time
 
+import pandas as pd
+
+
+def build_connect_params(db_config: Dict[str, Any]) -> Dict[str, Any]:
+    """DB 설정 → pymysql.connect 인자 (필수 항목 검증 포함)"""
+    user = db_config.get('user')
+    password = db_config.get('password')
+    database = db_config.get('database')
+
+    # 필수 항목 체크
+    if not user:
+        raise Exception("DB 사용자(user)가 설정되지 않았습니다.")
+    if not password:
+        raise Exception("DB 비밀번호(password)가 설정되지 않았습니다.")
+    if not database:
+        raise Exception("DB 이름(database)이 설정되지 않았습니다.")
+
+    return {
+        'host': db_config.get('host', 'localhost'),
+        'port': db_config.get('port', 3306),
+        'user': user,
+        'password': password,
+        'database': database,
+        'charset': db_config.get('charset', 'utf8mb4'),
+        'cursorclass': pymysql.cursors.DictCursor,
+        'autocommit': False,
+        'local_infile': db_config.get('local_infile', False)
+    }
+
+
+def explain_query(connection, sql: str, params=None) -> List[Dict[str, Any]]:
+    """SELECT 문의 실행 계획 조회 (별도 커서 사용 - 원래 커서의 결과는 유지)"""
+    with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        cursor.execute(f"EXPLAIN {sql}", params)
+        return list(cursor.fetchall())
+
+
+def timed_execute(cursor, sql: str, params=None, logger=None,
+                  slow_query_ms: Optional[float] = None):
+    """쿼리 실행 + 진단 (slow_query_ms 이상 걸린 SELECT는 EXPLAIN 계획을 로그로 남김)
+
+    Args:
+        cursor: pymysql 커서
+        sql: 쿼리
+        params: 파라미터
+        logger: 로거 객체
+        slow_query_ms: 느린 쿼리 기준(ms), None이면 진단하지 않음
+
+    Returns:
+        cursor: 실행한 커서 (fetchall 등 이어서 호출)
+    """
+    started = time.perf_counter()
+    cursor.execute(sql, params)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    if slow_query_ms is None or elapsed_ms < slow_query_ms:
+        return cursor
+
+    logger = logger or logging.getLogger(__name__)
+    statement = ' '.join(sql.split())
+    logger.warning(f"🐢 느린 쿼리 {elapsed_ms:.0f}ms: {statement[:300]}")
+
+    if statement.upper().startswith('SELECT'):
+        try:
+            for row in explain_query(cursor.connection, sql, params):
+                full_scan = " ⚠️ 전체 스캔" if row.get('type') == 'ALL' else ""
+                logger.warning(f"   └ {row.get('table')}: type={row.get('type')}, key={row.get('key')}, "
+                               f"rows={row.get('rows')}, partitions={row.get('partitions')}, "
+                               f"extra={row.get('Extra')}{full_scan}")
+        except Exception as e:
+            logger.debug(f"EXPLAIN 실패: {e}")
+
+    return cursor
+
+
+class ConnectionPool:
+    """스레드 안전 MySQL 커넥션 풀
+
+    - acquire/release 또는 connection() 컨텍스트 매니저로 대여/반납
+    - 일정 시간(ping_interval) 이상 유휴 상태였던 연결은 대여 전 ping으로 상태 확인,
+      끊어진 연결은 새로 생성 (reconnects 집계)
+    - 최대 연결 수(max_size)를 넘으면 반납될 때까지 대기 (wait_time 집계)
+    """
+
+    def __init__(self, db_config: Dict[str, Any], max_size: int = 5,
+                 timeout: float = 30.0, ping_interval: float = 60.0, logger=None):
+        """
+        Args:
+            db_config: 데이터베이스 설정 딕셔너리
+            max_size: 최대 연결 수
+            timeout: 연결 대여 최대 대기 시간(초)
+            ping_interval: 이 시간(초) 이상 유휴 상태였던 연결은 대여 전 상태 확인
+            logger: 로거 객체
+        """
+        self.connect_params = build_connect_params(db_config)
+        self.max_size = max(1, max_size)
+        self.timeout = timeout
+        self.ping_interval = ping_interval
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.condition = threading.Condition()
+        self.idle = []  # [(connection, 반납 시각)]
+        self.size = 0   # 생성된 연결 수 (대여 중 + 유휴)
+
+        self.metrics = {
+            'checkouts': 0,
+            'created': 0,
+            'reconnects': 0,
+            'wait_time': 0.0,
+            'max_wait_time': 0.0
+        }
+
+    def _create_connection(self):
+        connection = pymysql.connect(**self.connect_params)
+        with self.condition:
+            self.metrics['created'] += 1
+        return connection
+
+    def _is_alive(self, connection) -> bool:
+        try:
+            connection.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+    def acquire(self):
+        """연결 대여 (유휴 연결 재사용, 없으면 생성, 최대치면 대기)"""
+        start = time.monotonic()
+        deadline = start + self.timeout
+
+        with self.condition:
+            while not self.idle and self.size >= self.max_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"DB 커넥션 풀 대기 시간 초과 ({self.timeout}초)")
+                self.condition.wait(remaining)
+
+            if self.idle:
+                connection, released_at = self.idle.pop()
+            else:
+                connection, released_at = None, None
+                self.size += 1
+
+            waited = time.monotonic() - start
+            self.metrics['checkouts'] += 1
+            self.metrics['wait_time'] += waited
+            self.metrics['max_wait_time'] = max(self.metrics['max_wait_time'], waited)
+
+        try:
+            if connection is None:
+                return self._create_connection()
+
+            # 오래 유휴 상태였던 연결은 상태 확인 후 재연결
+            if time.monotonic() - released_at >= self.ping_interval and not self._is_alive(connection):
+                self._close_quietly(connection)
+                connection = self._create_connection()
+                with self.condition:
+                    self.metrics['reconnects'] += 1
+                self.logger.debug("🔄 끊어진 DB 연결 재생성")
+
+            return connection
+
+        except Exception:
+            # 연결 생성 실패 시 자리 반환
+            with self.condition:
+                self.size -= 1
+                self.condition.notify()
+            raise
+
+    def release(self, connection, discard: bool = False):
+        """연결 반납
+
+        Args:
+            connection: acquire로 받은 연결
+            discard: True면 풀에 넣지 않고 닫음 (오류가 난 연결 등)
+        """
+        if discard:
+            self._close_quietly(connection)
+            with self.condition:
+                self.size -= 1
+                self.condition.notify()
+            return
+
+        with self.condition:
+            self.idle.append((connection, time.monotonic()))
+            self.condition.notify()
+
+    @contextmanager
+    def connection(self):
+        """연결 대여 컨텍스트 (정상 종료 시 commit, 예외 시 rollback 후 반납)"""
+        connection = self.acquire()
+        discard = False
+        try:
+            yield connection
+            connection.commit()
+        except Exception:
+            try:
+                connection.rollback()
+            except Exception:
+                discard = True
+            raise
+        finally:
+            self.release(connection, discard=discard)
+
+    def _close_quietly(self, connection):
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """풀 지표 조회 (checkouts, 누적/최대 대기 시간, reconnects, 연결 수)"""
+        with self.condition:
+            metrics = dict(self.metrics)
+            metrics['size'] = self.size
+            metrics['idle'] = len(self.idle)
+            metrics['in_use'] = self.size - len(self.idle)
+        checkouts = metrics['checkouts']
+        metrics['avg_wait_time'] = metrics['wait_time'] / checkouts if checkouts else 0.0
+        return metrics
+
+    def close_all(self):
+        """유휴 연결 모두 닫기"""
+        with self.condition:
+            idle, self.idle = self.idle, []
+            self.size -= len(idle)
+        for connection, _ in idle:
+            self._close_quietly(connection)
+
+
+_pools: Dict[tuple, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_connection_pool(db_config: Dict[str, Any], logger=None) -> ConnectionPool:
+    """프로세스 공용 커넥션 풀 조회 (같은 host/port/user/database면 같은 풀 공유)
+
+    풀 설정은 db_config의 pool_size(기본 5), pool_timeout(기본 30초),
+    pool_ping_interval(기본 60초)을 사용
+    """
+    key = (
+        db_config.get('host', 'localhost'),
+        db_config.get('port', 3306),
+        db_config.get('user'),
+        db_config.get('database')
+    )
+
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(
+                db_config,
+                max_size=db_config.get('pool_size', 5),
+                timeout=db_config.get('pool_timeout', 30.0),
+                ping_interval=db_config.get('pool_ping_interval', 60.0),
+                logger=logger
+            )
+            _pools[key] = pool
+        return pool
+
 
 class DBManager:
     """MySQL 데이터베이스 관리 클래스"""
@@ -22,38 +286,20 @@ class DBManager:
         self.logger = logger or logging.getLogger(__name__)
         self.connection = None
         self.cursor = None
+        
+        # 쿼리 진단 모드 (database.query_diagnostics 또는 환경변수 DB_QUERY_DIAGNOSTICS=1)
+        self.query_diagnostics = bool(db_config.get('query_diagnostics')) or \
+            os.getenv('DB_QUERY_DIAGNOSTICS', '') in ('1', 'true', 'yes')
+        self.slow_query_ms = float(db_config.get('slow_query_ms', 200))
     
     def connect(self) -> bool:
         """데이터베이스 연결"""
         try:
-            # 설정값 확인
-            host = self.config.get('host', 'localhost')
-            port = self.config.get('port', 3306)
-            user = self.config.get('user')
-            password = self.config.get('password')
-            database = self.config.get('database')
-            charset = self.config.get('charset', 'utf8mb4')
+            params = build_connect_params(self.config)
             
-            # 필수 항목 체크
-            if not user:
-                raise Exception("DB 사용자(user)가 설정되지 않았습니다.")
-            if not password:
-                raise Exception("DB 비밀번호(password)가 설정되지 않았습니다.")
-            if not database:
-                raise Exception("DB 이름(database)이 설정되지 않았습니다.")
+            self.logger.debug(f"DB 연결 시도: {params['user']}@{params['host']}:{params['port']}/{params['database']}")
             
-            self.logger.debug(f"DB 연결 시도: {user}@{host}:{port}/{database}")
-            
-            self.connection = pymysql.connect(
-                host=host,
-                port=port,
-                user=user,
-                password=password,
-                database=database,
-                charset=charset,
-                cursorclass=pymysql.cursors.DictCursor,
-                autocommit=False
-            )
+            self.connection = pymysql.connect(**params)
             self.cursor = self.connection.cursor()
             self.logger.info("✅ 데이터베이스 연결 성공")
             return True
@@ -72,6 +318,90 @@ class DBManager:
         except Exception as e:
             self.logger.error(f"⚠️ 연결 해제 중 오류: {e}")
     
+    # ------------------------------------------------------------
+    # 쿼리 헬퍼
+    # ------------------------------------------------------------
+    @staticmethod
+    def range_condition(column: str, start=None, end=None) -> tuple:
+        """반열린 구간 조건 (column >= start AND column < end)
+
+        인덱스 컬럼에 DATE() 등 함수를 씌우지 않아 인덱스 범위 스캔/파티션 프루닝이 가능하고,
+        종료값은 항상 미포함이라 DATE/DATETIME 경계 중복이 없음
+
+        Args:
+            column: 컬럼명
+            start: 시작값 (포함, None이면 하한 없음)
+            end: 종료값 (미포함, None이면 상한 없음)
+
+        Returns:
+            tuple: (조건 SQL, 파라미터 리스트) - 조건이 없으면 ('1 = 1', [])
+        """
+        conditions, params = [], []
+        if start is not None:
+            conditions.append(f"{column} >= %s")
+            params.append(start)
+        if end is not None:
+            conditions.append(f"{column} < %s")
+            params.append(end)
+        return (' AND '.join(conditions) or '1 = 1'), params
+
+    @classmethod
+    def date_condition(cls, column: str, start_date: date, end_date: Optional[date] = None) -> tuple:
+        """날짜 범위 조건 (start_date 00:00 이상 ~ end_date 다음날 00:00 미만)
+
+        DATETIME 컬럼의 'DATE(column) = 날짜' / 'DATE(column) BETWEEN a AND b' 대체용
+
+        Args:
+            column: 컬럼명
+            start_date: 시작일 (포함)
+            end_date: 종료일 (포함, None이면 start_date 하루)
+        """
+        start = datetime.combine(start_date, datetime.min.time())
+        end = datetime.combine(end_date or start_date, datetime.min.time()) + timedelta(days=1)
+        return cls.range_condition(column, start, end)
+
+    def execute(self, sql: str, params=None):
+        """현재 커서로 쿼리 실행 (진단 모드면 느린 SELECT의 EXPLAIN 계획 로그)
+
+        Returns:
+            cursor: 실행한 커서
+        """
+        slow_query_ms = self.slow_query_ms if self.query_diagnostics else None
+        return timed_execute(self.cursor, sql, params, self.logger, slow_query_ms)
+
+    @property
+    def pool(self) -> ConnectionPool:
+        """프로세스 공용 커넥션 풀 (같은 DB 설정을 쓰는 DBManager끼리 공유)"""
+        return get_connection_pool(self.config, self.logger)
+    
+    @contextmanager
+    def session(self):
+        """풀에서 연결을 빌려 with 블록 동안 이 인스턴스의 connection/cursor로 사용
+        
+        connect()/disconnect() 대신 사용하면 매번 TCP 연결/인증을 하지 않고
+        기존 연결을 재사용함. 정상 종료 시 commit, 예외 시 rollback 후 반납.
+        (같은 인스턴스를 여러 스레드에서 동시에 session으로 쓰지 말 것 -
+         스레드별로 DBManager를 만들면 풀은 공유됨)
+        
+        사용 예:
+            with db_manager.session() as db:
+                rows = db.get_daily_prices('005930', 30)
+        """
+        previous = (self.connection, self.cursor)
+        
+        with self.pool.connection() as connection:
+            self.connection = connection
+            self.cursor = connection.cursor()
+            try:
+                yield self
+            finally:
+                self.cursor.close()
+                self.connection, self.cursor = previous
+    
+    def get_pool_metrics(self) -> Dict[str, Any]:
+        """커넥션 풀 지표 (checkouts, wait_time, reconnects 등)"""
+        return self.pool.get_metrics()
+    
     def create_tables(self) -> bool:
         """필요한 테이블 생성"""
         try:
@@ -141,8 +471,33 @@ class DBManager:
             ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='배치 실행 이력';
             """
 
+            # 일봉 기술적 지표 테이블 (수집 후 단계에서 계산, 지수이동평균은 다음 증분 계산의 시작 상태)
+            create_daily_indicators = """
+            CREATE TABLE IF NOT EXISTS daily_indicators (
+                stock_code VARCHAR(6) NOT NULL COMMENT '종목코드',
+                trade_date DATE NOT NULL COMMENT '거래일자',
+                close_price INT NOT NULL COMMENT '종가',
+                ma5 DOUBLE COMMENT '5일 이동평균',
+                ma20 DOUBLE COMMENT '20일 이동평균 (볼린저밴드 중심선)',
+                ma60 DOUBLE COMMENT '60일 이동평균',
+                bb_upper DOUBLE COMMENT '볼린저밴드 상단 (20일, 2σ)',
+                bb_lower DOUBLE COMMENT '볼린저밴드 하단 (20일, 2σ)',
+                rsi14 DOUBLE COMMENT 'RSI (14일)',
+                ema12 DOUBLE COMMENT '12일 지수이동평균',
+                ema26 DOUBLE COMMENT '26일 지수이동평균',
+                macd DOUBLE COMMENT 'MACD 라인',
+                macd_signal DOUBLE COMMENT 'MACD Signal 라인',
+                macd_hist DOUBLE COMMENT 'MACD 히스토그램',
+                volume_ma20 DOUBLE COMMENT '20일 평균 거래량',
+                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정일시',
+                PRIMARY KEY (stock_code, trade_date),
+                INDEX idx_date (trade_date DESC)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='일봉 기술적 지표';
+            """
+
             # 분봉 데이터 테이블 (외래 키 없이 독립적으로 운영)
-            create_minute_prices = """
+            # 거래일시 기준 RANGE 파티션 - 보관 기간 정리는 DROP PARTITION, 날짜 조건 조회는 파티션 프루닝
+            create_minute_prices = f"""
             CREATE TABLE IF NOT EXISTS minute_stock_prices (
                 stock_code VARCHAR(6) NOT NULL COMMENT '종목코드',
                 trade_datetime DATETIME NOT NULL COMMENT '거래일시',
@@ -156,15 +511,20 @@ class DBManager:
                 PRIMARY KEY (stock_code, trade_datetime),
                 INDEX idx_code_datetime (stock_code, trade_datetime DESC),
                 INDEX idx_datetime (trade_datetime DESC)
-            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='분봉 주가 데이터';
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='분봉 주가 데이터'
+            {self._minute_partition_clause(date.today())};
             """
 
             self.cursor.execute(create_stock_info)
             self.cursor.execute(create_daily_prices)
             self.cursor.execute(create_batch_history)
+            self.cursor.execute(create_daily_indicators)
             self.cursor.execute(create_minute_prices)
             self.connection.commit()
             
+            # 분봉 파티션 유지 (앞으로 사용할 파티션 미리 생성)
+            self.ensure_minute_partitions()
+            
             self.logger.info("✅ 테이블 생성/확인 완료")
             return True
             
@@ -357,8 +717,46 @@ class DBManager:
             self.logger.error(f"❌ 펀더멘털 데이터 조회 실패 ({stock_code}): {e}")
             return None
 
+    # daily_stock_prices INSERT 컬럼 순서 (튜플 기반 삽입 시 이 순서를 따름)
+    DAILY_PRICE_COLUMNS = (
+        'stock_code', 'trade_date', 'open_price', 'high_price', 'low_price',
+        'close_price', 'volume', 'trading_value',
+        'foreign_buy_qty', 'foreign_sell_qty', 'foreign_net_qty',
+        'institution_buy_qty', 'institution_sell_qty', 'institution_net_qty',
+        'individual_buy_qty', 'individual_sell_qty', 'individual_net_qty'
+    )
+
+    # 일봉 조회 컬럼 (DB 컬럼, API 응답 형식 별칭) - get_daily_prices와 동일한 별칭
+    DAILY_PRICE_SELECT = (
+        ('stock_code', 'stock_code'), ('trade_date', 'stck_bsop_date'),
+        ('open_price', 'stck_oprc'), ('high_price', 'stck_hgpr'),
+        ('low_price', 'stck_lwpr'), ('close_price', 'stck_clpr'),
+        ('volume', 'acml_vol'), ('trading_value', 'acml_tr_pbmn'),
+        ('foreign_buy_qty', 'foreign_buy_qty'), ('foreign_sell_qty', 'foreign_sell_qty'),
+        ('foreign_net_qty', 'foreign_net_qty'),
+        ('institution_buy_qty', 'institution_buy_qty'), ('institution_sell_qty', 'institution_sell_qty'),
+        ('institution_net_qty', 'institution_net_qty'),
+        ('individual_buy_qty', 'individual_buy_qty'), ('individual_sell_qty', 'individual_sell_qty'),
+        ('individual_net_qty', 'individual_net_qty')
+    )
+
     def bulk_insert_daily_prices(self, data_list: List[Dict[str, Any]]) -> tuple:
         """일봉 데이터 대량 삽입 (투자자별 매매 데이터 포함)"""
+        values = [
+            tuple(data.get(col) for col in self.DAILY_PRICE_COLUMNS)
+            for data in data_list
+        ]
+        return self.bulk_insert_daily_price_rows(values)
+
+    def bulk_insert_daily_price_rows(self, rows: List[tuple]) -> tuple:
+        """일봉 데이터 대량 삽입 (DAILY_PRICE_COLUMNS 순서의 튜플 리스트)
+
+        Args:
+            rows: executemany에 바로 전달할 튜플 리스트
+
+        Returns:
+            tuple: (성공 건수, 실패 건수)
+        """
         success_count = 0
         fail_count = 0
         
@@ -392,34 +790,12 @@ class DBManager:
                 individual_net_qty = VALUES(individual_net_qty)
             """
             
-            values = []
-            for data in data_list:
-                values.append((
-                    data.get('stock_code'),
-                    data.get('trade_date'),
-                    data.get('open_price'),
-                    data.get('high_price'),
-                    data.get('low_price'),
-                    data.get('close_price'),
-                    data.get('volume'),
-                    data.get('trading_value'),
-                    data.get('foreign_buy_qty'),
-                    data.get('foreign_sell_qty'),
-                    data.get('foreign_net_qty'),
-                    data.get('institution_buy_qty'),
-                    data.get('institution_sell_qty'),
-                    data.get('institution_net_qty'),
-                    data.get('individual_buy_qty'),
-                    data.get('individual_sell_qty'),
-                    data.get('individual_net_qty')
-                ))
-            
-            self.cursor.executemany(sql, values)
-            success_count = len(data_list)
+            self.cursor.executemany(sql, rows)
+            success_count = len(rows)
             
         except Exception as e:
             self.logger.error(f"❌ 대량 삽입 실패: {e}")
-            fail_count = len(data_list)
+            fail_count = len(rows)
         
         return success_count, fail_count
     
@@ -524,6 +900,292 @@ class DBManager:
             self.logger.error(f"❌ 일봉 데이터 조회 실패 ({stock_code}): {e}")
             return None
 
+    def get_latest_trade_dates(self, stock_codes: Optional[List[str]] = None) -> Dict[str, date]:
+        """종목별 마지막 저장 거래일 조회 (단일 GROUP BY 쿼리)
+
+        Args:
+            stock_codes: 조회할 종목코드 리스트 (None이면 전체)
+
+        Returns:
+            Dict[str, date]: {종목코드: 마지막 거래일} (데이터 없는 종목은 제외)
+        """
+        try:
+            sql = """
+            SELECT stock_code, MAX(trade_date) AS last_date
+            FROM daily_stock_prices
+            """
+            params = ()
+
+            if stock_codes:
+                placeholders = ', '.join(['%s'] * len(stock_codes))
+                sql += f" WHERE stock_code IN ({placeholders})"
+                params = tuple(stock_codes)
+
+            sql += " GROUP BY stock_code"
+
+            self.cursor.execute(sql, params)
+            results = self.cursor.fetchall()
+
+            return {row['stock_code']: row['last_date'] for row in results if row['last_date']}
+
+        except Exception as e:
+            self.logger.error(f"❌ 마지막 거래일 조회 실패: {e}")
+            return {}
+
+    def get_daily_prices_bulk(self, stock_codes: List[str], start_date: date,
+                              end_date: Optional[date] = None,
+                              chunk_size: int = 500) -> pd.DataFrame:
+        """여러 종목 일봉 데이터 일괄 조회 (종목별 반복 쿼리 대신 IN 목록 + 기간 조건)
+
+        (stock_code, trade_date) 기본키 범위 스캔으로 처리되며,
+        종목 수가 많으면 chunk_size 단위로 나누어 조회
+
+        Args:
+            stock_codes: 종목코드 리스트
+            start_date: 시작일 (포함)
+            end_date: 종료일 (포함, None이면 제한 없음)
+            chunk_size: 쿼리당 종목 수
+
+        Returns:
+            DataFrame: long format (stock_code, stck_bsop_date(YYYYMMDD), stck_oprc, ...)
+                       stock_code, 날짜 오름차순 정렬 / 조회 실패 시 빈 DataFrame
+        """
+        columns = ['stock_code', 'stck_bsop_date'] + [alias for _, alias in self.DAILY_PRICE_SELECT[2:]]
+        if not stock_codes:
+            return pd.DataFrame(columns=columns)
+
+        select_list = ',\n                    '.join(f"{col} AS {alias}" for col, alias in self.DAILY_PRICE_SELECT)
+        stock_codes = list(dict.fromkeys(stock_codes))
+        rows = []
+
+        try:
+            for i in range(0, len(stock_codes), chunk_size):
+                chunk = stock_codes[i:i + chunk_size]
+                placeholders = ', '.join(['%s'] * len(chunk))
+
+                date_sql, date_params = self.range_condition(
+                    'trade_date', start_date, end_date + timedelta(days=1) if end_date else None
+                )
+                sql = f"""
+                SELECT
+                    {select_list}
+                FROM daily_stock_prices
+                WHERE stock_code IN ({placeholders})
+                  AND {date_sql}
+                """
+
+                rows.extend(self.execute(sql, tuple(chunk) + tuple(date_params)).fetchall())
+
+        except Exception as e:
+            self.logger.error(f"❌ 일봉 데이터 일괄 조회 실패: {e}")
+            return pd.DataFrame(columns=columns)
+
+        if not rows:
+            return pd.DataFrame(columns=columns)
+
+        df = pd.DataFrame(rows, columns=columns)
+        df['stck_bsop_date'] = pd.to_datetime(df['stck_bsop_date']).dt.strftime('%Y%m%d')
+        df = df.sort_values(['stock_code', 'stck_bsop_date']).reset_index(drop=True)
+
+        self.logger.debug(f"💾 일봉 일괄 조회: {df['stock_code'].nunique()}종목, {len(df)}행")
+        return df
+
+    def get_latest_close_bulk(self, stock_codes: List[str], as_of: Optional[date] = None,
+                              lookback_days: int = 10) -> Dict[str, int]:
+        """여러 종목의 기준일 이전 마지막 종가 일괄 조회 (단일 쿼리)
+
+        Args:
+            stock_codes: 종목코드 리스트
+            as_of: 기준일 (포함, None이면 오늘)
+            lookback_days: 기준일로부터 조회할 최대 일수 (주말/휴장일 고려)
+
+        Returns:
+            Dict[str, int]: {종목코드: 종가} (기간 내 데이터 없는 종목은 제외)
+        """
+        if not stock_codes:
+            return {}
+
+        as_of = as_of or date.today()
+        since = as_of - timedelta(days=lookback_days)
+        stock_codes = list(dict.fromkeys(stock_codes))
+
+        try:
+            placeholders = ', '.join(['%s'] * len(stock_codes))
+            date_sql, date_params = self.range_condition('trade_date', since, as_of + timedelta(days=1))
+            sql = f"""
+            SELECT p.stock_code, p.close_price
+            FROM daily_stock_prices p
+            JOIN (
+                SELECT stock_code, MAX(trade_date) AS last_date
+                FROM daily_stock_prices
+                WHERE stock_code IN ({placeholders})
+                  AND {date_sql}
+                GROUP BY stock_code
+            ) latest
+              ON p.stock_code = latest.stock_code
+             AND p.trade_date = latest.last_date
+            """
+
+            results = self.execute(sql, tuple(stock_codes) + tuple(date_params)).fetchall()
+
+            return {
+                row['stock_code']: int(row['close_price'])
+                for row in results if row['close_price']
+            }
+
+        except Exception as e:
+            self.logger.error(f"❌ 종가 일괄 조회 실패: {e}")
+            return {}
+
+    # 일봉 기술적 지표 컬럼 (bulk_upsert_daily_indicators 튜플 순서)
+    DAILY_INDICATOR_COLUMNS = (
+        'stock_code', 'trade_date', 'close_price', 'ma5', 'ma20', 'ma60',
+        'bb_upper', 'bb_lower', 'rsi14', 'ema12', 'ema26',
+        'macd', 'macd_signal', 'macd_hist', 'volume_ma20'
+    )
+
+    def get_daily_closes(self, stock_code: str, after: Optional[date] = None,
+                         lookback_rows: int = 0) -> List[Dict]:
+        """지표 계산용 종가/거래량 조회 (after 이후 전체 + after 이전 lookback_rows개 거래일)
+
+        Args:
+            stock_code: 종목코드
+            after: 기준일 (None이면 전체 이력)
+            lookback_rows: 기준일 포함 이전 거래일 행 수 (이동평균 창 채우기용)
+
+        Returns:
+            List[Dict]: [{'trade_date', 'close_price', 'volume'}] (날짜 오름차순)
+        """
+        try:
+            rows = []
+            if after is not None and lookback_rows > 0:
+                # 기본키 역방향 범위 스캔 (LIMIT)
+                self.execute("""
+                SELECT trade_date, close_price, volume
+                FROM daily_stock_prices
+                WHERE stock_code = %s
+                  AND trade_date <= %s
+                ORDER BY trade_date DESC
+                LIMIT %s
+                """, (stock_code, after, lookback_rows))
+                rows = list(reversed(self.cursor.fetchall()))
+
+            date_sql, date_params = self.range_condition(
+                'trade_date', after + timedelta(days=1) if after else None
+            )
+            self.execute(f"""
+            SELECT trade_date, close_price, volume
+            FROM daily_stock_prices
+            WHERE stock_code = %s
+              AND {date_sql}
+            ORDER BY trade_date ASC
+            """, (stock_code, *date_params))
+            return rows + list(self.cursor.fetchall())
+
+        except Exception as e:
+            self.logger.error(f"❌ 지표 계산용 일봉 조회 실패 ({stock_code}): {e}")
+            return []
+
+    def get_indicator_state(self, stock_code: str, before: Optional[date] = None) -> Optional[Dict]:
+        """증분 계산 시작 상태 (before 이전 마지막 지표 행, None이면 마지막 행)"""
+        try:
+            date_sql, date_params = self.range_condition('trade_date', None, before)
+            self.execute(f"""
+            SELECT {', '.join(self.DAILY_INDICATOR_COLUMNS)}
+            FROM daily_indicators
+            WHERE stock_code = %s
+              AND {date_sql}
+            ORDER BY trade_date DESC
+            LIMIT 1
+            """, (stock_code, *date_params))
+            return self.cursor.fetchone()
+
+        except Exception as e:
+            self.logger.error(f"❌ 지표 상태 조회 실패 ({stock_code}): {e}")
+            return None
+
+    def bulk_upsert_daily_indicators(self, rows: List[tuple], batch_size: int = 5000) -> Dict[str, Any]:
+        """일봉 기술적 지표 대량 upsert (DAILY_INDICATOR_COLUMNS 순서 튜플, 결과는 bulk_upsert 참고)"""
+        return self.bulk_upsert(
+            'daily_indicators', list(self.DAILY_INDICATOR_COLUMNS), rows,
+            key_columns=['stock_code', 'trade_date'], batch_size=batch_size
+        )
+
+    def get_daily_indicators(self, stock_code: str, start_date: Optional[date] = None,
+                             end_date: Optional[date] = None) -> pd.DataFrame:
+        """저장된 일봉 기술적 지표 조회 (기본키 범위 스캔, 재계산 없이 사용)
+
+        Args:
+            stock_code: 종목코드
+            start_date: 시작일 (포함, None이면 처음부터)
+            end_date: 종료일 (포함, None이면 끝까지)
+
+        Returns:
+            DataFrame: DAILY_INDICATOR_COLUMNS 컬럼 (날짜 오름차순) / 없거나 실패 시 빈 DataFrame
+        """
+        columns = list(self.DAILY_INDICATOR_COLUMNS)
+        try:
+            date_sql, date_params = self.range_condition(
+                'trade_date', start_date, end_date + timedelta(days=1) if end_date else None
+            )
+            self.execute(f"""
+            SELECT {', '.join(columns)}
+            FROM daily_indicators
+            WHERE stock_code = %s
+              AND {date_sql}
+            ORDER BY trade_date ASC
+            """, (stock_code, *date_params))
+            return pd.DataFrame(list(self.cursor.fetchall()), columns=columns)
+
+        except Exception as e:
+            self.logger.error(f"❌ 지표 조회 실패 ({stock_code}): {e}")
+            return pd.DataFrame(columns=columns)
+
+    def get_latest_indicators_bulk(self, stock_codes: List[str], as_of: Optional[date] = None,
+                                   lookback_days: int = 10) -> Dict[str, Dict]:
+        """여러 종목의 기준일 이전 마지막 지표 행 일괄 조회 (단일 쿼리)
+
+        Args:
+            stock_codes: 종목코드 리스트
+            as_of: 기준일 (포함, None이면 오늘)
+            lookback_days: 기준일로부터 조회할 최대 일수 (주말/휴장일 고려)
+
+        Returns:
+            Dict[str, Dict]: {종목코드: 지표 행} (기간 내 지표 없는 종목은 제외)
+        """
+        if not stock_codes:
+            return {}
+
+        as_of = as_of or date.today()
+        stock_codes = list(dict.fromkeys(stock_codes))
+
+        try:
+            placeholders = ', '.join(['%s'] * len(stock_codes))
+            date_sql, date_params = self.range_condition(
+                'trade_date', as_of - timedelta(days=lookback_days), as_of + timedelta(days=1)
+            )
+            select_list = ', '.join(f"i.{col}" for col in self.DAILY_INDICATOR_COLUMNS)
+            sql = f"""
+            SELECT {select_list}
+            FROM daily_indicators i
+            JOIN (
+                SELECT stock_code, MAX(trade_date) AS last_date
+                FROM daily_indicators
+                WHERE stock_code IN ({placeholders})
+                  AND {date_sql}
+                GROUP BY stock_code
+            ) latest
+              ON i.stock_code = latest.stock_code
+             AND i.trade_date = latest.last_date
+            """
+
+            results = self.execute(sql, tuple(stock_codes) + tuple(date_params)).fetchall()
+            return {row['stock_code']: row for row in results}
+
+        except Exception as e:
+            self.logger.error(f"❌ 최신 지표 일괄 조회 실패: {e}")
+            return {}
+
     def bulk_insert_minute_prices(self, data_list: List[Dict[str, Any]]) -> tuple:
         """분봉 데이터 대량 삽입
 
@@ -576,6 +1238,208 @@ class DBManager:
 
         return success_count, fail_count
 
+    # minute_stock_prices INSERT 컬럼 순서 (튜플 기반 삽입 시 이 순서를 따름)
+    MINUTE_PRICE_COLUMNS = (
+        'stock_code', 'trade_datetime', 'open_price', 'high_price', 'low_price',
+        'close_price', 'volume', 'trading_value'
+    )
+
+    def bulk_upsert(self, table: str, columns: List[str], rows: List[tuple],
+                    key_columns: List[str], batch_size: int = 5000,
+                    use_load_data: bool = False) -> Dict[str, Any]:
+        """대량 upsert (임시 테이블 적재 후 한 번의 INSERT ... SELECT로 병합)
+
+        배치마다 행을 세션 임시 테이블에 적재(LOAD DATA LOCAL INFILE 또는
+        다중 행 INSERT)한 뒤 대상 테이블로 한 문장에 병합하므로
+        100건 단위 executemany보다 왕복 횟수가 크게 줄어듦.
+        커밋은 호출자가 수행.
+
+        Args:
+            table: 대상 테이블명
+            columns: 컬럼 리스트 (rows 튜플 순서와 동일)
+            rows: 저장할 튜플 리스트
+            key_columns: 기본키 컬럼 (ON DUPLICATE KEY UPDATE 대상에서 제외)
+            batch_size: 배치당 행 수
+            use_load_data: True면 LOAD DATA LOCAL INFILE로 적재 (실패 시 다중 행 INSERT로 대체,
+                           DB 설정에 local_infile: true 필요)
+
+        Returns:
+            Dict: {'success': 성공 건수, 'fail': 실패 건수, 'method': 적재 방식,
+                   'elapsed': 총 소요 시간(초), 'rows_per_sec': 초당 행 수,
+                   'batches': [{'rows', 'stage_sec', 'merge_sec'}, ...]}
+        """
+        result = {
+            'success': 0,
+            'fail': 0,
+            'method': 'load_data' if use_load_data else 'multi_row',
+            'elapsed': 0.0,
+            'rows_per_sec': 0.0,
+            'batches': []
+        }
+        if not rows:
+            return result
+
+        stage_table = f"tmp_stage_{table}"
+        column_sql = ', '.join(columns)
+        update_sql = ',\n                '.join(
+            f"{col} = VALUES({col})" for col in columns if col not in key_columns
+        )
+        stage_insert_sql = (
+            f"INSERT INTO {stage_table} ({column_sql}) "
+            f"VALUES ({', '.join(['%s'] * len(columns))})"
+        )
+        merge_sql = f"""
+            INSERT INTO {table} ({column_sql})
+            SELECT {column_sql} FROM {stage_table}
+            ON DUPLICATE KEY UPDATE
+                {update_sql}
+        """
+
+        start_time = time.perf_counter()
+
+        try:
+            # 인덱스/제약 없는 임시 테이블 (세션 종료 시 자동 삭제)
+            self.cursor.execute(f"DROP TEMPORARY TABLE IF EXISTS {stage_table}")
+            self.cursor.execute(
+                f"CREATE TEMPORARY TABLE {stage_table} AS "
+                f"SELECT {column_sql} FROM {table} WHERE 1 = 0"
+            )
+        except Exception as e:
+            self.logger.error(f"❌ 임시 테이블 생성 실패 ({table}): {e}")
+            result['fail'] = len(rows)
+            return result
+
+        for i in range(0, len(rows), batch_size):
+            batch = rows[i:i + batch_size]
+
+            try:
+                stage_start = time.perf_counter()
+                self.cursor.execute(f"DELETE FROM {stage_table}")
+
+                if result['method'] == 'load_data':
+                    try:
+                        self._load_data_infile(stage_table, columns, batch)
+                    except Exception as e:
+                        self.logger.warning(f"⚠️ LOAD DATA 실패, 다중 행 INSERT로 전환: {e}")
+                        result['method'] = 'multi_row'
+                        self.cursor.execute(f"DELETE FROM {stage_table}")
+
+                if result['method'] == 'multi_row':
+                    # pymysql은 INSERT ... VALUES executemany를 다중 행 INSERT 문으로 묶어 전송
+                    self.cursor.executemany(stage_insert_sql, batch)
+
+                merge_start = time.perf_counter()
+                self.cursor.execute(merge_sql)
+                merge_end = time.perf_counter()
+
+                batch_stats = {
+                    'rows': len(batch),
+                    'stage_sec': merge_start - stage_start,
+                    'merge_sec': merge_end - merge_start
+                }
+                result['batches'].append(batch_stats)
+                result['success'] += len(batch)
+
+                self.logger.debug(
+                    f"  📦 {table} 배치 {len(result['batches'])}: {len(batch)}건 "
+                    f"(적재 {batch_stats['stage_sec']:.3f}초, 병합 {batch_stats['merge_sec']:.3f}초)"
+                )
+
+            except Exception as e:
+                self.logger.error(f"❌ {table} 배치 저장 실패 ({len(batch)}건): {e}")
+                result['fail'] += len(batch)
+
+        try:
+            self.cursor.execute(f"DROP TEMPORARY TABLE IF EXISTS {stage_table}")
+        except Exception as e:
+            self.logger.debug(f"임시 테이블 삭제 실패 ({stage_table}): {e}")
+
+        result['elapsed'] = time.perf_counter() - start_time
+        if result['elapsed'] > 0:
+            result['rows_per_sec'] = result['success'] / result['elapsed']
+
+        return result
+
+    def _load_data_infile(self, stage_table: str, columns: List[str], rows: List[tuple]):
+        """임시 TSV 파일을 만들어 LOAD DATA LOCAL INFILE로 적재"""
+        def to_field(value):
+            if value is None:
+                return '\\N'
+            if isinstance(value, datetime):
+                return value.strftime('%Y-%m-%d %H:%M:%S')
+            if isinstance(value, date):
+                return value.strftime('%Y-%m-%d')
+            return str(value).replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n')
+
+        fd, path = tempfile.mkstemp(prefix=f"{stage_table}_", suffix='.tsv')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                for row in rows:
+                    f.write('\t'.join(to_field(value) for value in row))
+                    f.write('\n')
+
+            self.cursor.execute(
+                f"LOAD DATA LOCAL INFILE %s INTO TABLE {stage_table} "
+                f"CHARACTER SET utf8mb4 "
+                f"FIELDS TERMINATED BY '\\t' LINES TERMINATED BY '\\n' "
+                f"({', '.join(columns)})",
+                (path,)
+            )
+        finally:
+            os.remove(path)
+
+    def bulk_upsert_daily_price_rows(self, rows: List[tuple], batch_size: int = 5000,
+                                     use_load_data: bool = False) -> Dict[str, Any]:
+        """일봉 데이터 대량 upsert (DAILY_PRICE_COLUMNS 순서 튜플, 결과는 bulk_upsert 참고)"""
+        return self.bulk_upsert(
+            'daily_stock_prices', list(self.DAILY_PRICE_COLUMNS), rows,
+            key_columns=['stock_code', 'trade_date'],
+            batch_size=batch_size, use_load_data=use_load_data
+        )
+
+    def bulk_upsert_minute_prices(self, data_list: List[Dict[str, Any]], batch_size: int = 5000,
+                                  use_load_data: bool = False) -> Dict[str, Any]:
+        """분봉 데이터 대량 upsert (레코드 dict 리스트, 결과는 bulk_upsert 참고)"""
+        rows = [
+            tuple(data.get(col) for col in self.MINUTE_PRICE_COLUMNS)
+            for data in data_list
+        ]
+        return self.bulk_upsert(
+            'minute_stock_prices', list(self.MINUTE_PRICE_COLUMNS), rows,
+            key_columns=['stock_code', 'trade_datetime'],
+            batch_size=batch_size, use_load_data=use_load_data
+        )
+
+    def get_latest_minute_datetimes(self, stock_codes: List[str]) -> Dict[str, datetime]:
+        """종목별 마지막 저장 분봉 시각 조회 (단일 GROUP BY 쿼리, 기본키 범위 스캔)
+
+        Args:
+            stock_codes: 조회할 종목코드 리스트
+
+        Returns:
+            Dict[str, datetime]: {종목코드: 마지막 분봉 시각} (데이터 없는 종목은 제외)
+        """
+        if not stock_codes:
+            return {}
+
+        try:
+            placeholders = ', '.join(['%s'] * len(stock_codes))
+            sql = f"""
+            SELECT stock_code, MAX(trade_datetime) AS last_datetime
+            FROM minute_stock_prices
+            WHERE stock_code IN ({placeholders})
+            GROUP BY stock_code
+            """
+
+            self.cursor.execute(sql, tuple(stock_codes))
+            results = self.cursor.fetchall()
+
+            return {row['stock_code']: row['last_datetime'] for row in results if row['last_datetime']}
+
+        except Exception as e:
+            self.logger.error(f"❌ 마지막 분봉 시각 조회 실패: {e}")
+            return {}
+
     def get_minute_prices(self, stock_code: str, minutes: int = 60) -> Optional[List[Dict]]:
         """DB에서 분봉 데이터 조회
 
@@ -623,7 +1487,9 @@ class DBManager:
             List[Dict]: 분봉 데이터 리스트 또는 None
         """
         try:
-            sql = """
+            # 반열린 구간 (기본키 범위 스캔 + 파티션 프루닝)
+            date_sql, date_params = self.date_condition('trade_datetime', trade_date)
+            sql = f"""
             SELECT
                 stock_code,
                 trade_datetime,
@@ -635,12 +1501,11 @@ class DBManager:
                 trading_value
             FROM minute_stock_prices
             WHERE stock_code = %s
-              AND DATE(trade_datetime) = %s
+              AND {date_sql}
             ORDER BY trade_datetime ASC
             """
 
-            self.cursor.execute(sql, (stock_code, trade_date))
-            results = self.cursor.fetchall()
+            results = self.execute(sql, (stock_code, *date_params)).fetchall()
 
             return results if results else None
 
@@ -648,23 +1513,234 @@ class DBManager:
             self.logger.error(f"❌ 분봉 데이터 조회 실패 ({stock_code}): {e}")
             return None
 
+    def get_minute_closes_by_date(self, trade_date: date) -> Optional[List[Dict]]:
+        """특정 날짜 전 종목 분봉 종가 조회 (분봉 차트 뷰어용)
+
+        Returns:
+            List[Dict]: [{'stock_code', 'trade_datetime', 'close_price'}] (종목, 시간 오름차순)
+            None: 조회 실패 (분봉이 없는 날의 빈 리스트와 구분)
+        """
+        try:
+            date_sql, date_params = self.date_condition('trade_datetime', trade_date)
+            sql = f"""
+            SELECT
+                stock_code,
+                trade_datetime,
+                close_price
+            FROM minute_stock_prices
+            WHERE {date_sql}
+              AND close_price > 0
+            ORDER BY stock_code, trade_datetime ASC
+            """
+
+            return list(self.execute(sql, tuple(date_params)).fetchall())
+
+        except Exception as e:
+            self.logger.error(f"❌ 분봉 종가 조회 실패 ({trade_date}): {e}")
+            return None
+
+    # ------------------------------------------------------------
+    # 분봉 파티션 관리
+    # ------------------------------------------------------------
+    MINUTE_PARTITION_UNITS = ('day', 'month')
+
+    @property
+    def minute_partition_unit(self) -> str:
+        """분봉 파티션 단위 (database.minute_partition: day | month, 기본 day)"""
+        unit = self.config.get('minute_partition', 'day')
+        return unit if unit in self.MINUTE_PARTITION_UNITS else 'day'
+
+    @property
+    def minute_partition_ahead(self) -> int:
+        """미리 만들어 둘 분봉 파티션 기간 (일, database.minute_partition_ahead)"""
+        return int(self.config.get('minute_partition_ahead', 7))
+
+    @staticmethod
+    def _to_days(value: date) -> int:
+        """MySQL TO_DAYS()와 같은 값"""
+        return value.toordinal() + 365
+
+    @staticmethod
+    def _from_days(value: int) -> date:
+        """MySQL TO_DAYS() 값 → date"""
+        return date.fromordinal(value - 365)
+
+    def _minute_partition_bounds(self, start: date, end: date) -> List[tuple]:
+        """start ~ end를 덮는 파티션 목록 [(파티션명, 상한일(미포함))]"""
+        bounds = []
+
+        if self.minute_partition_unit == 'month':
+            current = start.replace(day=1)
+            while current <= end:
+                upper = (current + timedelta(days=32)).replace(day=1)
+                bounds.append((f"p{current:%Y%m}", upper))
+                current = upper
+        else:
+            current = start
+            while current <= end:
+                upper = current + timedelta(days=1)
+                bounds.append((f"p{current:%Y%m%d}", upper))
+                current = upper
+
+        return bounds
+
+    def _minute_partition_definitions(self, bounds: List[tuple]) -> str:
+        definitions = [
+            f"PARTITION {name} VALUES LESS THAN ({self._to_days(upper)})"
+            for name, upper in bounds
+        ]
+        definitions.append("PARTITION pmax VALUES LESS THAN MAXVALUE")
+        return ',\n                '.join(definitions)
+
+    def _minute_partition_clause(self, start: date) -> str:
+        """CREATE TABLE용 파티션 절 (start ~ 오늘 + minute_partition_ahead)"""
+        end = date.today() + timedelta(days=self.minute_partition_ahead)
+        definitions = self._minute_partition_definitions(self._minute_partition_bounds(start, end))
+        return f"""PARTITION BY RANGE (TO_DAYS(trade_datetime)) (
+                {definitions}
+            )"""
+
+    def get_minute_partitions(self) -> Optional[List[Dict[str, Any]]]:
+        """minute_stock_prices 파티션 목록
+
+        Returns:
+            List[Dict]: [{'name', 'upper': 상한일(미포함, MAXVALUE는 None), 'rows': 추정 행 수}]
+                        파티션이 없는 테이블이면 빈 리스트, 조회 실패/테이블 없음이면 None
+        """
+        try:
+            sql = """
+            SELECT PARTITION_NAME AS name, PARTITION_DESCRIPTION AS description, TABLE_ROWS AS table_rows
+            FROM information_schema.PARTITIONS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'minute_stock_prices'
+            ORDER BY PARTITION_ORDINAL_POSITION
+            """
+            self.cursor.execute(sql)
+            rows = self.cursor.fetchall()
+
+            if not rows:
+                return None
+            if rows[0]['name'] is None:
+                return []
+
+            partitions = []
+            for row in rows:
+                description = str(row['description'])
+                upper = None if description == 'MAXVALUE' else self._from_days(int(description))
+                partitions.append({'name': row['name'], 'upper': upper, 'rows': int(row['table_rows'] or 0)})
+            return partitions
+
+        except Exception as e:
+            self.logger.error(f"❌ 분봉 파티션 조회 실패: {e}")
+            return None
+
+    def ensure_minute_partitions(self, convert: bool = False) -> int:
+        """앞으로 사용할 분봉 파티션을 미리 생성 (pmax를 분할)
+
+        Args:
+            convert: 파티션이 없는 기존 테이블을 파티션 테이블로 재구성
+                     (테이블 전체를 다시 쓰므로 장 마감 후 1회 실행 권장)
+
+        Returns:
+            int: 추가된 파티션 수
+        """
+        partitions = self.get_minute_partitions()
+        if partitions is None:
+            return 0
+
+        end = date.today() + timedelta(days=self.minute_partition_ahead)
+
+        try:
+            if not partitions:
+                if not convert:
+                    self.logger.warning("⚠️ minute_stock_prices가 파티션 테이블이 아닙니다 "
+                                        "(python minute_collector.py --partitions 로 전환)")
+                    return 0
+
+                self.cursor.execute("SELECT MIN(trade_datetime) AS first_datetime FROM minute_stock_prices")
+                row = self.cursor.fetchone()
+                start = row['first_datetime'].date() if row and row['first_datetime'] else date.today()
+
+                bounds = self._minute_partition_bounds(start, end)
+                self.logger.info(f"🔧 minute_stock_prices 파티션 전환 중 ({len(bounds)}개)...")
+                self.cursor.execute(f"""
+                ALTER TABLE minute_stock_prices
+                {self._minute_partition_clause(start)}
+                """)
+                self.connection.commit()
+                self.logger.info(f"✅ 분봉 파티션 전환 완료 ({bounds[0][0]} ~ {bounds[-1][0]})")
+                return len(bounds)
+
+            bounded = [p for p in partitions if p['upper'] is not None]
+            next_start = bounded[-1]['upper'] if bounded else date.today()
+            if next_start > end:
+                return 0
+
+            bounds = self._minute_partition_bounds(next_start, end)
+            self.cursor.execute(f"""
+            ALTER TABLE minute_stock_prices
+            REORGANIZE PARTITION pmax INTO (
+                {self._minute_partition_definitions(bounds)}
+            )
+            """)
+            self.connection.commit()
+            self.logger.info(f"✅ 분봉 파티션 {len(bounds)}개 추가 ({bounds[0][0]} ~ {bounds[-1][0]})")
+            return len(bounds)
+
+        except Exception as e:
+            self.logger.error(f"❌ 분봉 파티션 생성 실패: {e}")
+            return 0
+
+    def drop_old_minute_partitions(self, cutoff: datetime) -> tuple:
+        """cutoff 이전 데이터만 담은 파티션 삭제
+
+        Returns:
+            tuple: (삭제한 파티션 수, 추정 삭제 행 수)
+        """
+        partitions = self.get_minute_partitions()
+        if not partitions:
+            return 0, 0
+
+        expired = [p for p in partitions if p['upper'] is not None and p['upper'] <= cutoff.date()]
+        if not expired:
+            return 0, 0
+
+        try:
+            names = ', '.join(p['name'] for p in expired)
+            self.cursor.execute(f"ALTER TABLE minute_stock_prices DROP PARTITION {names}")
+            self.connection.commit()
+
+            rows = sum(p['rows'] for p in expired)
+            self.logger.info(f"✅ 분봉 파티션 {len(expired)}개 삭제 ({expired[0]['name']} ~ {expired[-1]['name']}, "
+                             f"약 {rows:,}건)")
+            return len(expired), rows
+
+        except Exception as e:
+            self.logger.error(f"❌ 분봉 파티션 삭제 실패: {e}")
+            return 0, 0
+
     def delete_old_minute_prices(self, days: int = 30) -> int:
         """오래된 분봉 데이터 삭제 (디스크 공간 관리)
 
+        파티션 테이블이면 기간이 지난 파티션을 DROP PARTITION으로 삭제하고,
+        경계 파티션에 남은 행만 DELETE (파티션 프루닝으로 해당 파티션만 스캔)
+
         Args:
             days: 보관 일수 (기본 30일)
 
         Returns:
-            int: 삭제된 행 수
+            int: 삭제된 행 수 (파티션 삭제분은 추정치)
         """
         try:
+            cutoff = datetime.now() - timedelta(days=days)
+            _, dropped_rows = self.drop_old_minute_partitions(cutoff)
+
             sql = """
             DELETE FROM minute_stock_prices
-            WHERE trade_datetime < DATE_SUB(NOW(), INTERVAL %s DAY)
+            WHERE trade_datetime < %s
             """
 
-            self.cursor.execute(sql, (days,))
-            deleted_count = self.cursor.rowcount
+            self.cursor.execute(sql, (cutoff,))
+            deleted_count = self.cursor.rowcount + dropped_rows
             self.connection.commit()
 
             self.logger.info(f"✅ 오래된 분봉 데이터 {deleted_count}건 삭제 완료")
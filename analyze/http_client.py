@@ -0,0 +1,377 @@
+"""
+공유 HTTP 클라이언트 모듈
+프로세스의 모든 KIS API 호출이 함께 쓰는 호출 계층
+
+  - keep-alive 커넥션 풀 (requests.Session 1개를 스레드 간 공유)
+  - 프로세스 전역 TokenBucket + TR ID별 TokenBucket (둘 다 통과해야 호출)
+  - TR ID(엔드포인트)별 응답 시간 히스토그램
+  - 429/5xx 응답 재시도 (GET/HEAD만, 지수 백오프 - 주문 POST는 중복 체결 위험으로 재시도하지 않음)
+  - asyncio 변형 (AsyncHTTPClient, aiohttp가 없으면 스레드에서 동기 클라이언트 실행)
+
+사용 예:
+  http = get_http_client()
+  response = http.get(url, headers=headers, params=params, timeout=10)   # headers의 tr_id로 제한/집계
+  configure_http_client(rate=15, tr_limits={'FHKST01010100': 10})
+  for line in http.format_latency_stats(): logger.info(line)
+"""
+import asyncio
+import logging
+import threading
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from rate_limiter import TokenBucket
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+DEFAULT_RATE = 15       # KIS 실전 계좌 초당 20건 한도 이내
+DEFAULT_TIMEOUT = 30
+POOL_SIZE = 16
+
+# 상태 코드 재시도 (기존 create_robust_session의 Retry 설정과 같은 상태 코드/간격)
+RETRY_STATUS = (429, 500, 502, 503, 504)
+RETRY_METHODS = ('GET', 'HEAD')
+STATUS_RETRIES = 3
+RETRY_BACKOFF = 1.0     # 재시도 대기 1, 2, 4초
+MAX_RETRY_AFTER = 10.0  # Retry-After 헤더 대기 상한(초)
+
+# KIS 시세 TR별 기본 초당 호출 수 (KIS 클라이언트 생성 시 등록, 전역 한도와 함께 적용)
+KIS_TR_LIMITS = {
+    'FHKST01010100': 10,    # 현재가
+    'FHKST03010100': 8,     # 일봉
+    'FHKST03010200': 5,     # 분봉 (연속 조회 페이지 간격 0.2초 이상)
+}
+
+# 응답 시간 히스토그램 구간 상한 (ms, 마지막 구간은 그 이상)
+LATENCY_BUCKETS_MS = (25, 50, 100, 200, 400, 800, 1600, 3200)
+
+
+class LatencyHistogram:
+    """엔드포인트 하나의 응답 시간 히스토그램 (스레드 안전)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.calls = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, elapsed_ms: float, ok: bool = True):
+        idx = next((i for i, bound in enumerate(LATENCY_BUCKETS_MS) if elapsed_ms <= bound),
+                   len(LATENCY_BUCKETS_MS))
+        with self.lock:
+            self.counts[idx] += 1
+            self.calls += 1
+            self.errors += 0 if ok else 1
+            self.total_ms += elapsed_ms
+            self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def _percentile(self, counts: List[int], calls: int, ratio: float) -> Optional[float]:
+        """구간 상한으로 근사한 백분위수 (ms, 마지막 구간이면 최대값)"""
+        if not calls:
+            return None
+        target = calls * ratio
+        seen = 0
+        for idx, count in enumerate(counts):
+            seen += count
+            if seen >= target:
+                return float(LATENCY_BUCKETS_MS[idx]) if idx < len(LATENCY_BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    def snapshot(self) -> Dict:
+        """{'calls', 'errors', 'avg_ms', 'p50_ms', 'p95_ms', 'max_ms', 'buckets': {'<=25ms': n, ...}}"""
+        with self.lock:
+            counts = list(self.counts)
+            calls, errors, total_ms, max_ms = self.calls, self.errors, self.total_ms, self.max_ms
+
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+        return {
+            'calls': calls,
+            'errors': errors,
+            'avg_ms': total_ms / calls if calls else None,
+            'p50_ms': self._percentile(counts, calls, 0.5),
+            'p95_ms': self._percentile(counts, calls, 0.95),
+            'max_ms': max_ms,
+            'buckets': dict(zip(labels, counts)),
+        }
+
+
+class HTTPClient:
+    """공유 HTTP 클라이언트 (keep-alive 세션 + TR ID별 속도 제한 + 응답 시간 집계)"""
+
+    def __init__(self, rate: float = DEFAULT_RATE, tr_limits: Optional[Dict[str, float]] = None,
+                 pool_size: int = POOL_SIZE, timeout: float = DEFAULT_TIMEOUT, logger=None):
+        """
+        Args:
+            rate: 프로세스 전역 초당 호출 수
+            tr_limits: TR ID별 초당 호출 수 ({TR ID: 초당 호출 수}, 전역 한도와 함께 적용)
+            pool_size: 호스트당 유지할 커넥션 수 (동시 호출 스레드 수 이상)
+            timeout: 기본 타임아웃(초, 호출 시 timeout 인자가 없을 때)
+            logger: 로거 객체
+        """
+        self.timeout = timeout
+        self.logger = logger or logging.getLogger(__name__)
+        self.session = self._create_session(pool_size)
+
+        self.lock = threading.Lock()
+        self.limiter = TokenBucket(rate)
+        self.tr_limiters = {}
+        self.histograms = {}
+        for tr_id, tr_rate in (tr_limits or {}).items():
+            self.set_tr_limit(tr_id, tr_rate)
+
+    @staticmethod
+    def _create_session(pool_size: int) -> requests.Session:
+        """keep-alive 세션 (연결 실패만 재시도 - 요청이 전송되지 않았으므로 주문 POST도 안전)"""
+        session = requests.Session()
+        retry_strategy = Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.3)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=retry_strategy)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    # ------------------------------------------------------------
+    # 속도 제한
+    # ------------------------------------------------------------
+    def set_rate_limiter(self, limiter: TokenBucket):
+        """프로세스 전역 제한기 교체 (여러 클라이언트/스레드가 같은 TokenBucket 공유)"""
+        self.limiter = limiter
+
+    def set_tr_limit(self, tr_id: str, rate: Optional[float]):
+        """TR ID별 초당 호출 수 설정 (None이면 해제)"""
+        with self.lock:
+            if rate:
+                self.tr_limiters[tr_id] = TokenBucket(rate)
+            else:
+                self.tr_limiters.pop(tr_id, None)
+
+    def set_default_tr_limits(self, tr_limits: Dict[str, float]):
+        """아직 제한이 없는 TR ID에만 초당 호출 수 설정 (configure_http_client로 지정한 값은 유지)"""
+        for tr_id, rate in tr_limits.items():
+            if tr_id not in self.tr_limiters:
+                self.set_tr_limit(tr_id, rate)
+
+    def _limiters(self, tr_id: Optional[str], limiter: Optional[TokenBucket] = None) -> List[TokenBucket]:
+        limiters = [self.limiter]
+        tr_limiter = self.tr_limiters.get(tr_id) if tr_id else None
+        if tr_limiter:
+            limiters.append(tr_limiter)
+        if limiter:
+            limiters.append(limiter)
+        return limiters
+
+    def acquire(self, tr_id: Optional[str] = None, limiter: Optional[TokenBucket] = None) -> float:
+        """호출 전 대기 (전역 → TR ID → 호출자 제한기 순)
+
+        Returns:
+            float: 대기한 시간(초)
+        """
+        return sum(bucket.acquire() for bucket in self._limiters(tr_id, limiter))
+
+    async def acquire_async(self, tr_id: Optional[str] = None, limiter: Optional[TokenBucket] = None) -> float:
+        """acquire의 asyncio 버전 (이벤트 루프를 막지 않고 대기)"""
+        wait = max(bucket.reserve() for bucket in self._limiters(tr_id, limiter))
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    # ------------------------------------------------------------
+    # 호출
+    # ------------------------------------------------------------
+    @staticmethod
+    def endpoint_key(url: str, tr_id: Optional[str] = None) -> str:
+        """집계 키 (TR ID, 없으면 URL 경로 마지막 부분)"""
+        return tr_id or urlparse(url).path.rstrip('/').rsplit('/', 1)[-1] or url
+
+    def record(self, key: str, elapsed_ms: float, ok: bool = True):
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            with self.lock:
+                histogram = self.histograms.setdefault(key, LatencyHistogram())
+        histogram.record(elapsed_ms, ok)
+
+    @staticmethod
+    def _retry_delay(response: requests.Response, attempt: int) -> float:
+        """재시도 대기 시간 (Retry-After 헤더가 있으면 그 값, 없으면 지수 백오프)"""
+        retry_after = response.headers.get('Retry-After')
+        if retry_after:
+            try:
+                return min(max(float(retry_after), 0.0), MAX_RETRY_AFTER)
+            except ValueError:
+                pass
+        return RETRY_BACKOFF * (2 ** attempt)
+
+    def request(self, method: str, url: str, tr_id: Optional[str] = None, throttle: bool = True,
+                limiter: Optional[TokenBucket] = None, retries: Optional[int] = None,
+                **kwargs) -> requests.Response:
+        """HTTP 요청 (requests.request와 같은 인자, 응답 상태 확인은 호출자가 수행)
+
+        Args:
+            method: 'GET' / 'POST' 등
+            url: 요청 URL
+            tr_id: 속도 제한/집계 키 (None이면 headers의 tr_id 사용)
+            throttle: False면 속도 제한 없이 호출 (토큰 발급 등)
+            limiter: 호출자 전용 추가 제한기 (예: 최소 호출 간격)
+            retries: 429/5xx 응답 재시도 횟수 (None이면 GET/HEAD는 STATUS_RETRIES, 그 외 0)
+            **kwargs: headers, params, data, json, timeout 등
+        """
+        tr_id = tr_id or (kwargs.get('headers') or {}).get('tr_id')
+        kwargs.setdefault('timeout', self.timeout)
+        if retries is None:
+            retries = STATUS_RETRIES if method.upper() in RETRY_METHODS else 0
+
+        key = self.endpoint_key(url, tr_id)
+        for attempt in range(retries + 1):
+            if throttle:
+                self.acquire(tr_id, limiter)  # 재시도도 속도 제한에 포함
+
+            started = time.perf_counter()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except Exception:
+                self.record(key, (time.perf_counter() - started) * 1000, ok=False)
+                raise
+
+            self.record(key, (time.perf_counter() - started) * 1000, ok=response.status_code < 400)
+            if response.status_code not in RETRY_STATUS or attempt >= retries:
+                return response
+
+            delay = self._retry_delay(response, attempt)
+            self.logger.warning(f"⚠️ {key} HTTP {response.status_code} - {delay:.1f}초 후 재시도 "
+                                f"({attempt + 1}/{retries})")
+            response.close()
+            time.sleep(delay)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    # ------------------------------------------------------------
+    # 통계
+    # ------------------------------------------------------------
+    def get_latency_stats(self) -> Dict[str, Dict]:
+        """엔드포인트별 응답 시간 통계 ({키: LatencyHistogram.snapshot()})"""
+        with self.lock:
+            histograms = dict(self.histograms)
+        return {key: histogram.snapshot() for key, histogram in sorted(histograms.items())}
+
+    def format_latency_stats(self) -> List[str]:
+        """로그 출력용 엔드포인트별 한 줄 요약 (호출 많은 순)"""
+        lines = []
+        stats = self.get_latency_stats()
+        for key, item in sorted(stats.items(), key=lambda kv: -kv[1]['calls']):
+            lines.append(f"  {key}: {item['calls']}회 (오류 {item['errors']}), "
+                         f"평균 {item['avg_ms']:.0f}ms, p50 ≤{item['p50_ms']:.0f}ms, "
+                         f"p95 ≤{item['p95_ms']:.0f}ms, 최대 {item['max_ms']:.0f}ms")
+        return lines
+
+    def close(self):
+        self.session.close()
+
+
+class AsyncHTTPClient:
+    """HTTPClient의 asyncio 변형 (같은 제한기/히스토그램 공유, 응답은 JSON dict)
+
+    aiohttp가 있으면 aiohttp 커넥션 풀을 쓰고, 없으면 동기 세션 호출을 스레드에서 실행함
+
+    사용 예:
+      async with AsyncHTTPClient() as http:
+          results = await asyncio.gather(*(http.get_json(url, headers=h, params=p) for p in params_list))
+    """
+
+    def __init__(self, client: Optional[HTTPClient] = None, pool_size: int = POOL_SIZE):
+        self.client = client or get_http_client()
+        self.pool_size = pool_size
+        self.session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _get_session(self):
+        if self.session is None:
+            connector = aiohttp.TCPConnector(limit=self.pool_size, keepalive_timeout=30)
+            self.session = aiohttp.ClientSession(connector=connector)
+        return self.session
+
+    async def request_json(self, method: str, url: str, tr_id: Optional[str] = None,
+                           throttle: bool = True, limiter: Optional[TokenBucket] = None,
+                           headers: Optional[Dict] = None, params: Optional[Dict] = None,
+                           json: Optional[Dict] = None, timeout: Optional[float] = None) -> Dict:
+        """HTTP 요청 후 JSON 응답 반환 (HTTP 오류 상태면 예외)"""
+        tr_id = tr_id or (headers or {}).get('tr_id')
+        timeout = timeout or self.client.timeout
+        if throttle:
+            await self.client.acquire_async(tr_id, limiter)
+
+        key = self.client.endpoint_key(url, tr_id)
+        started = time.perf_counter()
+        ok = False
+        try:
+            if aiohttp is None:
+                def call():
+                    response = self.client.session.request(method, url, headers=headers, params=params,
+                                                           json=json, timeout=timeout)
+                    response.raise_for_status()
+                    return response.json()
+                result = await asyncio.to_thread(call)
+            else:
+                session = await self._get_session()
+                async with session.request(method, url, headers=headers, params=params, json=json,
+                                           timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                    response.raise_for_status()
+                    result = await response.json(content_type=None)
+            ok = True
+            return result
+        finally:
+            self.client.record(key, (time.perf_counter() - started) * 1000, ok)
+
+    async def get_json(self, url: str, **kwargs) -> Dict:
+        return await self.request_json('GET', url, **kwargs)
+
+    async def post_json(self, url: str, **kwargs) -> Dict:
+        return await self.request_json('POST', url, **kwargs)
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+
+_shared_client = None
+_shared_lock = threading.Lock()
+
+
+def get_http_client() -> HTTPClient:
+    """프로세스 공유 HTTP 클라이언트"""
+    global _shared_client
+    if _shared_client is None:
+        with _shared_lock:
+            if _shared_client is None:
+                _shared_client = HTTPClient()
+    return _shared_client
+
+
+def configure_http_client(rate: Optional[float] = None,
+                          tr_limits: Optional[Dict[str, float]] = None) -> HTTPClient:
+    """공유 클라이언트 속도 제한 설정 (rate: 전역 초당 호출 수, tr_limits: TR ID별 초당 호출 수)"""
+    client = get_http_client()
+    if rate:
+        client.set_rate_limiter(TokenBucket(rate))
+    for tr_id, tr_rate in (tr_limits or {}).items():
+        client.set_tr_limit(tr_id, tr_rate)
+    return client
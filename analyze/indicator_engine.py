@@ -0,0 +1,407 @@
+"""
+전 종목 기술적 지표 엔진
+(날짜 × 종목) 종가/거래량 행렬로 MA, 볼린저밴드, RSI, MACD를 한 번에 계산하고
+매수 신호 규칙별 불리언 행렬을 반환 (NumPy 벡터 연산)
+
+TechnicalIndicators의 종목별 함수와 같은 규칙/기준값을 사용하며,
+종목별 함수는 1종목짜리 IndicatorPanel의 마지막 행을 조회하는 얇은 래퍼임
+
+사용 예:
+  panel = IndicatorPanel.from_frames({'005930': df1, '000660': df2})
+  matrix = panel.signal('golden_cross')        # (날짜, 종목) bool
+  latest = panel.latest_signals()               # {규칙: 종목별 bool 배열}
+"""
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+PRICE_COLUMNS = ('stck_clpr', 'stck_prpr')
+VOLUME_COLUMNS = ('acml_vol', 'cntg_vol')
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """열 단위 이동평균 (창 안에 NaN이 있거나 데이터가 window개 미만이면 NaN)"""
+    result = np.full(values.shape, np.nan)
+    if len(values) >= window:
+        result[window - 1:] = sliding_window_view(values, window, axis=0).mean(axis=-1)
+    return result
+
+
+def rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    """열 단위 이동표준편차 (표본표준편차, ddof=1)"""
+    result = np.full(values.shape, np.nan)
+    if len(values) >= window:
+        result[window - 1:] = sliding_window_view(values, window, axis=0).std(axis=-1, ddof=1)
+    return result
+
+
+def ewm_mean(values: np.ndarray, span: int, initial: Optional[np.ndarray] = None) -> np.ndarray:
+    """열 단위 지수이동평균 (pandas ewm(span, adjust=False)와 동일, 첫 유효값부터 시작)
+
+    initial: 첫 행 직전의 지수이동평균 (이어서 계산할 때, NaN인 열은 첫 유효값부터 시작)
+    """
+    alpha = 2.0 / (span + 1)
+    result = np.full(values.shape, np.nan)
+    prev = np.full(values.shape[1:], np.nan)
+    if initial is not None:
+        prev = np.asarray(initial, dtype='float64').reshape(values.shape[1:]).copy()
+
+    for t in range(len(values)):
+        current = values[t]
+        updated = np.where(np.isnan(prev), current, (1 - alpha) * prev + alpha * current)
+        prev = np.where(np.isnan(current), prev, updated)
+        result[t] = prev
+
+    return result
+
+
+def shift(values: np.ndarray, periods: int = 1) -> np.ndarray:
+    """행 방향으로 periods만큼 뒤로 민 배열 (앞쪽은 NaN)"""
+    result = np.full(values.shape, np.nan)
+    if periods < len(values):
+        result[periods:] = values[:len(values) - periods]
+    return result
+
+
+class IndicatorPanel:
+    """(날짜 × 종목) 지표/신호 계산기
+
+    지표는 (이름, 파라미터) 단위로 한 번만 계산하여 보관하고,
+    신호 함수는 같은 모양의 불리언 행렬을 반환함.
+    종목별 이력 길이(history_length)는 종목의 첫 데이터 행부터 센 행 수로,
+    종목별 함수의 len(df) 조건과 같은 의미임.
+    """
+
+    def __init__(self, close: np.ndarray, volume: Optional[np.ndarray] = None,
+                 dates=None, codes: Optional[List[str]] = None):
+        """
+        Args:
+            close: 종가 행렬 (날짜 × 종목, 결측 NaN)
+            volume: 거래량 행렬 (같은 모양, 없으면 None - 거래량 조건은 종목별 함수와 같이 처리)
+            dates: 날짜 배열 (행 라벨)
+            codes: 종목코드 리스트 (열 라벨)
+        """
+        close = np.asarray(close, dtype='float64')
+        if close.ndim == 1:
+            close = close.reshape(-1, 1)
+
+        if volume is not None:
+            volume = np.asarray(volume, dtype='float64').reshape(close.shape)
+
+        self.close = close
+        self.volume = volume
+        self.dates = dates
+        self.codes = list(codes) if codes is not None else list(range(close.shape[1]))
+        self._cache = {}
+
+        # 종목별 이력 길이 (첫 데이터 행 이후 행 수)
+        present = ~np.isnan(close)
+        if volume is not None:
+            present |= ~np.isnan(volume)
+        num_rows = close.shape[0]
+        first_row = np.where(present.any(axis=0), present.argmax(axis=0), num_rows)
+        self.history_length = np.maximum(np.arange(1, num_rows + 1).reshape(-1, 1) - first_row, 0)
+
+        # 첫 데이터 행 이후 누적 종가 결측 수 (MACD 규칙은 결측이 있으면 무효)
+        missing_close = np.isnan(close) & (self.history_length > 0)
+        self.missing_close_count = np.cumsum(missing_close, axis=0)
+
+    # ------------------------------------------------------------
+    # 생성
+    # ------------------------------------------------------------
+    @staticmethod
+    def _pick_column(df: pd.DataFrame, candidates) -> Optional[str]:
+        for col in candidates:
+            if col in df.columns:
+                return col
+        return None
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame, code: str = None) -> Optional['IndicatorPanel']:
+        """종목 하나의 일봉 DataFrame → 1열 패널 (행 순서 그대로 사용)"""
+        if df is None or df.empty:
+            return None
+
+        price_col = cls._pick_column(df, PRICE_COLUMNS)
+        volume_col = cls._pick_column(df, VOLUME_COLUMNS)
+
+        close = (pd.to_numeric(df[price_col], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+                 if price_col else np.full(len(df), np.nan))
+        volume = (pd.to_numeric(df[volume_col], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+                  if volume_col else None)
+
+        dates = df['stck_bsop_date'].to_numpy() if 'stck_bsop_date' in df.columns else None
+        return cls(close, volume, dates=dates, codes=[code])
+
+    @classmethod
+    def from_frames(cls, frames: Dict[str, pd.DataFrame]) -> 'IndicatorPanel':
+        """종목별 일봉 DataFrame → 거래일(stck_bsop_date) 기준으로 정렬한 패널
+
+        종목에 없는 거래일(상장 전, 거래정지)은 NaN
+        """
+        series = {}
+        for code, df in frames.items():
+            if df is None or df.empty or 'stck_bsop_date' not in df.columns:
+                continue
+
+            price_col = cls._pick_column(df, PRICE_COLUMNS)
+            if price_col is None:
+                continue
+            volume_col = cls._pick_column(df, VOLUME_COLUMNS)
+
+            frame = df.drop_duplicates(subset='stck_bsop_date', keep='last')
+            series[code] = (
+                frame['stck_bsop_date'].astype(str).to_numpy(),
+                pd.to_numeric(frame[price_col], errors='coerce').to_numpy(dtype='float64', na_value=np.nan),
+                (pd.to_numeric(frame[volume_col], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+                 if volume_col else None)
+            )
+
+        if not series:
+            return cls(np.empty((0, 0)), np.empty((0, 0)), dates=np.array([]), codes=[])
+
+        dates = np.unique(np.concatenate([item[0] for item in series.values()]))
+        codes = list(series.keys())
+        close = np.full((len(dates), len(codes)), np.nan)
+        volume = np.full((len(dates), len(codes)), np.nan)
+
+        for col_idx, code in enumerate(codes):
+            stock_dates, stock_close, stock_volume = series[code]
+            rows = np.searchsorted(dates, stock_dates)
+            close[rows, col_idx] = stock_close
+            if stock_volume is not None:
+                volume[rows, col_idx] = stock_volume
+
+        return cls(close, volume, dates=dates, codes=codes)
+
+    @classmethod
+    def from_price_store(cls, price_store, codes: List[str], start_date=None, end_date=None) -> 'IndicatorPanel':
+        """로컬 가격 저장소(PriceStore)에서 종가/거래량 패널 생성"""
+        dates, close_codes, close = price_store.read_panel(codes, 'close_price', start_date, end_date)
+        _, volume_codes, volume = price_store.read_panel(close_codes, 'volume', start_date, end_date)
+
+        if volume_codes != close_codes or volume.shape != close.shape:
+            volume = None
+        return cls(close, volume, dates=dates, codes=close_codes)
+
+    # daily_indicators 컬럼 → (지표 캐시 키, 첫 유효 행 수)
+    STORED_INDICATORS = (
+        ('ma5', ('ma', 5), 5),
+        ('ma20', ('ma', 20), 20),
+        ('bb_lower', ('bollinger_lower', 20, 2), 20),
+        ('rsi14', ('rsi', 14), 15),
+        ('volume_ma20', ('volume_ma', 20), 20),
+    )
+
+    def seed_stored(self, stored: pd.DataFrame) -> bool:
+        """저장된 일봉 지표(DBManager.get_daily_indicators 결과)로 지표 캐시 채움 (1열 패널)
+
+        모든 행이 같은 거래일·종가의 저장 행과 맞을 때만 사용하고, 창이 덜 찬 앞쪽 행은
+        직접 계산할 때와 같이 NaN으로 둠. MACD는 저장값이 종목 전체 이력부터 이어진 EMA라
+        DataFrame 첫 행부터 계산하는 값과 달라서 제외.
+
+        Returns:
+            bool: 사용 여부 (저장되지 않은 행(오늘 실시간 행 등)이 있으면 False - 직접 계산)
+        """
+        if self.close.shape[1] != 1 or self.dates is None or stored is None or stored.empty:
+            return False
+
+        stored_dates = pd.to_datetime(stored['trade_date']).dt.strftime('%Y%m%d').to_numpy()
+        if not np.array_equal(np.asarray(self.dates).astype(str), stored_dates):
+            return False
+
+        stored_close = pd.to_numeric(stored['close_price'], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+        if not np.allclose(stored_close, self.close[:, 0]):
+            return False
+
+        rows = np.arange(len(stored_dates)).reshape(-1, 1)
+        for column, key, min_rows in self.STORED_INDICATORS:
+            if key[0] == 'volume_ma' and self.volume is None:
+                continue
+            values = pd.to_numeric(stored[column], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+            self._cache[key] = np.where(rows >= min_rows - 1, values.reshape(-1, 1), np.nan)
+        return True
+
+    # ------------------------------------------------------------
+    # 지표 (한 번 계산 후 재사용)
+    # ------------------------------------------------------------
+    def _cached(self, key, compute):
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def ma(self, window: int) -> np.ndarray:
+        """종가 이동평균"""
+        return self._cached(('ma', window), lambda: rolling_mean(self.close, window))
+
+    def volume_ma(self, window: int) -> np.ndarray:
+        """거래량 이동평균"""
+        return self._cached(('volume_ma', window), lambda: rolling_mean(self.volume, window))
+
+    def bollinger_lower(self, period: int = 20, num_std: float = 2) -> np.ndarray:
+        """볼린저밴드 하단선"""
+        return self._cached(
+            ('bollinger_lower', period, num_std),
+            lambda: self.ma(period) - num_std * self._cached(
+                ('std', period), lambda: rolling_std(self.close, period))
+        )
+
+    def rsi(self, period: int = 14) -> np.ndarray:
+        """RSI (단순 이동평균 방식, 손실 0은 0.0001로 대체)"""
+        def compute():
+            delta = self.close - shift(self.close)
+            gain = rolling_mean(np.where(delta > 0, delta, 0.0), period)
+            loss = rolling_mean(np.where(delta < 0, -delta, 0.0), period)
+            rs = gain / np.where(loss == 0, 0.0001, loss)
+            return 100 - (100 / (1 + rs))
+
+        return self._cached(('rsi', period), compute)
+
+    def macd(self, fast: int = 12, slow: int = 26, signal: int = 9) -> tuple:
+        """MACD (MACD 라인, Signal 라인)"""
+        def compute():
+            macd_line = ewm_mean(self.close, fast) - ewm_mean(self.close, slow)
+            return macd_line, ewm_mean(macd_line, signal)
+
+        return self._cached(('macd', fast, slow, signal), compute)
+
+    # ------------------------------------------------------------
+    # 신호 (불리언 행렬)
+    # ------------------------------------------------------------
+    def _volume_confirmed(self, multiplier: float, min_length: int = 10) -> np.ndarray:
+        """거래량 확인 조건 (거래량 데이터가 없으면 조건 생략)"""
+        if self.volume is None:
+            return np.ones(self.close.shape, dtype=bool)
+
+        confirmed = self.volume > self.volume_ma(10) * multiplier
+        return confirmed | (self.history_length < min_length)
+
+    def volume_sufficient(self, min_volume: int = 1000) -> np.ndarray:
+        """거래량이 최소 기준 이상 (절대조건)"""
+        if self.volume is None:
+            return np.zeros(self.close.shape, dtype=bool)
+        return (self.history_length >= 1) & (self.volume >= min_volume)
+
+    def above_bollinger_lower(self, period: int = 20, num_std: float = 2) -> np.ndarray:
+        """현재가가 볼린저밴드 하단선 이상 (절대조건)"""
+        lower = self.bollinger_lower(period, num_std)
+        return (self.history_length >= period + 1) & (self.close >= lower)
+
+    def rsi_buy_signal(self, period: int = 14, oversold_threshold: float = 30,
+                       recovery_threshold: float = 50) -> np.ndarray:
+        """RSI 과매도 회복 또는 매수 적정권 + RSI 상승"""
+        current = self.rsi(period)
+        previous = shift(current)
+
+        oversold_recovery = ((previous <= oversold_threshold) & (current > oversold_threshold)
+                             & (current < recovery_threshold))
+        buy_zone = (oversold_threshold <= current) & (current <= recovery_threshold)
+        uptrend = current > previous
+
+        return (self.history_length >= period + 5) & (oversold_recovery | buy_zone) & uptrend
+
+    def _macd_valid(self, slow: int, signal: int) -> np.ndarray:
+        return (self.history_length >= slow + signal + 5) & (self.missing_close_count == 0)
+
+    def macd_golden_cross(self, fast: int = 12, slow: int = 26, signal: int = 9) -> np.ndarray:
+        """MACD 라인이 Signal 라인 상향 돌파 + MACD 상승 + 거래량 10일 평균의 1.1배 초과"""
+        macd_line, signal_line = self.macd(fast, slow, signal)
+        prev_macd, prev_signal = shift(macd_line), shift(signal_line)
+
+        golden_cross = (prev_macd <= prev_signal) & (macd_line > signal_line) & (macd_line > prev_macd)
+        valid_position = signal_line <= 1000
+
+        return (self._macd_valid(slow, signal) & golden_cross & valid_position
+                & self._volume_confirmed(1.1))
+
+    def macd_near_golden_cross(self, fast: int = 12, slow: int = 26, signal: int = 9,
+                               threshold: float = 0.05) -> np.ndarray:
+        """MACD가 Signal 아래에서 근접 + (MACD 상승 또는 히스토그램 개선)"""
+        macd_line, signal_line = self.macd(fast, slow, signal)
+
+        below = macd_line < signal_line
+        diff = np.abs(macd_line - signal_line)
+        is_close = (diff / np.maximum(np.abs(signal_line), 0.01) <= threshold) | (diff <= 50)
+
+        prev_macd, prev2_macd = shift(macd_line), shift(macd_line, 2)
+        trend_up = (macd_line > prev_macd) & (prev_macd >= prev2_macd)
+
+        histogram = macd_line - signal_line
+        prev_hist, prev2_hist = shift(histogram), shift(histogram, 2)
+        improving = (histogram > prev_hist) & (prev_hist > prev2_hist)
+
+        return self._macd_valid(slow, signal) & below & is_close & (trend_up | improving)
+
+    def ma5_below_ma20(self) -> np.ndarray:
+        """5일선이 20일선보다 0.5% 이상 아래 (절대조건)"""
+        ma5, ma20 = self.ma(5), self.ma(20)
+        return (self.history_length >= 21) & (ma5 < ma20) & ((ma20 - ma5) / ma20 >= 0.005)
+
+    def golden_cross(self) -> np.ndarray:
+        """5일선이 20일선 상향 돌파"""
+        ma5, ma20 = self.ma(5), self.ma(20)
+        return (self.history_length >= 21) & (shift(ma5) < shift(ma20)) & (ma5 > ma20)
+
+    def ma5_crossing_above_ma20(self) -> np.ndarray:
+        """5일선 20일선 상향 돌파 + 5일선 상승 + 거래량 10일 평균의 1.2배 초과"""
+        ma5, ma20 = self.ma(5), self.ma(20)
+        prev_ma5 = shift(ma5)
+
+        cross = (prev_ma5 <= shift(ma20)) & (ma5 > ma20)
+        return (self.history_length >= 21) & cross & (ma5 > prev_ma5) & self._volume_confirmed(1.2)
+
+    def price_below_ma20(self) -> np.ndarray:
+        """현재가가 20일선보다 1% 이상 아래 (절대조건)"""
+        ma20 = self.ma(20)
+        return (self.history_length >= 21) & (self.close < ma20) & ((ma20 - self.close) / ma20 >= 0.01)
+
+    def bollinger_rebound(self) -> np.ndarray:
+        """전일 볼린저밴드 하단 아래 → 당일 하단 위로 복귀"""
+        lower = self.bollinger_lower(20, 2)
+        return ((self.history_length >= 21) & (shift(self.close) < shift(lower))
+                & (self.close > lower))
+
+    def volume_breakout(self, volume_period: int = 20, volume_multiplier: float = 2.0) -> np.ndarray:
+        """거래량이 평균의 volume_multiplier배 초과"""
+        if self.volume is None:
+            return np.zeros(self.close.shape, dtype=bool)
+
+        avg_volume = self.volume_ma(volume_period)
+        return ((self.history_length >= volume_period + 1) & (avg_volume != 0)
+                & (self.volume > avg_volume * volume_multiplier))
+
+    # 규칙 이름 → 신호 함수 (기본 파라미터)
+    RULES = (
+        'volume_sufficient', 'above_bollinger_lower', 'price_below_ma20', 'ma5_below_ma20',
+        'golden_cross', 'ma5_crossing_above_ma20', 'bollinger_rebound', 'volume_breakout',
+        'rsi_buy_signal', 'macd_golden_cross', 'macd_near_golden_cross'
+    )
+
+    def signal(self, rule: str, **params) -> np.ndarray:
+        """규칙별 불리언 행렬 (날짜 × 종목)"""
+        if rule not in self.RULES:
+            raise ValueError(f"알 수 없는 신호 규칙: {rule}")
+        def compute():
+            with np.errstate(invalid='ignore', divide='ignore'):
+                return getattr(self, rule)(**params)
+
+        return self._cached(('signal', rule, tuple(sorted(params.items()))), compute)
+
+    def signal_matrices(self, rules=None) -> Dict[str, np.ndarray]:
+        """여러 규칙의 불리언 행렬 (기본: 전체 규칙)"""
+        return {rule: self.signal(rule) for rule in (rules or self.RULES)}
+
+    def latest(self, rule: str, column: int = 0, **params) -> bool:
+        """마지막 행의 신호 값 (종목별 함수용)"""
+        if self.close.shape[0] == 0:
+            return False
+        return bool(self.signal(rule, **params)[-1, column])
+
+    def latest_signals(self, rules=None) -> Dict[str, np.ndarray]:
+        """마지막 거래일 기준 규칙별 종목 신호 ({규칙: 종목별 bool 배열}, 열 순서는 codes)"""
+        if self.close.shape[0] == 0:
+            return {rule: np.zeros(0, dtype=bool) for rule in (rules or self.RULES)}
+        return {rule: matrix[-1] for rule, matrix in self.signal_matrices(rules).items()}
@@ -0,0 +1,539 @@
+"""
+증분(스트리밍) 기술적 지표 상태 모듈
+분봉이 하나 들어올 때마다 O(1)로 갱신되는 지표 상태 객체와 종목별 상태 관리자
+
+매 주기 분봉 DataFrame 전체에 rolling()/ewm()을 다시 계산하지 않고,
+종목별 상태에 새로 완성된 분봉만 반영해서 마지막 값을 바로 읽음
+
+기준 구현 (같은 입력이면 같은 값):
+  - SMAState        : Series.rolling(window).mean()
+  - RollingStdState : Series.rolling(window).std()  (ddof=1)
+  - RollingMaxState / RollingMinState : Series.rolling(window).max() / min()
+  - EMAState        : Series.ewm(span=span).mean()  (adjust=True, pandas 기본값)
+  - MACDState       : TechnicalIndicators.calculate_macd (macd_line, macd_signal, macd_histogram, macd_cross)
+  - RSIState        : wilder=False면 TechnicalIndicators.calculate_rsi (단순 이동평균),
+                      wilder=True면 Wilder 평활 (첫 period개 평균으로 시작 후 (이전×(n-1)+현재)/n)
+  - StochasticState : TechnicalIndicators.calculate_stochastic (stoch_k, stoch_d)
+
+SMA/표준편차/최대·최소/RSI(단순)/스토캐스틱은 최근 window개 봉만 보므로 봉이 끊김 없이 들어왔다면
+분봉 DataFrame으로 계산한 값과 같고, EMA/MACD/Wilder RSI는 상태가 본 전체 이력 기준 값임
+
+사용 예:
+  book = IndicatorBook(lambda: {'ma20': SMAState(20), 'rsi': RSIState(14, wilder=False)})
+  latest = book.sync_frame('005930', minute_df)     # {'ma20': ..., 'rsi': ...} (마지막 봉 포함)
+  previous = book.previous('005930')                # 마지막 봉 직전까지의 값
+"""
+import math
+import threading
+from collections import deque
+from typing import Callable, Dict, Optional
+
+import pandas as pd
+
+
+NAN = float('nan')
+BUFFERS = '__buffers__'  # checkpoint에서 창(deque) 되돌리기 정보를 담는 키
+
+# 분봉 DataFrame 컬럼 (KIS 분봉 조회 형식)
+FRAME_COLUMNS = {'close': 'stck_prpr', 'high': 'stck_hgpr', 'low': 'stck_lwpr', 'volume': 'cntg_vol'}
+
+
+def _is_nan(value) -> bool:
+    return value is None or value != value
+
+
+class IndicatorState:
+    """지표 상태 기본 클래스 (source: 봉에서 읽을 값 close/high/low/volume)"""
+
+    def __init__(self, source: str = 'close'):
+        self.source = source
+        self.value = NAN
+
+    def update(self, value: float) -> float:
+        raise NotImplementedError
+
+    def push(self, bar: Dict[str, float]) -> float:
+        """봉 하나 반영 ({'close', 'high', 'low', 'volume'} 중 필요한 값)"""
+        return self.update(bar.get(self.source, NAN))
+
+    def outputs(self, name: str) -> Dict[str, float]:
+        """현재 값 (여러 값을 내는 지표는 name_접미사로 펼침)"""
+        return {name: self.value}
+
+    def checkpoint(self) -> Dict:
+        """현재 상태 저장 (스칼라 값과 하위 상태만 복사하고 창(deque)은 복사하지 않음)"""
+        saved = {BUFFERS: self._mark_buffers()}
+        for key, value in vars(self).items():
+            if isinstance(value, IndicatorState):
+                saved[key] = value.checkpoint()
+            elif not isinstance(value, deque):
+                saved[key] = value
+        return saved
+
+    def rollback(self, saved: Dict):
+        """checkpoint 후 봉 하나를 반영한 상태를 checkpoint 시점으로 되돌림 (봉당 O(1))"""
+        self._undo_buffers(saved[BUFFERS])
+        for key, value in saved.items():
+            if key == BUFFERS:
+                continue
+            current = getattr(self, key)
+            if isinstance(current, IndicatorState):
+                current.rollback(value)
+            else:
+                setattr(self, key, value)
+
+    def _mark_buffers(self):
+        """창 되돌리기에 필요한 정보 (창이 있는 상태만 재정의)"""
+        return None
+
+    def _undo_buffers(self, mark):
+        pass
+
+
+class _RollingSum(IndicatorState):
+    """최근 window개 값의 합/제곱합 (window번마다 다시 합산해서 부동소수 오차 누적 방지)"""
+
+    def __init__(self, window: int, source: str = 'close'):
+        super().__init__(source)
+        self.window = window
+        self.values = deque()
+        self.nan_count = 0
+        self.shift = None     # 제곱합 상쇄 오차를 줄이기 위한 기준값
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.since_resync = 0
+
+    def _add(self, value: float):
+        value = float(value) if not _is_nan(value) else NAN
+        self.values.append(value)
+        if value != value:
+            self.nan_count += 1
+        else:
+            if self.shift is None:
+                self.shift = value
+            d = value - self.shift
+            self.total += d
+            self.total_sq += d * d
+
+        if len(self.values) > self.window:
+            old = self.values.popleft()
+            if old != old:
+                self.nan_count -= 1
+            else:
+                d = old - self.shift
+                self.total -= d
+                self.total_sq -= d * d
+
+        self.since_resync += 1
+        if self.since_resync >= self.window:
+            self._resync()
+
+    def _resync(self):
+        """창 안의 값으로 합계 재계산 (window번에 1회 → 봉당 평균 O(1))"""
+        valid = [v for v in self.values if v == v]
+        self.shift = sum(valid) / len(valid) if valid else None
+        self.total = sum(v - self.shift for v in valid) if valid else 0.0
+        self.total_sq = sum((v - self.shift) ** 2 for v in valid) if valid else 0.0
+        self.since_resync = 0
+
+    def _mark_buffers(self):
+        return len(self.values), (self.values[0] if self.values else None)
+
+    def _undo_buffers(self, mark):
+        length, front = mark
+        self.values.pop()
+        if len(self.values) < length:
+            self.values.appendleft(front)  # 창이 가득 차서 밀려난 값
+
+    @property
+    def ready(self) -> bool:
+        """창이 차고 NaN이 없는지 (pandas rolling min_periods=window와 동일)"""
+        return len(self.values) == self.window and self.nan_count == 0
+
+
+class SMAState(_RollingSum):
+    """단순 이동평균"""
+
+    def update(self, value: float) -> float:
+        self._add(value)
+        self.value = self.shift + self.total / self.window if self.ready else NAN
+        return self.value
+
+
+class RollingStdState(_RollingSum):
+    """이동 표준편차 (표본표준편차 ddof=1)"""
+
+    def __init__(self, window: int, source: str = 'close', ddof: int = 1):
+        super().__init__(window, source)
+        self.ddof = ddof
+
+    def update(self, value: float) -> float:
+        self._add(value)
+        n = self.window
+        if not self.ready or n <= self.ddof:
+            self.value = NAN
+        else:
+            variance = (self.total_sq - self.total * self.total / n) / (n - self.ddof)
+            self.value = math.sqrt(max(variance, 0.0))
+        return self.value
+
+
+class _RollingExtreme(IndicatorState):
+    """최근 window개 값의 최대/최소 (단조 deque, 봉당 평균 O(1))"""
+
+    def __init__(self, window: int, source: str = 'close'):
+        super().__init__(source)
+        self.window = window
+        self.count = 0
+        self.candidates = deque()   # (순번, 값), 값이 단조
+        self.nan_positions = deque()
+        self.last_change = None     # 마지막 update의 deque 변경 (rollback용)
+
+    def _better(self, a: float, b: float) -> bool:
+        raise NotImplementedError
+
+    def update(self, value: float) -> float:
+        position = self.count
+        self.count += 1
+        expired = position - self.window
+
+        is_nan = _is_nan(value)
+        dominated = []
+        if is_nan:
+            self.nan_positions.append(position)
+        else:
+            value = float(value)
+            while self.candidates and not self._better(self.candidates[-1][1], value):
+                dominated.append(self.candidates.pop())
+            self.candidates.append((position, value))
+
+        expired_candidates = []
+        while self.candidates and self.candidates[0][0] <= expired:
+            expired_candidates.append(self.candidates.popleft())
+        expired_nans = []
+        while self.nan_positions and self.nan_positions[0] <= expired:
+            expired_nans.append(self.nan_positions.popleft())
+        self.last_change = (is_nan, dominated, expired_candidates, expired_nans)
+
+        ready = self.count >= self.window and not self.nan_positions
+        self.value = self.candidates[0][1] if ready and self.candidates else NAN
+        return self.value
+
+
+    def _undo_buffers(self, mark):
+        is_nan, dominated, expired_candidates, expired_nans = self.last_change
+        self.nan_positions.extendleft(reversed(expired_nans))
+        self.candidates.extendleft(reversed(expired_candidates))
+        if is_nan:
+            self.nan_positions.pop()
+        else:
+            self.candidates.pop()
+            self.candidates.extend(reversed(dominated))
+
+
+class RollingMaxState(_RollingExtreme):
+    """이동 최대값"""
+
+    def _better(self, a: float, b: float) -> bool:
+        return a > b
+
+
+class RollingMinState(_RollingExtreme):
+    """이동 최소값"""
+
+    def _better(self, a: float, b: float) -> bool:
+        return a < b
+
+
+class EMAState(IndicatorState):
+    """지수이동평균 (adjust=True: pandas ewm(span).mean() 기본값, adjust=False: 재귀식)
+
+    pandas ewma와 같은 가중평균 점화식으로 갱신 (값이 같으면 그대로 두어 횡보 구간에 오차가 생기지 않음)
+    NaN 입력은 값을 바꾸지 않고 가중치만 감쇠 (pandas ignore_na=False와 동일)
+    """
+
+    def __init__(self, span: float = None, alpha: float = None, adjust: bool = True, source: str = 'close'):
+        super().__init__(source)
+        if alpha is None:
+            alpha = 2.0 / (span + 1)
+        self.alpha = alpha
+        self.decay = 1.0 - alpha
+        self.adjust = adjust
+        self.new_weight = 1.0 if adjust else alpha
+        self.old_weight = 1.0  # 지금까지 값의 누적 가중치
+
+    def update(self, value: float) -> float:
+        if self.value != self.value:
+            if not _is_nan(value):
+                self.value = float(value)
+            return self.value
+
+        self.old_weight *= self.decay
+        if _is_nan(value):
+            return self.value
+
+        value = float(value)
+        if self.value != value:
+            self.value = (self.old_weight * self.value + self.new_weight * value) / (self.old_weight + self.new_weight)
+        if self.adjust:
+            self.old_weight += self.new_weight
+        else:
+            self.old_weight = 1.0
+        return self.value
+
+
+class MACDState(IndicatorState):
+    """MACD (line = 빠른 EMA - 느린 EMA, signal = line의 EMA, cross: 골든 1 / 데드 -1 / 없음 0)"""
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9, adjust: bool = True,
+                 source: str = 'close'):
+        super().__init__(source)
+        self.fast = EMAState(fast, adjust=adjust)
+        self.slow = EMAState(slow, adjust=adjust)
+        self.signal_ema = EMAState(signal, adjust=adjust)
+        self.line = NAN
+        self.signal = NAN
+        self.histogram = NAN
+        self.cross = 0
+
+    def update(self, value: float) -> float:
+        prev_line, prev_signal = self.line, self.signal
+
+        self.line = self.fast.update(value) - self.slow.update(value)
+        self.signal = self.signal_ema.update(self.line)
+        self.histogram = self.line - self.signal
+
+        if self.line > self.signal and prev_line <= prev_signal:
+            self.cross = 1
+        elif self.line < self.signal and prev_line >= prev_signal:
+            self.cross = -1
+        else:
+            self.cross = 0
+
+        self.value = self.line
+        return self.value
+
+    def outputs(self, name: str) -> Dict[str, float]:
+        return {
+            f'{name}_line': self.line,
+            f'{name}_signal': self.signal,
+            f'{name}_histogram': self.histogram,
+            f'{name}_cross': self.cross
+        }
+
+
+class RSIState(IndicatorState):
+    """RSI
+
+    wilder=True : Wilder 평활 (첫 period개 변화량 평균으로 시작, 이후 (이전 × (period-1) + 현재) / period)
+    wilder=False: 최근 period개 상승/하락폭 단순 평균 (TechnicalIndicators.calculate_rsi와 동일,
+                  첫 봉과 NaN 변화량은 상승/하락 0으로 취급하는 것까지 같음)
+    """
+
+    def __init__(self, period: int = 14, wilder: bool = True, source: str = 'close'):
+        super().__init__(source)
+        self.period = period
+        self.wilder = wilder
+        self.prev = None
+        self.started = False
+        if wilder:
+            self.avg_gain = self.avg_loss = NAN
+            self.seed_gain = self.seed_loss = 0.0
+            self.seed_count = 0
+        else:
+            self.gain_ma = SMAState(period)
+            self.loss_ma = SMAState(period)
+
+    def update(self, value: float) -> float:
+        value = NAN if _is_nan(value) else float(value)
+        first = not self.started
+        delta = NAN if first else value - self.prev
+        self.prev = value
+        self.started = True
+
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+
+        if not self.wilder:
+            avg_gain = self.gain_ma.update(gain)
+            avg_loss = self.loss_ma.update(loss)
+        elif first:
+            return self.value  # Wilder는 첫 변화량부터 집계
+        elif self.seed_count < self.period:
+            self.seed_gain += gain
+            self.seed_loss += loss
+            self.seed_count += 1
+            if self.seed_count < self.period:
+                return self.value
+            self.avg_gain = self.seed_gain / self.period
+            self.avg_loss = self.seed_loss / self.period
+            avg_gain, avg_loss = self.avg_gain, self.avg_loss
+        else:
+            self.avg_gain = (self.avg_gain * (self.period - 1) + gain) / self.period
+            self.avg_loss = (self.avg_loss * (self.period - 1) + loss) / self.period
+            avg_gain, avg_loss = self.avg_gain, self.avg_loss
+
+        if avg_gain != avg_gain or avg_loss != avg_loss:
+            self.value = NAN
+        elif avg_loss == 0:
+            self.value = 100.0 if avg_gain > 0 else NAN
+        else:
+            self.value = 100 - 100 / (1 + avg_gain / avg_loss)
+        return self.value
+
+
+class StochasticState(IndicatorState):
+    """스토캐스틱 (%K = (종가 - k_period 최저가) / (최고가 - 최저가) × 100, %D = %K의 d_period 평균)"""
+
+    def __init__(self, k_period: int = 14, d_period: int = 3):
+        super().__init__('close')
+        self.highest = RollingMaxState(k_period, 'high')
+        self.lowest = RollingMinState(k_period, 'low')
+        self.d_ma = SMAState(d_period)
+        self.k = NAN
+        self.d = NAN
+
+    def push(self, bar: Dict[str, float]) -> float:
+        high = self.highest.push(bar)
+        low = self.lowest.push(bar)
+        close = bar.get('close', NAN)
+
+        if high != high or low != low or _is_nan(close):
+            self.k = NAN
+        elif high == low:
+            numerator = close - low
+            self.k = NAN if numerator == 0 else math.copysign(math.inf, numerator)
+        else:
+            self.k = 100 * (close - low) / (high - low)
+
+        self.d = self.d_ma.update(self.k)
+        self.value = self.k
+        return self.value
+
+    def update(self, value: float) -> float:
+        return self.push({'close': value, 'high': value, 'low': value})
+
+    def outputs(self, name: str) -> Dict[str, float]:
+        return {f'{name}_k': self.k, f'{name}_d': self.d}
+
+
+def snapshot(states: Dict[str, IndicatorState]) -> Dict[str, float]:
+    """상태 묶음의 현재 값 {이름: 값}"""
+    values = {}
+    for name, state in states.items():
+        values.update(state.outputs(name))
+    return values
+
+
+class IndicatorBook:
+    """종목별 지표 상태 관리 (분봉 DataFrame을 주기마다 받아 새로 완성된 분봉만 반영)
+
+    분봉 조회 결과의 마지막 봉은 아직 진행 중인 봉으로 보고 상태에 확정하지 않고,
+    임시로 반영해서 값만 계산한 뒤 checkpoint 시점으로 되돌림 (다음 주기에 봉이 완성되면 그때 확정)
+    조회 결과가 마지막 확정 봉 이후부터 시작하거나(누락 구간) 시각이 거꾸로 가면(날짜 변경) 처음부터 다시 쌓음
+    """
+
+    def __init__(self, factory: Callable[[], Dict[str, IndicatorState]],
+                 time_col: str = 'stck_cntg_hour', columns: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            factory: 종목 하나의 상태 묶음 생성 함수 → {이름: IndicatorState}
+            time_col: 분봉 시각 컬럼
+            columns: 봉 값 컬럼 {'close': ..., 'high': ..., 'low': ..., 'volume': ...}
+        """
+        self.factory = factory
+        self.time_col = time_col
+        self.columns = dict(columns or FRAME_COLUMNS)
+        self.entries = {}  # {종목코드: {'states', 'last_time', 'committed', 'current'}}
+        self.lock = threading.Lock()
+
+    def _new_entry(self) -> Dict:
+        return {'states': self.factory(), 'last_time': None, 'committed': {}, 'current': {}}
+
+    def _bars(self, df: pd.DataFrame, start: int, end: int):
+        """DataFrame 행 구간을 봉 dict로 변환"""
+        fields = [(key, col) for key, col in self.columns.items() if col in df.columns]
+        data = {key: df[col].to_numpy()[start:end] for key, col in fields}
+        for i in range(end - start):
+            yield {key: values[i] for key, values in data.items()}
+
+    @staticmethod
+    def _push(states: Dict[str, IndicatorState], bar: Dict[str, float]):
+        for state in states.values():
+            state.push(bar)
+
+    def sync_frame(self, symbol: str, df: pd.DataFrame) -> Dict[str, float]:
+        """분봉 DataFrame(시각 오름차순)의 새 봉 반영 후 마지막 봉 기준 지표 값 반환"""
+        if df is None or df.empty:
+            return {}
+
+        times = df[self.time_col]
+        with self.lock:
+            entry = self.entries.get(symbol)
+            last_time = entry['last_time'] if entry else None
+            if last_time is not None and (times.iloc[0] > last_time or times.iloc[-1] <= last_time):
+                entry = None  # 누락 구간 또는 날짜 변경
+
+            if entry is None:
+                entry = self._new_entry()
+                self.entries[symbol] = entry
+                start = 0
+            else:
+                start = int(times.searchsorted(last_time, side='right'))
+
+            # 마지막 봉 직전까지 확정
+            end = len(df) - 1
+            if start < end:
+                for bar in self._bars(df, start, end):
+                    self._push(entry['states'], bar)
+                entry['last_time'] = times.iloc[end - 1]
+                entry['committed'] = snapshot(entry['states'])
+
+            # 진행 중인 마지막 봉은 값만 계산하고 되돌림
+            states = entry['states']
+            saved = {name: state.checkpoint() for name, state in states.items()}
+            try:
+                self._push(states, next(self._bars(df, end, end + 1)))
+                entry['current'] = snapshot(states)
+            finally:
+                for name, state in states.items():
+                    state.rollback(saved[name])
+            return dict(entry['current'])
+
+    def update_bar(self, symbol: str, bar: Dict, bar_time=None) -> Dict[str, float]:
+        """완성된 봉 하나 확정 반영 (실시간 분봉 이벤트용, bar는 columns 매핑의 컬럼명 사용)"""
+        with self.lock:
+            entry = self.entries.get(symbol)
+            if entry and bar_time is not None and entry['last_time'] is not None:
+                if bar_time == entry['last_time']:
+                    return dict(entry['committed'])  # 이미 반영한 봉
+                if bar_time < entry['last_time']:
+                    entry = None  # 날짜 변경
+
+            if entry is None:
+                entry = self._new_entry()
+                self.entries[symbol] = entry
+
+            values = {key: bar.get(col, NAN) for key, col in self.columns.items()}
+            self._push(entry['states'], values)
+            entry['last_time'] = bar_time
+            entry['committed'] = entry['current'] = snapshot(entry['states'])
+            return dict(entry['committed'])
+
+    def latest(self, symbol: str) -> Dict[str, float]:
+        """마지막 sync/update 기준 지표 값"""
+        entry = self.entries.get(symbol)
+        return dict(entry['current']) if entry else {}
+
+    def previous(self, symbol: str) -> Dict[str, float]:
+        """확정된 봉(마지막 봉 직전)까지의 지표 값"""
+        entry = self.entries.get(symbol)
+        return dict(entry['committed']) if entry else {}
+
+    def reset(self, symbol: str = None):
+        """종목(None이면 전체) 상태 초기화"""
+        with self.lock:
+            if symbol is None:
+                self.entries.clear()
+            else:
+                self.entries.pop(symbol, None)
@@ -2,7 +2,6 @@
 KIS API 클라이언트 모듈
 토큰 관리, API 호출 등 기본 기능
 """
-import requests
 import json
 import time
 import os
@@ -10,6 +9,9 @@ import logging
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
+from http_client import get_http_client, KIS_TR_LIMITS
+from token_broker import get_token_broker
+
 load_dotenv()
 
 class KISAPIClient:
@@ -18,15 +20,35 @@ class KISAPIClient:
         self.app_secret = os.getenv("KIS_APP_SECRET")
         self.token_file = "token.json"
         self.access_token = None
+        self.http = get_http_client()  # 프로세스 공유 클라이언트 (keep-alive, TR ID별 속도 제한)
+        self.http.set_default_tr_limits(KIS_TR_LIMITS)
         self.logger = logging.getLogger(__name__)
 
+    @property
+    def rate_limiter(self):
+        """프로세스 전역 호출 속도 제한기 (TokenBucket)"""
+        return self.http.limiter
+
+    def set_rate_limiter(self, rate_limiter):
+        """호출 속도 제한기(TokenBucket) 설정 - 공유 클라이언트의 전역 제한기를 교체"""
+        self.http.set_rate_limiter(rate_limiter)
+
+    def throttle(self, tr_id=None):
+        """API 호출 전 대기 (공유 클라이언트의 전역/TR ID별 제한)"""
+        self.http.acquire(tr_id)
+
     def load_keys(self):
         if not self.app_key or not self.app_secret:
             raise ValueError("환경변수 KIS_APP_KEY 또는 KIS_APP_SECRET이 설정되지 않았습니다.")
         return self.app_key, self.app_secret
 
-    def request_new_token(self):
-        """새로운 액세스 토큰 요청"""
+    @property
+    def token_broker(self):
+        """token.json 공유 브로커 (메모리 캐시, 프로세스 간 파일 잠금, 만료 전 백그라운드 갱신)"""
+        return get_token_broker(self.token_file, self.issue_token, name="KIS", logger=self.logger)
+
+    def issue_token(self):
+        """새로운 액세스 토큰 발급 (파일 저장은 토큰 브로커가 수행)"""
         url = "https://openapi.koreainvestment.com:9443/oauth2/tokenP"
         headers = {"Content-Type": "application/json"}
         data = {
@@ -36,42 +58,24 @@ class KISAPIClient:
         }
         
         try:
-            res = requests.post(url, headers=headers, data=json.dumps(data))
+            res = self.http.post(url, headers=headers, data=json.dumps(data), throttle=False)
             res.raise_for_status()
             token_data = res.json()
             token_data["requested_at"] = int(time.time())
-            
-            with open(self.token_file, "w") as f:
-                json.dump(token_data, f)
-            
-            self.logger.info("✅ 새로운 액세스 토큰 발급 완료")
-            return token_data["access_token"]
+            return token_data
         except Exception as e:
             self.logger.error(f"❌ 토큰 발급 실패: {e}")
             raise
 
-    def load_token(self):
-        """저장된 토큰 로드 또는 새 토큰 요청"""
-        if not os.path.exists(self.token_file):
-            return self.request_new_token()
-        
-        try:
-            with open(self.token_file, "r") as f:
-                token_data = json.load(f)
+    def request_new_token(self):
+        """토큰 강제 재발급 (현재 토큰을 폐기하고 브로커를 통해 발급)"""
+        self.token_broker.invalidate(self.access_token)
+        return self.load_token()
 
-            now = int(time.time())
-            issued_at = token_data.get("requested_at", 0)
-            expires_in = int(token_data.get("expires_in", 0))
-            
-            # 토큰이 만료되었으면 새로 요청
-            if now - issued_at >= expires_in - 3600:  # 1시간 여유
-                return self.request_new_token()
-            else:
-                self.access_token = token_data["access_token"]
-                return self.access_token
-        except Exception as e:
-            self.logger.error(f"❌ 토큰 로드 실패: {e}")
-            return self.request_new_token()
+    def load_token(self):
+        """유효한 토큰 반환 (메모리 캐시 우선, 만료 임박 시 브로커가 재발급)"""
+        self.access_token = self.token_broker.get_token()
+        return self.access_token
 
     def get_headers(self, tr_id):
         """API 요청 헤더 생성"""
@@ -84,19 +88,17 @@ class KISAPIClient:
         }
 
     def api_request(self, url, params, tr_id, max_retries=3):
-        """통합 API 요청 함수"""
+        """통합 API 요청 함수
+
+        429/5xx 재시도는 공유 HTTP 클라이언트가 백오프와 함께 max_retries회까지 수행
+        (KIS 초당 한도 초과 EGW00201도 HTTP 500이라 재시도 계층을 하나로 유지)
+        """
         headers = self.get_headers(tr_id)
-        
-        for attempt in range(max_retries):
-            try:
-                time.sleep(0.15)  # API 호출 제한 고려
-                response = requests.get(url, headers=headers, params=params, timeout=10)
-                response.raise_for_status()
-                return response.json()
-            except Exception as e:
-                self.logger.error(f"❌ API 요청 실패 (시도 {attempt + 1}/{max_retries}): {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(1)
-                else:
-                    raise
-        return None
+
+        try:
+            response = self.http.get(url, headers=headers, params=params, timeout=10, retries=max_retries)
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            self.logger.error(f"❌ API 요청 실패: {e}")
+            raise
@@ -5,7 +5,6 @@
 import requests
 import json
 import time
-import os
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
@@ -13,6 +12,7 @@ import pandas as pd
 
 from kiwoom_config import KiwoomConfig
 from base_fetcher import BaseAPIClient
+from token_broker import get_token_broker
 import yaml
 
 
@@ -29,10 +29,12 @@ class KiwoomAPIClient(BaseAPIClient):
         self.token_file = self.config.TOKEN_FILE
 
         self.access_token = None
-        self.last_token_time = None
-        
-        # 계좌별 독립 토큰 캐시 {alias: {'token': ..., 'time': ...}}
-        self._account_tokens: Dict[str, dict] = {}
+
+        # 계좌별 토큰 브로커 {alias: TokenBroker}
+        self._account_brokers: Dict[str, object] = {}
+
+        # 호출 속도 제한기 (여러 스레드에서 동시 조회 시 set_rate_limiter로 공유 TokenBucket 설정)
+        self.rate_limiter = None
 
         self.logger = logging.getLogger(__name__)
 
@@ -47,97 +49,55 @@ class KiwoomAPIClient(BaseAPIClient):
         self.kis_token = None
         self.kis_token_time = None
     
-    def load_saved_token(self) -> bool:
-        """저장된 토큰 파일에서 토큰 로드"""
-        try:
-            if os.path.exists(self.token_file):
-                with open(self.token_file, 'r', encoding='utf-8') as f:
-                    token_data = json.load(f)
-
-                expire_time_str = token_data.get('access_token_token_expired', '')
-                if expire_time_str:
-                    expire_time = datetime.strptime(expire_time_str, '%Y-%m-%d %H:%M:%S')
-
-                    # 만료 10분 전이면 재발급
-                    if datetime.now() < expire_time - timedelta(minutes=10):
-                        token = token_data.get('access_token')
-                        if token:
-                            self.access_token = token
-                            self.last_token_time = datetime.fromtimestamp(
-                                token_data.get('requested_at', 0)
-                            )
-                            self.logger.info("✅ 저장된 토큰 로드 성공")
-                            return True
-        except Exception as e:
-            self.logger.warning(f"⚠️ 토큰 로드 실패: {e}")
-
-        return False
-    
-    def save_token(self, token_response: dict):
-        """토큰을 파일에 저장"""
-        try:
-            current_time = int(time.time())
+    def set_rate_limiter(self, rate_limiter):
+        """호출 속도 제한기(TokenBucket) 설정 (여러 스레드 공유 가능)"""
+        self.rate_limiter = rate_limiter
+
+    def throttle(self):
+        """API 호출 전 대기 (Rate Limiter가 없으면 고정 간격)"""
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+        else:
+            time.sleep(self.config.API_DELAY)
 
-            # expires_dt는 "20260206102638" 형식
-            expires_dt = token_response.get('expires_dt', '')
-            if expires_dt:
-                expire_datetime = datetime.strptime(expires_dt, '%Y%m%d%H%M%S')
-            else:
-                expire_datetime = datetime.fromtimestamp(current_time + 86400)
+    @property
+    def token_broker(self):
+        """메인 토큰 공유 브로커 (메모리 캐시, 프로세스 간 파일 잠금, 만료 전 백그라운드 갱신)"""
+        return get_token_broker(self.token_file, self._request_new_token, name="키움",
+                                validator=self._is_token_valid, logger=self.logger)
+
+    def _account_broker(self, alias: str, app_key: str, app_secret: str):
+        """계좌별 토큰 공유 브로커 (kiwoom_token_{alias}.json)"""
+        broker = self._account_brokers.get(alias)
+        if broker is None:
+            broker = get_token_broker(
+                f"kiwoom_token_{alias}.json",
+                lambda: self._issue_token(app_key, app_secret),
+                name=f"키움 {alias}", validator=self._is_token_valid, logger=self.logger
+            )
+            self._account_brokers[alias] = broker
+        return broker
 
-            token_data = {
-                'access_token': token_response.get('token'),
-                'access_token_token_expired': expire_datetime.strftime('%Y-%m-%d %H:%M:%S'),
-                'token_type': token_response.get('token_type', 'Bearer'),
-                'expires_dt': expires_dt,
-                'requested_at': current_time
-            }
-            
-            with open(self.token_file, 'w', encoding='utf-8') as f:
-                json.dump(token_data, f, ensure_ascii=False, indent=2)
-            
-            self.logger.info("✅ 토큰 저장 완료")
-        except Exception as e:
-            self.logger.error(f"❌ 토큰 저장 실패: {e}")
-    
     def get_access_token(self) -> str:
         """
-        키움 REST API 액세스 토큰 발급 또는 재사용
+        키움 REST API 액세스 토큰 반환 (토큰 브로커 경유)
 
         ※ 키움 API 특성: 신규 토큰 발급 시 이전 토큰 즉시 무효화.
            파일 만료시각이 유효해 보여도 다른 프로세스가 재발급했다면 서버에서 무효.
-           따라서 파일 토큰 로드 후 반드시 서버 검증을 거칩니다.
+           따라서 이 프로세스가 처음 보는 파일 토큰은 서버 검증 후 채택하고,
+           이후 다른 프로세스의 재발급은 브로커가 파일 변경으로 감지하여 반영합니다.
 
         흐름:
-          1. 메모리 토큰 (같은 프로세스 내 발급) → 재사용
-          2. 파일 토큰 로드 → 서버 검증 통과 시 재사용
+          1. 메모리 토큰 유효 → 파일 I/O 없이 재사용 (만료 30분 전부터 백그라운드 재발급)
+          2. 메모리 토큰 없음/만료 → 파일 잠금 후 파일 토큰 확인, 서버 검증 통과 시 재사용
           3. 파일 토큰 무효 또는 없음 → 신규 발급 후 파일 갱신
         """
-        # 1. 이번 프로세스에서 발급한 메모리 토큰 재사용 (23시간 이내)
-        if self.access_token and self.last_token_time:
-            if datetime.now() - self.last_token_time < timedelta(hours=23):
-                return self.access_token
-
-        # 2. 파일 토큰 로드 후 서버 검증
-        if self.load_saved_token() and self.access_token:
-            if self._is_token_valid(self.access_token):
-                self.last_token_time = datetime.now()
-                self.logger.info("✅ 파일 토큰 서버 검증 성공, 재사용")
-                return self.access_token
-            else:
-                self.logger.warning(
-                    "⚠️ 파일 토큰 서버 검증 실패 (다른 프로세스가 재발급한 것으로 추정). "
-                    "신규 발급합니다."
-                )
-                self.access_token = None
-                self.last_token_time = None
-
-        # 3. 신규 토큰 발급
-        return self._request_new_token()
+        self.access_token = self.token_broker.get_token()
+        return self.access_token
 
     def get_account_token(self, alias: str, app_key: str, app_secret: str) -> str:
         """
-        계좌별 독립 토큰 발급/캐시 반환
+        계좌별 독립 토큰 반환 (토큰 브로커 경유, 메모리 토큰 유효 시 서버 검증·파일 I/O 없음)
 
         Args:
             alias: 계좌 별칭 (토큰 파일 구분용)
@@ -147,69 +107,18 @@ class KiwoomAPIClient(BaseAPIClient):
         Returns:
             str: 액세스 토큰
         """
-        token_file = f"kiwoom_token_{alias}.json"
-
-        # 캐시 확인
-        cached = self._account_tokens.get(alias)
-        if cached:
-            # 서버 검증
-            if self._is_token_valid(cached['token']):
-                return cached['token']
-            else:
-                self.logger.warning(f"⚠️ {alias} 캐시 토큰 만료, 재발급")
-                self._account_tokens.pop(alias, None)
-
-        # 파일 캐시 확인
-        try:
-            if os.path.exists(token_file):
-                with open(token_file, 'r', encoding='utf-8') as f:
-                    token_data = json.load(f)
-                expire_str = token_data.get('access_token_token_expired', '')
-                if expire_str:
-                    expire_time = datetime.strptime(expire_str, '%Y-%m-%d %H:%M:%S')
-                    if datetime.now() < expire_time - timedelta(minutes=10):
-                        token = token_data.get('access_token')
-                        if token and self._is_token_valid(token):
-                            self._account_tokens[alias] = {'token': token}
-                            self.logger.info(f"✅ {alias} 파일 토큰 재사용")
-                            return token
-        except Exception as e:
-            self.logger.warning(f"⚠️ {alias} 토큰 파일 로드 실패: {e}")
-
-        # 신규 발급
-        self.logger.info(f"🔄 {alias} 토큰 신규 발급 중...")
-        url = f"{self.base_url}/oauth2/token"
-        headers = {"Content-Type": "application/json; charset=UTF-8"}
-        data = {
-            "grant_type": "client_credentials",
-            "appkey": app_key,
-            "secretkey": app_secret
-        }
-
-        try:
-            response = requests.post(url, headers=headers,
-                                     data=json.dumps(data),
-                                     timeout=self.config.TIMEOUT)
-            response.raise_for_status()
-            token_response = response.json()
-
-            if token_response.get('return_code') != 0:
-                raise Exception(f"토큰 발급 실패: {token_response.get('return_msg', '')}")
+        return self._account_broker(alias, app_key, app_secret).get_token()
 
-            token = token_response.get('token')
-            self._account_tokens[alias] = {'token': token}
+    def invalidate_token(self, token: str):
+        """서버가 거부한 토큰 폐기 (다음 조회 시 파일 재확인 후 필요하면 재발급)"""
+        for broker in [self.token_broker, *self._account_brokers.values()]:
+            broker.invalidate(token)
 
-            # 파일 저장
-            token_response['requested_at'] = datetime.now().timestamp()
-            with open(token_file, 'w', encoding='utf-8') as f:
-                json.dump(token_response, f, ensure_ascii=False, indent=2)
-
-            self.logger.info(f"✅ {alias} 토큰 발급 완료")
-            return token
-
-        except Exception as e:
-            self.logger.error(f"❌ {alias} 토큰 발급 실패: {e}")
-            raise
+    @staticmethod
+    def _is_token_rejected(data: dict) -> bool:
+        """응답이 토큰 무효(8005) 오류인지 확인"""
+        msg = str(data.get('return_msg', '')) if isinstance(data, dict) else ''
+        return '8005' in msg or 'Token이 유효하지 않습니다' in msg
 
     def _is_token_valid(self, token: str) -> bool:
         """토큰 서버 유효성 검증 (ka10080으로 실제 확인)"""
@@ -237,16 +146,18 @@ class KiwoomAPIClient(BaseAPIClient):
         except Exception:
             return False
 
-    def _request_new_token(self) -> str:
-        """신규 토큰 발급 및 파일 저장"""
-        self.logger.info("🔄 새로운 토큰 발급 중...")
+    def _request_new_token(self) -> Dict:
+        """메인 토큰 신규 발급 (토큰 브로커의 발급 함수)"""
+        return self._issue_token(self.app_key, self.app_secret)
 
+    def _issue_token(self, app_key: str, app_secret: str) -> Dict:
+        """신규 토큰 발급 후 토큰 파일 형식으로 반환 (파일 저장은 브로커가 수행)"""
         url = f"{self.base_url}/oauth2/token"
         headers = {"Content-Type": "application/json; charset=UTF-8"}
         data = {
             "grant_type": "client_credentials",
-            "appkey": self.app_key,
-            "secretkey": self.app_secret
+            "appkey": app_key,
+            "secretkey": app_secret
         }
 
         try:
@@ -262,12 +173,22 @@ class KiwoomAPIClient(BaseAPIClient):
             if return_code != 0:
                 raise Exception(f"토큰 발급 실패: {token_response.get('return_msg', '')}")
 
-            self.access_token = token_response.get('token')
-            self.last_token_time = datetime.now()
-            self.save_token(token_response)
+            current_time = int(time.time())
+
+            # expires_dt는 "20260206102638" 형식
+            expires_dt = token_response.get('expires_dt', '')
+            if expires_dt:
+                expire_datetime = datetime.strptime(expires_dt, '%Y%m%d%H%M%S')
+            else:
+                expire_datetime = datetime.fromtimestamp(current_time + 86400)
 
-            self.logger.info("✅ 새 토큰 발급 완료")
-            return self.access_token
+            return {
+                'access_token': token_response.get('token'),
+                'access_token_token_expired': expire_datetime.strftime('%Y-%m-%d %H:%M:%S'),
+                'token_type': token_response.get('token_type', 'Bearer'),
+                'expires_dt': expires_dt,
+                'requested_at': current_time
+            }
 
         except Exception as e:
             self.logger.error(f"❌ 토큰 발급 실패: {e}")
@@ -293,9 +214,10 @@ class KiwoomAPIClient(BaseAPIClient):
         Returns:
             dict: API 응답 데이터
         """
+        token = self.get_access_token()
         headers = {
             "Content-Type": "application/json;charset=UTF-8",
-            "authorization": f"Bearer {self.get_access_token()}"
+            "authorization": f"Bearer {token}"
         }
 
         if api_id:
@@ -303,7 +225,7 @@ class KiwoomAPIClient(BaseAPIClient):
         
         for attempt in range(self.config.MAX_RETRIES):
             try:
-                time.sleep(self.config.API_DELAY)
+                self.throttle()
 
                 # 키움 API는 기본적으로 POST 사용
                 response = requests.post(
@@ -326,7 +248,15 @@ class KiwoomAPIClient(BaseAPIClient):
                     else:
                         raise Exception(f"HTTP {response.status_code}: {error_detail}")
 
-                return response.json()
+                data = response.json()
+                if self._is_token_rejected(data) and attempt < self.config.MAX_RETRIES - 1:
+                    # 다른 프로세스가 재발급하여 무효화된 토큰 → 폐기 후 새 토큰으로 재시도
+                    self.invalidate_token(token)
+                    token = self.get_access_token()
+                    headers["authorization"] = f"Bearer {token}"
+                    continue
+
+                return data
 
             except Exception as e:
                 if "HTTP" not in str(e):
@@ -475,12 +405,15 @@ class KiwoomAPIClient(BaseAPIClient):
             "api-id": api_id,
         }
         try:
-            time.sleep(self.config.API_DELAY)
+            self.throttle()
             response = requests.post(url, headers=headers,
                                      json=params or {},
                                      timeout=self.config.TIMEOUT)
             if response.status_code == 200:
-                return response.json()
+                data = response.json()
+                if self._is_token_rejected(data):
+                    self.invalidate_token(token)
+                return data
             self.logger.error(f"❌ HTTP {response.status_code}: {response.text[:300]}")
             return None
         except Exception as e:
@@ -641,7 +574,8 @@ class KiwoomAPIClient(BaseAPIClient):
             return pd.DataFrame()
     
 
-    def get_minute_price_data(self, stock_code: str, count: int = 120) -> list:
+    def get_minute_price_data(self, stock_code: str, count: int = 120,
+                              since: Optional[datetime] = None) -> list:
         """
         키움 REST API (ka10080) 주식분봉차트 조회
         NXT 시간외 거래(15:30 ~ 20:00) 포함 데이터 수집
@@ -649,6 +583,8 @@ class KiwoomAPIClient(BaseAPIClient):
         Args:
             stock_code: 종목코드 (6자리)
             count: 수집할 분봉 개수 (기본 120개)
+            since: 지정 시 이 시각 이후(포함) 분봉만 수집하고 더 과거 페이지는 조회하지 않음
+                   (마지막 저장 분봉은 진행 중이던 봉일 수 있어 다시 받아 갱신)
 
         Returns:
             List[Dict]: DB 저장용 분봉 레코드 리스트
@@ -681,7 +617,7 @@ class KiwoomAPIClient(BaseAPIClient):
             }
 
             try:
-                time.sleep(self.config.API_DELAY)
+                self.throttle()
                 response = requests.post(
                     url,
                     headers=headers,
@@ -737,6 +673,11 @@ class KiwoomAPIClient(BaseAPIClient):
                     self.logger.debug(f"레코드 변환 오류 ({stock_code}): {e}")
                     continue
 
+            # since 이전 분봉이 나오면 종료 (응답은 최신 분봉부터)
+            if since is not None and any(r["trade_datetime"] < since for r in all_records):
+                all_records = [r for r in all_records if r["trade_datetime"] >= since]
+                break
+
             # count 충족 시 종료
             if len(all_records) >= count:
                 all_records = all_records[:count]
@@ -749,10 +690,13 @@ class KiwoomAPIClient(BaseAPIClient):
             if cont_yn != "Y" or not next_key:
                 break
 
-        self.logger.info(
-            f"✅ {stock_code}: 분봉 {len(all_records)}건 수집 "
-            f"(NXT 포함, 키움 ka10080)"
-        )
+        if since is not None:
+            self.logger.debug(f"✅ {stock_code}: 신규 분봉 {len(all_records)}건 (since {since:%H:%M})")
+        else:
+            self.logger.info(
+                f"✅ {stock_code}: 분봉 {len(all_records)}건 수집 "
+                f"(NXT 포함, 키움 ka10080)"
+            )
         return all_records
 
     def get_kis_token(self) -> str:
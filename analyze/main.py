@@ -4,12 +4,17 @@
 """
 import os
 import time
+import argparse
+import logging
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from datetime import datetime
 from dotenv import load_dotenv
 
 # 모듈 import (기존과 동일)
 from data_fetcher import DataFetcher
 from technical_indicators import SignalAnalyzer
+from rate_limiter import TokenBucket
+from quote_snapshot import QuoteSnapshot
 from utils import (
     setup_logger, send_discord_message, format_multi_signal_message,
     format_signal_combination_message, save_backtest_candidates, ProgressTracker
@@ -24,12 +29,56 @@ from enhanced_technical_indicators import (
 
 load_dotenv()
 
+
+def score_stock(df, name, code, foreign_trend, foreign_netbuy_list, detail_min_score=3):
+    """종목 점수 계산 (CPU 단계 - 프로세스 풀에서 실행 가능하도록 모듈 함수로 분리)
+
+    Returns:
+        dict: {'score', 'active_signals', 'passes_absolute', 'filter_reason',
+               'individual_signals'(detail_min_score 이상일 때만, 아니면 None)}
+        None: 점수 계산 실패
+    """
+    try:
+        score, active_signals, passes_absolute, filter_reason = SignalAnalyzer.calculate_buy_signal_score(
+            df, name, code, foreign_trend=foreign_trend, foreign_netbuy_list=foreign_netbuy_list
+        )
+    except Exception as score_error:
+        logging.getLogger(__name__).error(f"❌ {name}({code}) 점수 계산 실패: {score_error}")
+        return None
+
+    individual_signals = None
+    if passes_absolute and score >= detail_min_score:
+        try:
+            individual_signals = SignalAnalyzer(None).get_individual_signals(df)
+        except Exception as signal_error:
+            logging.getLogger(__name__).warning(f"⚠️ {name}({code}) 개별신호 분석 실패: {signal_error}")
+
+    return {
+        'score': score,
+        'active_signals': active_signals,
+        'passes_absolute': passes_absolute,
+        'filter_reason': filter_reason,
+        'individual_signals': individual_signals
+    }
+
+
 class EnhancedStockAnalyzer:
     """강화된 주식 분석 메인 클래스 - 절대조건 필터링"""
 
-    def __init__(self):
+    def __init__(self, workers=1, score_workers=0, api_rate_limit=15, quote_ttl=300):
+        """
+        Args:
+            workers: 종목 조회 스레드 수 (1이면 순차 분석)
+            score_workers: 점수 계산 프로세스 수 (0이면 메인 스레드에서 계산)
+            api_rate_limit: 초당 API 호출 한도 (모든 조회 스레드 공유)
+            quote_ttl: 현재가 스냅샷 유효 시간(초), 지나면 종목별로 다시 조회
+        """
         self.logger = setup_logger()
         self.data_fetcher = DataFetcher()
+        self.workers = max(1, workers or 1)
+        self.score_workers = max(0, score_workers or 0)
+        self.rate_limiter = TokenBucket(api_rate_limit)
+        self.quote_ttl = quote_ttl
         self.signal_analyzer = SignalAnalyzer(self.data_fetcher)
         self.webhook_url = os.getenv("DISCORD_WEBHOOK_URL")
 
@@ -121,140 +170,167 @@ class EnhancedStockAnalyzer:
         개별 종목 분석 (절대조건 필터링 적용)
         버그 수정 완료 버전
         """
+        success, _ = self._analyze_one(name, code)
+        return success
+
+    def _analyze_one(self, name, code):
+        """개별 종목 분석 (조회 → 점수 계산 → 결과 기록)
+
+        Returns:
+            tuple: (분석 성공 여부, 절대조건 통과 여부)
+        """
         try:
-            # 외국인 순매수 추세 확인 (로컬 DB 우선, 없으면 API)
-            try:
-                if self.use_local_db:
-                    foreign_netbuy_list, foreign_trend = self.data_fetcher.get_foreign_netbuy_trend_from_db(code)
-                    # DB에서 데이터가 없거나 불충분하면 API 사용
-                    if not foreign_netbuy_list or foreign_trend == "unknown":
-                        self.logger.debug(f"🌐 {name}({code}): 외국인 데이터 API 사용")
-                        foreign_netbuy_list, foreign_trend = self.data_fetcher.get_foreign_netbuy_trend(code)
-                    else:
-                        self.logger.debug(f"💾 {name}({code}): 외국인 데이터 DB 사용")
-                else:
+            data = self._fetch_stock_data(name, code)
+            if data is None:
+                return False, False
+
+            df, foreign_netbuy_list, foreign_trend = data
+            if self.use_local_db:
+                self.signal_analyzer.load_stored_indicators(df, code)
+            result = score_stock(df, name, code, foreign_trend, foreign_netbuy_list,
+                                 self.min_score_for_detail)
+            if result is None:
+                return False, False
+
+            return True, self._record_analysis(name, code, df, foreign_netbuy_list, foreign_trend, result)
+
+        except Exception as e:
+            self.logger.error(f"❌ {name}({code}) 분석 실패: {e}")
+            import traceback
+            traceback.print_exc()
+            return False, False
+
+    def _fetch_stock_data(self, name, code):
+        """종목 데이터 조회 (I/O 단계 - 여러 스레드에서 동시 호출 가능)
+
+        Returns:
+            tuple: (일봉 DataFrame, 외국인 순매수 리스트, 외국인 추세) 또는 None (조회 실패)
+        """
+        # 외국인 순매수 추세 확인 (로컬 DB 우선, 없으면 API)
+        try:
+            if self.use_local_db:
+                foreign_netbuy_list, foreign_trend = self.data_fetcher.get_foreign_netbuy_trend_from_db(code)
+                # DB에서 데이터가 없거나 불충분하면 API 사용
+                if not foreign_netbuy_list or foreign_trend == "unknown":
+                    self.logger.debug(f"🌐 {name}({code}): 외국인 데이터 API 사용")
                     foreign_netbuy_list, foreign_trend = self.data_fetcher.get_foreign_netbuy_trend(code)
-            except Exception as e:
-                self.logger.warning(f"⚠️ {name}({code}) 외국인 데이터 조회 실패: {e}")
-                foreign_netbuy_list, foreign_trend = [], "unknown"
-            
-            # 주가 데이터 조회 (로컬 DB 우선, 없으면 API)
-            df = None
+                else:
+                    self.logger.debug(f"💾 {name}({code}): 외국인 데이터 DB 사용")
+            else:
+                foreign_netbuy_list, foreign_trend = self.data_fetcher.get_foreign_netbuy_trend(code)
+        except Exception as e:
+            self.logger.warning(f"⚠️ {name}({code}) 외국인 데이터 조회 실패: {e}")
+            foreign_netbuy_list, foreign_trend = [], "unknown"
+        
+        # 주가 데이터 조회 (로컬 DB 우선, 없으면 API)
+        df = None
+        try:
+            # 로컬 DB 사용 시도
+            if self.use_local_db:
+                df = self.data_fetcher.get_daily_data_from_db(code)
+                if df is not None and not df.empty:
+                    self.logger.debug(f"💾 {name}({code}): 로컬 DB 데이터 사용")
+
+            # 로컬 DB에 데이터가 없거나 DB 미사용 시 API 사용
+            if df is None or df.empty:
+                self.logger.debug(f"🌐 {name}({code}): API 데이터 사용")
+                df = self.data_fetcher.get_daily_price_data_with_realtime(code)
+
+        except Exception as e:
+            self.logger.warning(f"⚠️ {name}({code}) 실시간 데이터 실패, 기본 API 시도: {e}")
             try:
-                # 로컬 DB 사용 시도
-                if self.use_local_db:
-                    df = self.data_fetcher.get_daily_data_from_db(code)
-                    if df is not None and not df.empty:
-                        self.logger.debug(f"💾 {name}({code}): 로컬 DB 데이터 사용")
+                df = self.data_fetcher.get_period_price_data(code)
+            except Exception as e2:
+                self.logger.error(f"❌ {name}({code}) 모든 데이터 조회 실패: {e2}")
+                return None
+        
+        if df is None or df.empty:
+            self.logger.warning(f"⚠️ {name}: 가격 데이터를 가져올 수 없습니다.")
+            return None
 
-                # 로컬 DB에 데이터가 없거나 DB 미사용 시 API 사용
-                if df is None or df.empty:
-                    self.logger.debug(f"🌐 {name}({code}): API 데이터 사용")
-                    df = self.data_fetcher.get_daily_price_data_with_realtime(code)
+        return df, foreign_netbuy_list, foreign_trend
 
-            except Exception as e:
-                self.logger.warning(f"⚠️ {name}({code}) 실시간 데이터 실패, 기본 API 시도: {e}")
-                try:
-                    df = self.data_fetcher.get_period_price_data(code)
-                except Exception as e2:
-                    self.logger.error(f"❌ {name}({code}) 모든 데이터 조회 실패: {e2}")
-                    return False
-            
-            if df is None or df.empty:
-                self.logger.warning(f"⚠️ {name}: 가격 데이터를 가져올 수 없습니다.")
+    def _record_analysis(self, name, code, df, foreign_netbuy_list, foreign_trend, result):
+        """점수 계산 결과 기록 (메인 스레드에서만 호출)
+
+        Returns:
+            bool: 절대조건 통과 여부 (다중신호 등급에 분류되었는지)
+        """
+        score = result['score']
+        active_signals = result['active_signals']
+        filter_reason = result['filter_reason']
+
+        # 절대조건 미통과시 로깅 후 종료
+        if not result['passes_absolute']:
+            self.logger.debug(f"🚫 {name}({code}) 절대조건 미통과: {filter_reason}")
+            return False  # 분석은 성공했으나 조건 미통과
+        
+        # 현재 가격 정보 안전하게 추출
+        try:
+            # 컬럼명 통일 처리
+            if 'stck_clpr' in df.columns:
+                current_price = df.iloc[-1]["stck_clpr"]
+            elif 'stck_prpr' in df.columns:
+                current_price = df.iloc[-1]["stck_prpr"]
+            else:
+                current_price = 0
+        
+            if current_price > 400000:
+                self.logger.debug(f"🚫 {name}({code}) 구매가격이 너무 높음: {current_price/10000:.1f}만원")
                 return False
-            
-            # SignalAnalyzer에서 절대조건 체크 및 점수 계산
-            try:
-                score, active_signals, passes_absolute, filter_reason = self.signal_analyzer.calculate_buy_signal_score(
-                    df, name, code, foreign_trend=foreign_trend, foreign_netbuy_list=foreign_netbuy_list
-                )
                 
-                # 절대조건 미통과시 로깅 후 종료
-                if not passes_absolute:
-                    self.logger.debug(f"🚫 {name}({code}) 절대조건 미통과: {filter_reason}")
-                    return True  # 분석은 성공했으나 조건 미통과
-                    
-            except Exception as score_error:
-                self.logger.error(f"❌ {name}({code}) 점수 계산 실패: {score_error}")
-                return False
-            
-            # 현재 가격 정보 안전하게 추출
-            try:
-                # 컬럼명 통일 처리
-                if 'stck_clpr' in df.columns:
-                    current_price = df.iloc[-1]["stck_clpr"]
-                elif 'stck_prpr' in df.columns:
-                    current_price = df.iloc[-1]["stck_prpr"]
-                else:
-                    current_price = 0
-            
-                if current_price > 400000:
-                    self.logger.debug(f"🚫 {name}({code}) 구매가격이 너무 높음: {current_price/10000:.1f}만원")
-                    return True
-                    
-                if 'acml_vol' in df.columns:
-                    volume = df.iloc[-1]["acml_vol"]
-                elif 'cntg_vol' in df.columns:
-                    volume = df.iloc[-1]["cntg_vol"]
-                else:
-                    volume = 0
-                    
-            except Exception as price_error:
-                self.logger.warning(f"⚠️ {name}({code}) 가격정보 추출 실패: {price_error}")
-                current_price = 0
+            if 'acml_vol' in df.columns:
+                volume = df.iloc[-1]["acml_vol"]
+            elif 'cntg_vol' in df.columns:
+                volume = df.iloc[-1]["cntg_vol"]
+            else:
                 volume = 0
-    
-            
-            # 점수별 처리 - 개별 신호 기록
-            if score >= self.min_score_for_detail:
-                try:
-                    individual_signals = self.signal_analyzer.get_individual_signals(df)
-                    # 🔥 버그 수정 1: score 인자 추가
-                    self._record_individual_signals(individual_signals, name, code, foreign_trend, score)
-                except Exception as signal_error:
-                    self.logger.warning(f"⚠️ {name}({code}) 개별신호 분석 실패: {signal_error}")
-            
-            # 다중신호 등급 분류 (절대조건 통과 종목만)
-            stock_info = {
-                "name": name, "code": code, "score": score,
-                "signals": active_signals, "price": current_price, "volume": volume,
-                "foreign": foreign_netbuy_list,
+                
+        except Exception as price_error:
+            self.logger.warning(f"⚠️ {name}({code}) 가격정보 추출 실패: {price_error}")
+            current_price = 0
+            volume = 0
+
+        
+        # 점수별 처리 - 개별 신호 기록
+        if score >= self.min_score_for_detail and result['individual_signals'] is not None:
+            # 🔥 버그 수정 1: score 인자 추가
+            self._record_individual_signals(result['individual_signals'], name, code, foreign_trend, score)
+        
+        # 다중신호 등급 분류 (절대조건 통과 종목만)
+        stock_info = {
+            "name": name, "code": code, "score": score,
+            "signals": active_signals, "price": current_price, "volume": volume,
+            "foreign": foreign_netbuy_list,
+            "filter_status": "절대조건통과",
+            "filter_reason": filter_reason
+        }
+        classified = self._classify_multi_signal_stock_filtered(stock_info)
+        
+        # 🔥 버그 수정 2: _record_signal_combination을 인라인 코드로 교체
+        # 신호 조합 패턴 분석 (3점 이상)
+        if score >= self.min_score_for_messaging and active_signals:
+            combo_key = " + ".join(sorted(active_signals))
+            if combo_key not in self.signal_combinations:
+                self.signal_combinations[combo_key] = []
+            self.signal_combinations[combo_key].append(f"{name}({code})")
+        
+        # 백테스트 후보 (3점 이상, 절대조건 통과)
+        if score >= self.min_score_for_messaging:
+            self.backtest_candidates.append({
+                "code": code,
+                "name": name,
+                "score": score,
+                "signals": active_signals,
+                "price": current_price,
+                "volume": volume,
+                "foreign_netbuy": foreign_netbuy_list,
                 "filter_status": "절대조건통과",
-                "filter_reason": filter_reason
-            }
-            self._classify_multi_signal_stock_filtered(stock_info)
-            
-            # 🔥 버그 수정 2: _record_signal_combination을 인라인 코드로 교체
-            # 신호 조합 패턴 분석 (3점 이상)
-            if score >= self.min_score_for_messaging and active_signals:
-                combo_key = " + ".join(sorted(active_signals))
-                if combo_key not in self.signal_combinations:
-                    self.signal_combinations[combo_key] = []
-                self.signal_combinations[combo_key].append(f"{name}({code})")
-            
-            # 백테스트 후보 (3점 이상, 절대조건 통과)
-            if score >= self.min_score_for_messaging:
-                self.backtest_candidates.append({
-                    "code": code,
-                    "name": name,
-                    "score": score,
-                    "signals": active_signals,
-                    "price": current_price,
-                    "volume": volume,
-                    "foreign_netbuy": foreign_netbuy_list,
-                    "filter_status": "절대조건통과",
-                    "filter_reason": filter_reason,
-                    "analysis_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                })
-            
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"❌ {name}({code}) 분석 실패: {e}")
-            import traceback
-            traceback.print_exc()
-            return False
+                "filter_reason": filter_reason,
+                "analysis_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            })
+        
+        return classified
     
     def _record_individual_signals(self, signals, name, code, foreign_trend, score):
         """개별 신호 기록 (점수별 필터링 적용)"""
@@ -275,9 +351,12 @@ class EnhancedStockAnalyzer:
             self.logger.info(f"📊 {name}({code}) {score}점 ✅: {', '.join(active_signal_names)}")
 
     def _classify_multi_signal_stock_filtered(self, stock_info):
-        """다중신호 등급별 분류 (절대조건 통과 종목만)"""
+        """다중신호 등급별 분류 (절대조건 통과 종목만, 분류되면 True)"""
         score = stock_info["score"]
         
+        if score < 1:
+            return False
+        
         if score >= 5:
             self.multi_signal_stocks["ultra_strong"].append(stock_info)
         elif score == 4:
@@ -290,6 +369,8 @@ class EnhancedStockAnalyzer:
         elif score == 1:
             self.multi_signal_stocks["single_internal"].append(stock_info)
             self.logger.debug(f"📝 절대조건통과: {stock_info['name']}({stock_info['code']}) 1점")
+        
+        return True
 
     def run_analysis(self):
         """전체 분석 실행 (절대조건 필터링 적용)"""
@@ -308,28 +389,38 @@ class EnhancedStockAnalyzer:
             self.logger.error("❌ 종목 리스트를 가져올 수 없습니다.")
             return False
         
+        # API 호출 속도 제한 (모든 조회 스레드 공유)
+        self.data_fetcher.set_rate_limiter(self.rate_limiter)
+        # 토큰을 미리 로드 (여러 스레드가 동시에 재발급하지 않도록)
+        self.data_fetcher.load_token()
+
+        # 로컬 DB 사용 시 전 종목 일봉을 한 번의 쿼리로 적재 (종목별 DB 조회 제거)
+        if self.use_local_db:
+            self.data_fetcher.preload_daily_data(list(stock_list.values()))
+
+        # 전 종목 현재가를 한 번에 조회 (일봉에 붙일 오늘 시세는 스냅샷에서 사용)
+        quote_snapshot = QuoteSnapshot(self.data_fetcher, ttl=self.quote_ttl,
+                                       workers=self.workers, logger=self.logger)
+        quote_snapshot.refresh(list(stock_list.values()))
+        self.data_fetcher.set_quote_snapshot(quote_snapshot)
+
         # 진행상황 추적
         progress = ProgressTracker(len(stock_list))
         
         # 각 종목 분석
-        for name, code in stock_list.items():
-            success = self.analyze_stock(name, code)
-
-            # 절대조건 통과 여부 확인 (multi_signal_stocks에 추가되었는지로 판단)
-            filter_passed = any(
-                stock['code'] == code
-                for grade_stocks in self.multi_signal_stocks.values()
-                for stock in grade_stocks
-            )
-
-            progress.update(success, filter_passed)
+        if self.workers > 1:
+            self._run_concurrent(stock_list, progress)
+        else:
+            for name, code in stock_list.items():
+                success, filter_passed = self._analyze_one(name, code)
+                progress.update(success, filter_passed)
 
-            # API 호출 제한 (로컬 DB 사용 시에는 대기 시간 불필요)
-            if not self.use_local_db:
-                time.sleep(0.2)
-            else:
-                # 로컬 DB 사용 시에도 실시간 현재가 조회를 위한 최소 대기
-                time.sleep(0.05)
+                # API 호출 제한 (로컬 DB 사용 시에는 대기 시간 불필요)
+                if not self.use_local_db:
+                    time.sleep(0.2)
+                else:
+                    # 로컬 DB 사용 시에도 실시간 현재가 조회를 위한 최소 대기
+                    time.sleep(0.05)
         
         # 결과 처리 - ProgressTracker의 카운트 사용
         summary = progress.get_summary()
@@ -340,6 +431,91 @@ class EnhancedStockAnalyzer:
         )
         return True
 
+    def _run_concurrent(self, stock_list, progress):
+        """종목 병렬 분석
+
+        - 조회(I/O): 스레드 풀(workers개), API 호출은 공유 TokenBucket으로 초당 호출 수 제한
+          (오늘 시세는 run_analysis에서 미리 받은 현재가 스냅샷 사용)
+        - 점수 계산(CPU): score_workers > 0이면 프로세스 풀, 아니면 메인 스레드에서 계산
+          (메인 스레드 계산 시 daily_indicators에 저장된 지표를 먼저 적용)
+        - 결과 기록: 모든 종목 완료 후 종목 리스트 순서대로 메인 스레드에서 기록
+          (절대조건 통과 집계는 순차 분석과 같이 _record_analysis 반환값 사용 - 고가 종목 제외 등 반영)
+        """
+        self.logger.info(f"⚡ 병렬 분석: 조회 {self.workers}스레드 (API {self.rate_limiter.rate:.0f}회/초), "
+                         f"점수 계산 {'프로세스 ' + str(self.score_workers) + '개' if self.score_workers > 0 else '메인 스레드'}")
+
+        score_executor = ProcessPoolExecutor(max_workers=self.score_workers) if self.score_workers > 0 else None
+        fetched = {}  # {code: (df, foreign_netbuy_list, foreign_trend)}
+        results = {}  # {code: score_stock 결과}
+
+        def handle_score(code, result):
+            if result is None:
+                progress.update(False, False)
+            else:
+                results[code] = result
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='screen') as io_executor:
+                fetch_futures = {
+                    io_executor.submit(self._fetch_stock_data, name, code): (name, code)
+                    for name, code in stock_list.items()
+                }
+                score_futures = {}
+
+                for future in as_completed(fetch_futures):
+                    name, code = fetch_futures[future]
+                    try:
+                        data = future.result()
+                    except Exception as e:
+                        self.logger.error(f"❌ {name}({code}) 조회 실패: {e}")
+                        data = None
+
+                    if data is None:
+                        progress.update(False, False)
+                        continue
+
+                    fetched[code] = data
+                    df, foreign_netbuy_list, foreign_trend = data
+                    args = (df, name, code, foreign_trend, foreign_netbuy_list, self.min_score_for_detail)
+
+                    if score_executor:
+                        score_futures[score_executor.submit(score_stock, *args)] = (name, code)
+                    else:
+                        # 저장된 지표 조회는 DB 연결을 쓰는 메인 스레드에서만
+                        if self.use_local_db:
+                            self.signal_analyzer.load_stored_indicators(df, code)
+                        handle_score(code, score_stock(*args))
+
+                for future in as_completed(score_futures):
+                    name, code = score_futures[future]
+                    try:
+                        handle_score(code, future.result())
+                    except Exception as e:
+                        self.logger.error(f"❌ {name}({code}) 점수 계산 실패: {e}")
+                        handle_score(code, None)
+        finally:
+            if score_executor:
+                score_executor.shutdown()
+
+        # 결과 기록 (종목 리스트 순서 유지)
+        for name, code in stock_list.items():
+            result = results.get(code)
+            if result is None:
+                continue
+            df, foreign_netbuy_list, foreign_trend = fetched[code]
+            try:
+                passed = self._record_analysis(name, code, df, foreign_netbuy_list, foreign_trend, result)
+                progress.update(True, passed)
+            except Exception as e:
+                self.logger.error(f"❌ {name}({code}) 결과 기록 실패: {e}")
+                progress.update(False, False)
+
+        api_stats = self.rate_limiter.get_stats()
+        self.logger.info(f"🚀 API 호출 {api_stats['calls']}회 ({api_stats['calls_per_sec']:.1f}회/초, "
+                         f"한도 대기 {api_stats['total_wait']:.1f}초)")
+        for line in self.data_fetcher.http.format_latency_stats():
+            self.logger.info(line)
+
     def _process_results(self, progress, filter_passed_count, filter_failed_count):
         """분석 결과 처리 및 전송 (절대조건 통계 포함)"""
         summary = progress.get_summary()
@@ -495,6 +671,13 @@ class EnhancedStockAnalyzer:
 
 def main():
     """메인 실행 함수 (절대조건 필터링 적용)"""
+    parser = argparse.ArgumentParser(description='절대조건 필터링 주식 분석')
+    parser.add_argument('--workers', type=int, default=1, help='종목 조회 스레드 수 (기본값: 1, 순차 분석)')
+    parser.add_argument('--score-workers', type=int, default=0,
+                        help='점수 계산 프로세스 수 (기본값: 0, 메인 스레드에서 계산)')
+    parser.add_argument('--rate-limit', type=float, default=15, help='초당 API 호출 한도 (기본값: 15)')
+    args = parser.parse_args()
+
     analyzer = None
     try:
         # 환경변수 체크
@@ -506,7 +689,8 @@ def main():
             return
 
         # 강화된 분석기 생성 및 실행
-        analyzer = EnhancedStockAnalyzer()
+        analyzer = EnhancedStockAnalyzer(workers=args.workers, score_workers=args.score_workers,
+                                         api_rate_limit=args.rate_limit)
         analyzer.logger.info("🚀 절대조건 필터링 주식 분석 시작")
 
         success = analyzer.run_analysis()
@@ -10,10 +10,9 @@ import sys
 import os
 import yaml
 import logging
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from typing import Dict, List, Optional
 
-import pymysql
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QDateEdit, QLabel, QStatusBar, QSizePolicy
@@ -30,6 +29,8 @@ from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as Navigation
 from matplotlib.figure import Figure
 import matplotlib.ticker as mticker
 
+from db_manager import DBManager
+
 # 한글 폰트 설정
 plt.rcParams['font.family'] = ['AppleGothic', 'Malgun Gothic', 'NanumGothic', 'DejaVu Sans']
 plt.rcParams['axes.unicode_minus'] = False
@@ -62,51 +63,23 @@ class DataLoader(QThread):
         self.trade_date = trade_date
 
     def run(self):
-        conn = None
+        db = DBManager(self.db_config)
         try:
-            conn = pymysql.connect(
-                host=self.db_config.get('host', 'localhost'),
-                port=self.db_config.get('port', 3306),
-                user=self.db_config['user'],
-                password=self.db_config['password'],
-                database=self.db_config['database'],
-                charset=self.db_config.get('charset', 'utf8mb4'),
-                cursorclass=pymysql.cursors.DictCursor,
-            )
-            cursor = conn.cursor()
+            if not db.connect():
+                raise ConnectionError("데이터베이스 연결 실패")
 
             # 1) 종목명 조회
-            cursor.execute("SELECT stock_code, stock_name FROM stock_info")
-            name_map = {r['stock_code']: r['stock_name'] for r in cursor.fetchall()}
-
-            # 2) 전날 종가 조회 (daily_stock_prices에서 조회일 직전 거래일)
-            prev_close_sql = """
-                SELECT stock_code, close_price
-                FROM daily_stock_prices
-                WHERE trade_date = (
-                    SELECT MAX(trade_date)
-                    FROM daily_stock_prices
-                    WHERE trade_date < %s
-                )
-            """
-            cursor.execute(prev_close_sql, (self.trade_date,))
-            prev_close_map = {r['stock_code']: int(r['close_price'])
-                              for r in cursor.fetchall() if r['close_price']}
-
-            # 3) 분봉 데이터 조회
-            sql = """
-                SELECT
-                    stock_code,
-                    trade_datetime,
-                    close_price
-                FROM minute_stock_prices
-                WHERE DATE(trade_datetime) = %s
-                  AND close_price IS NOT NULL
-                  AND close_price > 0
-                ORDER BY stock_code, trade_datetime ASC
-            """
-            cursor.execute(sql, (self.trade_date,))
-            rows = cursor.fetchall()
+            db.execute("SELECT stock_code, stock_name FROM stock_info")
+            name_map = {r['stock_code']: r['stock_name'] for r in db.cursor.fetchall()}
+
+            # 2) 분봉 데이터 조회 (trade_datetime 반열린 구간 - 기본키 범위 스캔 + 파티션 프루닝)
+            rows = db.get_minute_closes_by_date(self.trade_date)
+            if rows is None:
+                raise RuntimeError(f"{self.trade_date} 분봉 데이터 조회 실패")
+
+            # 3) 전날 종가 조회 (분봉이 있는 종목만, 종목별 조회일 직전 거래일 종가)
+            codes = list(dict.fromkeys(row['stock_code'] for row in rows))
+            prev_close_map = db.get_latest_close_bulk(codes, as_of=self.trade_date - timedelta(days=1))
 
             # 종목별로 그룹핑
             result: Dict[str, dict] = {}
@@ -128,8 +101,7 @@ class DataLoader(QThread):
         except Exception as e:
             self.error.emit(str(e))
         finally:
-            if conn:
-                conn.close()
+            db.disconnect()
 
 
 # ────────────────────────────────────────────
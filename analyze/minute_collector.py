@@ -9,6 +9,8 @@ NXT 시간외 거래(15:30~20:00) 포함
   python minute_collector.py --test           # 테스트 모드 (1종목)
   python minute_collector.py --codes 005930 000660  # 특정 종목 지정
   python minute_collector.py --cleanup        # 오래된 데이터 정리 (30일 이전)
+  python minute_collector.py --partitions     # 분봉 테이블 파티션 점검/전환
+  python minute_collector.py --stream         # 스트리밍 수집 (신규 분봉만 주기 조회, 20:05까지)
 """
 import sys
 import os
@@ -23,6 +25,8 @@ import yaml
 # 현재 디렉토리 모듈 import
 from data_fetcher import DataFetcher
 from db_manager import DBManager
+from minute_stream import MinuteStreamIngestor
+from rate_limiter import TokenBucket
 
 # 키움 API 클라이언트
 try:
@@ -108,6 +112,7 @@ class MinuteDataCollector:
         # 설정 로드
         self.config_manager = ConfigManager()
         self.db_config = self.config_manager.get_database_config()
+        self.minute_config = self.config_manager.get_minute_collection_config()
 
         # 관심종목 설정 로드
         self.watchlist = self.config_manager.get_watchlist()
@@ -132,6 +137,9 @@ class MinuteDataCollector:
         # DB 매니저 초기화
         self.db_manager = DBManager(self.db_config, self.logger)
 
+        # 스트리밍 수집기 (run_stream 실행 중 링 버퍼 접근용)
+        self.ingestor = None
+
         # 통계
         self.stats = {
             'total_stocks': 0,
@@ -293,7 +301,20 @@ class MinuteDataCollector:
                 self.logger.warning(f"{stock_code}: 종목 정보 저장 실패, 계속 진행")
 
             # 분봉 데이터 저장
-            success, fail = self.db_manager.bulk_insert_minute_prices(records)
+            write_method = self.minute_config.get('bulk_write_method', 'executemany')
+
+            if write_method in ('multi_row', 'load_data'):
+                # 임시 테이블 적재 후 한 번에 병합
+                result = self.db_manager.bulk_upsert_minute_prices(
+                    records,
+                    batch_size=self.minute_config.get('bulk_load_size', 5000),
+                    use_load_data=(write_method == 'load_data')
+                )
+                success, fail = result['success'], result['fail']
+                self.logger.debug(f"{stock_code}: {success}건 저장 "
+                                  f"({result['method']}, {len(result['batches'])}배치, {result['elapsed']:.3f}초)")
+            else:
+                success, fail = self.db_manager.bulk_insert_minute_prices(records)
 
             self.stats['success_records'] += success
             self.stats['fail_records'] += fail
@@ -402,6 +423,95 @@ class MinuteDataCollector:
         finally:
             self.db_manager.disconnect()
 
+    def run_stream(self, poll_interval: float = 30.0, workers: int = 4,
+                   until: Optional[datetime] = None) -> bool:
+        """스트리밍 수집 실행 (종목별 마지막 저장 분봉 이후만 주기적으로 조회)
+
+        Args:
+            poll_interval: 조회 주기(초)
+            workers: 동시 조회 스레드 수
+            until: 종료 시각 (None이면 Ctrl+C까지)
+
+        Returns:
+            bool: 성공 여부
+        """
+        batch_id = 0
+
+        try:
+            if not self.kiwoom_client:
+                raise Exception("키움 API 클라이언트 없음 - 스트리밍 수집 불가")
+
+            if not self.db_manager.connect():
+                raise Exception("데이터베이스 연결 실패")
+
+            self.db_manager.create_tables()
+
+            holdings = self.get_holdings()
+            if not holdings:
+                self.logger.info("수집할 종목이 없습니다.")
+                return True
+
+            if self.test_mode:
+                first_code = list(holdings.keys())[0]
+                holdings = {first_code: holdings[first_code]}
+
+            self.stats['total_stocks'] = len(holdings)
+            batch_id = self.db_manager.start_batch('MINUTE_STREAM')
+
+            for stock_code, stock_name in holdings.items():
+                if not self.db_manager.upsert_stock_info(stock_code, stock_name):
+                    self.logger.warning(f"{stock_code}: 종목 정보 저장 실패, 계속 진행")
+            self.db_manager.commit()
+
+            # 여러 스레드가 하나의 버킷을 공유 (기본: 키움 call_delay 간격과 같은 초당 호출 수)
+            call_delay = self.kiwoom_client.config.API_DELAY
+            rate = self.minute_config.get('stream_rate_limit') or (1.0 / call_delay if call_delay > 0 else 5.0)
+            self.kiwoom_client.set_rate_limiter(TokenBucket(rate))
+
+            self.ingestor = MinuteStreamIngestor(
+                self.kiwoom_client, self.db_manager, holdings,
+                poll_interval=poll_interval,
+                workers=workers,
+                batch_size=self.minute_config.get('stream_batch_size', 1000),
+                flush_interval=self.minute_config.get('stream_flush_interval', 3.0),
+                backfill_count=self.minute_count,
+                write_method=self.minute_config.get('bulk_write_method', 'executemany'),
+                bulk_load_size=self.minute_config.get('bulk_load_size', 5000),
+                logger=self.logger
+            )
+            self.ingestor.run(until)
+
+            stats = self.ingestor.get_stats()
+            self.stats['success_stocks'] = len(self.ingestor.last_datetimes)
+            self.stats['fail_stocks'] = len(holdings) - self.stats['success_stocks']
+            self.stats['total_records'] = stats['new_bars']
+            self.stats['success_records'] = stats['written_rows']
+
+            self.db_manager.end_batch(
+                batch_id, 'SUCCESS',
+                self.stats['total_stocks'],
+                self.stats['success_stocks'],
+                self.stats['fail_stocks']
+            )
+            return True
+
+        except Exception as e:
+            self.logger.error(f"스트리밍 수집 실패: {e}")
+
+            if batch_id:
+                self.db_manager.end_batch(
+                    batch_id, 'FAIL',
+                    self.stats['total_stocks'],
+                    self.stats['success_stocks'],
+                    self.stats['fail_stocks'],
+                    str(e)
+                )
+
+            return False
+
+        finally:
+            self.db_manager.disconnect()
+
     def cleanup_old_data(self, days: int = 30):
         """오래된 분봉 데이터 정리
 
@@ -423,6 +533,28 @@ class MinuteDataCollector:
         finally:
             self.db_manager.disconnect()
 
+    def maintain_partitions(self):
+        """분봉 테이블 파티션 점검 (파티션이 없는 기존 테이블은 파티션 테이블로 전환)"""
+        try:
+            if not self.db_manager.connect():
+                raise Exception("DB 연결 실패")
+
+            added = self.db_manager.ensure_minute_partitions(convert=True)
+            partitions = self.db_manager.get_minute_partitions() or []
+
+            bounded = [p for p in partitions if p['upper'] is not None]
+            self.logger.info(f"파티션 단위: {self.db_manager.minute_partition_unit}, "
+                             f"추가 {added}개, 전체 {len(partitions)}개")
+            if bounded:
+                self.logger.info(f"파티션 범위: {bounded[0]['name']} ~ {bounded[-1]['name']} "
+                                 f"(추정 {sum(p['rows'] for p in partitions):,}건)")
+
+        except Exception as e:
+            self.logger.error(f"파티션 점검 실패: {e}")
+
+        finally:
+            self.db_manager.disconnect()
+
     def print_summary(self, start_time: datetime):
         """결과 요약 출력"""
         elapsed = datetime.now() - start_time
@@ -464,8 +596,14 @@ def main():
   # 특정 종목 지정
   python minute_collector.py --codes 005930 000660
 
-  # 오래된 데이터 정리
+  # 오래된 데이터 정리 (파티션 테이블이면 DROP PARTITION)
   python minute_collector.py --cleanup --days 30
+
+  # 분봉 테이블 파티션 점검 (기존 비분할 테이블은 1회 전환, 장 마감 후 실행)
+  python minute_collector.py --partitions
+
+  # 스트리밍 수집 (30초마다 신규 분봉만 조회, 20:05 종료)
+  python minute_collector.py --stream --poll-interval 30 --workers 4 --until 20:05
         """
     )
 
@@ -503,6 +641,41 @@ def main():
         help='데이터 보관 일수 (--cleanup 옵션과 함께 사용, 기본값: 30)'
     )
 
+    parser.add_argument(
+        '--partitions',
+        action='store_true',
+        help='분봉 테이블 파티션 점검/생성 (파티션이 없는 기존 테이블은 전환)'
+    )
+
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='스트리밍 수집 모드 (마지막 저장 분봉 이후만 주기적으로 조회)'
+    )
+
+    parser.add_argument(
+        '--poll-interval',
+        type=float,
+        default=30.0,
+        metavar='SEC',
+        help='스트리밍 조회 주기 (초, 기본값: 30)'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=4,
+        help='스트리밍 동시 조회 스레드 수 (기본값: 4)'
+    )
+
+    parser.add_argument(
+        '--until',
+        type=str,
+        default='20:05',
+        metavar='HH:MM',
+        help='스트리밍 종료 시각 (기본값: 20:05, NXT 마감 이후)'
+    )
+
     parser.add_argument(
         '--yes', '-y',
         action='store_true',
@@ -523,6 +696,29 @@ def main():
             collector.cleanup_old_data(args.days)
             return 0
 
+        # 파티션 점검 모드
+        if args.partitions:
+            collector = MinuteDataCollector()
+            collector.maintain_partitions()
+            return 0
+
+        # 스트리밍 수집 모드
+        if args.stream:
+            if not KIWOOM_AVAILABLE:
+                print("\n키움 API를 사용할 수 없습니다.")
+                return 1
+
+            until_time = datetime.strptime(args.until, '%H:%M').time()
+            until = datetime.combine(datetime.now().date(), until_time)
+            print(f"\n스트리밍 수집: {args.poll_interval:.0f}초 주기, {until:%H:%M}까지 (중단: Ctrl+C)")
+
+            collector = MinuteDataCollector(
+                minute_count=args.count,
+                test_mode=args.test,
+                specific_codes=args.codes
+            )
+            return 0 if collector.run_stream(args.poll_interval, args.workers, until) else 1
+
         # 분봉 수집 모드
         if args.test:
             print("\n테스트 모드: 1종목만 수집합니다.")
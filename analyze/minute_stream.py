@@ -0,0 +1,372 @@
+"""
+분봉 스트리밍 수집 모듈
+감시 종목의 마지막 저장 분봉 이후 데이터만 주기적으로 병렬 조회하여
+소량 배치(micro-batch)로 DB에 추가하고, 프로세스 내 링 버퍼로 최신 분봉을 제공
+
+구성:
+  - MinuteBarBuffer: 종목별 최근 분봉 링 버퍼 (스레드 안전, DB 조회 없이 최신 분봉 읽기)
+  - MinuteStreamIngestor: 조회 스레드 풀(키움 ka10080, 공유 TokenBucket으로 속도 제한)
+                          + DB 쓰기 전용 스레드 1개 (pymysql 연결은 스레드 간 공유 불가)
+
+링 버퍼는 수집기를 띄운 프로세스(minute_collector.py --stream) 안에서만 유효함.
+매매 프로그램은 별도 프로세스라 이 버퍼를 읽을 수 없고, 매매 쪽 최신 분봉은
+realtime_feed가 같은 MinuteBarBuffer를 자체적으로 채워 제공함
+(trading_system/main.py AutoTrader.on_realtime_bar의 feed.buffer.latest)
+
+사용 예 (수집 프로세스 내부):
+  ingestor = MinuteStreamIngestor(kiwoom_client, db_manager, {'005930': '삼성전자'})
+  ingestor.start()
+  bars = ingestor.buffer.latest('005930', 20)     # 시간 오름차순 최근 20개
+  ingestor.stop()
+"""
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+
+class MinuteBarBuffer:
+    """종목별 최근 분봉 링 버퍼"""
+
+    def __init__(self, maxlen: int = 900):
+        """
+        Args:
+            maxlen: 종목당 보관 분봉 수 (초과 시 오래된 분봉부터 제거)
+        """
+        self.maxlen = maxlen
+        self.bars = {}  # {종목코드: deque(분봉 레코드, 시간 오름차순)}
+        self.version = 0
+        self.condition = threading.Condition()
+
+    def update(self, stock_code: str, records: List[Dict]) -> int:
+        """분봉 반영 (같은 시각은 새 값으로 대체, 버퍼보다 오래된 분봉은 무시)
+
+        Returns:
+            int: 새로 추가된 분봉 수
+        """
+        if not records:
+            return 0
+
+        added = 0
+        with self.condition:
+            bars = self.bars.setdefault(stock_code, deque(maxlen=self.maxlen))
+
+            for record in sorted(records, key=lambda r: r['trade_datetime']):
+                trade_dt = record['trade_datetime']
+                if not bars or trade_dt > bars[-1]['trade_datetime']:
+                    bars.append(record)
+                    added += 1
+                    continue
+
+                # 이미 있는 시각 (진행 중이던 마지막 봉 갱신 등) - 뒤에서부터 탐색
+                for idx in range(len(bars) - 1, -1, -1):
+                    if bars[idx]['trade_datetime'] == trade_dt:
+                        bars[idx] = record
+                        break
+                    if bars[idx]['trade_datetime'] < trade_dt:
+                        break
+
+            self.version += 1
+            self.condition.notify_all()
+
+        return added
+
+    def latest(self, stock_code: str, count: Optional[int] = None) -> List[Dict]:
+        """최근 분봉 (시간 오름차순, count 미지정 시 버퍼 전체)"""
+        with self.condition:
+            bars = list(self.bars.get(stock_code, ()))
+        return bars if count is None else bars[-count:]
+
+    def since(self, stock_code: str, after: datetime) -> List[Dict]:
+        """after 이후(미포함) 분봉 (시간 오름차순)"""
+        with self.condition:
+            bars = self.bars.get(stock_code, ())
+            return [bar for bar in bars if bar['trade_datetime'] > after]
+
+    def last_datetime(self, stock_code: str) -> Optional[datetime]:
+        """버퍼의 마지막 분봉 시각"""
+        with self.condition:
+            bars = self.bars.get(stock_code)
+            return bars[-1]['trade_datetime'] if bars else None
+
+    def to_frame(self, stock_code: str, count: Optional[int] = None) -> pd.DataFrame:
+        """최근 분봉 DataFrame (minute_stock_prices 컬럼명)"""
+        return pd.DataFrame(self.latest(stock_code, count))
+
+    def wait_for_update(self, version: int, timeout: Optional[float] = None) -> int:
+        """version 이후 갱신이 있을 때까지 대기
+
+        Returns:
+            int: 현재 버전 (타임아웃이면 입력과 같음)
+        """
+        with self.condition:
+            self.condition.wait_for(lambda: self.version != version, timeout)
+            return self.version
+
+
+class MinuteStreamIngestor:
+    """분봉 스트리밍 수집기 (조회 스레드 풀 + DB 쓰기 스레드)"""
+
+    def __init__(self, kiwoom_client, db_manager, stock_codes: Dict[str, str],
+                 buffer: Optional[MinuteBarBuffer] = None, poll_interval: float = 30.0,
+                 workers: int = 4, batch_size: int = 1000, flush_interval: float = 3.0,
+                 backfill_count: int = 660, write_method: str = 'executemany',
+                 bulk_load_size: int = 5000, logger=None):
+        """
+        Args:
+            kiwoom_client: KiwoomAPIClient (get_minute_price_data(since=...) 제공)
+            db_manager: DBManager (연결된 상태, 쓰기 스레드만 사용)
+            stock_codes: {종목코드: 종목명}
+            buffer: 공유할 링 버퍼 (None이면 새로 생성)
+            poll_interval: 조회 주기(초)
+            workers: 조회 스레드 수
+            batch_size: DB 쓰기 배치 최대 행 수
+            flush_interval: 배치가 차지 않아도 쓰는 간격(초)
+            backfill_count: DB에 분봉이 없는 종목의 첫 조회 개수
+            write_method: DB 쓰기 방식 (executemany / multi_row / load_data, minute_collector의 bulk_write_method)
+            bulk_load_size: multi_row / load_data 방식의 한 번에 적재할 행 수
+            logger: 로거 객체
+        """
+        self.kiwoom_client = kiwoom_client
+        self.db_manager = db_manager
+        self.stock_codes = dict(stock_codes)
+        self.buffer = buffer or MinuteBarBuffer()
+        self.poll_interval = poll_interval
+        self.workers = max(1, workers)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.backfill_count = backfill_count
+        self.write_method = write_method
+        self.bulk_load_size = bulk_load_size
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.last_datetimes = {}  # {종목코드: 마지막으로 받은 분봉 시각}
+        self.write_queue = queue.Queue()
+        self.stop_event = threading.Event()
+        self.writer_stop = threading.Event()
+        self.executor = None
+        self.threads = []
+
+        self.stats_lock = threading.Lock()
+        self.stats = {
+            'polls': 0,
+            'fetched_bars': 0,
+            'new_bars': 0,
+            'fetch_errors': 0,
+            'written_rows': 0,
+            'write_batches': 0,
+            'write_errors': 0,
+            'last_poll_sec': 0.0,
+        }
+
+    # ------------------------------------------------------------
+    # 시작 / 종료
+    # ------------------------------------------------------------
+    def start(self):
+        """마지막 저장 시각 로드 후 조회/쓰기 스레드 시작 (즉시 반환)"""
+        # 토큰은 스레드 시작 전에 발급 (동시 재발급 시 이전 토큰이 무효화됨)
+        self.kiwoom_client.get_access_token()
+
+        self.last_datetimes = self.db_manager.get_latest_minute_datetimes(list(self.stock_codes))
+        self.logger.info(f"스트리밍 시작: {len(self.stock_codes)}종목 "
+                         f"(저장 이력 {len(self.last_datetimes)}종목, 조회 주기 {self.poll_interval}초, "
+                         f"스레드 {self.workers}개)")
+
+        self.stop_event.clear()
+        self.writer_stop.clear()
+        self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='minute-poll')
+        self.threads = [
+            threading.Thread(target=self._poll_loop, name='minute-poller', daemon=True),
+            threading.Thread(target=self._write_loop, name='minute-writer', daemon=True),
+        ]
+        for thread in self.threads:
+            thread.start()
+
+    def stop(self):
+        """조회 중단 후 남은 배치까지 저장하고 종료"""
+        # 조회 스레드가 끝난 뒤 쓰기 스레드 종료 (마지막 조회분까지 저장)
+        self.stop_event.set()
+        poller, writer = self.threads or (None, None)
+        if poller:
+            poller.join()
+        self.writer_stop.set()
+        if writer:
+            writer.join()
+        self.threads = []
+
+        if self.executor:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+        stats = self.get_stats()
+        self.logger.info(f"스트리밍 종료: 조회 {stats['polls']}회, 신규 분봉 {stats['new_bars']}건, "
+                         f"저장 {stats['written_rows']}건 ({stats['write_batches']}배치, "
+                         f"실패 {stats['write_errors']}배치)")
+
+    def run(self, until: Optional[datetime] = None):
+        """until 시각(또는 Ctrl+C)까지 스트리밍 (블로킹)"""
+        self.start()
+        try:
+            while not self.stop_event.is_set():
+                if until and datetime.now() >= until:
+                    self.logger.info(f"종료 시각 도달 ({until:%H:%M})")
+                    break
+                self.stop_event.wait(1.0)
+        except KeyboardInterrupt:
+            self.logger.info("사용자 중단")
+        finally:
+            self.stop()
+
+    # ------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------
+    def _fetch(self, stock_code: str) -> tuple:
+        """종목 하나의 신규 분봉 조회 (마지막 저장 분봉 포함)"""
+        since = self.last_datetimes.get(stock_code)
+        try:
+            if since is None:
+                records = self.kiwoom_client.get_minute_price_data(stock_code, self.backfill_count)
+            else:
+                records = self.kiwoom_client.get_minute_price_data(
+                    stock_code, self.backfill_count, since=since
+                )
+            return stock_code, records or [], None
+        except Exception as e:
+            return stock_code, [], e
+
+    def poll_once(self) -> int:
+        """전 종목 1회 조회 → 링 버퍼 반영 + 쓰기 큐 추가
+
+        Returns:
+            int: 새로 받은 분봉 수
+        """
+        started = time.monotonic()
+        new_bars = 0
+        fetched = 0
+        errors = 0
+
+        for stock_code, records, error in self.executor.map(self._fetch, list(self.stock_codes)):
+            if error is not None:
+                errors += 1
+                self.logger.warning(f"{stock_code} 분봉 조회 실패: {error}")
+                continue
+            if not records:
+                continue
+
+            for record in records:
+                record['stock_code'] = stock_code
+
+            fetched += len(records)
+            new_bars += self.buffer.update(stock_code, records)
+            self.last_datetimes[stock_code] = max(r['trade_datetime'] for r in records)
+            self.write_queue.put(records)
+
+        elapsed = time.monotonic() - started
+        with self.stats_lock:
+            self.stats['polls'] += 1
+            self.stats['fetched_bars'] += fetched
+            self.stats['new_bars'] += new_bars
+            self.stats['fetch_errors'] += errors
+            self.stats['last_poll_sec'] = elapsed
+
+        self.logger.debug(f"분봉 조회: 신규 {new_bars}건 (수신 {fetched}건, 실패 {errors}종목, {elapsed:.1f}초)")
+        return new_bars
+
+    def _poll_loop(self):
+        while not self.stop_event.is_set():
+            started = time.monotonic()
+            try:
+                self.poll_once()
+            except Exception as e:
+                self.logger.error(f"분봉 조회 루프 오류: {e}")
+
+            self.stop_event.wait(max(0.0, self.poll_interval - (time.monotonic() - started)))
+
+    # ------------------------------------------------------------
+    # 저장
+    # ------------------------------------------------------------
+    def _flush(self, batch: List[Dict]) -> bool:
+        """배치 저장 (쓰기 스레드에서만 호출)
+
+        Returns:
+            bool: 커밋 성공 여부 (실패하면 롤백, 호출 측이 배치를 유지해서 재시도)
+        """
+        try:
+            if self.write_method in ('multi_row', 'load_data'):
+                result = self.db_manager.bulk_upsert_minute_prices(
+                    batch, batch_size=self.bulk_load_size,
+                    use_load_data=(self.write_method == 'load_data')
+                )
+                success, fail = result['success'], result['fail']
+            else:
+                success, fail = self.db_manager.bulk_insert_minute_prices(batch)
+
+            if fail:
+                raise Exception(f"{fail}건 삽입 실패")
+            self.db_manager.commit()
+        except Exception as e:
+            self.logger.error(f"분봉 배치 저장 실패 ({len(batch)}건): {e}")
+            try:
+                self.db_manager.rollback()
+            except Exception as rollback_error:
+                self.logger.error(f"롤백 실패: {rollback_error}")
+            with self.stats_lock:
+                self.stats['write_errors'] += 1
+            return False
+
+        with self.stats_lock:
+            self.stats['written_rows'] += success
+            self.stats['write_batches'] += 1
+        return True
+
+    def _write_loop(self):
+        # 조회 시각(last_datetimes)은 큐에 넣을 때 이미 전진하므로, 저장 실패한 배치는 버리지 않고
+        # flush_interval 뒤 다시 저장 (다음 조회가 그 분봉들을 다시 가져오지 않음)
+        batch = []
+        batch_started = None
+        retry_at = 0.0
+
+        while True:
+            stopping = self.writer_stop.is_set()
+            try:
+                records = self.write_queue.get(timeout=0.5)
+                batch.extend(records)
+                if batch_started is None:
+                    batch_started = time.monotonic()
+            except queue.Empty:
+                if stopping:
+                    break
+
+            now = time.monotonic()
+            if batch and now >= retry_at and (len(batch) >= self.batch_size or stopping
+                                              or now - batch_started >= self.flush_interval):
+                if self._flush(batch):
+                    batch = []
+                    batch_started = None
+                elif stopping:
+                    break
+                else:
+                    retry_at = now + self.flush_interval
+
+        while True:  # 저장 실패로 중단했으면 큐에 남은 분봉도 함께 마지막 시도
+            try:
+                batch.extend(self.write_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        if batch and not self._flush(batch):
+            # 프로세스 종료 후 재시작하면 DB의 마지막 저장 시각부터 다시 조회
+            self.logger.error(f"종료 시 미저장 분봉 {len(batch)}건 - 다음 시작 시 DB 마지막 시각부터 재조회")
+
+    def get_stats(self) -> Dict:
+        """수집 통계"""
+        with self.stats_lock:
+            stats = dict(self.stats)
+        stats['queued'] = self.write_queue.qsize()
+        return stats
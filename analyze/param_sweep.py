@@ -0,0 +1,299 @@
+"""
+신호 기준값 파라미터 스윕
+파라미터 격자의 조합마다 벡터화 백테스트(BacktestEngine)를 실행하고
+보유기간별 성공률/평균/중앙값 수익률 순위표를 저장
+
+- 가격 패널은 한 번만 적재하여 .npy로 저장하고, 워커 프로세스는 읽기 전용 메모리 맵으로 공유
+- 조합별 결과는 끝나는 즉시 results.jsonl에 추가되므로 중단 후 같은 명령으로 재실행하면
+  완료된 조합은 건너뜀 (같은 출력 폴더 + 같은 기간 설정일 때)
+
+격자 파일 (YAML, 키는 backtest_engine.DEFAULT_PARAMS):
+  oversold_threshold: [25, 30, 35]   # RSI 과매도 기준
+  volume_multiplier: [1.5, 2.0]      # 거래량 급증 배수
+  threshold: [0.03, 0.05]            # MACD 돌파직전 근접 비율
+  num_std: [2]                       # 볼린저밴드 표준편차 배수
+  min_score: [3, 4]                  # 발굴 최소 점수
+
+사용법:
+  python param_sweep.py --start 2023-01-02 --end 2025-12-31 --grid sweep_grid.yaml --workers 4
+"""
+import argparse
+import itertools
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from backtest_engine import BacktestEngine, DEFAULT_PARAMS
+
+
+DEFAULT_GRID = {
+    'oversold_threshold': [25, 30, 35],
+    'volume_multiplier': [1.5, 2.0, 2.5],
+    'threshold': [0.03, 0.05, 0.1],
+    'num_std': [1.5, 2, 2.5],
+    'min_score': [3, 4],
+}
+
+RESULTS_FILE = 'results.jsonl'
+RANKING_FILE = 'ranking.csv'
+META_FILE = 'sweep.json'
+PANEL_DIR = 'panel'
+
+# 워커 프로세스별 엔진 (초기화 시 메모리 맵 패널로 생성)
+_worker_engine = None
+
+
+def expand_grid(grid: Dict[str, List]) -> List[Dict]:
+    """파라미터 격자 → 조합 리스트"""
+    unknown = set(grid) - set(DEFAULT_PARAMS)
+    if unknown:
+        raise ValueError(f"알 수 없는 파라미터: {', '.join(sorted(unknown))}")
+
+    keys = sorted(grid)
+    values = [grid[key] if isinstance(grid[key], list) else [grid[key]] for key in keys]
+    return [dict(zip(keys, combo)) for combo in itertools.product(*values)]
+
+
+def params_key(params: Dict) -> str:
+    """조합 식별 키 (재개 시 완료 여부 판단)"""
+    return json.dumps({**DEFAULT_PARAMS, **params}, sort_keys=True)
+
+
+def summarize(discoveries: List[Dict], holding_periods: List[int]) -> Dict:
+    """발굴 결과 → 보유기간별 성공률/평균/중앙값 수익률"""
+    metrics = {'discoveries': len(discoveries)}
+
+    for days in holding_periods:
+        returns = np.array([d['returns'][days] for d in discoveries if d['returns'].get(days) is not None],
+                           dtype='float64')
+        metrics[f'trades_{days}'] = int(len(returns))
+        if len(returns):
+            metrics[f'hit_rate_{days}'] = round(float((returns > 0).mean() * 100), 2)
+            metrics[f'mean_return_{days}'] = round(float(returns.mean()), 3)
+            metrics[f'median_return_{days}'] = round(float(np.median(returns)), 3)
+        else:
+            metrics[f'hit_rate_{days}'] = None
+            metrics[f'mean_return_{days}'] = None
+            metrics[f'median_return_{days}'] = None
+
+    return metrics
+
+
+def _init_worker(panel_dir: str):
+    """워커 초기화: 공유 패널을 메모리 맵으로 열기"""
+    global _worker_engine
+    _worker_engine = BacktestEngine.from_arrays(panel_dir)
+
+
+def _run_combo(params: Dict, start_date: str, end_date: str, interval_days: int,
+               holding_periods: List[int]) -> Dict:
+    """워커에서 조합 하나 실행"""
+    started = time.perf_counter()
+    result = _worker_engine.run(start_date, end_date, interval_days, holding_periods, params)
+    metrics = summarize(result['discoveries'], holding_periods)
+    metrics['elapsed'] = round(time.perf_counter() - started, 3)
+    return {'key': params_key(params), 'params': params, 'metrics': metrics}
+
+
+class ParameterSweep:
+    """파라미터 스윕 실행기 (출력 폴더 단위로 재개 가능)"""
+
+    def __init__(self, output_dir: str, start_date: str, end_date: str, interval_days: int = 1,
+                 holding_periods: List[int] = (5, 10, 20), logger=None):
+        """
+        Args:
+            output_dir: 결과 폴더 (패널, results.jsonl, ranking.csv 저장)
+            start_date: 백테스트 시작일 (YYYY-MM-DD)
+            end_date: 백테스트 종료일 (YYYY-MM-DD)
+            interval_days: 분석 간격 (일)
+            holding_periods: 보유기간 리스트
+            logger: 로거 객체
+        """
+        self.output_dir = output_dir
+        self.panel_dir = os.path.join(output_dir, PANEL_DIR)
+        self.results_path = os.path.join(output_dir, RESULTS_FILE)
+        self.logger = logger or logging.getLogger(__name__)
+        self.meta = {
+            'start_date': start_date,
+            'end_date': end_date,
+            'interval_days': interval_days,
+            'holding_periods': list(holding_periods),
+        }
+        os.makedirs(output_dir, exist_ok=True)
+
+    # ------------------------------------------------------------
+    # 상태 (재개)
+    # ------------------------------------------------------------
+    def check_meta(self) -> bool:
+        """기존 출력 폴더의 기간 설정이 같은지 확인 (없으면 새로 기록)"""
+        meta_path = os.path.join(self.output_dir, META_FILE)
+        if os.path.exists(meta_path):
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            if saved != self.meta:
+                self.logger.error(f"❌ 기존 스윕 설정과 다름 ({meta_path}): {saved}")
+                return False
+            return True
+
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump(self.meta, f, ensure_ascii=False, indent=2)
+        return True
+
+    def has_panel(self) -> bool:
+        return os.path.exists(os.path.join(self.panel_dir, 'codes.json'))
+
+    def save_panel(self, engine: BacktestEngine):
+        engine.save_arrays(self.panel_dir)
+        self.logger.info(f"💾 가격 패널 저장: {len(engine.dates)}일 × {len(engine.codes)}종목 → {self.panel_dir}")
+
+    def load_results(self) -> Dict[str, Dict]:
+        """완료된 조합 결과 ({키: 결과}, 중단으로 깨진 마지막 줄은 무시)"""
+        results = {}
+        if not os.path.exists(self.results_path):
+            return results
+
+        with open(self.results_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    results[record['key']] = record
+                except (json.JSONDecodeError, KeyError):
+                    continue
+        return results
+
+    # ------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------
+    def run(self, grid: Dict[str, List], workers: int = 4) -> List[Dict]:
+        """남은 조합을 프로세스 풀로 실행
+
+        Returns:
+            List[Dict]: 완료된 전체 조합 결과 (이전 실행분 포함)
+        """
+        combos = expand_grid(grid)
+        done = self.load_results()
+        pending = [params for params in combos if params_key(params) not in done]
+
+        self.logger.info(f"🔧 파라미터 조합 {len(combos)}개 (완료 {len(combos) - len(pending)}개, "
+                         f"남은 {len(pending)}개, 워커 {workers}개)")
+
+        if pending:
+            started = time.perf_counter()
+            args = (self.meta['start_date'], self.meta['end_date'],
+                    self.meta['interval_days'], self.meta['holding_periods'])
+
+            with ProcessPoolExecutor(max_workers=max(1, workers), initializer=_init_worker,
+                                     initargs=(self.panel_dir,)) as executor:
+                futures = {executor.submit(_run_combo, params, *args): params for params in pending}
+
+                with open(self.results_path, 'a', encoding='utf-8') as f:
+                    for count, future in enumerate(as_completed(futures), 1):
+                        params = futures[future]
+                        try:
+                            record = future.result()
+                        except Exception as e:
+                            self.logger.error(f"❌ 조합 실행 실패 {params}: {e}")
+                            continue
+
+                        f.write(json.dumps(record, ensure_ascii=False) + '\n')
+                        f.flush()
+                        done[record['key']] = record
+
+                        if count % 10 == 0 or count == len(pending):
+                            self.logger.info(f"⏳ 진행 {count}/{len(pending)} "
+                                             f"({time.perf_counter() - started:.1f}초)")
+
+        combo_keys = {params_key(params) for params in combos}
+        return [record for key, record in done.items() if key in combo_keys]
+
+    def write_ranking(self, records: List[Dict], rank_by: Optional[str] = None) -> Optional[pd.DataFrame]:
+        """순위표 저장 (기본: 첫 보유기간 평균 수익률 내림차순)"""
+        if not records:
+            self.logger.warning("⚠️ 순위표를 만들 결과가 없습니다.")
+            return None
+
+        rank_by = rank_by or f"mean_return_{self.meta['holding_periods'][0]}"
+        table = pd.DataFrame([{**DEFAULT_PARAMS, **record['params'], **record['metrics']}
+                              for record in records])
+        if rank_by not in table.columns:
+            raise ValueError(f"알 수 없는 순위 기준: {rank_by}")
+
+        table = table.sort_values(rank_by, ascending=False, na_position='last').reset_index(drop=True)
+        table.insert(0, 'rank', range(1, len(table) + 1))
+
+        ranking_path = os.path.join(self.output_dir, RANKING_FILE)
+        table.to_csv(ranking_path, index=False, encoding='utf-8-sig')
+        self.logger.info(f"💾 순위표 저장: {ranking_path} ({rank_by} 기준)")
+
+        for row in table.head(10).to_dict('records'):
+            params = ', '.join(f"{key}={row[key]}" for key in DEFAULT_PARAMS)
+            self.logger.info(f"  {int(row['rank']):3d}. {rank_by}={row[rank_by]} | "
+                             f"발굴 {int(row['discoveries'])}개 | {params}")
+        return table
+
+
+def main():
+    """파라미터 스윕 실행"""
+    parser = argparse.ArgumentParser(description='신호 기준값 파라미터 스윕')
+    parser.add_argument('--start', type=str, required=True, help='시작일 (YYYY-MM-DD)')
+    parser.add_argument('--end', type=str, required=True, help='종료일 (YYYY-MM-DD)')
+    parser.add_argument('--interval', type=int, default=1, help='분석 간격 (일, 기본값: 1)')
+    parser.add_argument('--grid', type=str, default=None, help='파라미터 격자 YAML (기본: 내장 격자)')
+    parser.add_argument('--workers', type=int, default=4, help='워커 프로세스 수 (기본값: 4)')
+    parser.add_argument('--output-dir', type=str, default='backtest/sweep', help='결과 폴더')
+    parser.add_argument('--rank-by', type=str, default=None,
+                        help='순위 기준 컬럼 (예: hit_rate_5, median_return_10)')
+    parser.add_argument('--price-store', action='store_true', help='로컬 가격 저장소에서 데이터 적재')
+    args = parser.parse_args()
+
+    from utils import setup_logger
+    logger = setup_logger("param_sweep")
+
+    try:
+        grid = DEFAULT_GRID
+        if args.grid:
+            with open(args.grid, 'r', encoding='utf-8') as f:
+                grid = yaml.safe_load(f) or {}
+
+        from backtest import BacktestAnalyzer
+        analyzer = BacktestAnalyzer()
+        holding_periods = analyzer.backtest_config.get('performance', {}).get('holding_periods', [5, 10, 20])
+
+        sweep = ParameterSweep(args.output_dir, args.start, args.end, args.interval, holding_periods, logger)
+        if not sweep.check_meta():
+            return 1
+
+        if sweep.has_panel():
+            logger.info(f"📂 저장된 가격 패널 사용: {sweep.panel_dir}")
+        else:
+            stock_list = analyzer.get_historical_stock_list(args.start)
+            engine = analyzer.load_engine(stock_list, args.start, args.end, holding_periods, args.price_store)
+            if engine is None or not engine.codes:
+                logger.error("❌ 백테스트할 가격 데이터가 없습니다.")
+                return 1
+            sweep.save_panel(engine)
+
+        records = sweep.run(grid, args.workers)
+        sweep.write_ranking(records, args.rank_by)
+
+        print("\n✅ 파라미터 스윕 완료!")
+
+    except Exception as e:
+        print(f"\n❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""
+일봉 레코드 변환 모듈
+KIS API 응답 DataFrame을 컬럼 단위(NumPy 배열)로 변환하여 DB 저장용 튜플로 만듦
+(행 단위 iterrows 변환 대체)
+"""
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from db_manager import DBManager
+
+
+# daily_stock_prices INSERT 컬럼 순서 (DBManager.bulk_insert_daily_price_rows와 동일)
+DAILY_PRICE_COLUMNS = list(DBManager.DAILY_PRICE_COLUMNS)
+
+PRICE_COLUMNS = DAILY_PRICE_COLUMNS[2:8]
+INVESTOR_COLUMNS = DAILY_PRICE_COLUMNS[8:]
+
+
+def _to_number_array(series: Optional[pd.Series], length: int) -> np.ndarray:
+    """숫자 컬럼을 정수값 float64 배열로 일괄 변환 (소수점 버림, 변환 불가 값은 NaN)"""
+    if series is None:
+        return np.full(length, np.nan)
+
+    if not pd.api.types.is_numeric_dtype(series):
+        series = series.astype(str).str.replace(',', '', regex=False)
+
+    values = pd.to_numeric(series, errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+    return np.trunc(values)
+
+
+def _to_python_list(values: np.ndarray) -> list:
+    """float64 배열 → 파이썬 int 리스트 (NaN은 None)"""
+    mask = np.isnan(values)
+    result = np.where(mask, 0, values).astype(np.int64).tolist()
+    for idx in np.flatnonzero(mask):
+        result[idx] = None
+    return result
+
+
+def build_price_frame(stock_code: str, df: pd.DataFrame) -> pd.DataFrame:
+    """API 일봉 DataFrame → 가격 컬럼 DataFrame (날짜/숫자를 프레임 단위로 한 번에 변환)
+
+    Args:
+        stock_code: 종목코드
+        df: KIS 일봉 응답 DataFrame (stck_bsop_date, stck_clpr/stck_prpr, ...)
+
+    Returns:
+        DataFrame: trade_date(datetime64) + PRICE_COLUMNS(float64, 결측 NaN)
+                   날짜 파싱 실패 행 제외, attrs['stock_code']에 종목코드 보관
+    """
+    if df is None or df.empty or 'stck_bsop_date' not in df.columns:
+        frame = pd.DataFrame({'trade_date': pd.Series(dtype='datetime64[ns]')})
+        for col in PRICE_COLUMNS:
+            frame[col] = pd.Series(dtype='float64')
+        frame.attrs['stock_code'] = stock_code
+        return frame
+
+    close_col = 'stck_clpr' if 'stck_clpr' in df.columns else 'stck_prpr'
+    volume_col = 'acml_vol' if 'acml_vol' in df.columns else 'cntg_vol'
+
+    source_columns = {
+        'open_price': 'stck_oprc',
+        'high_price': 'stck_hgpr',
+        'low_price': 'stck_lwpr',
+        'close_price': close_col,
+        'volume': volume_col,
+        'trading_value': 'acml_tr_pbmn'
+    }
+
+    trade_dates = pd.to_datetime(df['stck_bsop_date'].astype(str), format='%Y%m%d', errors='coerce').to_numpy()
+    valid = ~np.isnat(trade_dates)
+
+    columns = {'trade_date': trade_dates[valid]}
+    for target, source in source_columns.items():
+        columns[target] = _to_number_array(df.get(source), len(df))[valid]
+
+    frame = pd.DataFrame(columns)
+    frame.attrs['stock_code'] = stock_code
+    return frame
+
+
+def merge_investor_frame(price_frame: pd.DataFrame, investor_records: List[Dict]) -> pd.DataFrame:
+    """투자자별 매매 데이터를 trade_date 기준으로 병합 (left join, 인덱스 배열 조회)
+
+    Args:
+        price_frame: build_price_frame 결과
+        investor_records: [{'trade_date': date, 'foreign_buy_qty': int, ...}, ...]
+
+    Returns:
+        DataFrame: price_frame + INVESTOR_COLUMNS(float64, 투자자 데이터 없는 날짜는 NaN)
+    """
+    length = len(price_frame)
+    columns = {col: price_frame[col].to_numpy() for col in price_frame.columns}
+
+    if investor_records:
+        investor_frame = pd.DataFrame(investor_records)
+        investor_frame = investor_frame.drop_duplicates(subset='trade_date', keep='last')
+        investor_dates = pd.DatetimeIndex(pd.to_datetime(investor_frame['trade_date']))
+
+        positions = investor_dates.get_indexer(pd.DatetimeIndex(price_frame['trade_date']))
+        matched = positions >= 0
+
+        for col in INVESTOR_COLUMNS:
+            values = np.full(length, np.nan)
+            if col in investor_frame.columns:
+                source = pd.to_numeric(investor_frame[col], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+                values[matched] = source[positions[matched]]
+            columns[col] = values
+    else:
+        for col in INVESTOR_COLUMNS:
+            columns[col] = np.full(length, np.nan)
+
+    merged = pd.DataFrame(columns)
+    merged.attrs['stock_code'] = price_frame.attrs.get('stock_code')
+    return merged
+
+
+def frame_to_rows(frame: pd.DataFrame, stock_code: str = None) -> List[tuple]:
+    """DataFrame → executemany용 튜플 리스트 (DAILY_PRICE_COLUMNS 순서, NaN은 None)"""
+    if frame.empty:
+        return []
+
+    stock_code = stock_code or frame.attrs.get('stock_code')
+    length = len(frame)
+
+    columns = [
+        [stock_code] * length,
+        frame['trade_date'].to_numpy().astype('datetime64[D]').tolist()
+    ]
+    for col in DAILY_PRICE_COLUMNS[2:]:
+        if col in frame.columns:
+            columns.append(_to_python_list(frame[col].to_numpy(dtype='float64')))
+        else:
+            columns.append([None] * length)
+
+    return list(zip(*columns))
@@ -0,0 +1,295 @@
+"""
+로컬 일봉 컬럼 저장소 모듈
+daily_stock_prices를 종목별 Arrow IPC 파일로 미러링하여
+DB 조회 없이 메모리 맵으로 NumPy 배열을 바로 읽음
+
+저장 구조:
+  data/price_store/daily/{종목코드}.arrow
+  - trade_date(date32) 오름차순, 나머지 컬럼 float64 (결측 NaN)
+  - 압축 없는 IPC 파일이라 memory_map으로 복사 없이 읽기 가능
+
+사용법:
+  python price_store.py --sync --days 1000     # DB에서 전 종목 백필
+  python price_store.py --info                  # 저장소 현황
+"""
+import argparse
+import logging
+import os
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+from db_manager import DBManager
+
+
+DEFAULT_STORE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'price_store')
+
+# 저장 컬럼 (DBManager.DAILY_PRICE_COLUMNS에서 stock_code 제외)
+VALUE_COLUMNS = list(DBManager.DAILY_PRICE_COLUMNS[2:])
+
+
+class PriceStore:
+    """종목별 Arrow 파일 기반 일봉 저장소"""
+
+    def __init__(self, root_dir: str = None, logger=None):
+        """
+        Args:
+            root_dir: 저장소 경로 (기본: analyze/data/price_store)
+            logger: 로거 객체
+        """
+        self.root_dir = root_dir or DEFAULT_STORE_DIR
+        self.daily_dir = os.path.join(self.root_dir, 'daily')
+        self.logger = logger or logging.getLogger(__name__)
+        self.lock = threading.Lock()
+
+        if PYARROW_AVAILABLE:
+            os.makedirs(self.daily_dir, exist_ok=True)
+
+    @property
+    def available(self) -> bool:
+        """pyarrow 설치 여부"""
+        return PYARROW_AVAILABLE
+
+    def _path(self, stock_code: str) -> str:
+        return os.path.join(self.daily_dir, f"{stock_code}.arrow")
+
+    def _read_table(self, stock_code: str):
+        """종목 파일을 메모리 맵으로 열기 (없으면 None)"""
+        path = self._path(stock_code)
+        if not os.path.exists(path):
+            return None
+
+        with pa.memory_map(path, 'r') as source:
+            return ipc.open_file(source).read_all()
+
+    def get_stock_codes(self) -> List[str]:
+        """저장된 종목코드 목록"""
+        if not PYARROW_AVAILABLE or not os.path.isdir(self.daily_dir):
+            return []
+        return sorted(name[:-6] for name in os.listdir(self.daily_dir) if name.endswith('.arrow'))
+
+    def last_trade_date(self, stock_code: str) -> Optional[date]:
+        """저장된 마지막 거래일 (없으면 None)"""
+        if not PYARROW_AVAILABLE:
+            return None
+
+        table = self._read_table(stock_code)
+        if table is None or table.num_rows == 0:
+            return None
+        return table.column('trade_date')[-1].as_py()
+
+    # ------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------
+    def write_rows(self, stock_code: str, rows: List[tuple]) -> int:
+        """DB 저장용 행 튜플을 저장소에 병합 (같은 거래일은 새 값으로 대체)
+
+        Args:
+            stock_code: 종목코드
+            rows: DBManager.DAILY_PRICE_COLUMNS 순서 튜플 리스트
+
+        Returns:
+            int: 병합 후 저장된 전체 행 수
+        """
+        if not PYARROW_AVAILABLE or not rows:
+            return 0
+
+        columns = list(zip(*rows))
+        new_frame = pd.DataFrame({'trade_date': pd.to_datetime(list(columns[1]))})
+        for idx, col in enumerate(VALUE_COLUMNS, start=2):
+            new_frame[col] = pd.to_numeric(pd.Series(columns[idx], dtype=object), errors='coerce').astype('float64')
+
+        return self.write_frame(stock_code, new_frame)
+
+    def write_frame(self, stock_code: str, frame: pd.DataFrame) -> int:
+        """trade_date + VALUE_COLUMNS DataFrame을 저장소에 병합"""
+        if not PYARROW_AVAILABLE or frame.empty:
+            return 0
+
+        frame = frame.copy()
+        frame['trade_date'] = pd.to_datetime(frame['trade_date'])
+        for col in VALUE_COLUMNS:
+            if col not in frame.columns:
+                frame[col] = np.nan
+        frame = frame[['trade_date'] + VALUE_COLUMNS]
+
+        with self.lock:
+            existing = self._read_table(stock_code)
+            if existing is not None and existing.num_rows > 0:
+                old_frame = existing.to_pandas()
+                old_frame['trade_date'] = pd.to_datetime(old_frame['trade_date'])
+                frame = pd.concat([old_frame, frame], ignore_index=True)
+
+            frame = frame.drop_duplicates(subset='trade_date', keep='last')
+            frame = frame.sort_values('trade_date').reset_index(drop=True)
+
+            arrays = [pa.array(frame['trade_date'].dt.date, type=pa.date32())]
+            arrays += [pa.array(frame[col].to_numpy(dtype='float64')) for col in VALUE_COLUMNS]
+            table = pa.Table.from_arrays(arrays, names=['trade_date'] + VALUE_COLUMNS)
+
+            # 임시 파일에 쓴 뒤 교체 (읽는 중인 프로세스가 깨진 파일을 보지 않도록)
+            path = self._path(stock_code)
+            tmp_path = f"{path}.tmp"
+            with pa.OSFile(tmp_path, 'wb') as sink:
+                with ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp_path, path)
+
+        return len(frame)
+
+    def sync_from_db(self, db_manager: DBManager, stock_codes: List[str],
+                     start_date: date, end_date: Optional[date] = None) -> Dict[str, int]:
+        """DB 일봉 데이터로 저장소 채우기 (초기 백필용)
+
+        Returns:
+            Dict[str, int]: {종목코드: 저장된 행 수}
+        """
+        if not PYARROW_AVAILABLE:
+            self.logger.warning("⚠️ pyarrow 미설치 - 가격 저장소 동기화 생략")
+            return {}
+
+        panel = db_manager.get_daily_prices_bulk(stock_codes, start_date, end_date)
+        if panel.empty:
+            return {}
+
+        rename = {alias: col for col, alias in DBManager.DAILY_PRICE_SELECT}
+        panel = panel.rename(columns=rename)
+        panel['trade_date'] = pd.to_datetime(panel['trade_date'], format='%Y%m%d')
+        for col in VALUE_COLUMNS:
+            panel[col] = pd.to_numeric(panel[col], errors='coerce').astype('float64')
+
+        result = {}
+        for stock_code, frame in panel.groupby('stock_code', sort=False):
+            result[stock_code] = self.write_frame(stock_code, frame.drop(columns='stock_code'))
+        return result
+
+    # ------------------------------------------------------------
+    # 읽기
+    # ------------------------------------------------------------
+    def read(self, stock_code: str, start_date: Optional[date] = None,
+             end_date: Optional[date] = None,
+             columns: Optional[List[str]] = None) -> Optional[Dict[str, np.ndarray]]:
+        """종목 일봉을 NumPy 배열로 조회 (메모리 맵, 기간은 이진 탐색으로 슬라이스)
+
+        Args:
+            stock_code: 종목코드
+            start_date: 시작일 (포함, None이면 처음부터)
+            end_date: 종료일 (포함, None이면 끝까지)
+            columns: 조회할 컬럼 (기본: VALUE_COLUMNS 전체)
+
+        Returns:
+            Dict[str, np.ndarray]: {'trade_date': datetime64[D] 배열, 컬럼명: float64 배열}
+                                   저장된 데이터가 없으면 None
+        """
+        if not PYARROW_AVAILABLE:
+            return None
+
+        table = self._read_table(stock_code)
+        if table is None:
+            return None
+
+        dates = table.column('trade_date').to_numpy().astype('datetime64[D]')
+        lo = 0 if start_date is None else int(np.searchsorted(dates, np.datetime64(start_date, 'D'), side='left'))
+        hi = len(dates) if end_date is None else int(np.searchsorted(dates, np.datetime64(end_date, 'D'), side='right'))
+
+        result = {'trade_date': dates[lo:hi]}
+        for col in columns or VALUE_COLUMNS:
+            result[col] = table.column(col).to_numpy()[lo:hi]
+        return result
+
+    def read_panel(self, stock_codes: List[str], field: str = 'close_price',
+                   start_date: Optional[date] = None,
+                   end_date: Optional[date] = None) -> tuple:
+        """여러 종목의 한 컬럼을 (날짜 × 종목) 행렬로 조회
+
+        Returns:
+            tuple: (dates: datetime64[D] 배열, codes: 데이터가 있는 종목코드 리스트,
+                    matrix: float64 (len(dates), len(codes)) 배열, 거래 없는 날 NaN)
+        """
+        series = {}
+        for stock_code in stock_codes:
+            data = self.read(stock_code, start_date, end_date, columns=[field])
+            if data is not None and len(data['trade_date']) > 0:
+                series[stock_code] = data
+
+        if not series:
+            return np.array([], dtype='datetime64[D]'), [], np.empty((0, 0))
+
+        dates = np.unique(np.concatenate([data['trade_date'] for data in series.values()]))
+        codes = list(series.keys())
+        matrix = np.full((len(dates), len(codes)), np.nan)
+
+        for col_idx, stock_code in enumerate(codes):
+            data = series[stock_code]
+            rows = np.searchsorted(dates, data['trade_date'])
+            matrix[rows, col_idx] = data[field]
+
+        return dates, codes, matrix
+
+
+def main():
+    """가격 저장소 관리 (DB 백필 / 현황 조회)"""
+    parser = argparse.ArgumentParser(description='로컬 일봉 컬럼 저장소 관리')
+    parser.add_argument('--sync', action='store_true', help='DB에서 일봉 데이터 백필')
+    parser.add_argument('--days', type=int, default=1000, help='백필 기간 (기본값: 1000일)')
+    parser.add_argument('--info', action='store_true', help='저장소 현황 출력')
+    parser.add_argument('--dir', type=str, default=None, help='저장소 경로')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
+    logger = logging.getLogger(__name__)
+
+    store = PriceStore(args.dir, logger)
+    if not store.available:
+        print("❌ pyarrow가 설치되지 않았습니다: pip install pyarrow")
+        return 1
+
+    if args.sync:
+        import yaml
+
+        with open("config.yaml", 'r', encoding='utf-8') as f:
+            config = yaml.safe_load(f)
+
+        db_manager = DBManager(config.get('database', {}), logger)
+        if not db_manager.connect():
+            print("❌ 데이터베이스 연결 실패")
+            return 1
+
+        try:
+            stock_codes = list(db_manager.get_latest_trade_dates().keys())
+            start_date = (datetime.now() - timedelta(days=args.days)).date()
+
+            started = time.perf_counter()
+            result = store.sync_from_db(db_manager, stock_codes, start_date)
+            print(f"✅ 백필 완료: {len(result)}종목, {sum(result.values()):,}행 "
+                  f"({time.perf_counter() - started:.1f}초)")
+        finally:
+            db_manager.disconnect()
+
+    if args.info or not args.sync:
+        stock_codes = store.get_stock_codes()
+        print(f"📁 저장소: {store.root_dir}")
+        print(f"📈 종목 수: {len(stock_codes)}개")
+
+        if stock_codes:
+            started = time.perf_counter()
+            dates, codes, matrix = store.read_panel(stock_codes)
+            print(f"📊 종가 패널: {len(dates)}일 × {len(codes)}종목 "
+                  f"({dates[0]} ~ {dates[-1]}, 로드 {time.perf_counter() - started:.3f}초)")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
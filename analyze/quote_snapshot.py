@@ -0,0 +1,165 @@
+"""
+실시간 현재가 스냅샷 모듈
+분석 대상 전 종목의 현재가를 실행당 한 번 일괄 조회하여 짧은 TTL로 보관
+(종목마다 inquire-price를 순차 호출하던 방식 대체)
+
+조회 순서:
+  1. 관심종목(멀티종목) 시세조회 (FHKST11300006, 요청당 최대 30종목)
+  2. 응답에 없는 종목은 inquire-price(FHKST01010100)를 스레드 풀로 병렬 조회
+     (API 호출 속도는 API 클라이언트에 설정된 TokenBucket이 제한)
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+
+MULTI_QUOTE_URL = "https://openapi.koreainvestment.com:9443/uapi/domestic-stock/v1/quotations/intstock-multprice"
+MULTI_QUOTE_TR_ID = "FHKST11300006"
+MULTI_QUOTE_MAX_CODES = 30
+
+
+def _to_number(value, cast=float):
+    try:
+        return cast(float(str(value).replace(',', '')))
+    except (TypeError, ValueError):
+        return None
+
+
+class QuoteSnapshot:
+    """종목별 현재가 스냅샷 (TTL 캐시)"""
+
+    def __init__(self, api_client, ttl: float = 60.0, workers: int = 4,
+                 use_multi_quote: bool = True, logger=None):
+        """
+        Args:
+            api_client: DataFetcher (api_request, get_current_price 제공)
+            ttl: 현재가 유효 시간(초), 지나면 get()이 None 반환
+            workers: 종목별 조회 스레드 수
+            use_multi_quote: 멀티종목 시세조회 사용 여부
+            logger: 로거 객체
+        """
+        self.api_client = api_client
+        self.ttl = ttl
+        self.workers = max(1, workers)
+        self.use_multi_quote = use_multi_quote
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.lock = threading.Lock()
+        self.quotes = {}  # {종목코드: (현재가, 거래량, 전일종가, 조회 시각)}
+        self.stats = {'hits': 0, 'misses': 0, 'multi_calls': 0, 'single_calls': 0}
+
+    # ------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------
+    def refresh(self, stock_codes: List[str]) -> int:
+        """종목 현재가 일괄 조회
+
+        Args:
+            stock_codes: 종목코드 리스트
+
+        Returns:
+            int: 현재가를 얻은 종목 수
+        """
+        start = time.monotonic()
+        stock_codes = list(dict.fromkeys(stock_codes))
+        fetched = {}
+
+        if self.use_multi_quote:
+            fetched.update(self._fetch_multi(stock_codes))
+
+        remaining = [code for code in stock_codes if code not in fetched]
+        if remaining:
+            fetched.update(self._fetch_single(remaining))
+
+        now = time.monotonic()
+        with self.lock:
+            for code, (price, volume, prev_close) in fetched.items():
+                self.quotes[code] = (price, volume, prev_close, now)
+
+        self.logger.info(f"📡 현재가 스냅샷: {len(fetched)}/{len(stock_codes)}종목 "
+                         f"(멀티 {self.stats['multi_calls']}회, 단건 {self.stats['single_calls']}회, "
+                         f"{time.monotonic() - start:.1f}초)")
+        return len(fetched)
+
+    def _fetch_multi(self, stock_codes: List[str]) -> Dict[str, Tuple]:
+        """멀티종목 시세조회 (실패하면 이번 실행에서는 더 사용하지 않음)"""
+        result = {}
+
+        for i in range(0, len(stock_codes), MULTI_QUOTE_MAX_CODES):
+            chunk = stock_codes[i:i + MULTI_QUOTE_MAX_CODES]
+            params = {}
+            for idx, code in enumerate(chunk, 1):
+                params[f"FID_COND_MRKT_DIV_CODE_{idx}"] = "J"
+                params[f"FID_INPUT_ISCD_{idx}"] = code
+
+            try:
+                data = self.api_client.api_request(MULTI_QUOTE_URL, params, MULTI_QUOTE_TR_ID)
+                self.stats['multi_calls'] += 1
+            except Exception as e:
+                self.logger.warning(f"⚠️ 멀티종목 시세조회 실패 - 종목별 조회로 전환: {e}")
+                self.use_multi_quote = False
+                break
+
+            output = data.get("output") if data else None
+            if not output:
+                self.logger.warning("⚠️ 멀티종목 시세조회 응답 없음 - 종목별 조회로 전환")
+                self.use_multi_quote = False
+                break
+
+            for item in output:
+                code = item.get("inter_shrn_iscd")
+                price = _to_number(item.get("inter2_prpr"))
+                volume = _to_number(item.get("acml_vol"), int)
+                prev_close = _to_number(item.get("inter2_prdy_clpr"))
+                if code in chunk and price:
+                    result[code] = (price, volume, prev_close)
+
+        return result
+
+    def _fetch_single(self, stock_codes: List[str]) -> Dict[str, Tuple]:
+        """종목별 현재가 병렬 조회"""
+        def fetch(code):
+            price, volume, prev_close = self.api_client.get_current_price(code)
+            with self.lock:
+                self.stats['single_calls'] += 1
+            return code, price, volume, prev_close
+
+        result = {}
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='quote') as executor:
+            for code, price, volume, prev_close in executor.map(fetch, stock_codes):
+                if price:
+                    result[code] = (price, volume, prev_close)
+        return result
+
+    # ------------------------------------------------------------
+    # 사용
+    # ------------------------------------------------------------
+    def get(self, stock_code: str) -> Optional[Tuple]:
+        """스냅샷 현재가 조회
+
+        Returns:
+            tuple: (현재가, 거래량, 전일종가) 또는 None (없거나 TTL 경과)
+        """
+        with self.lock:
+            entry = self.quotes.get(stock_code)
+            if entry is None or time.monotonic() - entry[3] > self.ttl:
+                self.stats['misses'] += 1
+                return None
+            self.stats['hits'] += 1
+            return entry[:3]
+
+    def put(self, stock_code: str, price, volume, prev_close):
+        """개별 조회한 현재가를 스냅샷에 반영"""
+        if not price:
+            return
+        with self.lock:
+            self.quotes[stock_code] = (price, volume, prev_close, time.monotonic())
+
+    def get_stats(self) -> Dict:
+        """스냅샷 통계 (hits, misses, multi_calls, single_calls, size)"""
+        with self.lock:
+            stats = dict(self.stats)
+            stats['size'] = len(self.quotes)
+        return stats
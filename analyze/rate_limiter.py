@@ -0,0 +1,98 @@
+"""
+API 호출 속도 제한 모듈
+토큰 버킷 방식으로 초당 호출 수 제한 (여러 스레드가 하나의 버킷 공유)
+"""
+import threading
+import time
+from typing import Dict
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷 Rate Limiter"""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Args:
+            rate: 초당 토큰 충전 수 (= 초당 허용 호출 수)
+            capacity: 버킷 최대 크기 (순간 허용 호출 수, 기본 1 = 버스트 없이 균등 간격)
+        """
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+
+        self.rate = float(rate)
+        self.capacity = max(float(capacity), 1.0)
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+        # 통계
+        self.start_time = time.monotonic()
+        self.total_acquired = 0
+        self.total_wait_time = 0.0
+
+    def _refill(self):
+        """경과 시간만큼 토큰 충전 (lock 보유 상태에서 호출)"""
+        now = time.monotonic()
+        elapsed = now - self.last_refill
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.last_refill = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """토큰 획득 (부족하면 충전될 때까지 대기)
+
+        Args:
+            tokens: 필요한 토큰 수
+
+        Returns:
+            float: 대기한 시간(초)
+        """
+        waited = 0.0
+
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    self.total_acquired += 1
+                    self.total_wait_time += waited
+                    return waited
+                shortage = (tokens - self.tokens) / self.rate
+
+            time.sleep(shortage)
+            waited += shortage
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """토큰 예약 (대기하지 않고 사용 가능해질 때까지 남은 시간 반환, asyncio.sleep용)
+
+        부족분은 빚으로 남아 이후 acquire/reserve 호출이 그만큼 더 기다림
+
+        Returns:
+            float: 호출 전 기다려야 할 시간(초)
+        """
+        with self.lock:
+            self._refill()
+            self.tokens -= tokens
+            wait = max(0.0, -self.tokens / self.rate)
+            self.total_acquired += 1
+            self.total_wait_time += wait
+            return wait
+
+    def get_stats(self) -> Dict:
+        """호출 통계 조회
+
+        Returns:
+            Dict: {'calls': 총 호출 수, 'elapsed': 경과 시간(초),
+                   'calls_per_sec': 초당 호출 수, 'total_wait': 누적 대기 시간(초)}
+        """
+        with self.lock:
+            elapsed = time.monotonic() - self.start_time
+            calls = self.total_acquired
+            total_wait = self.total_wait_time
+
+        return {
+            'calls': calls,
+            'elapsed': elapsed,
+            'calls_per_sec': calls / elapsed if elapsed > 0 else 0.0,
+            'total_wait': total_wait
+        }
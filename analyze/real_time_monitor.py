@@ -3,6 +3,7 @@
 상단: 일별 수익률 차트 + 키움 보유종목 모니터링
 하단: trading_list.json 종목 모니터링
 """
+import os
 import sys
 import json
 import logging
@@ -67,6 +68,7 @@ class RealTimeMonitor(QMainWindow):
 
         # 데이터 초기화
         self.data_fetcher = DataFetcher()
+        self.db_manager = self._setup_local_db()
         self.stocks = []  # trading_list.json 종목
         self.holdings = []  # 키움 보유종목
         self.stock_data = {}
@@ -560,6 +562,45 @@ class RealTimeMonitor(QMainWindow):
 
         logger.info("✅ 전체 종목 새로고침 완료")
 
+    def _setup_local_db(self):
+        """로컬 DB 연결 (config.yaml에 database 설정이 있을 경우, 없으면 None)"""
+        try:
+            import yaml
+            from db_manager import DBManager
+
+            if not os.path.exists("config.yaml"):
+                return None
+            with open("config.yaml", 'r', encoding='utf-8') as f:
+                db_config = (yaml.safe_load(f) or {}).get('database', {})
+            if not db_config:
+                return None
+
+            db_manager = DBManager(db_config, logger)
+            return db_manager if db_manager.connect() else None
+        except Exception as e:
+            logger.warning(f"⚠️ 로컬 DB 설정 실패: {e} - 20일평균은 API로 계산")
+            return None
+
+    def get_stored_ma20(self, codes):
+        """daily_indicators에 저장된 종목별 최신 20일 이동평균 ({종목코드: ma20}, DB 없으면 빈 딕셔너리)"""
+        if not self.db_manager:
+            return {}
+        latest = self.db_manager.get_latest_indicators_bulk(codes)
+        return {code: row['ma20'] for code, row in latest.items() if row.get('ma20') is not None}
+
+    def get_ma20_price(self, code, stored_ma20):
+        """20일 평균가 (저장된 지표 우선, 없으면 최근 일봉으로 계산)"""
+        if code in stored_ma20:
+            return float(stored_ma20[code])
+
+        try:
+            df_20d = self.data_fetcher.get_period_price_data(code, days=20)
+            if df_20d is not None and not df_20d.empty and len(df_20d) >= 20:
+                return df_20d['stck_clpr'].tail(20).mean()
+        except Exception as e:
+            logger.debug(f"⚠️ {code}: 20일평균 계산 오류: {e}")
+        return None
+
     def update_data(self):
         """실시간 데이터 업데이트 (차트 + 보유종목 + 관심종목)"""
         logger.info("📊 가격 업데이트 시작...")
@@ -587,6 +628,7 @@ class RealTimeMonitor(QMainWindow):
         
         total_eval_amount = 0
         total_profit_loss = 0
+        stored_ma20 = self.get_stored_ma20([holding.get("stock_code") for holding in self.holdings])
         
         for i, holding in enumerate(self.holdings):
             code = holding.get("stock_code")
@@ -601,14 +643,8 @@ class RealTimeMonitor(QMainWindow):
                 current_price = None
                 prev_close = None
             
-            # 20일 평균가 계산
-            ma20_price = None
-            try:
-                df_20d = self.data_fetcher.get_period_price_data(code, days=20)
-                if df_20d is not None and not df_20d.empty and len(df_20d) >= 20:
-                    ma20_price = df_20d['stck_clpr'].tail(20).mean()
-            except Exception as e:
-                logger.debug(f"⚠️ {code}: 20일평균 계산 오류: {e}")
+            # 20일 평균가 (저장된 지표 우선)
+            ma20_price = self.get_ma20_price(code, stored_ma20)
             
             if current_price:
                 # 현재가
@@ -741,6 +777,7 @@ class RealTimeMonitor(QMainWindow):
         up_count = 0
         down_count = 0
         same_count = 0
+        stored_ma20 = self.get_stored_ma20([stock.get("code") for stock in self.stocks])
 
         for i, stock in enumerate(self.stocks):
             code = stock.get("code")
@@ -755,14 +792,8 @@ class RealTimeMonitor(QMainWindow):
                 current_price = None
                 current_volume = None
 
-            # 20일 평균가 계산
-            ma20_price = None
-            try:
-                df_20d = self.data_fetcher.get_period_price_data(code, days=20)
-                if df_20d is not None and not df_20d.empty and len(df_20d) >= 20:
-                    ma20_price = df_20d['stck_clpr'].tail(20).mean()
-            except Exception as e:
-                logger.debug(f"⚠️ {code}: 20일평균 계산 오류: {e}")
+            # 20일 평균가 (저장된 지표 우선)
+            ma20_price = self.get_ma20_price(code, stored_ma20)
 
             if current_price and current_volume:
                 # 현재가
@@ -0,0 +1,559 @@
+"""
+실시간 시세 구독 모듈
+REST 현재가 폴링 대신 체결 틱/분봉 이벤트로 전략을 구동하기 위한 구독 계층
+
+구성:
+  - RealtimeFeed: 전송 계층에서 받은 틱을 전용 스레드에서 리스너에 전달, 틱을 1분봉으로 집계하여
+                  분봉 완성 이벤트 발생 (MinuteBarBuffer에도 반영), 종목별 최신 체결 조회
+  - KISWebSocketTransport: KIS 실시간 체결가(H0STCNT0) 웹소켓 (websocket-client 필요)
+  - ReplayTransport: minute_stock_prices에 저장된 분봉을 틱(시가→저가/고가→종가)으로 재생
+                     (장 외 시간 테스트용, 네트워크/주문 없이 전략 이벤트 흐름 검증)
+
+틱: {'stock_code', 'time'(datetime), 'price', 'volume'(체결량), 'acc_volume'(누적 거래량),
+     'change_rate'(전일 대비 %, 모르면 None), 'open', 'high', 'low'(당일)}
+분봉: MinuteBarBuffer와 같은 레코드 (stock_code, trade_datetime, open/high/low/close_price, volume)
+
+사용 예:
+  feed = create_realtime_feed({'transport': 'websocket'}, kis_config, logger=logger)
+  feed.on_tick(lambda tick: ...)
+  feed.on_bar(lambda bar: ...)
+  feed.subscribe(['005930', '000660'])
+  feed.start()
+"""
+import heapq
+import json
+import logging
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional
+
+from http_client import get_http_client
+from minute_stream import MinuteBarBuffer
+
+try:
+    import websocket  # websocket-client
+except ImportError:
+    websocket = None
+
+
+class QuoteTransport(ABC):
+    """실시간 시세 전송 계층 추상 클래스 (emit(틱)으로 전달, 스트림 종료 시 emit(None))"""
+
+    max_subscriptions = None  # 동시 구독 가능 종목 수 (None이면 제한 없음)
+    is_replay = False
+
+    @abstractmethod
+    def start(self, emit: Callable[[Optional[Dict]], None]):
+        """수신 시작 (틱마다 emit(틱) 호출)"""
+        pass
+
+    @abstractmethod
+    def subscribe(self, stock_codes: List[str]):
+        """종목 구독 등록"""
+        pass
+
+    @abstractmethod
+    def unsubscribe(self, stock_codes: List[str]):
+        """종목 구독 해제"""
+        pass
+
+    @abstractmethod
+    def stop(self):
+        """수신 중지 (종료 신호 emit(None)은 늦게 오거나 오지 않을 수 있음)"""
+        pass
+
+
+class KISWebSocketTransport(QuoteTransport):
+    """KIS 실시간 체결가 웹소켓 (H0STCNT0)
+
+    접속키(approval_key) 발급 → 종목별 구독 등록 → '0|H0STCNT0|건수|필드^필드...' 수신
+    연결이 끊기면 재접속 후 구독을 다시 등록
+    """
+
+    TR_ID = 'H0STCNT0'
+    max_subscriptions = 41  # KIS 세션당 실시간 등록 한도
+
+    # H0STCNT0 필드 위치
+    FIELD_CODE, FIELD_TIME, FIELD_PRICE = 0, 1, 2
+    FIELD_CHANGE_RATE = 5
+    FIELD_OPEN, FIELD_HIGH, FIELD_LOW = 7, 8, 9
+    FIELD_VOLUME, FIELD_ACC_VOLUME = 12, 13
+
+    def __init__(self, app_key: str, app_secret: str, base_url: str, ws_url: str = None,
+                 reconnect_delay: float = 3.0, logger=None):
+        """
+        Args:
+            app_key: KIS 앱 키
+            app_secret: KIS 앱 시크릿
+            base_url: KIS REST 주소 (접속키 발급, 모의투자 여부 판단)
+            ws_url: 웹소켓 주소 (기본: 실전 21000 / 모의 31000 포트)
+            reconnect_delay: 재접속 대기(초)
+            logger: 로거 객체
+        """
+        if websocket is None:
+            raise ImportError("websocket-client 패키지가 필요합니다 (pip install websocket-client)")
+
+        self.app_key = app_key
+        self.app_secret = app_secret
+        self.base_url = base_url
+        is_mock = 'vts' in base_url.lower()
+        self.ws_url = ws_url or f"ws://ops.koreainvestment.com:{31000 if is_mock else 21000}"
+        self.reconnect_delay = reconnect_delay
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.approval_key = None
+        self.codes = []
+        self.lock = threading.Lock()
+        self.ws = None
+        self.emit = None
+        self.thread = None
+        self.running = False
+
+    def _issue_approval_key(self) -> str:
+        """실시간 접속키 발급"""
+        response = get_http_client().post(
+            f"{self.base_url}/oauth2/Approval",
+            headers={"content-type": "application/json; utf-8"},
+            data=json.dumps({"grant_type": "client_credentials",
+                             "appkey": self.app_key, "secretkey": self.app_secret}),
+            throttle=False, timeout=10
+        )
+        response.raise_for_status()
+        return response.json()['approval_key']
+
+    def _send(self, stock_code: str, register: bool):
+        message = {
+            "header": {"approval_key": self.approval_key, "custtype": "P",
+                       "tr_type": "1" if register else "2", "content-type": "utf-8"},
+            "body": {"input": {"tr_id": self.TR_ID, "tr_key": stock_code}}
+        }
+        self.ws.send(json.dumps(message))
+
+    def start(self, emit):
+        self.emit = emit
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name="kis-websocket", daemon=True)
+        self.thread.start()
+
+    def subscribe(self, stock_codes):
+        with self.lock:
+            new_codes = [code for code in stock_codes if code not in self.codes]
+            self.codes.extend(new_codes)
+            if self.ws and self.ws.sock and self.ws.sock.connected:
+                for code in new_codes:
+                    self._send(code, True)
+
+    def unsubscribe(self, stock_codes):
+        with self.lock:
+            for code in stock_codes:
+                if code in self.codes:
+                    self.codes.remove(code)
+                    if self.ws and self.ws.sock and self.ws.sock.connected:
+                        self._send(code, False)
+
+    def stop(self):
+        self.running = False
+        if self.ws:
+            self.ws.close()
+
+    def _on_open(self, ws):
+        with self.lock:
+            for code in self.codes:
+                self._send(code, True)
+        self.logger.info(f"📡 실시간 체결가 연결: {len(self.codes)}종목 구독")
+
+    def _on_message(self, ws, message: str):
+        if message[:1] in ('0', '1'):
+            parts = message.split('|', 3)
+            if len(parts) == 4 and parts[1] == self.TR_ID:
+                for tick in self.parse_ticks(parts[3], int(parts[2])):
+                    self.emit(tick)
+            return
+
+        try:
+            data = json.loads(message)
+        except ValueError:
+            return
+        if data.get('header', {}).get('tr_id') == 'PINGPONG':
+            ws.send(message)
+        elif data.get('body', {}).get('rt_cd') not in (None, '0'):
+            self.logger.warning(f"⚠️ 실시간 등록 응답: {data['body'].get('msg1', '')}")
+
+    @classmethod
+    def parse_ticks(cls, payload: str, count: int) -> List[Dict]:
+        """H0STCNT0 수신 데이터 → 틱 리스트 (한 메시지에 여러 체결이 올 수 있음)"""
+        fields = payload.split('^')
+        size = len(fields) // max(count, 1)
+        today = date.today()
+        ticks = []
+
+        for i in range(count):
+            row = fields[i * size:(i + 1) * size]
+            hhmmss = row[cls.FIELD_TIME]
+            ticks.append({
+                'stock_code': row[cls.FIELD_CODE],
+                'time': datetime.combine(today, datetime.strptime(hhmmss, '%H%M%S').time()),
+                'price': int(row[cls.FIELD_PRICE]),
+                'volume': int(row[cls.FIELD_VOLUME]),
+                'acc_volume': int(row[cls.FIELD_ACC_VOLUME]),
+                'change_rate': float(row[cls.FIELD_CHANGE_RATE]),
+                'open': int(row[cls.FIELD_OPEN]),
+                'high': int(row[cls.FIELD_HIGH]),
+                'low': int(row[cls.FIELD_LOW]),
+            })
+        return ticks
+
+    def _run(self):
+        """접속 + 재접속 루프"""
+        while self.running:
+            try:
+                self.approval_key = self.approval_key or self._issue_approval_key()
+                self.ws = websocket.WebSocketApp(
+                    self.ws_url, on_open=self._on_open, on_message=self._on_message,
+                    on_error=lambda ws, e: self.logger.warning(f"⚠️ 실시간 연결 오류: {e}")
+                )
+                self.ws.run_forever(ping_interval=60, ping_timeout=10)
+            except Exception as e:
+                self.logger.error(f"❌ 실시간 연결 실패: {e}")
+
+            if self.running:
+                self.logger.info(f"🔄 실시간 재접속 대기 ({self.reconnect_delay:.0f}초)")
+                time.sleep(self.reconnect_delay)
+
+        self.emit(None)
+
+
+class ReplayTransport(QuoteTransport):
+    """저장된 분봉 재생 전송 계층
+
+    분봉 하나를 틱 4개(시가 → 양봉이면 저가·고가, 음봉이면 고가·저가 → 종가, 15초 간격)로 바꿔 시간순 재생
+    (재생한 틱을 RealtimeFeed가 다시 집계하면 원래 분봉과 같은 OHLCV)
+    """
+
+    is_replay = True
+
+    def __init__(self, db_manager=None, trade_date: date = None, records: List[Dict] = None,
+                 prev_closes: Dict[str, int] = None, speed: float = 60.0, logger=None):
+        """
+        Args:
+            db_manager: DBManager (연결된 상태, 구독 시 호출 스레드에서 분봉 조회)
+            trade_date: 재생할 거래일 (기본: 어제)
+            records: DB 대신 사용할 분봉 레코드 리스트 (테스트용)
+            prev_closes: {종목코드: 전일 종가} (틱의 change_rate 계산용, 선택)
+            speed: 재생 배속 (60이면 1분봉이 1초, 0이면 대기 없이 최대 속도)
+            logger: 로거 객체
+        """
+        self.db_manager = db_manager
+        self.trade_date = trade_date or date.today() - timedelta(days=1)
+        self.records = records
+        self.prev_closes = prev_closes or {}
+        self.speed = speed
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.heap = []   # (틱 시각, 순번, 틱)
+        self.seq = 0
+        self.codes = set()
+        self.acc = {}    # {종목코드: 당일 누적 상태}
+        self.condition = threading.Condition()
+        self.emit = None
+        self.thread = None
+        self.running = False
+
+    def _load_bars(self, stock_codes: List[str]) -> List[Dict]:
+        if self.records is not None:
+            wanted = set(stock_codes)
+            return [r for r in self.records if r['stock_code'] in wanted]
+
+        bars = []
+        for code in stock_codes:
+            bars.extend(self.db_manager.get_minute_prices_by_date(code, self.trade_date) or [])
+        return bars
+
+    def _bar_ticks(self, bar: Dict) -> List[Dict]:
+        """분봉 1개 → 틱 4개"""
+        code = bar['stock_code']
+        o, h, l, c = (int(bar[k]) for k in ('open_price', 'high_price', 'low_price', 'close_price'))
+        volume = int(bar.get('volume') or 0)
+        path = [o, l, h, c] if c >= o else [o, h, l, c]
+        volumes = [volume // 4] * 3 + [volume - volume // 4 * 3]
+
+        state = self.acc.setdefault(code, {'acc_volume': 0, 'open': o, 'high': h, 'low': l})
+        prev_close = self.prev_closes.get(code)
+        ticks = []
+        for i, (price, vol) in enumerate(zip(path, volumes)):
+            state['acc_volume'] += vol
+            state['high'] = max(state['high'], price)
+            state['low'] = min(state['low'], price)
+            ticks.append({
+                'stock_code': code,
+                'time': bar['trade_datetime'] + timedelta(seconds=15 * i),
+                'price': price,
+                'volume': vol,
+                'acc_volume': state['acc_volume'],
+                'change_rate': (price - prev_close) / prev_close * 100 if prev_close else None,
+                'open': state['open'],
+                'high': state['high'],
+                'low': state['low'],
+            })
+        return ticks
+
+    def subscribe(self, stock_codes):
+        new_codes = [code for code in stock_codes if code not in self.codes]
+        if not new_codes:
+            return
+
+        bars = sorted(self._load_bars(new_codes), key=lambda b: (b['stock_code'], b['trade_datetime']))
+        with self.condition:
+            self.codes.update(new_codes)
+            for bar in bars:
+                for tick in self._bar_ticks(bar):
+                    heapq.heappush(self.heap, (tick['time'], self.seq, tick))
+                    self.seq += 1
+            self.condition.notify_all()
+        self.logger.info(f"🧪 리플레이 구독: {len(new_codes)}종목, 분봉 {len(bars)}개 ({self.trade_date})")
+
+    def unsubscribe(self, stock_codes):
+        with self.condition:
+            self.codes.difference_update(stock_codes)
+
+    def start(self, emit):
+        self.emit = emit
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name="quote-replay", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+
+    def _run(self):
+        """틱 시각 간격을 배속으로 줄여 재생, 모두 재생하면 emit(None)"""
+        replay_start = None
+        wall_start = time.monotonic()
+
+        while True:
+            with self.condition:
+                if not self.running or not self.heap:
+                    break
+                tick_time, _, tick = heapq.heappop(self.heap)
+                if tick['stock_code'] not in self.codes:
+                    continue
+
+            if self.speed > 0:
+                replay_start = replay_start or tick_time
+                due = (tick_time - replay_start).total_seconds() / self.speed
+                delay = due - (time.monotonic() - wall_start)
+                if delay > 0:
+                    time.sleep(delay)
+
+            self.emit(tick)
+
+        self.emit(None)
+
+
+class RealtimeFeed:
+    """실시간 시세 구독 + 이벤트 전달
+
+    전송 계층 스레드는 틱을 큐에 넣기만 하고, 리스너 호출/분봉 집계는 전달 스레드 1개에서 순서대로 수행
+    (리스너에서 주문을 내도 수신이 막히지 않음, 같은 종목 이벤트는 발생 순서 보장)
+    """
+
+    def __init__(self, transport: QuoteTransport, buffer: MinuteBarBuffer = None, logger=None):
+        """
+        Args:
+            transport: 전송 계층 (KISWebSocketTransport / ReplayTransport)
+            buffer: 완성 분봉을 반영할 링 버퍼 (기본: 새 MinuteBarBuffer)
+            logger: 로거 객체
+        """
+        self.transport = transport
+        self.buffer = buffer or MinuteBarBuffer()
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.tick_listeners = []
+        self.bar_listeners = []
+        self.quotes = {}        # {종목코드: 최신 틱}
+        self.building = {}      # {종목코드: 집계 중인 분봉}
+        self.subscribed = []
+
+        self.queue = queue.Queue()
+        self.finished = threading.Event()
+        self.thread = None
+
+        self.tick_count = 0
+        self.bar_count = 0
+        self.listener_errors = 0
+        self.max_lag = 0.0      # 수신 → 리스너 전달 최대 지연(초)
+
+    @property
+    def is_replay(self) -> bool:
+        return self.transport.is_replay
+
+    def on_tick(self, callback: Callable[[Dict], None]):
+        """체결 틱 리스너 등록"""
+        self.tick_listeners.append(callback)
+
+    def on_bar(self, callback: Callable[[Dict], None]):
+        """분봉 완성 리스너 등록"""
+        self.bar_listeners.append(callback)
+
+    def subscribe(self, stock_codes: Iterable[str]) -> List[str]:
+        """종목 구독 (전송 계층 한도를 넘는 종목은 제외)
+
+        Returns:
+            List[str]: 이번에 새로 구독된 종목코드
+        """
+        new_codes = [code for code in dict.fromkeys(stock_codes) if code not in self.subscribed]
+        limit = self.transport.max_subscriptions
+        if limit is not None and len(self.subscribed) + len(new_codes) > limit:
+            skipped = len(self.subscribed) + len(new_codes) - limit
+            new_codes = new_codes[:max(0, limit - len(self.subscribed))]
+            self.logger.warning(f"⚠️ 실시간 구독 한도 {limit}종목 초과 - {skipped}종목 제외")
+
+        if new_codes:
+            self.transport.subscribe(new_codes)
+            self.subscribed.extend(new_codes)
+        return new_codes
+
+    def unsubscribe(self, stock_codes: Iterable[str]):
+        """종목 구독 해제"""
+        codes = [code for code in stock_codes if code in self.subscribed]
+        if codes:
+            self.transport.unsubscribe(codes)
+            self.subscribed = [code for code in self.subscribed if code not in codes]
+
+    def get_quote(self, stock_code: str) -> Optional[Dict]:
+        """종목 최신 체결 틱 (아직 수신 전이면 None)"""
+        return self.quotes.get(stock_code)
+
+    def start(self):
+        """전달 스레드 + 전송 계층 시작"""
+        self.finished.clear()
+        self.thread = threading.Thread(target=self._dispatch, name="quote-feed", daemon=True)
+        self.thread.start()
+        self.transport.start(self._enqueue)
+
+    def stop(self, timeout: float = 5.0):
+        """전송 계층 중지 후 남은 이벤트 전달까지 대기
+
+        웹소켓 전송 계층은 재접속 대기가 끝나야 종료 신호를 보내므로 기다리지 않고 직접 종료 신호를 넣음
+        (이후 도착하는 틱/종료 신호는 전달 스레드가 끝난 뒤라 무시됨)
+        """
+        self.transport.stop()
+        if self.thread and self.thread.is_alive() and not self.finished.is_set():
+            self._enqueue(None)
+        if self.thread:
+            self.thread.join(timeout)
+
+    def wait(self, timeout: float = None) -> bool:
+        """스트림 종료(리플레이 끝)까지 대기
+
+        Returns:
+            bool: 종료되었으면 True
+        """
+        return self.finished.wait(timeout)
+
+    def get_stats(self) -> Dict:
+        """수신 통계 {'ticks', 'bars', 'subscribed', 'listener_errors', 'max_lag_ms'}"""
+        return {
+            'ticks': self.tick_count,
+            'bars': self.bar_count,
+            'subscribed': len(self.subscribed),
+            'listener_errors': self.listener_errors,
+            'max_lag_ms': self.max_lag * 1000,
+        }
+
+    def _enqueue(self, tick: Optional[Dict]):
+        self.queue.put((time.monotonic(), tick))
+
+    def _notify(self, listeners, event: Dict):
+        for callback in listeners:
+            try:
+                callback(event)
+            except Exception as e:
+                self.listener_errors += 1
+                self.logger.error(f"❌ 실시간 이벤트 처리 오류 ({event.get('stock_code')}): {e}")
+
+    def _complete_bar(self, bar: Dict):
+        self.buffer.update(bar['stock_code'], [bar])
+        self.bar_count += 1
+        self._notify(self.bar_listeners, bar)
+
+    def _aggregate(self, tick: Dict):
+        """틱 → 1분봉 집계 (다음 분 틱이 오면 이전 분봉 완성)"""
+        code = tick['stock_code']
+        minute = tick['time'].replace(second=0, microsecond=0)
+        bar = self.building.get(code)
+
+        if bar and bar['trade_datetime'] != minute:
+            self._complete_bar(bar)
+            bar = None
+
+        if bar is None:
+            self.building[code] = {
+                'stock_code': code,
+                'trade_datetime': minute,
+                'open_price': tick['price'],
+                'high_price': tick['price'],
+                'low_price': tick['price'],
+                'close_price': tick['price'],
+                'volume': tick['volume'],
+            }
+        else:
+            bar['high_price'] = max(bar['high_price'], tick['price'])
+            bar['low_price'] = min(bar['low_price'], tick['price'])
+            bar['close_price'] = tick['price']
+            bar['volume'] += tick['volume']
+
+    def _dispatch(self):
+        """큐의 틱을 순서대로 집계/전달, 스트림 종료(None) 시 집계 중인 분봉 마감"""
+        while True:
+            received, tick = self.queue.get()
+            if tick is None:
+                for bar in list(self.building.values()):
+                    self._complete_bar(bar)
+                self.building.clear()
+                self.finished.set()
+                break
+
+            self.max_lag = max(self.max_lag, time.monotonic() - received)
+            self.tick_count += 1
+            self.quotes[tick['stock_code']] = tick
+            self._aggregate(tick)
+            self._notify(self.tick_listeners, tick)
+
+
+def create_realtime_feed(realtime_config: Dict, kis_config: Dict, db_manager=None,
+                         prev_closes: Dict[str, int] = None, logger=None) -> RealtimeFeed:
+    """설정으로 실시간 시세 구독 생성
+
+    Args:
+        realtime_config: {'transport': 'websocket' | 'replay', 'replay_date': 'YYYY-MM-DD', 'replay_speed': 60}
+        kis_config: {'app_key', 'app_secret', 'base_url'} (웹소켓용)
+        db_manager: DBManager (리플레이용, 연결된 상태)
+        prev_closes: {종목코드: 전일 종가} (리플레이 change_rate 계산용)
+        logger: 로거 객체
+    """
+    transport_name = realtime_config.get('transport', 'websocket')
+
+    if transport_name == 'replay':
+        replay_date = realtime_config.get('replay_date')
+        transport = ReplayTransport(
+            db_manager=db_manager,
+            trade_date=datetime.strptime(str(replay_date), '%Y-%m-%d').date() if replay_date else None,
+            prev_closes=prev_closes,
+            speed=float(realtime_config.get('replay_speed', 60)),
+            logger=logger
+        )
+    elif transport_name == 'websocket':
+        transport = KISWebSocketTransport(
+            kis_config['app_key'], kis_config['app_secret'], kis_config['base_url'],
+            ws_url=realtime_config.get('ws_url'), logger=logger
+        )
+    else:
+        raise ValueError(f"알 수 없는 실시간 전송 방식: {transport_name}")
+
+    return RealtimeFeed(transport, logger=logger)
@@ -2,19 +2,23 @@
 업종 모멘텀 분석 모듈
 2일 연속 상승 업종의 시가총액 상위 종목 추출
 """
-import requests
-import time
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple
 import logging
 
+from http_client import get_http_client
+from rate_limiter import TokenBucket
+
 logger = logging.getLogger(__name__)
 
 
 class SectorMomentumAnalyzer:
     """업종 모멘텀 분석 클래스"""
     
+    # 분석기 KIS 호출 초당 횟수 (기존 호출 전 0.2초 대기와 같은 간격)
+    API_RATE = 5
+    
     # 한국 업종 코드 매핑 (KOSPI 주요 업종)
     SECTOR_CODES = {
         "G10": "음식료품",
@@ -49,6 +53,8 @@ class SectorMomentumAnalyzer:
         self.app_key = api_client.app_key
         self.app_secret = api_client.app_secret
         self.access_token = None
+        self.http = get_http_client()  # 공유 클라이언트 (전역 TokenBucket + 아래 분석기 전용 제한기)
+        self.api_limiter = TokenBucket(self.API_RATE)
         
     def _get_access_token(self):
         """액세스 토큰 가져오기"""
@@ -90,8 +96,7 @@ class SectorMomentumAnalyzer:
                 "fid_org_adj_prc": "0"
             }
             
-            time.sleep(0.2)  # API 호출 제한
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self.http.get(url, headers=headers, params=params, timeout=10, limiter=self.api_limiter)
             response.raise_for_status()
             
             data = response.json()
@@ -178,8 +183,6 @@ class SectorMomentumAnalyzer:
                     logger.info(f"✅ {sector_name}({sector_code}): {min_days}일 연속 상승, "
                               f"누적 수익률 {period_return:.2f}%")
                 
-                time.sleep(0.1)  # API 호출 간격
-                
             except Exception as e:
                 logger.warning(f"⚠️ {sector_name}({sector_code}) 분석 오류: {e}")
                 continue
@@ -217,8 +220,7 @@ class SectorMomentumAnalyzer:
                 "FID_INPUT_ISCD": sector_code
             }
             
-            time.sleep(0.2)
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self.http.get(url, headers=headers, params=params, timeout=10, limiter=self.api_limiter)
             response.raise_for_status()
             
             data = response.json()
@@ -319,8 +321,6 @@ class SectorMomentumAnalyzer:
                 logger.info(f"  ✅ #{rank} {stock['name']}({stock['code']}): "
                           f"시가총액 {stock_data['market_cap_billion']:.0f}억원, "
                           f"현재가 {stock['current_price']:,}원 ({stock['change_rate']:+.2f}%)")
-            
-            time.sleep(0.2)
         
         logger.info(f"\n🎯 최종 추천 종목: {len(recommended_stocks)}개")
         logger.info("=" * 60)
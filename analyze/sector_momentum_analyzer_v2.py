@@ -12,12 +12,18 @@ from typing import Dict, List, Tuple
 import logging
 from bs4 import BeautifulSoup
 
+from http_client import get_http_client
+from rate_limiter import TokenBucket
+
 logger = logging.getLogger(__name__)
 
 
 class SectorMomentumAnalyzerV2:
     """개별 종목 기반 업종 모멘텀 분석 클래스"""
     
+    # 분석기 KIS 호출 초당 횟수 (기존 호출 전 0.1초 대기와 같은 간격)
+    API_RATE = 10
+    
     # 네이버 금융 업종 코드
     NAVER_SECTOR_CODES = {
         "0": "음식료품",
@@ -52,6 +58,8 @@ class SectorMomentumAnalyzerV2:
         self.api_client = api_client
         self.app_key = api_client.app_key
         self.app_secret = api_client.app_secret
+        self.http = get_http_client()  # 공유 클라이언트 (전역 TokenBucket + 아래 분석기 전용 제한기)
+        self.api_limiter = TokenBucket(self.API_RATE)
     
     def get_sector_stocks_from_naver(self, sector_code: str) -> List[Dict]:
         """
@@ -166,7 +174,7 @@ class SectorMomentumAnalyzerV2:
                 "fid_org_adj_prc": "0"
             }
             
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self.http.get(url, headers=headers, params=params, timeout=10, limiter=self.api_limiter)
             response.raise_for_status()
             
             data = response.json()
@@ -223,7 +231,6 @@ class SectorMomentumAnalyzerV2:
                     return_pct = self.get_stock_recent_performance(stock['code'], days=min_days)
                     if return_pct != 0.0:
                         returns.append(return_pct)
-                    time.sleep(0.1)  # API 호출 제한
                 
                 if len(returns) < 3:
                     logger.debug(f"업종 {sector_name}: 유효 데이터 부족")
@@ -330,8 +337,6 @@ class SectorMomentumAnalyzerV2:
                 logger.info(f"  ✅ #{rank} {stock['name']}({stock['code']}): "
                           f"현재가 {stock['current_price']:,}원 "
                           f"({stock_return:+.2f}%)")
-                
-                time.sleep(0.1)
         
         logger.info(f"\n🎯 최종 추천 종목: {len(recommended_stocks)}개")
         logger.info("=" * 60)
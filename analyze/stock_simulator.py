@@ -198,114 +198,110 @@ class StockSimulator:
             시뮬레이션 결과 딕셔너리
         """
         try:
-            # DB 연결
-            if not self.db_manager.connect():
-                return None
-
-            # 종목코드 확인
-            stock_code = self.resolve_stock_code(stock_code_or_name)
-            if not stock_code:
-                return None
-
-            # 종목 정보 조회
-            stock_info = self.get_stock_info(stock_code)
-            if not stock_info:
-                self.logger.error(f"❌ 종목코드 '{stock_code}'를 찾을 수 없습니다.")
-                return None
-
-            stock_name = stock_info['stock_name']
-
-            # 매수일 데이터 조회 (해당 날짜가 비거래일이면 이후 첫 거래일)
-            buy_data = self.get_price_on_date(stock_code, buy_date)
-            if not buy_data:
-                self.logger.warning(f"⚠️ {buy_date}는 거래일이 아닙니다. 이후 거래일을 찾습니다...")
-                actual_buy_date = self.get_nearest_trading_date(stock_code, buy_date, 'after')
-                if not actual_buy_date:
-                    self.logger.error(f"❌ {buy_date} 이후 거래 데이터가 없습니다.")
+            # DB 연결 (커넥션 풀에서 재사용, with 블록 종료 시 반납)
+            with self.db_manager.session():
+                # 종목코드 확인
+                stock_code = self.resolve_stock_code(stock_code_or_name)
+                if not stock_code:
                     return None
-                buy_data = self.get_price_on_date(stock_code, actual_buy_date)
-                buy_date = actual_buy_date
-
-            # 매도일 데이터 조회 (해당 날짜가 비거래일이면 이전 거래일)
-            sell_data = self.get_price_on_date(stock_code, sell_date)
-            if not sell_data:
-                self.logger.warning(f"⚠️ {sell_date}는 거래일이 아닙니다. 이전 거래일을 찾습니다...")
-                actual_sell_date = self.get_nearest_trading_date(stock_code, sell_date, 'before')
-                if not actual_sell_date:
-                    self.logger.error(f"❌ {sell_date} 이전 거래 데이터가 없습니다.")
+
+                # 종목 정보 조회
+                stock_info = self.get_stock_info(stock_code)
+                if not stock_info:
+                    self.logger.error(f"❌ 종목코드 '{stock_code}'를 찾을 수 없습니다.")
                     return None
-                sell_data = self.get_price_on_date(stock_code, actual_sell_date)
-                sell_date = actual_sell_date
 
-            # 날짜 검증
-            if buy_date >= sell_date:
-                self.logger.error("❌ 매수일이 매도일보다 늦습니다.")
-                return None
+                stock_name = stock_info['stock_name']
+
+                # 매수일 데이터 조회 (해당 날짜가 비거래일이면 이후 첫 거래일)
+                buy_data = self.get_price_on_date(stock_code, buy_date)
+                if not buy_data:
+                    self.logger.warning(f"⚠️ {buy_date}는 거래일이 아닙니다. 이후 거래일을 찾습니다...")
+                    actual_buy_date = self.get_nearest_trading_date(stock_code, buy_date, 'after')
+                    if not actual_buy_date:
+                        self.logger.error(f"❌ {buy_date} 이후 거래 데이터가 없습니다.")
+                        return None
+                    buy_data = self.get_price_on_date(stock_code, actual_buy_date)
+                    buy_date = actual_buy_date
+
+                # 매도일 데이터 조회 (해당 날짜가 비거래일이면 이전 거래일)
+                sell_data = self.get_price_on_date(stock_code, sell_date)
+                if not sell_data:
+                    self.logger.warning(f"⚠️ {sell_date}는 거래일이 아닙니다. 이전 거래일을 찾습니다...")
+                    actual_sell_date = self.get_nearest_trading_date(stock_code, sell_date, 'before')
+                    if not actual_sell_date:
+                        self.logger.error(f"❌ {sell_date} 이전 거래 데이터가 없습니다.")
+                        return None
+                    sell_data = self.get_price_on_date(stock_code, actual_sell_date)
+                    sell_date = actual_sell_date
+
+                # 날짜 검증
+                if buy_date >= sell_date:
+                    self.logger.error("❌ 매수일이 매도일보다 늦습니다.")
+                    return None
 
-            # 기간 통계 조회
-            period_stats = self.get_period_stats(stock_code, buy_date, sell_date)
+                # 기간 통계 조회
+                period_stats = self.get_period_stats(stock_code, buy_date, sell_date)
 
-            # 매매 계산
-            buy_price = buy_data['close_price']
-            sell_price = sell_data['close_price']
+                # 매매 계산
+                buy_price = buy_data['close_price']
+                sell_price = sell_data['close_price']
 
-            # 매수 가능 주식 수 (수수료 제외)
-            shares = amount // buy_price
+                # 매수 가능 주식 수 (수수료 제외)
+                shares = amount // buy_price
 
-            if shares == 0:
-                self.logger.error(f"❌ 투자금액이 부족합니다. (필요금액: {buy_price}원 이상)")
-                return None
-
-            # 실제 투자금액
-            actual_investment = shares * buy_price
-
-            # 매도 금액
-            sell_amount = shares * sell_price
-
-            # 손익
-            profit = sell_amount - actual_investment
-            profit_rate = (profit / actual_investment) * 100
-
-            # 최대 수익/손실 (보유 기간 중)
-            max_profit = 0
-            max_loss = 0
-            if period_stats:
-                max_high = period_stats['max_high']
-                min_low = period_stats['min_low']
-
-                max_profit_amount = shares * max_high - actual_investment
-                max_profit = (max_profit_amount / actual_investment) * 100
-
-                max_loss_amount = shares * min_low - actual_investment
-                max_loss = (max_loss_amount / actual_investment) * 100
-
-            # 결과 반환
-            result = {
-                'stock_code': stock_code,
-                'stock_name': stock_name,
-                'buy_date': buy_date,
-                'sell_date': sell_date,
-                'buy_price': buy_price,
-                'sell_price': sell_price,
-                'shares': shares,
-                'investment': actual_investment,
-                'sell_amount': sell_amount,
-                'profit': profit,
-                'profit_rate': profit_rate,
-                'period_stats': period_stats,
-                'max_profit_rate': max_profit,
-                'max_loss_rate': max_loss
-            }
+                if shares == 0:
+                    self.logger.error(f"❌ 투자금액이 부족합니다. (필요금액: {buy_price}원 이상)")
+                    return None
 
-            return result
+                # 실제 투자금액
+                actual_investment = shares * buy_price
+
+                # 매도 금액
+                sell_amount = shares * sell_price
+
+                # 손익
+                profit = sell_amount - actual_investment
+                profit_rate = (profit / actual_investment) * 100
+
+                # 최대 수익/손실 (보유 기간 중)
+                max_profit = 0
+                max_loss = 0
+                if period_stats:
+                    max_high = period_stats['max_high']
+                    min_low = period_stats['min_low']
+
+                    max_profit_amount = shares * max_high - actual_investment
+                    max_profit = (max_profit_amount / actual_investment) * 100
+
+                    max_loss_amount = shares * min_low - actual_investment
+                    max_loss = (max_loss_amount / actual_investment) * 100
+
+                # 결과 반환
+                result = {
+                    'stock_code': stock_code,
+                    'stock_name': stock_name,
+                    'buy_date': buy_date,
+                    'sell_date': sell_date,
+                    'buy_price': buy_price,
+                    'sell_price': sell_price,
+                    'shares': shares,
+                    'investment': actual_investment,
+                    'sell_amount': sell_amount,
+                    'profit': profit,
+                    'profit_rate': profit_rate,
+                    'period_stats': period_stats,
+                    'max_profit_rate': max_profit,
+                    'max_loss_rate': max_loss
+                }
+
+                return result
 
         except Exception as e:
             self.logger.error(f"❌ 시뮬레이션 실패: {e}")
             import traceback
             traceback.print_exc()
             return None
-        finally:
-            self.db_manager.disconnect()
 
     def print_result(self, result: Dict):
         """결과 출력"""
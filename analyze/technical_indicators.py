@@ -2,9 +2,13 @@
 기술적 지표 분석 모듈 (이동평균선 함수 추가) - 수정 버전
 각종 매수 신호 감지 함수들
 """
-import pandas as pd
 import numpy as np
 import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+from indicator_engine import IndicatorPanel, PRICE_COLUMNS, VOLUME_COLUMNS
 
 # pandas_ta 모듈이 없는 경우를 대비한 조건부 import
 try:
@@ -17,7 +21,59 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+# DataFrame별 지표 컨텍스트 캐시 {id(df): (df, 지문, IndicatorPanel)}
+_context_cache = OrderedDict()
+_context_lock = threading.Lock()
+CONTEXT_CACHE_SIZE = 16
+
+
+def _context_fingerprint(df):
+    """DataFrame 변경 감지용 지문 (행 수 + 마지막 행 종가/거래량)"""
+    last = df.iloc[-1]
+    values = tuple(last[col] for col in PRICE_COLUMNS + VOLUME_COLUMNS if col in df.columns)
+    return len(df), values
+
+
+def get_indicator_context(df):
+    """
+    DataFrame의 지표 컨텍스트(IndicatorPanel) 조회
+    - 같은 DataFrame 객체면 이전에 만든 컨텍스트를 재사용하여
+      이동평균/표준편차/RSI/MACD 등을 (지표, 파라미터)별로 한 번만 계산
+    - 행 수나 마지막 종가/거래량이 바뀌면 새로 생성
+
+    Args:
+        df: 주가 데이터프레임 또는 IndicatorPanel
+
+    Returns:
+        IndicatorPanel: 지표 컨텍스트 (데이터 없으면 None)
+    """
+    if isinstance(df, IndicatorPanel):
+        return df
+    if df is None or df.empty:
+        return None
+
+    key = id(df)
+    fingerprint = _context_fingerprint(df)
+
+    with _context_lock:
+        entry = _context_cache.get(key)
+        if entry is not None and entry[0] is df and entry[1] == fingerprint:
+            _context_cache.move_to_end(key)
+            return entry[2]
+
+    panel = IndicatorPanel.from_dataframe(df)
+
+    with _context_lock:
+        _context_cache[key] = (df, fingerprint, panel)
+        _context_cache.move_to_end(key)
+        while len(_context_cache) > CONTEXT_CACHE_SIZE:
+            _context_cache.popitem(last=False)
+
+    return panel
+
+
 class TechnicalIndicators:
+    """종목별 매수 신호 함수 (DataFrame별 지표 컨텍스트의 마지막 거래일 신호 조회)"""
 
     @staticmethod
     def is_volume_sufficient(df, min_volume=1000):
@@ -32,31 +88,8 @@ class TechnicalIndicators:
             bool: 거래량 충분 여부
         """
         try:
-            if df is None or df.empty or len(df) < 1:
-                return False
-            
-            # 거래량 컬럼 통일 처리
-            volume_col = None
-            if 'acml_vol' in df.columns:
-                volume_col = 'acml_vol'
-            elif 'cntg_vol' in df.columns:
-                volume_col = 'cntg_vol'
-            else:
-                return False
-            
-            # 최신 거래량
-            current_volume = df.iloc[-1][volume_col]
-            
-            # NaN 체크
-            if pd.isna(current_volume):
-                return False
-            
-            # 거래량 검증
-            is_sufficient = current_volume >= min_volume
-            logger.debug(f"{current_volume}, {is_sufficient}")
-            
-            return is_sufficient
-            
+            panel = get_indicator_context(df)
+            return panel is not None and panel.latest('volume_sufficient', min_volume=min_volume)
         except Exception as e:
             logger.error(f"❌ 거래량 확인 오류: {e}")
             return False
@@ -68,45 +101,8 @@ class TechnicalIndicators:
         - 볼린저밴드 하단을 이탈한 과도한 하락 종목 제외
         """
         try:
-            if df is None or df.empty or len(df) < period + 1:
-                return False
-        
-            # 컬럼명 통일 처리
-            price_col = None
-            if 'stck_clpr' in df.columns:
-                price_col = 'stck_clpr'
-            elif 'stck_prpr' in df.columns:
-                price_col = 'stck_prpr'
-            else:
-                return False
-            
-            df = df.copy()
-            
-            # 볼린저밴드 계산
-            df["ma20"] = df[price_col].rolling(window=period).mean()
-            df["stddev"] = df[price_col].rolling(window=period).std()
-            df["lower_band"] = df["ma20"] - num_std * df["stddev"]
-            
-            # 최신 데이터
-            current = df.iloc[-1]
-            
-            # NaN 값 체크
-            if pd.isna(current["lower_band"]):
-                return False
-            
-            current_price = current[price_col]
-            lower_band = current["lower_band"]
-            
-            # 현재가가 볼린저밴드 하단선 위에 있는지 확인
-            above_lower_band = current_price >= lower_band
-            
-            # 디버깅 로그
-            if not above_lower_band:
-                distance_ratio = (lower_band - current_price) / lower_band * 100
-                logger.debug(f"볼린저밴드 하단 이탈: 현재가 {current_price:,}원, 하단선 {lower_band:.0f}원 (이탈률 {distance_ratio:.1f}%)")
-            
-            return above_lower_band
-            
+            panel = get_indicator_context(df)
+            return panel is not None and panel.latest('above_bollinger_lower', period=period, num_std=num_std)
         except Exception as e:
             logger.error(f"❌ 볼린저밴드 확인 오류: {e}")
             return False
@@ -128,54 +124,10 @@ class TechnicalIndicators:
             bool: RSI 매수 신호 여부
         """
         try:
-            if df is None or df.empty or len(df) < period + 5:
-                return False
-            
-            # 컬럼명 통일 처리
-            price_col = None
-            if 'stck_clpr' in df.columns:
-                price_col = 'stck_clpr'
-            elif 'stck_prpr' in df.columns:
-                price_col = 'stck_prpr'
-            else:
-                return False
-            
-            df = df.copy()
-            
-            # RSI 계산
-            delta = df[price_col].diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-            
-            # 0으로 나누기 방지
-            rs = gain / loss.replace(0, 0.0001)
-            rsi = 100 - (100 / (1 + rs))
-            
-            if len(rsi) < 2:
-                return False
-            
-            current_rsi = rsi.iloc[-1]
-            previous_rsi = rsi.iloc[-2]
-            
-            # NaN 체크
-            if pd.isna(current_rsi) or pd.isna(previous_rsi):
-                return False
-            
-            # 매수 신호 조건들
-            # 1. 과매도에서 회복 중 (RSI가 30 아래였다가 상승)
-            oversold_recovery = (previous_rsi <= oversold_threshold and 
-                                current_rsi > oversold_threshold and 
-                                current_rsi < recovery_threshold)
-            
-            # 2. 매수 적정권 (RSI 30~50)
-            buy_zone = (oversold_threshold <= current_rsi <= recovery_threshold)
-            
-            # 3. RSI 상승 추세 확인
-            rsi_uptrend = current_rsi > previous_rsi
-            
-            # 조건: (과매도 회복 또는 매수 적정권) + RSI 상승 추세
-            return (oversold_recovery or buy_zone) and rsi_uptrend
-            
+            panel = get_indicator_context(df)
+            return panel is not None and panel.latest('rsi_buy_signal', period=period,
+                                                      oversold_threshold=oversold_threshold,
+                                                      recovery_threshold=recovery_threshold)
         except Exception as e:
             logger.error(f"❌ RSI 매수 신호 계산 오류: {e}")
             return False
@@ -196,73 +148,8 @@ class TechnicalIndicators:
             bool: MACD 골든크로스 여부
         """
         try:
-            if df is None or df.empty or len(df) < slow + signal + 5:
-                return False
-            
-            # 컬럼명 통일 처리
-            price_col = None
-            if 'stck_clpr' in df.columns:
-                price_col = 'stck_clpr'
-            elif 'stck_prpr' in df.columns:
-                price_col = 'stck_prpr'
-            else:
-                return False
-            
-            close_prices = df[price_col].copy()
-            
-            # NaN 체크
-            if close_prices.isnull().any():
-                return False
-            
-            # MACD 계산
-            ema_fast = close_prices.ewm(span=fast, adjust=False).mean()
-            ema_slow = close_prices.ewm(span=slow, adjust=False).mean()
-            
-            # MACD Line = 단기 EMA - 장기 EMA
-            macd_line = ema_fast - ema_slow
-            
-            # Signal Line = MACD의 EMA
-            signal_line = macd_line.ewm(span=signal, adjust=False).mean()
-            
-            if len(macd_line) < 2 or len(signal_line) < 2:
-                return False
-            
-            # 오늘과 어제의 MACD, Signal 값
-            today_macd = macd_line.iloc[-1]
-            today_signal = signal_line.iloc[-1]
-            yesterday_macd = macd_line.iloc[-2]
-            yesterday_signal = signal_line.iloc[-2]
-            
-            # NaN 체크
-            if (pd.isna(today_macd) or pd.isna(today_signal) or 
-                pd.isna(yesterday_macd) or pd.isna(yesterday_signal)):
-                return False
-            
-            # 골든크로스 조건
-            # 1. 어제는 MACD가 Signal 아래
-            # 2. 오늘은 MACD가 Signal 위로 돌파
-            # 3. MACD가 상승 추세
-            golden_cross = (
-                yesterday_macd <= yesterday_signal and  # 어제는 아래
-                today_macd > today_signal and           # 오늘은 위로 돌파
-                today_macd > yesterday_macd             # MACD 상승 추세
-            )
-            
-            # 추가 필터: 매수 시점 검증 (0선 근처 이하에서만 유효)
-            # 너무 높은 곳에서의 골든크로스는 제외
-            valid_position = today_signal <= 1000  # 적절한 임계값 설정
-            
-            # 거래량 확인 (선택사항)
-            volume_col = 'acml_vol' if 'acml_vol' in df.columns else 'cntg_vol'
-            if volume_col in df.columns and len(df) >= 10:
-                avg_volume = df[volume_col].rolling(window=10).mean().iloc[-1]
-                current_volume = df[volume_col].iloc[-1]
-                volume_surge = current_volume > avg_volume * 1.1
-                
-                return golden_cross and valid_position and volume_surge
-            else:
-                return golden_cross and valid_position
-            
+            panel = get_indicator_context(df)
+            return panel is not None and panel.latest('macd_golden_cross', fast=fast, slow=slow, signal=signal)
         except Exception as e:
             logger.error(f"❌ MACD 골든크로스 계산 오류: {e}")
             return False
@@ -281,70 +168,9 @@ class TechnicalIndicators:
             bool: MACD 골든크로스 근접 여부
         """
         try:
-            if df is None or df.empty or len(df) < slow + signal + 5:
-                return False
-            
-            # 컬럼명 통일 처리
-            price_col = None
-            if 'stck_clpr' in df.columns:
-                price_col = 'stck_clpr'
-            elif 'stck_prpr' in df.columns:
-                price_col = 'stck_prpr'
-            else:
-                return False
-            
-            close_prices = df[price_col].copy()
-            
-            if close_prices.isnull().any():
-                return False
-            
-            # MACD 계산
-            ema_fast = close_prices.ewm(span=fast, adjust=False).mean()
-            ema_slow = close_prices.ewm(span=slow, adjust=False).mean()
-            macd_line = ema_fast - ema_slow
-            signal_line = macd_line.ewm(span=signal, adjust=False).mean()
-            
-            if len(macd_line) < 3:
-                return False
-            
-            current_macd = macd_line.iloc[-1]
-            current_signal = signal_line.iloc[-1]
-            
-            # NaN 체크
-            if pd.isna(current_macd) or pd.isna(current_signal):
-                return False
-            
-            # 1. MACD가 Signal 아래에 있어야 함
-            if current_macd >= current_signal:
-                return False
-            
-            # 2. 차이가 매우 작음 (근접 상태)
-            diff = abs(current_macd - current_signal)
-            signal_abs = abs(current_signal)
-            is_close = (diff / max(signal_abs, 0.01) <= threshold) or (diff <= 50)
-            
-            # 3. MACD 상승 추세 확인
-            macd_trend_up = False
-            if len(macd_line) >= 3:
-                macd_trend_up = (
-                    macd_line.iloc[-1] > macd_line.iloc[-2] and 
-                    macd_line.iloc[-2] >= macd_line.iloc[-3]
-                )
-            
-            # 4. 히스토그램 개선 추세
-            histogram_improving = False
-            if len(macd_line) >= 3:
-                hist_today = current_macd - current_signal
-                hist_yesterday = macd_line.iloc[-2] - signal_line.iloc[-2]
-                hist_2days_ago = macd_line.iloc[-3] - signal_line.iloc[-3]
-                
-                histogram_improving = (
-                    hist_today > hist_yesterday and 
-                    hist_yesterday > hist_2days_ago
-                )
-            
-            return is_close and (macd_trend_up or histogram_improving)
-            
+            panel = get_indicator_context(df)
+            return panel is not None and panel.latest('macd_near_golden_cross', fast=fast, slow=slow,
+                                                      signal=signal, threshold=threshold)
         except Exception as e:
             logger.error(f"❌ MACD 근접 계산 오류: {e}")
             return False
@@ -361,44 +187,8 @@ class TechnicalIndicators:
             bool: 5일선이 20일선 아래 있으면 True
         """
         try:
-            if df is None or df.empty or len(df) < 21:
-                return False
-            
-            # 컬럼명 통일 처리
-            price_col = None
-            if 'stck_clpr' in df.columns:
-                price_col = 'stck_clpr'
-            elif 'stck_prpr' in df.columns:
-                price_col = 'stck_prpr'
-            else:
-                return False
-                
-            df = df.copy()
-            
-            # 이동평균선 계산
-            df["ma5"] = df[price_col].rolling(window=5).mean()
-            df["ma20"] = df[price_col].rolling(window=20).mean()
-            
-            # 최신 데이터
-            current = df.iloc[-1]
-            
-            # NaN 값 체크
-            if pd.isna(current["ma5"]) or pd.isna(current["ma20"]):
-                return False
-            
-            # 5일선이 20일선 아래 있는지 확인
-            is_below = current["ma5"] < current["ma20"]
-            
-            # 추가 검증: 의미있는 차이가 있는지 (0.5% 이상)
-            if is_below:
-                distance_ratio = (current["ma20"] - current["ma5"]) / current["ma20"]
-                meaningful_gap = distance_ratio >= 0.005  # 0.5% 이상 차이
-                
-                logger.debug(f"5일선<20일선 검증: 차이 {distance_ratio:.2%}, 의미있는 차이: {meaningful_gap}")
-                return meaningful_gap
-            
-            return False
-            
+            panel = get_indicator_context(df)
+            return panel is not None and panel.latest('ma5_below_ma20')
         except Exception as e:
             logger.error(f"❌ 5일선 20일선 아래 위치 확인 오류: {e}")
             return False
@@ -407,31 +197,8 @@ class TechnicalIndicators:
     def is_golden_cross(df):
         """골든크로스 신호 감지 (5일선이 20일선을 상향 돌파)"""
         try:
-            if df is None or df.empty or len(df) < 21:
-                return False
-            
-            # 컬럼명 통일 처리
-            price_col = None
-            if 'stck_clpr' in df.columns:
-                price_col = 'stck_clpr'
-            elif 'stck_prpr' in df.columns:
-                price_col = 'stck_prpr'
-            else:
-                return False
-                
-            df = df.copy()
-            df["ma5"] = df[price_col].rolling(window=5).mean()
-            df["ma20"] = df[price_col].rolling(window=20).mean()
-            
-            if len(df) < 2:
-                return False
-                
-            today = df.iloc[-1]
-            yesterday = df.iloc[-2]
-            
-            return (not pd.isna(today["ma5"]) and not pd.isna(today["ma20"]) and
-                    not pd.isna(yesterday["ma5"]) and not pd.isna(yesterday["ma20"]) and
-                    yesterday["ma5"] < yesterday["ma20"] and today["ma5"] > today["ma20"])
+            panel = get_indicator_context(df)
+            return panel is not None and panel.latest('golden_cross')
         except Exception as e:
             logger.error(f"❌ 골든크로스 계산 오류: {e}")
             return False
@@ -442,54 +209,8 @@ class TechnicalIndicators:
         5일 이동평균선이 20일 이동평균선을 상향 돌파하는 시점 감지 (골든크로스)
         """
         try:
-            if df is None or df.empty or len(df) < 21:
-                return False
-            
-            # 컬럼명 통일 처리
-            price_col = None
-            if 'stck_clpr' in df.columns:
-                price_col = 'stck_clpr'
-            elif 'stck_prpr' in df.columns:
-                price_col = 'stck_prpr'
-            else:
-                return False
-                
-            df = df.copy()
-            
-            # 이동평균선 계산
-            df["ma5"] = df[price_col].rolling(window=5).mean()
-            df["ma20"] = df[price_col].rolling(window=20).mean()
-            
-            if len(df) < 2:
-                return False
-                
-            # 오늘과 어제 데이터
-            today = df.iloc[-1]
-            yesterday = df.iloc[-2]
-            
-            # NaN 값 체크
-            if (pd.isna(today["ma5"]) or pd.isna(today["ma20"]) or
-                pd.isna(yesterday["ma5"]) or pd.isna(yesterday["ma20"])):
-                return False
-            
-            # 골든크로스 조건
-            cross_condition = (yesterday["ma5"] <= yesterday["ma20"] and 
-                              today["ma5"] > today["ma20"])
-            
-            # 추가 확인: 5일선이 상승 추세인지
-            upward_trend = today["ma5"] > yesterday["ma5"]
-            
-            # 거래량 확인 (선택사항)
-            volume_col = 'acml_vol' if 'acml_vol' in df.columns else 'cntg_vol'
-            if volume_col in df.columns and len(df) >= 10:
-                avg_volume = df[volume_col].rolling(window=10).mean().iloc[-1]
-                current_volume = df[volume_col].iloc[-1]
-                volume_surge = current_volume > avg_volume * 1.2
-                
-                return cross_condition and upward_trend and volume_surge
-            else:
-                return cross_condition and upward_trend
-                
+            panel = get_indicator_context(df)
+            return panel is not None and panel.latest('ma5_crossing_above_ma20')
         except Exception as e:
             logger.error(f"❌ 5일선 20일선 상향돌파 계산 오류: {e}")
             return False
@@ -498,74 +219,18 @@ class TechnicalIndicators:
     def is_price_below_ma20(df, name):
         """현재 주가가 20일 이동평균선 아래에 있는지 확인"""
         try:
-            if df is None or df.empty or len(df) < 21:
-                return False
-            
-            # 컬럼명 통일 처리
-            price_col = None
-            if 'stck_clpr' in df.columns:
-                price_col = 'stck_clpr'
-            elif 'stck_prpr' in df.columns:
-                price_col = 'stck_prpr'
-            else:
-                return False
-                
-            df = df.copy()
-            
-            # 20일 이동평균선 계산
-            df["ma20"] = df[price_col].rolling(window=20).mean()
-            
-            # 최신 데이터
-            current = df.iloc[-1]
-            
-            # NaN 값 체크
-            if pd.isna(current["ma20"]):
-                return False
-            
-            current_price = current[price_col]
-            ma20_value = current["ma20"]
-            
-            # 현재가가 20일선 아래 있는지 확인
-            below_ma20 = current_price < ma20_value
-            
-            # 추가 조건: 20일선과의 거리 (1% 이상)
-            distance_ratio = (ma20_value - current_price) / ma20_value
-            meaningful_distance = distance_ratio >= 0.01
-            
-            logger.debug(f"{name}: {current_price}, {ma20_value}, {round(current_price/ma20_value*100,2)}% {distance_ratio}")
-            logger.debug(f"{below_ma20}: {meaningful_distance}")
-            return below_ma20 and meaningful_distance
-            
+            panel = get_indicator_context(df)
+            return panel is not None and panel.latest('price_below_ma20')
         except Exception as e:
             logger.error(f"❌ 20일선 아래 위치 확인 오류: {e}")
             return False
 
-    # 기존 다른 지표들 (변경 없음, 길이 제한으로 생략)
     @staticmethod
     def is_bollinger_rebound(df):
         """볼린저밴드 하한선 반등 신호"""
         try:
-            if df is None or df.empty or len(df) < 21:
-                return False
-            
-            price_col = 'stck_clpr' if 'stck_clpr' in df.columns else 'stck_prpr'
-            if price_col not in df.columns:
-                return False
-                
-            df = df.copy()
-            df["ma20"] = df[price_col].rolling(window=20).mean()
-            df["stddev"] = df[price_col].rolling(window=20).std()
-            df["lower_band"] = df["ma20"] - 2 * df["stddev"]
-
-            if len(df) < 2:
-                return False
-                
-            today = df.iloc[-1]
-            yesterday = df.iloc[-2]
-
-            return (not pd.isna(yesterday["lower_band"]) and not pd.isna(today["lower_band"]) and
-                    yesterday[price_col] < yesterday["lower_band"] and
-                    today[price_col] > today["lower_band"])
+            panel = get_indicator_context(df)
+            return panel is not None and panel.latest('bollinger_rebound')
         except Exception as e:
             logger.error(f"❌ 볼린저밴드 계산 오류: {e}")
             return False
@@ -574,21 +239,9 @@ class TechnicalIndicators:
     def is_volume_breakout(df, volume_period=20, volume_multiplier=2.0):
         """거래량 급증 신호"""
         try:
-            if df is None or df.empty or len(df) < volume_period + 1:
-                return False
-            
-            volume_col = 'acml_vol' if 'acml_vol' in df.columns else 'cntg_vol'
-            if volume_col not in df.columns:
-                return False
-            
-            avg_volume = df[volume_col].rolling(window=volume_period).mean()
-            today_volume = df[volume_col].iloc[-1]
-            avg_volume_today = avg_volume.iloc[-1]
-            
-            if pd.isna(avg_volume_today) or avg_volume_today == 0:
-                return False
-            
-            return today_volume > avg_volume_today * volume_multiplier
+            panel = get_indicator_context(df)
+            return panel is not None and panel.latest('volume_breakout', volume_period=volume_period,
+                                                      volume_multiplier=volume_multiplier)
         except Exception as e:
             logger.error(f"❌ 거래량 계산 오류: {e}")
             return False
@@ -693,10 +346,13 @@ def get_comprehensive_analysis(df, foreign_netbuy_list=None, name=""):
             'recommendation': 'HOLD'
         }
         
+        # 지표는 DataFrame당 한 번만 계산
+        ctx = get_indicator_context(df)
+        
         # 1. 절대조건 체크
-        analysis['price_below_ma20'] = TechnicalIndicators.is_price_below_ma20(df, name)
-        analysis['volume_sufficient'] = TechnicalIndicators.is_volume_sufficient(df, min_volume=1000)
-        analysis['above_bollinger_lower'] = TechnicalIndicators.is_price_above_bollinger_lower(df)
+        analysis['price_below_ma20'] = TechnicalIndicators.is_price_below_ma20(ctx, name)
+        analysis['volume_sufficient'] = TechnicalIndicators.is_volume_sufficient(ctx, min_volume=1000)
+        analysis['above_bollinger_lower'] = TechnicalIndicators.is_price_above_bollinger_lower(ctx)
         
         # 2. 외국인 연속 매수 체크
         if foreign_netbuy_list:
@@ -718,10 +374,10 @@ def get_comprehensive_analysis(df, foreign_netbuy_list=None, name=""):
         # 4. 기술적 신호들 (절대조건 통과시에만)
         if analysis['meets_absolute_conditions']:
             analysis['technical_signals'] = {
-                'golden_cross': TechnicalIndicators.is_golden_cross(df),
-                'bollinger_rebound': TechnicalIndicators.is_bollinger_rebound(df),
-                'volume_breakout': TechnicalIndicators.is_volume_breakout(df),
-                'ma5_crossing_above': TechnicalIndicators.is_ma5_crossing_above_ma20(df)
+                'golden_cross': TechnicalIndicators.is_golden_cross(ctx),
+                'bollinger_rebound': TechnicalIndicators.is_bollinger_rebound(ctx),
+                'volume_breakout': TechnicalIndicators.is_volume_breakout(ctx),
+                'ma5_crossing_above': TechnicalIndicators.is_ma5_crossing_above_ma20(ctx)
             }
             
             # 5. 매수 추천 여부
@@ -762,8 +418,11 @@ class SignalAnalyzer:
             if df is None or df.empty:
                 return 0, [], False, "데이터 없음"
             
+            # 지표 컨텍스트 (절대조건/상세 신호/get_individual_signals가 같은 계산 결과 공유)
+            ctx = get_indicator_context(df)
+            
             # 1. 절대조건 체크
-            absolute_check = get_comprehensive_analysis(df, foreign_netbuy_list, name)
+            absolute_check = get_comprehensive_analysis(ctx, foreign_netbuy_list, name)
             
             if not absolute_check['meets_absolute_conditions']:
                 reasons = []
@@ -785,14 +444,14 @@ class SignalAnalyzer:
             consecutive_days = foreign_check.get('consecutive_days', 0)
             
             signals = {
-                "골든크로스": TechnicalIndicators.is_golden_cross(df),
-                "볼린저밴드복귀": TechnicalIndicators.is_bollinger_rebound(df),
-                "거래량급증": TechnicalIndicators.is_volume_breakout(df),
-                "5일선20일선돌파": TechnicalIndicators.is_ma5_crossing_above_ma20(df),
-                "RSI매수신호": TechnicalIndicators.is_rsi_buy_signal(df),
-                "MACD골든크로스": TechnicalIndicators.is_macd_golden_cross(df),
-                "MACD돌파직전": TechnicalIndicators.is_macd_near_golden_cross(df),
-                "볼린저밴드내위치": TechnicalIndicators.is_price_above_bollinger_lower(df)
+                "골든크로스": TechnicalIndicators.is_golden_cross(ctx),
+                "볼린저밴드복귀": TechnicalIndicators.is_bollinger_rebound(ctx),
+                "거래량급증": TechnicalIndicators.is_volume_breakout(ctx),
+                "5일선20일선돌파": TechnicalIndicators.is_ma5_crossing_above_ma20(ctx),
+                "RSI매수신호": TechnicalIndicators.is_rsi_buy_signal(ctx),
+                "MACD골든크로스": TechnicalIndicators.is_macd_golden_cross(ctx),
+                "MACD돌파직전": TechnicalIndicators.is_macd_near_golden_cross(ctx),
+                "볼린저밴드내위치": TechnicalIndicators.is_price_above_bollinger_lower(ctx)
             }
             
             if consecutive_days >= 3:
@@ -807,18 +466,45 @@ class SignalAnalyzer:
             logger.error(f"❌ {name}: 매수 신호 점수 계산 오류: {e}")
             return 0, [], False, f"계산 오류: {e}"
     
+    def load_stored_indicators(self, df, code):
+        """
+        daily_indicators에 저장된 지표로 df의 지표 컨텍스트를 채움 (이동평균/볼린저/RSI 재계산 생략)
+        - 같은 df로 calculate_buy_signal_score / get_individual_signals를 호출하면 저장값 사용
+        - 저장 행이 없거나 df의 거래일·종가와 맞지 않으면 아무것도 하지 않음 (기존 계산 경로)
+
+        Returns:
+            bool: 저장된 지표 사용 여부
+        """
+        db_manager = getattr(self.data_fetcher, 'db_manager', None)
+        if db_manager is None or df is None or df.empty or 'stck_bsop_date' not in df.columns:
+            return False
+
+        try:
+            start_date = datetime.strptime(str(df['stck_bsop_date'].iloc[0]), '%Y%m%d').date()
+            end_date = datetime.strptime(str(df['stck_bsop_date'].iloc[-1]), '%Y%m%d').date()
+            stored = db_manager.get_daily_indicators(code, start_date, end_date)
+            if stored.empty:
+                return False
+
+            ctx = get_indicator_context(df)
+            return ctx is not None and ctx.seed_stored(stored)
+        except Exception as e:
+            logger.debug(f"⚠️ {code}: 저장된 지표 사용 불가, 직접 계산: {e}")
+            return False
+
     def get_individual_signals(self, df):
         """개별 기술적 신호들을 딕셔너리로 반환"""
         try:
+            ctx = get_indicator_context(df)
             signals = {
-                "골든크로스": self.ti.is_golden_cross(df),
-                "볼린저밴드복귀": self.ti.is_bollinger_rebound(df),
-                "거래량급증": self.ti.is_volume_breakout(df),
-                "5일선20일선돌파": self.ti.is_ma5_crossing_above_ma20(df),
-                "RSI매수신호": self.ti.is_rsi_buy_signal(df),
-                "MACD골든크로스": self.ti.is_macd_golden_cross(df),
-                "볼린저밴드내위치": self.ti.is_price_above_bollinger_lower(df),
-                "MACD돌파직전": self.ti.is_macd_near_golden_cross(df), 
+                "골든크로스": self.ti.is_golden_cross(ctx),
+                "볼린저밴드복귀": self.ti.is_bollinger_rebound(ctx),
+                "거래량급증": self.ti.is_volume_breakout(ctx),
+                "5일선20일선돌파": self.ti.is_ma5_crossing_above_ma20(ctx),
+                "RSI매수신호": self.ti.is_rsi_buy_signal(ctx),
+                "MACD골든크로스": self.ti.is_macd_golden_cross(ctx),
+                "볼린저밴드내위치": self.ti.is_price_above_bollinger_lower(ctx),
+                "MACD돌파직전": self.ti.is_macd_near_golden_cross(ctx), 
                 "기관매수추세": False,
             }
             
@@ -0,0 +1,232 @@
+"""
+증분 지표 상태(indicator_state) 비교 테스트
+
+목적:
+  - 각 상태 객체를 봉 단위로 갱신한 값이 pandas/TechnicalIndicators로 전체 계산한 값과 같은지 확인
+    (무작위 가격 구간을 잘라 처음부터 흘려보내는 슬라이딩 윈도우 방식, NaN 봉 포함)
+  - IndicatorBook.sync_frame의 확정/임시 반영/되돌림 경로 확인
+    (매 주기 마지막 봉은 진행 중인 값으로 바뀌어 들어오고, latest()는 진행 중인 봉 포함,
+     previous()는 확정 봉까지의 전체 계산 값과 같아야 함)
+
+실행:
+  python test_indicator_state.py               # 상태 200회, IndicatorBook 50회
+  python test_indicator_state.py --trials 1000 --book-trials 200 --seed 7
+  python -m pytest test_indicator_state.py
+"""
+import os
+import sys
+import argparse
+import math
+import random
+
+import pandas as pd
+
+from indicator_state import (
+    IndicatorBook, SMAState, RollingStdState, RollingMaxState, RollingMinState,
+    EMAState, MACDState, RSIState, StochasticState
+)
+
+# 기준 구현 (trading_system/strategy/technical_indicators.py)
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from trading_system.strategy.technical_indicators import TechnicalIndicators
+
+CLOSE, HIGH, LOW, VOLUME, TIME = 'stck_prpr', 'stck_hgpr', 'stck_lwpr', 'cntg_vol', 'stck_cntg_hour'
+MACD_PARAMS = (5, 12, 9)  # TechnicalIndicators.calculate_macd 기본값
+TOLERANCE = 1e-7
+
+
+def make_bars(rng: random.Random, length: int, nan_rate: float = 0.0) -> pd.DataFrame:
+    """무작위 분봉 (종가 랜덤워크, 가끔 횡보 구간과 NaN 봉)"""
+    rows = []
+    price = rng.uniform(1_000, 200_000)
+    for i in range(length):
+        if rng.random() < 0.1:
+            close = price  # 횡보 (상승/하락 0, 고가=저가 구간 유도)
+        else:
+            price = max(price * (1 + rng.gauss(0, 0.01)), 1.0)
+            close = price
+        high = close * (1 + abs(rng.gauss(0, 0.005)))
+        low = close * (1 - abs(rng.gauss(0, 0.005)))
+        if rng.random() < 0.05:
+            high = low = close
+        volume = float(rng.randint(0, 50_000))
+        if rng.random() < nan_rate:
+            close = high = low = volume = float('nan')
+        minute = 9 * 60 + i
+        rows.append({TIME: f'{minute // 60:02d}{minute % 60:02d}00',
+                     CLOSE: close, HIGH: high, LOW: low, VOLUME: volume})
+    return pd.DataFrame(rows)
+
+
+def wilder_rsi(closes, period: int = 14):
+    """Wilder RSI 기준값 (첫 period개 변화량 평균으로 시작하는 정의 그대로 계산)"""
+    result = [float('nan')] * len(closes)
+    avg_gain = avg_loss = None
+    gains, losses = [], []
+    for i in range(1, len(closes)):
+        delta = closes[i] - closes[i - 1]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        if avg_gain is None:
+            gains.append(gain)
+            losses.append(loss)
+            if len(gains) < period:
+                continue
+            avg_gain, avg_loss = sum(gains) / period, sum(losses) / period
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+        if avg_loss == 0:
+            result[i] = 100.0 if avg_gain > 0 else float('nan')
+        else:
+            result[i] = 100 - 100 / (1 + avg_gain / avg_loss)
+    return result
+
+
+def build_states():
+    """비교 대상 상태 묶음 (IndicatorBook factory 겸용)"""
+    fast, slow, signal = MACD_PARAMS
+    return {
+        'ma5': SMAState(5),
+        'ma20': SMAState(20),
+        'std20': RollingStdState(20),
+        'high10': RollingMaxState(10, 'high'),
+        'low10': RollingMinState(10, 'low'),
+        'ema12': EMAState(12),
+        'macd': MACDState(fast, slow, signal),
+        'rsi': RSIState(14, wilder=False),
+        'stoch': StochasticState(14, 3),
+        'volume_ma20': SMAState(20, source='volume')
+    }
+
+
+def reference(df: pd.DataFrame) -> pd.DataFrame:
+    """pandas/TechnicalIndicators 전체 계산 값 (컬럼명은 snapshot 키와 같음)"""
+    close = df[CLOSE].astype(float)
+    ref = pd.DataFrame(index=df.index)
+    ref['ma5'] = close.rolling(5).mean()
+    ref['ma20'] = close.rolling(20).mean()
+    ref['std20'] = close.rolling(20).std()
+    ref['high10'] = df[HIGH].rolling(10).max()
+    ref['low10'] = df[LOW].rolling(10).min()
+    ref['ema12'] = close.ewm(span=12).mean()
+    ref['volume_ma20'] = df[VOLUME].rolling(20).mean()
+
+    fast, slow, signal = MACD_PARAMS
+    macd = TechnicalIndicators.calculate_macd(df.copy(), CLOSE, fast, slow, signal)
+    for col in ('line', 'signal', 'histogram', 'cross'):
+        ref[f'macd_{col}'] = macd[f'macd_{col}'] if f'macd_{col}' in macd.columns else float('nan')
+
+    ref['rsi'] = TechnicalIndicators.calculate_rsi(df.copy(), CLOSE, 14)['rsi']
+    stoch = TechnicalIndicators.calculate_stochastic(df.copy(), HIGH, LOW, CLOSE, 14, 3)
+    ref['stoch_k'] = stoch['stoch_k']
+    ref['stoch_d'] = stoch['stoch_d']
+    return ref
+
+
+def same(actual, expected) -> bool:
+    """NaN/무한대까지 같은 값인지 (유한값은 상대 오차 허용)"""
+    actual, expected = float(actual), float(expected)
+    if math.isnan(expected) or math.isnan(actual):
+        return math.isnan(expected) and math.isnan(actual)
+    if math.isinf(expected) or math.isinf(actual):
+        return actual == expected
+    return math.isclose(actual, expected, rel_tol=TOLERANCE, abs_tol=TOLERANCE)
+
+
+def check_values(label: str, actual: dict, expected: pd.Series):
+    for name, value in expected.items():
+        assert name in actual, f'{label}: {name} 값 없음'
+        assert same(actual[name], value), f'{label}: {name} = {actual[name]!r}, 기준값 {value!r}'
+
+
+def bar_dict(row) -> dict:
+    return {'close': row[CLOSE], 'high': row[HIGH], 'low': row[LOW], 'volume': row[VOLUME]}
+
+
+def run_state_trials(trials: int = 200, seed: int = 0):
+    """상태 객체 슬라이딩 윈도우 비교 (무작위 구간을 처음부터 흘려서 매 봉 값 비교)"""
+    rng = random.Random(seed)
+    for trial in range(trials):
+        source = make_bars(rng, 400, nan_rate=0.02 if trial % 4 == 3 else 0.0)
+        length = rng.randint(MACD_PARAMS[1] + MACD_PARAMS[2], 250)
+        start = rng.randint(0, len(source) - length)
+        df = source.iloc[start:start + length].reset_index(drop=True)
+
+        ref = reference(df)
+        wilder = wilder_rsi(df[CLOSE].tolist()) if not df[CLOSE].isna().any() else None
+        states = build_states()
+        wilder_state = RSIState(14, wilder=True)
+        for i, row in enumerate(df.to_dict('records')):
+            bar = bar_dict(row)
+            values = {}
+            for name, state in states.items():
+                state.push(bar)
+                values.update(state.outputs(name))
+            check_values(f'trial {trial} 봉 {i}', values, ref.iloc[i])
+
+            wilder_state.push(bar)
+            if wilder is not None:
+                assert same(wilder_state.value, wilder[i]), \
+                    f'trial {trial} 봉 {i}: wilder rsi = {wilder_state.value!r}, 기준값 {wilder[i]!r}'
+
+
+def run_book_trials(trials: int = 50, seed: int = 0):
+    """IndicatorBook.sync_frame 비교 (주기마다 진행 중인 마지막 봉 값이 바뀌는 조회 결과를 흉내냄)"""
+    rng = random.Random(seed)
+    for trial in range(trials):
+        final = make_bars(rng, 120)
+        expected = reference(final)  # 확정 봉 기준값 (지표가 과거 봉만 보므로 뒤 봉과 무관)
+        book = IndicatorBook(build_states)
+        symbol = '005930'
+
+        # calculate_macd는 slow + signal개 미만이면 계산하지 않으므로 확정 봉이 그 이상일 때부터 비교
+        count = rng.randint(MACD_PARAMS[1] + MACD_PARAMS[2] + 1, 40)
+        committed = 0  # 지난 주기까지 확정된 봉 수
+        while count <= len(final):
+            # 진행 중인 마지막 봉: 완성 전 값 (다음 주기에 확정 값으로 다시 들어옴)
+            history = final.iloc[:count].copy()
+            forming = history.index[-1]
+            partial = history.at[forming, CLOSE] * (1 + rng.gauss(0, 0.005))
+            history.at[forming, CLOSE] = partial
+            history.at[forming, HIGH] = max(history.at[forming, HIGH], partial)
+            history.at[forming, LOW] = min(history.at[forming, LOW], partial)
+            history.at[forming, VOLUME] = float(rng.randint(0, 50_000))
+
+            # 조회 결과는 최근 일부 봉만 옴 (마지막 확정 봉과 겹쳐야 누락 구간으로 보지 않음)
+            first = max(0, min(count - rng.randint(2, 30), committed - 1))
+            frame = history.iloc[first:].reset_index(drop=True)
+
+            latest = book.sync_frame(symbol, frame)
+            label = f'trial {trial} 봉 {count - 1}'
+            check_values(f'{label} latest', latest, reference(history).iloc[-1])
+            assert latest == book.latest(symbol)
+            check_values(f'{label} previous', book.previous(symbol), expected.iloc[count - 2])
+            committed = count - 1
+
+            # 다음 주기: 같은 봉이 값만 바뀌어 다시 오거나(0) 봉이 1~3개 추가됨
+            count += rng.choice([0, 1, 1, 1, 2, 3])
+
+
+def test_states_match_reference():
+    run_state_trials(trials=200)
+
+
+def test_book_preview_and_rollback():
+    run_book_trials(trials=10)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='증분 지표 상태 비교 테스트')
+    parser.add_argument('--trials', type=int, default=200, help='상태 객체 비교 무작위 구간 수')
+    parser.add_argument('--book-trials', type=int, default=50, help='IndicatorBook 비교 횟수 (주기마다 전체 재계산이라 느림)')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+    args = parser.parse_args()
+
+    run_state_trials(args.trials, args.seed)
+    print(f"✅ 상태 객체 {args.trials}회 비교 통과")
+    run_book_trials(args.book_trials, args.seed)
+    print(f"✅ IndicatorBook.sync_frame {args.book_trials}회 비교 통과")
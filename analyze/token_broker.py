@@ -0,0 +1,286 @@
+"""
+액세스 토큰 브로커 모듈
+수집기/자동매매/모니터링 서버 등 여러 프로세스가 같은 토큰 파일(token.json, kiwoom_token_*.json)을
+공유하도록 메모리 캐시 + 파일 잠금 + 만료 전 백그라운드 갱신 제공
+
+동작:
+  - get_token(): 메모리 토큰이 유효하면 파일 I/O 없이 바로 반환 (API 호출마다 사용 가능)
+  - 만료 refresh_margin초 전부터 백그라운드 스레드가 재발급 (호출 스레드는 기존 토큰으로 계속 진행)
+  - 발급은 토큰 파일 옆 .lock 파일 잠금 안에서만 수행하고, 잠금 후 파일을 다시 읽어
+    다른 프로세스가 이미 갱신했으면 그 토큰을 사용 (프로세스끼리 중복 발급 경쟁 방지)
+  - 백그라운드 스레드가 watch_interval초마다 파일 변경 시각을 확인하여 다른 프로세스의 재발급을 반영
+    (키움은 신규 발급 시 이전 토큰이 즉시 무효화되므로 필요)
+  - 서버가 토큰을 거부하면 invalidate(token) 호출 → 다음 get_token에서 파일 재확인 후 필요하면 재발급
+
+토큰 파일 형식 (기존 프로그램과 호환):
+  {"access_token": ..., "access_token_token_expired": "YYYY-MM-DD HH:MM:SS", "requested_at": epoch초, ...}
+
+사용 예:
+  broker = get_token_broker("token.json", issuer=client.issue_token, name="KIS")
+  headers["authorization"] = f"Bearer {broker.get_token()}"
+"""
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows 등: 프로세스 내 잠금만 사용
+    fcntl = None
+
+
+EXPIRE_FORMAT = '%Y-%m-%d %H:%M:%S'
+REFRESH_MARGIN = 1800  # 만료 30분 전부터 백그라운드 재발급
+EXPIRY_GUARD = 60      # 만료 1분 전부터는 만료로 간주 (호출 스레드가 직접 재발급)
+WATCH_INTERVAL = 10    # 다른 프로세스의 재발급 확인 주기(초)
+
+
+def parse_expiry(token_data: Dict) -> float:
+    """토큰 파일/발급 응답에서 만료 시각(epoch초) 추출
+
+    지원 형식: access_token_token_expired(KIS/기존 파일), expires_dt(키움 응답),
+              requested_at + expires_in
+
+    Returns:
+        float: 만료 시각, 알 수 없으면 0
+    """
+    try:
+        expired = token_data.get('access_token_token_expired')
+        if expired:
+            return datetime.strptime(expired, EXPIRE_FORMAT).timestamp()
+
+        expires_dt = token_data.get('expires_dt')
+        if expires_dt:
+            return datetime.strptime(str(expires_dt), '%Y%m%d%H%M%S').timestamp()
+
+        if token_data.get('requested_at') and token_data.get('expires_in'):
+            return float(token_data['requested_at']) + float(token_data['expires_in'])
+    except (TypeError, ValueError):
+        pass
+    return 0.0
+
+
+def _token_of(token_data: Dict) -> Optional[str]:
+    return token_data.get('access_token') or token_data.get('token')
+
+
+class TokenBroker:
+    """토큰 파일 하나를 관리하는 브로커 (프로세스당 파일별 1개, get_token_broker로 생성)"""
+
+    def __init__(self, token_file: str, issuer: Callable[[], Dict], name: str = None,
+                 refresh_margin: float = REFRESH_MARGIN, watch_interval: float = WATCH_INTERVAL,
+                 validator: Callable[[str], bool] = None, logger=None):
+        """
+        Args:
+            token_file: 토큰 파일 경로
+            issuer: 신규 토큰 발급 함수 → {'access_token': ..., 'access_token_token_expired': ...} 반환
+                    (파일 저장은 브로커가 수행)
+            name: 로그 표시 이름
+            refresh_margin: 만료 몇 초 전부터 백그라운드 재발급할지
+            watch_interval: 토큰 파일 변경 확인 주기(초)
+            validator: 이 프로세스가 처음 보는 파일 토큰을 채택하기 전 서버 검증 함수 (선택)
+            logger: 로거 객체
+        """
+        self.token_file = os.path.abspath(token_file)
+        self.lock_file = self.token_file + '.lock'
+        self.issuer = issuer
+        self.name = name or os.path.basename(token_file)
+        self.refresh_margin = refresh_margin
+        self.watch_interval = watch_interval
+        self.validator = validator
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._token = None
+        self._expires_at = 0.0
+        self._mtime = None
+        self._seen = set()      # 이 프로세스에서 이미 채택/검증한 토큰
+        self._rejected = None   # 서버가 거부한 토큰 (파일에 남아 있어도 다시 채택하지 않음)
+
+        self._lock = threading.Lock()  # 프로세스 내 발급/파일 읽기 직렬화
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._closed = False
+
+    def get_token(self) -> str:
+        """유효한 액세스 토큰 반환 (메모리 토큰이 유효하면 I/O 없음)"""
+        token = self._token
+        if token and time.time() < self._expires_at - EXPIRY_GUARD:
+            return token
+        return self._refresh(EXPIRY_GUARD)
+
+    @property
+    def expires_at(self) -> Optional[datetime]:
+        """현재 토큰 만료 시각"""
+        return datetime.fromtimestamp(self._expires_at) if self._token else None
+
+    def invalidate(self, token: str = None):
+        """서버가 거부한 토큰 폐기 (다음 get_token에서 파일 재확인 후 필요하면 재발급)
+
+        Args:
+            token: 거부된 토큰 (None이면 현재 토큰, 이미 교체된 토큰이면 무시)
+        """
+        with self._lock:
+            if token is None or token == self._token:
+                self._rejected = self._token
+                self._token = None
+                self._expires_at = 0.0
+                self.logger.warning(f"⚠️ {self.name} 토큰 거부됨, 다음 호출 시 재확인")
+
+    def close(self):
+        """백그라운드 갱신 스레드 종료"""
+        self._closed = True
+        self._wakeup.set()
+
+    @contextmanager
+    def _file_lock(self):
+        """프로세스 간 발급 잠금 (.lock 파일, fcntl 없으면 생략)"""
+        if fcntl is None:
+            yield
+            return
+
+        with open(self.lock_file, 'a') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _read_file(self) -> Dict:
+        """토큰 파일 읽기 (없거나 깨졌으면 빈 dict)"""
+        try:
+            self._mtime = os.stat(self.token_file).st_mtime
+            with open(self.token_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            self._mtime = None
+        except Exception as e:
+            self.logger.warning(f"⚠️ {self.name} 토큰 파일 로드 실패: {e}")
+        return {}
+
+    def _write_file(self, token_data: Dict):
+        """토큰 파일 저장 (임시 파일 후 교체 - 다른 프로세스가 쓰다 만 파일을 읽지 않도록)"""
+        tmp_file = f"{self.token_file}.{os.getpid()}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(token_data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_file, self.token_file)
+        self._mtime = os.stat(self.token_file).st_mtime
+
+    def _adopt(self, token_data: Dict, min_remaining: float) -> bool:
+        """파일 토큰이 충분히 남았고 거부된 토큰이 아니면 메모리에 채택 (lock 보유 상태에서 호출)"""
+        token = _token_of(token_data)
+        expires_at = parse_expiry(token_data)
+        if not token or token == self._rejected or time.time() >= expires_at - min_remaining:
+            return False
+
+        if token not in self._seen and self.validator and not self.validator(token):
+            self.logger.warning(f"⚠️ {self.name} 파일 토큰 서버 검증 실패 (다른 프로세스가 재발급한 것으로 추정)")
+            self._rejected = token
+            return False
+
+        self._seen.add(token)
+        self._token = token
+        self._expires_at = expires_at
+        return True
+
+    def _refresh(self, min_remaining: float) -> str:
+        """만료까지 min_remaining초 이상 남은 토큰 확보 (파일 재확인 → 없으면 발급)"""
+        with self._lock:
+            if self._token and time.time() < self._expires_at - min_remaining:
+                return self._token  # 다른 스레드가 먼저 갱신
+
+            with self._file_lock():
+                if not self._adopt(self._read_file(), min_remaining):
+                    self._issue()
+
+            self._start_refresher()
+            return self._token
+
+    def _issue(self):
+        """신규 토큰 발급 후 파일 저장 (lock + 파일 잠금 보유 상태에서 호출)"""
+        self.logger.info(f"🔄 {self.name} 토큰 신규 발급 중...")
+        token_data = dict(self.issuer())
+        token_data.setdefault('requested_at', int(time.time()))
+
+        token = _token_of(token_data)
+        expires_at = parse_expiry(token_data)
+        if not token:
+            raise Exception(f"{self.name} 토큰 발급 응답에 토큰 없음")
+        if not expires_at:
+            expires_at = token_data['requested_at'] + 86400
+            token_data['access_token_token_expired'] = datetime.fromtimestamp(expires_at).strftime(EXPIRE_FORMAT)
+
+        try:
+            self._write_file(token_data)
+        except Exception as e:
+            self.logger.error(f"❌ {self.name} 토큰 저장 실패: {e}")
+
+        self._seen.add(token)
+        self._token = token
+        self._expires_at = expires_at
+        self.logger.info(f"✅ {self.name} 토큰 발급 완료 "
+                         f"(만료: {datetime.fromtimestamp(expires_at).strftime(EXPIRE_FORMAT)})")
+
+    def _check_file(self):
+        """다른 프로세스가 토큰 파일을 갱신했으면 반영"""
+        try:
+            mtime = os.stat(self.token_file).st_mtime
+        except OSError:
+            return
+        if mtime == self._mtime:
+            return
+
+        with self._lock:
+            previous = self._token
+            if self._adopt(self._read_file(), EXPIRY_GUARD) and self._token != previous:
+                self.logger.info(f"🔁 {self.name} 다른 프로세스가 갱신한 토큰 반영")
+
+    def _start_refresher(self):
+        """백그라운드 갱신 스레드 시작 (최초 1회)"""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name=f"token-{self.name}", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        """만료 전 재발급 + 파일 변경 감시 루프"""
+        while not self._closed:
+            until_refresh = self._expires_at - self.refresh_margin - time.time()
+            self._wakeup.wait(max(1.0, min(self.watch_interval, until_refresh)))
+            if self._closed:
+                break
+
+            try:
+                self._check_file()
+                if self._token and time.time() >= self._expires_at - self.refresh_margin:
+                    self._refresh(self.refresh_margin)
+            except Exception as e:
+                # 재발급 실패해도 기존 토큰은 만료 전까지 계속 사용, 다음 주기에 재시도
+                self.logger.warning(f"⚠️ {self.name} 토큰 사전 갱신 실패: {e}")
+                self._wakeup.wait(self.watch_interval)
+
+
+_brokers: Dict[str, TokenBroker] = {}
+_brokers_lock = threading.Lock()
+
+
+def get_token_broker(token_file: str, issuer: Callable[[], Dict], **kwargs) -> TokenBroker:
+    """토큰 파일별 프로세스 공유 브로커 반환 (처음 호출 시 생성, 이후 같은 파일은 같은 브로커)
+
+    Args:
+        token_file: 토큰 파일 경로
+        issuer: 신규 토큰 발급 함수 (TokenBroker 참고)
+        **kwargs: TokenBroker 생성 옵션 (name, refresh_margin, watch_interval, validator, logger)
+    """
+    path = os.path.abspath(token_file)
+    broker = _brokers.get(path)
+    if broker is None:
+        with _brokers_lock:
+            broker = _brokers.get(path)
+            if broker is None:
+                broker = TokenBroker(path, issuer, **kwargs)
+                _brokers[path] = broker
+    return broker
@@ -1,6 +1,4 @@
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 import json
 import pandas as pd
 import numpy as np
@@ -13,6 +11,16 @@ import os
 from pathlib import Path
 import sys
 
+# analyze 디렉토리의 공유 HTTP 클라이언트/속도 제한기 사용
+analyze_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'analyze')
+if analyze_dir not in sys.path:
+    sys.path.append(analyze_dir)
+
+from http_client import get_http_client
+from rate_limiter import TokenBucket
+from token_broker import get_token_broker
+from indicator_state import IndicatorBook, RSIState, RollingStdState, SMAState
+
 
 class PositionManager:
     """종목별 포지션 관리 클래스"""
@@ -114,7 +122,6 @@ class KISAutoTrader:
         self.positions = {}
         self.daily_pnl = 0
         self.trade_count = 0
-        self.last_token_time = None
         self.strategy_map = {}  # 종목별 전략 매핑
         
         self.skip_stock_name_api = False
@@ -127,6 +134,9 @@ class KISAutoTrader:
         self.macd_cross_lookback = 3
         self.macd_trend_confirmation = 5
 
+        # 종목별 분봉 지표 상태 (신호 계산 시 새 분봉만 반영, 전체 rolling 재계산 없음)
+        self.minute_indicators = IndicatorBook(self.create_minute_indicators)
+
         # 종목명 캐시 초기화
         self.stock_names = {}
         self.stock_names_file = "stock_names.json"
@@ -173,12 +183,13 @@ class KISAutoTrader:
         self.api_retry_count = 3  # 재시도 횟수 증가
         self.api_retry_delay = 2  # 재시도 간격 증가
         
-        # 요청 세션 설정 (연결 재사용)
-        self.session = self.create_robust_session()
+        # 요청 세션 설정 (프로세스 공유 클라이언트 - 연결 재사용, TR ID별 속도 제한, 응답 시간 집계)
+        self.http = get_http_client()
+        self.session = self.http.session
         
-        # API 호출 간격 제어
-        self.last_api_call = None
+        # safe_api_request 호출 간격 제어 (공유 클라이언트 전역 한도와 함께 적용)
         self.min_api_interval = 0.5  # 최소 0.5초 간격
+        self.api_limiter = TokenBucket(1 / self.min_api_interval)
         
         # 타임아웃 발생 시 대체 로직 활성화
         self.fallback_mode = False
@@ -644,68 +655,29 @@ class KISAutoTrader:
         self.send_discord_notification(title, message, 0xff0000)
 
     def load_saved_token(self):
-        """저장된 토큰 파일에서 토큰 로드 (기존 프로그램과 호환)"""
+        """시작 시 토큰 준비 (저장된 토큰이 유효하면 재사용, 없으면 발급 - 토큰 브로커 경유)"""
         try:
-            if os.path.exists(self.token_file):
-                with open(self.token_file, 'r', encoding='utf-8') as f:
-                    token_data = json.load(f)
-
-                # 기존 형식의 만료시간 파싱
-                expire_time_str = token_data.get('access_token_token_expired', '')
-                if expire_time_str:
-                    expire_time = datetime.strptime(expire_time_str, '%Y-%m-%d %H:%M:%S')
-
-                    # 토큰이 아직 유효한지 확인 (10분 여유 둠)
-                    if datetime.now() < expire_time - timedelta(minutes=10):
-                        self.access_token = token_data.get('access_token')
-                        self.last_token_time = datetime.fromtimestamp(token_data.get('requested_at', 0))
-                        self.logger.info(f"기존 토큰을 재사용합니다. (만료: {expire_time_str})")
-                        return True
-                    else:
-                        self.logger.info(f"저장된 토큰이 만료되었습니다. (만료: {expire_time_str})")
-
-        except Exception as e:
-            self.logger.warning(f"토큰 파일 로드 실패: {e}")
-
-        return False
-
-    def save_token(self, token_response: dict):
-        """토큰을 기존 프로그램과 호환되는 형식으로 저장"""
-        try:
-            current_time = int(time.time())
-            expires_in = token_response.get('expires_in', 86400)
-            expire_datetime = datetime.fromtimestamp(current_time + expires_in)
-
-            token_data = {
-                'access_token': token_response.get('access_token'),
-                'access_token_token_expired': expire_datetime.strftime('%Y-%m-%d %H:%M:%S'),
-                'token_type': token_response.get('token_type', 'Bearer'),
-                'expires_in': expires_in,
-                'requested_at': current_time
-            }
-
-            with open(self.token_file, 'w', encoding='utf-8') as f:
-                json.dump(token_data, f, ensure_ascii=False, indent=2)
-
-            self.logger.info(f"토큰이 저장되었습니다. (만료: {token_data['access_token_token_expired']})")
-
+            self.get_access_token()
+            expires_at = self.token_broker.expires_at
+            if expires_at:
+                self.logger.info(f"토큰 준비 완료 (만료: {expires_at:%Y-%m-%d %H:%M:%S})")
+            return True
         except Exception as e:
-            self.logger.error(f"토큰 저장 실패: {e}")
+            self.logger.warning(f"토큰 준비 실패: {e}")
+            return False
 
+    @property
+    def token_broker(self):
+        """token.json 공유 브로커 (메모리 캐시, 프로세스 간 파일 잠금, 만료 전 백그라운드 갱신)"""
+        return get_token_broker(self.token_file, self.issue_token, name="KIS", logger=self.logger)
 
     def get_access_token(self) -> str:
-        """KIS API 액세스 토큰 발급 또는 재사용 (기존 프로그램과 호환)"""
-        # 메모리에 유효한 토큰이 있는지 확인
-        if self.access_token and self.last_token_time:
-            # 23시간 이내면 메모리 토큰 재사용
-            if datetime.now() - self.last_token_time < timedelta(hours=23):
-                return self.access_token
-    
-        # 저장된 토큰 재확인
-        if self.load_saved_token():
-            return self.access_token
-    
-        # 새 토큰 발급
+        """KIS API 액세스 토큰 반환 (메모리 캐시 우선, 파일 I/O·재발급은 브로커가 처리)"""
+        self.access_token = self.token_broker.get_token()
+        return self.access_token
+
+    def issue_token(self) -> Dict:
+        """KIS API 신규 토큰 발급 (기존 프로그램과 호환되는 형식으로 반환, 파일 저장은 브로커가 수행)"""
         self.logger.info("새로운 액세스 토큰을 발급받습니다...")
     
         url = f"{self.base_url}/oauth2/tokenP"
@@ -717,7 +689,7 @@ class KISAutoTrader:
         }
     
         try:
-            response = requests.post(url, headers=headers, data=json.dumps(data))
+            response = self.http.post(url, headers=headers, data=json.dumps(data), throttle=False)
             response.raise_for_status()
     
             token_response = response.json()
@@ -729,15 +701,18 @@ class KISAutoTrader:
             access_token = token_response.get("access_token")
             
             if access_token:
-                # 토큰이 있으면 성공
-                self.access_token = access_token
-                self.last_token_time = datetime.now()
-    
-                # 토큰을 기존 형식으로 파일에 저장
-                self.save_token(token_response)
-    
-                self.logger.info("✅ 새로운 액세스 토큰 발급 완료")
-                return self.access_token
+                # 토큰이 있으면 성공 - 기존 형식으로 변환
+                current_time = int(time.time())
+                expires_in = token_response.get('expires_in', 86400)
+                expire_datetime = datetime.fromtimestamp(current_time + expires_in)
+
+                return {
+                    'access_token': access_token,
+                    'access_token_token_expired': expire_datetime.strftime('%Y-%m-%d %H:%M:%S'),
+                    'token_type': token_response.get('token_type', 'Bearer'),
+                    'expires_in': expires_in,
+                    'requested_at': current_time
+                }
             
             else:
                 # 토큰이 없으면 실패 - rt_cd 기반 오류 처리
@@ -785,7 +760,7 @@ class KISAutoTrader:
         params = {"fid_cond_mrkt_div_code": "J", "fid_input_iscd": symbol}
 
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self.http.get(url, headers=headers, params=params)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -813,7 +788,7 @@ class KISAutoTrader:
         }
 
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self.http.get(url, headers=headers, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -830,22 +805,39 @@ class KISAutoTrader:
 
         return pd.DataFrame()
 
-    def calculate_momentum_signals(self, df: pd.DataFrame) -> Dict:
-        """모멘텀 신호 계산"""
+    def create_minute_indicators(self) -> Dict:
+        """종목 하나의 분봉 지표 상태 묶음 (모멘텀/평균회귀 신호용)"""
+        return {
+            'ma_short': SMAState(self.ma_short),
+            'ma_long': SMAState(self.ma_long),
+            'volume_ma20': SMAState(20, source='volume'),
+            'bb_middle': SMAState(20),
+            'bb_std': RollingStdState(20),
+            'rsi': RSIState(14, wilder=False)
+        }
+
+    def calculate_momentum_signals(self, df: pd.DataFrame, symbol: str = None) -> Dict:
+        """모멘텀 신호 계산 (symbol을 주면 종목별 지표 상태 사용, 없으면 DataFrame 전체 계산)"""
         if len(df) < max(self.ma_long, self.momentum_period):
             return {'signal': 'HOLD', 'strength': 0}
 
-        # 이동평균선
-        df['ma_short'] = df['stck_prpr'].rolling(self.ma_short).mean()
-        df['ma_long'] = df['stck_prpr'].rolling(self.ma_long).mean()
-
         # 모멘텀 계산
         current_price = df['stck_prpr'].iloc[-1]
         past_price = df['stck_prpr'].iloc[-(self.momentum_period+1)]
         momentum = (current_price - past_price) / past_price
 
+        if symbol and 'stck_cntg_hour' in df.columns:
+            # 이동평균선/평균 거래량: 새 분봉만 반영한 상태값 (평균 거래량은 직전 봉 기준)
+            latest = self.minute_indicators.sync_frame(symbol, df)
+            avg_volume = self.minute_indicators.previous(symbol).get('volume_ma20', np.nan)
+        else:
+            # 이동평균선
+            df['ma_short'] = df['stck_prpr'].rolling(self.ma_short).mean()
+            df['ma_long'] = df['stck_prpr'].rolling(self.ma_long).mean()
+            avg_volume = df['cntg_vol'].rolling(20).mean().iloc[-2]
+            latest = df.iloc[-1]
+
         # 거래량 증가율
-        avg_volume = df['cntg_vol'].rolling(20).mean().iloc[-2]
         current_volume = df['cntg_vol'].iloc[-1]
         volume_ratio = current_volume / avg_volume if avg_volume > 0 else 1
 
@@ -853,7 +845,6 @@ class KISAutoTrader:
         signal = 'HOLD'
         strength = 0
 
-        latest = df.iloc[-1]
         if (latest['ma_short'] > latest['ma_long'] and
             momentum > self.momentum_threshold and
             volume_ratio > self.volume_threshold):
@@ -876,26 +867,36 @@ class KISAutoTrader:
         }
 
 
-    def calculate_mean_reversion_signals(self, df: pd.DataFrame) -> Dict:
-        """평균회귀 전략 신호 계산"""
+    def calculate_mean_reversion_signals(self, df: pd.DataFrame, symbol: str = None) -> Dict:
+        """평균회귀 전략 신호 계산 (symbol을 주면 종목별 지표 상태 사용, 없으면 DataFrame 전체 계산)"""
         if len(df) < 20:
             return {'signal': 'HOLD', 'strength': 0, 'current_price': 0}
         
-        # 볼린저 밴드
-        df['bb_middle'] = df['stck_prpr'].rolling(20).mean()
-        bb_std = df['stck_prpr'].rolling(20).std()
-        df['bb_upper'] = df['bb_middle'] + (bb_std * 2)
-        df['bb_lower'] = df['bb_middle'] - (bb_std * 2)
-        
-        # RSI (간단 버전)
-        delta = df['stck_prpr'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(14).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
-        rs = gain / loss
-        df['rsi'] = 100 - (100 / (1 + rs))
+        if symbol and 'stck_cntg_hour' in df.columns:
+            # 볼린저 밴드/RSI: 새 분봉만 반영한 상태값
+            values = self.minute_indicators.sync_frame(symbol, df)
+            latest = {
+                'bb_middle': values['bb_middle'],
+                'bb_upper': values['bb_middle'] + (values['bb_std'] * 2),
+                'bb_lower': values['bb_middle'] - (values['bb_std'] * 2),
+                'rsi': values['rsi']
+            }
+        else:
+            # 볼린저 밴드
+            df['bb_middle'] = df['stck_prpr'].rolling(20).mean()
+            bb_std = df['stck_prpr'].rolling(20).std()
+            df['bb_upper'] = df['bb_middle'] + (bb_std * 2)
+            df['bb_lower'] = df['bb_middle'] - (bb_std * 2)
+            
+            # RSI (간단 버전)
+            delta = df['stck_prpr'].diff()
+            gain = (delta.where(delta > 0, 0)).rolling(14).mean()
+            loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
+            rs = gain / loss
+            df['rsi'] = 100 - (100 / (1 + rs))
+            latest = df.iloc[-1]
         
         current_price = df['stck_prpr'].iloc[-1]
-        latest = df.iloc[-1]
         
         signal = 'HOLD'
         strength = 0
@@ -1018,7 +1019,7 @@ class KISAutoTrader:
         }
 
 
-    def calculate_combined_signals(self, df: pd.DataFrame, strategy: str) -> Dict:
+    def calculate_combined_signals(self, df: pd.DataFrame, strategy: str, symbol: str = None) -> Dict:
         """복합 전략 신호 계산 (예: momentum + breakout)"""
         strategies = strategy.split(' + ')
         all_signals = []
@@ -1026,9 +1027,9 @@ class KISAutoTrader:
         for strat in strategies:
             strat = strat.strip()
             if strat == 'momentum':
-                signals = self.calculate_momentum_signals(df)
+                signals = self.calculate_momentum_signals(df, symbol=symbol)
             elif strat == 'mean_reversion':
-                signals = self.calculate_mean_reversion_signals(df)
+                signals = self.calculate_mean_reversion_signals(df, symbol=symbol)
             elif strat == 'breakout':
                 signals = self.calculate_breakout_signals(df)
             elif strat == 'scalping':
@@ -1108,7 +1109,7 @@ class KISAutoTrader:
         self.logger.debug(f"주문 데이터: {data}")
     
         try:
-            response = requests.post(url, headers=headers, data=json.dumps(data))
+            response = self.http.post(url, headers=headers, data=json.dumps(data))
             response.raise_for_status()
             result = response.json()
     
@@ -1210,7 +1211,7 @@ class KISAutoTrader:
         }
     
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self.http.get(url, headers=headers, params=params)
             response.raise_for_status()
             
             data = response.json()
@@ -1290,7 +1291,7 @@ class KISAutoTrader:
         }
         
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self.http.get(url, headers=headers, params=params)
             data = response.json()
             
             if data.get('rt_cd') == '0':
@@ -1346,7 +1347,7 @@ class KISAutoTrader:
         }
         
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self.http.get(url, headers=headers, params=params)
             data = response.json()
             
             if data.get('rt_cd') == '0':
@@ -1467,17 +1468,17 @@ class KISAutoTrader:
     
             # 전략에 따라 다른 신호 계산 함수 호출
             if optimal_strategy == 'momentum':
-                signals = self.calculate_momentum_signals(df)
+                signals = self.calculate_momentum_signals(df, symbol=symbol)
             elif optimal_strategy == 'mean_reversion':
-                signals = self.calculate_mean_reversion_signals(df)
+                signals = self.calculate_mean_reversion_signals(df, symbol=symbol)
             elif optimal_strategy == 'breakout':
                 signals = self.calculate_breakout_signals(df)
             elif optimal_strategy == 'scalping':
                 signals = self.calculate_scalping_signals(df)
             elif ' + ' in optimal_strategy:
-                signals = self.calculate_combined_signals(df, optimal_strategy)
+                signals = self.calculate_combined_signals(df, optimal_strategy, symbol=symbol)
             else:
-                signals = self.calculate_momentum_signals(df)
+                signals = self.calculate_momentum_signals(df, symbol=symbol)
     
             current_price = signals['current_price']
     
@@ -1620,17 +1621,17 @@ class KISAutoTrader:
             self.logger.debug(f"📋 {symbol} - 사용 전략: {optimal_strategy}")
             
             if optimal_strategy == 'momentum':
-                signals = self.calculate_momentum_signals(df)
+                signals = self.calculate_momentum_signals(df, symbol=symbol)
             elif optimal_strategy == 'mean_reversion':
-                signals = self.calculate_mean_reversion_signals(df)
+                signals = self.calculate_mean_reversion_signals(df, symbol=symbol)
             elif optimal_strategy == 'breakout':
                 signals = self.calculate_breakout_signals(df)
             elif optimal_strategy == 'scalping':
                 signals = self.calculate_scalping_signals(df)
             elif ' + ' in optimal_strategy:
-                signals = self.calculate_combined_signals(df, optimal_strategy)
+                signals = self.calculate_combined_signals(df, optimal_strategy, symbol=symbol)
             else:
-                signals = self.calculate_momentum_signals(df)
+                signals = self.calculate_momentum_signals(df, symbol=symbol)
     
             current_price = signals['current_price']
             signal = signals['signal']
@@ -1850,11 +1851,11 @@ class KISAutoTrader:
             optimal_strategy = self.strategy_map.get(symbol, 'momentum')
             
             if optimal_strategy == 'momentum':
-                signals = self.calculate_momentum_signals(df)
+                signals = self.calculate_momentum_signals(df, symbol=symbol)
             elif optimal_strategy == 'scalping':
                 signals = self.calculate_scalping_signals(df)
             else:
-                signals = self.calculate_momentum_signals(df)
+                signals = self.calculate_momentum_signals(df, symbol=symbol)
             
             self.logger.info(f"4️⃣ 현재 신호:")
             self.logger.info(f"   신호: {signals['signal']}")
@@ -2338,7 +2339,7 @@ class KISAutoTrader:
             params = {"fid_cond_mrkt_div_code": "J", "fid_input_iscd": symbol}
             
             # 짧은 타임아웃 (5초)
-            response = requests.get(url, headers=headers, params=params, timeout=5)
+            response = self.http.get(url, headers=headers, params=params, timeout=5)
             
             if response.status_code == 200:
                 data = response.json()
@@ -2579,7 +2580,7 @@ class KISAutoTrader:
         }
         
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self.http.get(url, headers=headers, params=params, timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 if data.get('rt_cd') == '0' and data.get('output1'):
@@ -2680,7 +2681,7 @@ class KISAutoTrader:
         }
         
         try:
-            response = requests.post(url, headers=headers, data=json.dumps(data))
+            response = self.http.post(url, headers=headers, data=json.dumps(data))
             result = response.json()
             
             if result.get('rt_cd') == '0':
@@ -2877,7 +2878,7 @@ class KISAutoTrader:
         }
         
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self.http.get(url, headers=headers, params=params, timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 if data.get('rt_cd') == '0' and data.get('output1'):
@@ -3030,7 +3031,7 @@ class KISAutoTrader:
             self.logger.info(f"📊 호가단위 적용 지정가 주문: {symbol} {side} {quantity}주 @ {limit_price:,}원")
             self.logger.debug(f"주문 데이터: {data}")
             
-            response = requests.post(url, headers=headers, data=json.dumps(data))
+            response = self.http.post(url, headers=headers, data=json.dumps(data))
             response.raise_for_status()
             result = response.json()
             
@@ -3329,7 +3330,7 @@ class KISAutoTrader:
             
             self.logger.debug(f"잔고 조회 파라미터: {params}")
             
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = self.http.get(url, headers=headers, params=params, timeout=30)
             
             if response.status_code == 200:
                 data = response.json()
@@ -3426,7 +3427,7 @@ class KISAutoTrader:
             
             self.logger.debug(f"잔고 조회 파라미터: {params}")
             
-            response = requests.get(url, headers=headers, params=params, timeout=15)
+            response = self.http.get(url, headers=headers, params=params, timeout=15)
             
             self.logger.debug(f"잔고 조회 응답 코드: {response.status_code}")
             
@@ -3867,15 +3868,15 @@ class KISAutoTrader:
         if strategy == 'momentum':
             return self.calculate_enhanced_momentum_signals(df)
         elif strategy == 'mean_reversion':
-            return self.calculate_mean_reversion_signals(df)
+            return self.calculate_mean_reversion_signals(df, symbol=symbol)
         elif strategy == 'breakout':
             return self.calculate_breakout_signals(df)
         elif strategy == 'scalping':
             return self.calculate_scalping_signals(df)
         elif ' + ' in strategy:
-            return self.calculate_combined_signals(df, strategy)
+            return self.calculate_combined_signals(df, strategy, symbol=symbol)
         else:
-            return self.calculate_momentum_signals(df)
+            return self.calculate_momentum_signals(df, symbol=symbol)
     
     def run_debug_improved(self, interval_minutes: int = 1):
         """개선된 디버그 모드"""
@@ -4019,7 +4020,7 @@ class KISAutoTrader:
             }
             params = {"fid_cond_mrkt_div_code": "J", "fid_input_iscd": symbol}
     
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = self.http.get(url, headers=headers, params=params, timeout=30)
             
             if response.status_code == 200:
                 data = response.json()
@@ -4207,7 +4208,7 @@ class KISAutoTrader:
             
             self.logger.info(f"📊 안전 지정가 주문: {symbol} {side} {quantity}주 @ {limit_price:,}원")
             
-            response = requests.post(url, headers=headers, data=json.dumps(data))
+            response = self.http.post(url, headers=headers, data=json.dumps(data))
             response.raise_for_status()
             result = response.json()
             
@@ -4528,37 +4529,8 @@ class KISAutoTrader:
             print(f"  {test_time.strftime('%H:%M')}: {status}")
 
 
-    def create_robust_session(self):
-        """견고한 HTTP 세션 생성"""
-        session = requests.Session()
-        
-        # 재시도 전략 설정
-        retry_strategy = Retry(
-            total=3,  # 총 재시도 횟수
-            backoff_factor=1,  # 재시도 간격 (1초씩 증가)
-            status_forcelist=[429, 500, 502, 503, 504],  # 재시도할 HTTP 상태 코드
-            allowed_methods=["HEAD", "GET", "POST"]
-        )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        
-        return session
-    
-    def rate_limit_api_call(self):
-        """API 호출 속도 제한"""
-        if self.last_api_call:
-            elapsed = time.time() - self.last_api_call
-            if elapsed < self.min_api_interval:
-                time.sleep(self.min_api_interval - elapsed)
-        
-        self.last_api_call = time.time()
-    
     def safe_api_request(self, method, url, **kwargs):
-        """안전한 API 요청 - 타임아웃 및 재시도 처리"""
-        self.rate_limit_api_call()
-        
+        """안전한 API 요청 - 타임아웃 및 재시도 처리 (재시도 포함 매 호출 속도 제한)"""
         # 기본 타임아웃 설정
         kwargs.setdefault('timeout', self.api_timeout)
         
@@ -4569,12 +4541,7 @@ class KISAutoTrader:
                     self.logger.info(f"API 재시도 {attempt}/{self.api_retry_count} (대기: {delay}초)")
                     time.sleep(delay)
                 
-                if method.upper() == 'GET':
-                    response = self.session.get(url, **kwargs)
-                elif method.upper() == 'POST':
-                    response = self.session.post(url, **kwargs)
-                else:
-                    response = self.session.request(method, url, **kwargs)
+                response = self.http.request(method.upper(), url, limiter=self.api_limiter, **kwargs)
                 
                 response.raise_for_status()
                 return response
@@ -4816,7 +4783,7 @@ class KISAutoTrader:
             params = {"fid_cond_mrkt_div_code": "J", "fid_input_iscd": symbol}
             
             # 짧은 타임아웃 (5초)
-            response = self.session.get(url, headers=headers, params=params, timeout=5)
+            response = self.http.get(url, headers=headers, params=params, timeout=5)
             
             if response.status_code == 200:
                 data = response.json()
@@ -5136,18 +5103,13 @@ class KISAutoTrader:
             # Histogram = MACD Line - Signal Line
             df['macd_histogram'] = df['macd_line'] - df['macd_signal']
             
-            # 골든크로스/데드크로스 감지
-            df['macd_cross'] = 0
-            for i in range(1, len(df)):
-                # 골든크로스: MACD Line이 Signal Line을 위로 돌파
-                if (df['macd_line'].iloc[i] > df['macd_signal'].iloc[i] and 
-                    df['macd_line'].iloc[i-1] <= df['macd_signal'].iloc[i-1]):
-                    df.loc[df.index[i], 'macd_cross'] = 1  # 골든크로스
-                
-                # 데드크로스: MACD Line이 Signal Line을 아래로 돌파
-                elif (df['macd_line'].iloc[i] < df['macd_signal'].iloc[i] and 
-                      df['macd_line'].iloc[i-1] >= df['macd_signal'].iloc[i-1]):
-                    df.loc[df.index[i], 'macd_cross'] = -1  # 데드크로스
+            # 골든크로스/데드크로스 감지 (봉별 반복 대신 직전 봉과 벡터 비교)
+            line, signal_line = df['macd_line'], df['macd_signal']
+            prev_line, prev_signal = line.shift(1), signal_line.shift(1)
+            # 골든크로스: MACD Line이 Signal Line을 위로 돌파 / 데드크로스: 아래로 돌파
+            golden = (line > signal_line) & (prev_line <= prev_signal)
+            dead = (line < signal_line) & (prev_line >= prev_signal)
+            df['macd_cross'] = np.where(golden, 1, np.where(dead, -1, 0))
             
             self.logger.debug(f"MACD 계산 완료: {len(df)}개 봉")
             
@@ -5484,7 +5446,7 @@ class KISAutoTrader:
                 }
         
         elif strategy == 'mean_reversion':
-            return self.calculate_mean_reversion_signals(df)
+            return self.calculate_mean_reversion_signals(df, symbol=symbol)
         elif strategy == 'breakout':
             return self.calculate_breakout_signals(df)
         elif strategy == 'scalping':
@@ -5854,7 +5816,7 @@ class KISAutoTrader:
     
         try:
             self.logger.info(f"📅 {symbol} 일봉 데이터 조회: {days}일간")
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = self.http.get(url, headers=headers, params=params, timeout=30)
             response.raise_for_status()
             data = response.json()
     
@@ -5930,7 +5892,7 @@ class KISAutoTrader:
                 "fid_org_adj_prc": "0"
             }
     
-            response = requests.get(url, headers=headers, params=params, timeout=15)
+            response = self.http.get(url, headers=headers, params=params, timeout=15)
             data = response.json()
     
             print(f"📊 API 응답 구조:")
@@ -6247,7 +6209,7 @@ class KISAutoTrader:
         }
     
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=15)
+            response = self.http.get(url, headers=headers, params=params, timeout=15)
             response.raise_for_status()
             data = response.json()
     
@@ -6660,7 +6622,7 @@ def standalone_macd_test():
             }
             
             try:
-                response = requests.get(url, headers=headers, params=params, timeout=15)
+                response = get_http_client().get(url, headers=headers, params=params, timeout=15)
                 data = response.json()
                 
                 if data.get('output2'):
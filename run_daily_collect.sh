@@ -11,7 +11,7 @@ cd /Users/jsshin/RESTAPI/analyze
 # 2. 가상 환경의 파이썬 인터프리터와 실행할 스크립트를 모두 절대 경로로 지정하여 실행
 /Users/jsshin/RESTAPI/venv311/bin/python \
   /Users/jsshin/RESTAPI/analyze/daily_collector.py \
-  --stocks 400 --days 3 -y \
+  --stocks 400 --days 3 --incremental -y \
   >> /Users/jsshin/cron.log 2>&1
 
 echo "--end--" >> /Users/jsshin/cron.log
@@ -70,6 +70,18 @@ class ConfigManager:
         """데이터베이스 설정 반환"""
         return self.config.get('database', {})
 
+    def get_api_cache_config(self) -> Dict[str, Any]:
+        """시세 조회 응답 캐시 설정 반환 (ttls: {TR ID: 초}, max_entries)"""
+        return self.config.get('api_cache', {})
+
+    def get_realtime_config(self) -> Dict[str, Any]:
+        """실시간 시세 구독 설정 반환 (enabled, transport: websocket | replay, replay_date, replay_speed)"""
+        return self.config.get('realtime', {})
+
+    def get_decline_scan_config(self) -> Dict[str, Any]:
+        """급락 매수 고빈도 스캔 설정 반환 (workers, batch_size, interval, hot_ratio, rate)"""
+        return self.config.get('decline_scan', {})
+
     def create_sample_config(self):
         """샘플 설정 파일 생성"""
         sample_config = {
@@ -118,6 +130,27 @@ class ConfigManager:
                 'min_return_threshold': 5.0,
                 'performance_tracking': True
             },
+            'api_cache': {
+                'max_entries': 2000,
+                'ttls': {
+                    'FHKST03010100': 60,
+                    'FHKST03010200': 5,
+                    'FHKST01010100': 3,
+                    'CTPF1002R': 86400
+                }
+            },
+            'realtime': {
+                'enabled': False,
+                'transport': 'websocket',
+                'replay_date': '',
+                'replay_speed': 60
+            },
+            'decline_scan': {
+                'workers': 8,
+                'batch_size': 30,
+                'interval': 0.5,
+                'hot_ratio': 0.5
+            },
             'notification': {
                 'discord_webhook': '',
                 'notify_on_trade': True,
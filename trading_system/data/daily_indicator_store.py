@@ -0,0 +1,72 @@
+"""
+저장된 일봉 기술적 지표 조회 모듈
+analyze/daily_collector.py가 장 마감 후 적재한 daily_indicators 테이블을 읽어서
+전략의 일봉 지표 재계산을 생략 (저장되지 않은 거래일이 있으면 None → 호출 측에서 직접 계산)
+"""
+import logging
+import os
+import sys
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+# analyze 디렉토리의 DBManager 사용 (trading_system의 utils/config 패키지가 가려지지 않도록 뒤에 추가)
+analyze_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'analyze')
+if analyze_dir not in sys.path:
+    sys.path.append(analyze_dir)
+
+from db_manager import DBManager
+
+
+class DailyIndicatorStore:
+    """daily_indicators 조회 (조회마다 DBManager를 만들어 스레드 간 커서 공유 없이 커넥션 풀만 공유)"""
+
+    def __init__(self, db_config: Optional[Dict] = None, logger=None):
+        """
+        Args:
+            db_config: 데이터베이스 설정 (config.yaml database, host가 없으면 비활성)
+            logger: 로거 객체
+        """
+        self.db_config = db_config or {}
+        self.logger = logger or logging.getLogger(__name__)
+        self.enabled = bool(self.db_config.get('host')) and self.db_config.get('use_stored_indicators', True)
+
+    def get_frame_indicators(self, symbol: str, df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        일봉 DataFrame의 모든 거래일에 대한 저장 지표
+
+        Args:
+            symbol: 종목코드
+            df: 일봉 (get_daily_data 결과, stck_bsop_date 오름차순)
+
+        Returns:
+            DataFrame: df와 같은 인덱스의 DAILY_INDICATOR_COLUMNS 값
+                       / 저장되지 않은 거래일(장중 오늘 행 등)이 있거나 종가가 다르면 None
+        """
+        if not self.enabled or df is None or df.empty or 'stck_bsop_date' not in df.columns:
+            return None
+
+        try:
+            dates = pd.to_datetime(df['stck_bsop_date'].astype(str), format='%Y%m%d')
+            db_manager = DBManager(self.db_config, self.logger)
+            with db_manager.session():
+                stored = db_manager.get_daily_indicators(symbol, dates.iloc[0].date(), dates.iloc[-1].date())
+        except Exception as e:
+            # DB에 연결할 수 없으면 이후 조회도 실패하므로 직접 계산으로 전환
+            self.enabled = False
+            self.logger.warning(f"⚠️ 저장된 일봉 지표 사용 중지 (직접 계산): {e}")
+            return None
+
+        if stored.empty:
+            return None
+
+        stored = stored.set_index(pd.to_datetime(stored['trade_date'])).reindex(dates.to_numpy())
+        stored_close = pd.to_numeric(stored['close_price'], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+        close = pd.to_numeric(df['stck_prpr'], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+        if np.isnan(stored_close).any() or not np.allclose(stored_close, close):
+            return None  # 저장 안 된 거래일 또는 정정된 종가
+
+        stored.index = df.index
+        columns = [col for col in DBManager.DAILY_INDICATOR_COLUMNS if col not in ('stock_code', 'trade_date')]
+        return stored[columns].apply(pd.to_numeric, errors='coerce')
@@ -1,98 +1,204 @@
 """
 KIS API 클라이언트 모듈
 """
-import requests
+import copy
 import json
 import time
 import os
-from datetime import datetime, timedelta
+import sys
+import threading
+from collections import OrderedDict, defaultdict
+from datetime import datetime, timedelta, time as dt_time
 from typing import Dict, Optional
 import pandas as pd
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+
+# analyze 디렉토리의 공유 HTTP 클라이언트 사용 (trading_system의 utils/config 패키지가 가려지지 않도록 뒤에 추가)
+analyze_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'analyze')
+if analyze_dir not in sys.path:
+    sys.path.append(analyze_dir)
+
+from http_client import get_http_client, KIS_TR_LIMITS
+from token_broker import get_token_broker
+
+
+# 시세 조회 TR별 응답 캐시 유지 시간(초) - 여기 없는 TR(잔고, 주문 등)은 캐시하지 않음
+CACHE_TTLS = {
+    'FHKST03010100': 60,     # 일봉 (장중에는 당일 봉이 계속 변하므로 짧게, 장 마감 후에는 다음 개장까지)
+    'FHKST03010200': 5,      # 분봉
+    'FHKST01010100': 3,      # 현재가 (호가는 주문 직전 조회라 캐시하지 않음)
+    'CTPF1002R': 86400,      # 종목 기본정보
+}
+SESSION_ALIGNED_TRS = {'FHKST03010100'}  # 장 외 시간에는 다음 개장까지 유지
+MARKET_OPEN = dt_time(9, 0)
+MARKET_CLOSE = dt_time(15, 30)
+
+# 시장 상황 판단용 KOSPI 일봉 (모든 사용처가 같은 코드/기간으로 조회해야 선조회 캐시를 공유)
+KOSPI_INDEX_CODE = '0001'
+KOSPI_DAILY_DAYS = 10  # 가장 긴 사용처(FuturePotentialAnalyzer 시장 환경 점수) 기준
+
+
+class ResponseCache:
+    """TR ID·파라미터 기준 응답 캐시 (TTL + LRU, 스레드 안전)
+
+    저장/조회 시 복사본을 사용하므로 호출부에서 DataFrame에 컬럼을 추가해도 캐시는 변하지 않음
+    begin_snapshot() 이후 저장된 항목은 end_snapshot()까지 유지 시간과 무관하게 유효
+    (매매 사이클 시작 시 선조회한 시세로 사이클 전체를 판단하기 위함)
+    """
+
+    def __init__(self, ttls: Dict[str, float] = None, max_entries: int = 2000):
+        """
+        Args:
+            ttls: {TR ID: 유지 시간(초)} (CACHE_TTLS에 덮어씀, 0이면 해당 TR 캐시 안 함)
+            max_entries: 최대 항목 수 (초과 시 가장 오래 사용하지 않은 항목부터 제거)
+        """
+        self.ttls = {**CACHE_TTLS, **(ttls or {})}
+        self.max_entries = max_entries
+        self.entries = OrderedDict()  # {(tr_id, params): (만료 시각, 저장 시각, 값)}
+        self.lock = threading.Lock()
+        self.snapshot_since = None    # 사이클 스냅샷 시작 시각
+
+        self.hits = defaultdict(int)
+        self.misses = defaultdict(int)
+        self.window_hits = defaultdict(int)  # 다른 키(더 긴 기간)의 응답을 잘라서 쓴 적중 (hits에 포함)
+        self.evictions = 0
+
+    @staticmethod
+    def _key(tr_id: str, params: Dict) -> tuple:
+        return tr_id, tuple(sorted((params or {}).items()))
+
+    @staticmethod
+    def _clone(value):
+        return value.copy() if isinstance(value, pd.DataFrame) else copy.deepcopy(value)
+
+    def _expires_at(self, tr_id: str) -> float:
+        """항목 만료 시각 (일봉은 장 외 시간이면 다음 개장까지)"""
+        now = datetime.now()
+        expires_at = now.timestamp() + self.ttls[tr_id]
+
+        if tr_id in SESSION_ALIGNED_TRS and not (MARKET_OPEN <= now.time() < MARKET_CLOSE):
+            next_open = datetime.combine(now.date(), MARKET_OPEN)
+            if now.time() >= MARKET_CLOSE:
+                next_open += timedelta(days=1)
+            expires_at = max(expires_at, next_open.timestamp())
+        return expires_at
+
+    def get(self, tr_id: str, params: Dict, count: bool = True):
+        """캐시 조회 (없거나 만료되었으면 None)
+
+        Args:
+            count: False면 적중/미스를 통계에 넣지 않음 (다른 키의 응답을 잘라 쓸 때 - 실제로 쓰면
+                   호출부가 record_window_hit으로 기록)
+        """
+        if not self.ttls.get(tr_id):
+            return None
+
+        key = self._key(tr_id, params)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry:
+                expires_at, stored_at, value = entry
+                in_snapshot = self.snapshot_since is not None and stored_at >= self.snapshot_since
+                if expires_at > time.time() or in_snapshot:
+                    self.entries.move_to_end(key)
+                    if count:
+                        self.hits[tr_id] += 1
+                    return self._clone(value)
+                del self.entries[key]
+            if count:
+                self.misses[tr_id] += 1
+        return None
+
+    def record_window_hit(self, tr_id: str):
+        """다른 키의 캐시 응답을 잘라서 요청에 응답한 적중 기록"""
+        with self.lock:
+            self.hits[tr_id] += 1
+            self.window_hits[tr_id] += 1
+
+    def put(self, tr_id: str, params: Dict, value):
+        """응답 저장 (캐시 대상 TR만)"""
+        if not self.ttls.get(tr_id):
+            return
+
+        key = self._key(tr_id, params)
+        with self.lock:
+            self.entries[key] = (self._expires_at(tr_id), time.time(), self._clone(value))
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def begin_snapshot(self):
+        """사이클 스냅샷 시작 (이후 저장 항목은 end_snapshot까지 만료되지 않음)"""
+        with self.lock:
+            self.snapshot_since = time.time()
+
+    def end_snapshot(self):
+        """사이클 스냅샷 종료 (항목별 원래 유지 시간 적용)"""
+        with self.lock:
+            self.snapshot_since = None
+
+    def clear(self, tr_id: str = None):
+        """캐시 비우기 (tr_id 지정 시 해당 TR만)"""
+        with self.lock:
+            if tr_id is None:
+                self.entries.clear()
+            else:
+                for key in [k for k in self.entries if k[0] == tr_id]:
+                    del self.entries[key]
+
+    def get_stats(self) -> Dict:
+        """적중 통계
+
+        Returns:
+            Dict: {'hits', 'misses', 'window_hits', 'hit_rate', 'entries', 'evictions',
+                   'by_tr': {TR ID: {'hits', 'misses', 'window_hits'}}}
+                  (window_hits: 더 긴 기간 일봉을 잘라서 응답한 적중, hits에 포함)
+        """
+        with self.lock:
+            by_tr = {tr_id: {'hits': self.hits[tr_id], 'misses': self.misses[tr_id],
+                             'window_hits': self.window_hits[tr_id]}
+                     for tr_id in sorted(set(self.hits) | set(self.misses))}
+            hits = sum(self.hits.values())
+            misses = sum(self.misses.values())
+            return {
+                'hits': hits,
+                'misses': misses,
+                'window_hits': sum(self.window_hits.values()),
+                'hit_rate': hits / (hits + misses) * 100 if hits + misses else 0.0,
+                'entries': len(self.entries),
+                'evictions': self.evictions,
+                'by_tr': by_tr
+            }
 
 
 class KISAPIClient:
     """KIS API 클라이언트"""
     
-    def __init__(self, app_key: str, app_secret: str, base_url: str, account_no: str):
+    def __init__(self, app_key: str, app_secret: str, base_url: str, account_no: str,
+                 cache_ttls: Dict[str, float] = None, cache_size: int = 2000):
         self.app_key = app_key
         self.app_secret = app_secret
         self.base_url = base_url
         self.account_no = account_no
         self.token_file = "token.json"
         self.access_token = None
-        self.last_token_time = None
-        self.session = self.create_robust_session()
-    
-    def create_robust_session(self):
-        """견고한 HTTP 세션 생성"""
-        session = requests.Session()
-        
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "POST"]
-        )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        
-        return session
-    
-    def load_saved_token(self) -> bool:
-        """저장된 토큰 파일에서 토큰 로드"""
-        try:
-            if os.path.exists(self.token_file):
-                with open(self.token_file, 'r', encoding='utf-8') as f:
-                    token_data = json.load(f)
-                
-                expire_time_str = token_data.get('access_token_token_expired', '')
-                if expire_time_str:
-                    expire_time = datetime.strptime(expire_time_str, '%Y-%m-%d %H:%M:%S')
-
-                    if datetime.now() < expire_time - timedelta(minutes=10):
-                        self.access_token = token_data.get('access_token')
-                        self.last_token_time = datetime.fromtimestamp(token_data.get('requested_at', 0))
-                        return True
-        except Exception:
-            pass
-        
-        return False
-    
-    def save_token(self, token_response: dict):
-        """토큰을 파일에 저장"""
-        try:
-            current_time = int(time.time())
-            expires_in = token_response.get('expires_in', 86400)
-            expire_datetime = datetime.fromtimestamp(current_time + expires_in)
+        self.http = get_http_client()  # 프로세스 공유 클라이언트 (keep-alive, TR ID별 속도 제한, 응답 시간 집계)
+        self.http.set_default_tr_limits(KIS_TR_LIMITS)
+        self.session = self.http.session
+        self.cache = ResponseCache(cache_ttls, cache_size)  # 시세 조회 응답 캐시 (같은 사이클 내 중복 호출 제거)
+        self.daily_windows = {}  # {종목코드: 가장 긴 일봉 조회 파라미터} - 짧은 기간 조회는 잘라서 응답
 
-            token_data = {
-                'access_token': token_response.get('access_token'),
-                'access_token_token_expired': expire_datetime.strftime('%Y-%m-%d %H:%M:%S'),
-                'token_type': token_response.get('token_type', 'Bearer'),
-                'expires_in': expires_in,
-                'requested_at': current_time
-            }
-
-            with open(self.token_file, 'w', encoding='utf-8') as f:
-                json.dump(token_data, f, ensure_ascii=False, indent=2)
-        except Exception:
-            pass
+    def get_cache_stats(self) -> Dict:
+        """응답 캐시 적중 통계 (ResponseCache.get_stats 참고)"""
+        return self.cache.get_stats()
     
-    def get_access_token(self) -> str:
-        """KIS API 액세스 토큰 발급 또는 재사용"""
-        if self.access_token and self.last_token_time:
-            if datetime.now() - self.last_token_time < timedelta(hours=23):
-                return self.access_token
-
-        if self.load_saved_token():
-            return self.access_token
-        else:
-            print("get_access_token:load_save_token failed!!")
+    @property
+    def token_broker(self):
+        """token.json 공유 브로커 (메모리 캐시, 프로세스 간 파일 잠금, 만료 전 백그라운드 갱신)"""
+        return get_token_broker(self.token_file, self.issue_token, name="KIS")
 
+    def issue_token(self) -> Dict:
+        """신규 토큰 발급 (기존 프로그램과 호환되는 형식으로 반환, 파일 저장은 브로커가 수행)"""
         url = f"{self.base_url}/oauth2/tokenP"
         headers = {"content-type": "application/json"}
         data = {
@@ -102,23 +208,35 @@ class KISAPIClient:
         }
 
         try:
-            response = requests.post(url, headers=headers, data=json.dumps(data))
+            response = self.http.post(url, headers=headers, data=json.dumps(data), throttle=False)
             response.raise_for_status()
 
             token_response = response.json()
             access_token = token_response.get("access_token")
             
-            if access_token:
-                self.access_token = access_token
-                self.last_token_time = datetime.now()
-                self.save_token(token_response)
-                return self.access_token
-            else:
+            if not access_token:
                 error_msg = token_response.get('msg1', 'Unknown error')
                 raise Exception(f"토큰 발급 실패: {error_msg}")
 
+            current_time = int(time.time())
+            expires_in = token_response.get('expires_in', 86400)
+            expire_datetime = datetime.fromtimestamp(current_time + expires_in)
+
+            return {
+                'access_token': access_token,
+                'access_token_token_expired': expire_datetime.strftime('%Y-%m-%d %H:%M:%S'),
+                'token_type': token_response.get('token_type', 'Bearer'),
+                'expires_in': expires_in,
+                'requested_at': current_time
+            }
+
         except Exception as e:
             raise Exception(f"토큰 발급 실패: {e}")
+
+    def get_access_token(self) -> str:
+        """KIS API 액세스 토큰 반환 (메모리 캐시 우선, 파일 I/O·재발급은 브로커가 처리)"""
+        self.access_token = self.token_broker.get_token()
+        return self.access_token
     
     def get_daily_data(self, symbol: str, days: int = 180) -> pd.DataFrame:
         """일봉 데이터 조회"""
@@ -143,8 +261,14 @@ class KISAPIClient:
             "fid_org_adj_prc": "0"
         }
 
+        cached = self._get_daily_from_window(symbol, params)
+        if cached is None:
+            cached = self.cache.get("FHKST03010100", params)
+        if cached is not None:
+            return cached
+
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = self.http.get(url, headers=headers, params=params, timeout=30)
             response.raise_for_status()
             data = response.json()
 
@@ -172,13 +296,52 @@ class KISAPIClient:
                         df[col] = pd.to_numeric(df[col], errors='coerce')
                 
                 df = df.dropna(subset=['stck_prpr'])
+                self.cache.put("FHKST03010100", params, df)
+
+                window = self.daily_windows.get(symbol)
+                if (not window or window['fid_input_date_2'] != end_date
+                        or start_date < window['fid_input_date_1']):
+                    self.daily_windows[symbol] = params
                 return df
                 
         except Exception:
             pass
 
         return pd.DataFrame()
+
+    def get_kospi_daily(self) -> pd.DataFrame:
+        """KOSPI 지수 일봉 (KOSPI_DAILY_DAYS 기간, 짧은 기간이 필요하면 호출자가 tail로 사용)"""
+        return self.get_daily_data(KOSPI_INDEX_CODE, days=KOSPI_DAILY_DAYS)
     
+    def _get_daily_from_window(self, symbol: str, params: Dict) -> Optional[pd.DataFrame]:
+        """같은 종목의 더 긴 기간 일봉이 캐시에 있으면 요청 기간만 잘라서 반환
+
+        API는 기간 내 최근 100건까지만 주므로, 긴 기간 결과의 첫 거래일이 요청 시작일 이전이거나
+        100건 미만(전체 이력)일 때만 잘라낸 결과가 직접 조회 결과와 같음
+        """
+        window = self.daily_windows.get(symbol)
+        if (not window or window == params or window['fid_input_date_2'] != params['fid_input_date_2']
+                or window['fid_input_date_1'] > params['fid_input_date_1']):
+            return None
+
+        df = self.cache.get("FHKST03010100", window, count=False)
+        if df is None or 'stck_bsop_date' not in df.columns:
+            return None
+
+        start_date = params['fid_input_date_1']
+        if len(df) >= 100 and df['stck_bsop_date'].iloc[0] > start_date:
+            return None
+        self.cache.record_window_hit("FHKST03010100")
+        return df[df['stck_bsop_date'] >= start_date].reset_index(drop=True)
+
+    def begin_snapshot(self):
+        """매매 사이클 스냅샷 시작 (이후 조회한 시세를 end_snapshot까지 재사용)"""
+        self.cache.begin_snapshot()
+
+    def end_snapshot(self):
+        """매매 사이클 스냅샷 종료"""
+        self.cache.end_snapshot()
+
     def get_minute_data(self, symbol: str, minutes: int = 240) -> pd.DataFrame:
         """분봉 데이터 조회"""
         url = f"{self.base_url}/uapi/domestic-stock/v1/quotations/inquire-time-itemchartprice"
@@ -198,9 +361,15 @@ class KISAPIClient:
             "fid_input_hour_1": end_time,
             "fid_pw_data_incu_yn": "Y"
         }
+        # 조회 시각은 매초 바뀌므로 캐시 키에서 제외 (유지 시간 안에서는 같은 분봉)
+        cache_key = {k: v for k, v in params.items() if k != "fid_input_hour_1"}
+
+        cached = self.cache.get("FHKST03010200", cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = self.http.get(url, headers=headers, params=params, timeout=30)
             response.raise_for_status()
             data = response.json()
 
@@ -216,15 +385,21 @@ class KISAPIClient:
                     df = df.dropna(subset=['stck_prpr'])
                     
                     if not df.empty:
-                        return df.sort_values('stck_cntg_hour').reset_index(drop=True)
+                        df = df.sort_values('stck_cntg_hour').reset_index(drop=True)
+                        self.cache.put("FHKST03010200", cache_key, df)
+                        return df
 
         except Exception:
             pass
 
         return pd.DataFrame()
     
-    def get_current_price(self, symbol: str) -> Dict:
-        """현재가 조회"""
+    def get_current_price(self, symbol: str, use_cache: bool = True) -> Dict:
+        """현재가 조회
+
+        Args:
+            use_cache: False면 캐시를 건너뛰고 항상 새로 조회 (조회 결과는 캐시에 저장)
+        """
         url = f"{self.base_url}/uapi/domestic-stock/v1/quotations/inquire-price"
         headers = {
             "content-type": "application/json",
@@ -235,10 +410,17 @@ class KISAPIClient:
         }
         params = {"fid_cond_mrkt_div_code": "J", "fid_input_iscd": symbol}
 
+        cached = self.cache.get("FHKST01010100", params) if use_cache else None
+        if cached is not None:
+            return cached
+
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = self.http.get(url, headers=headers, params=params, timeout=30)
             response.raise_for_status()
-            return response.json()
+            data = response.json()
+            if data.get('output'):
+                self.cache.put("FHKST01010100", params, data)
+            return data
         except Exception:
             return {}
     
@@ -246,8 +428,8 @@ class KISAPIClient:
         """현재 호가 정보 조회 (개선된 버전)"""
         
         try:
-            # 1. 먼저 현재가 확실히 조회
-            current_price_data = self.get_current_price(symbol)
+            # 1. 먼저 현재가 확실히 조회 (주문 가격 계산용이라 사이클 스냅샷 대신 새로 조회)
+            current_price_data = self.get_current_price(symbol, use_cache=False)
             current_price = 0
             if current_price_data and current_price_data.get('output'):
                 current_price = float(current_price_data['output'].get('stck_prpr', 0))
@@ -269,7 +451,7 @@ class KISAPIClient:
                 "fid_input_iscd": symbol
             }
 
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self.http.get(url, headers=headers, params=params, timeout=10)
             
             # 3. 호가 조회 성공 시 처리
             if response.status_code == 200:
@@ -370,7 +552,7 @@ class KISAPIClient:
         }
 
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = self.http.get(url, headers=headers, params=params, timeout=30)
             response.raise_for_status()
             
             data = response.json()
@@ -418,7 +600,7 @@ class KISAPIClient:
                 "CTX_AREA_NK100": ""
             }
             
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = self.http.get(url, headers=headers, params=params, timeout=30)
             
             if response.status_code == 200:
                 data = response.json()
@@ -486,7 +668,7 @@ class KISAPIClient:
         }
     
         try:
-            response = requests.post(url, headers=headers, data=json.dumps(data), timeout=30)
+            response = self.http.post(url, headers=headers, data=json.dumps(data), timeout=30)
             response.raise_for_status()
             result = response.json()
     
@@ -568,11 +750,18 @@ class KISAPIClient:
             "PRDT_TYPE_CD": "300",  # 주식
             "PDNO": symbol
         }
+
+        cached = self.cache.get("CTPF1002R", params)
+        if cached is not None:
+            return cached
         
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = self.http.get(url, headers=headers, params=params, timeout=30)
             response.raise_for_status()
-            return response.json()
+            data = response.json()
+            if data.get('output'):
+                self.cache.put("CTPF1002R", params, data)
+            return data
         except Exception as e:
             print(f"종목기본정보 조회 오류: {e}")
             return {}
@@ -4,10 +4,12 @@
 import os
 import sys
 import time
+import threading
 import json
 import logging
 import pandas as pd  # 추가된 import
 import numpy as np   # 추가된 import
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -21,6 +23,8 @@ if current_dir not in sys.path:
 try:
     from config.config_manager import ConfigManager
     from data.kis_api_client import KISAPIClient
+    from data.daily_indicator_store import DailyIndicatorStore
+    from realtime_feed import create_realtime_feed  # analyze 디렉토리 (data.kis_api_client가 경로 추가)
     from trading.position_manager import PositionManager
     from trading.order_manager import OrderManager
     from trading.order_tracker import OrderTracker
@@ -55,16 +59,20 @@ class AutoTrader:
         
         # KIS API 클라이언트 초기화
         kis_config = self.config_manager.get_kis_config()
+        cache_config = self.config_manager.get_api_cache_config()
         self.api_client = KISAPIClient(
             app_key=kis_config['app_key'],
             app_secret=kis_config['app_secret'],
             base_url=kis_config['base_url'],
-            account_no=kis_config['account_no']
+            account_no=kis_config['account_no'],
+            cache_ttls=cache_config.get('ttls'),
+            cache_size=cache_config.get('max_entries', 2000)
         )
 
         # 거래 설정
         trading_config = self.config_manager.get_trading_config()
         self.max_symbols = trading_config.get('max_symbols', 5)
+        self.prefetch_workers = trading_config.get('prefetch_workers', 4)  # 사이클 시작 시세 선조회 동시 작업 수
         self.stop_loss_pct = 0.06  # 개선: 8% → 6%
         self.take_profit_pct = 0.20  # 개선: 25% → 20%
         
@@ -105,6 +113,9 @@ class AutoTrader:
         from monitoring.daily_performance import DailyPerformanceTracker as DPT
         self.daily_tracker = DPT(self.api_client, self.logger)
 
+        # 저장된 일봉 지표 (analyze 일봉 수집 시 적재한 daily_indicators, DB 설정이 없으면 직접 계산)
+        self.indicator_store = DailyIndicatorStore(self.config_manager.get_database_config(), self.logger)
+
         # 하이브리드 전략 초기화 (get_stock_name 메서드가 이제 존재함)
         self.hybrid_strategy = HybridStrategy(
             api_client=self.api_client,
@@ -114,9 +125,16 @@ class AutoTrader:
             logger=self.logger,
             order_tracker=self.order_tracker, 
             get_stock_name_func=self.get_stock_name,
-            daily_tracker=self.daily_tracker 
+            daily_tracker=self.daily_tracker,
+            indicator_store=self.indicator_store
         )
-        self.future_analyzer = FuturePotentialAnalyzer(self.api_client, self.logger)
+        self.future_analyzer = FuturePotentialAnalyzer(self.api_client, self.logger,
+                                                       indicator_store=self.indicator_store)
+
+        # 실시간 체결가 구독 (보유 종목 분봉 완성 시 사이클을 기다리지 않고 급락 체크)
+        self.realtime_config = self.config_manager.get_realtime_config()
+        self.feed = None
+        self.sell_lock = threading.RLock()  # 사이클 매도와 실시간 급락 매도 동시 실행 방지
 
         # 자동 종료 설정 추가
         system_config = self.config_manager.get_system_config()
@@ -300,7 +318,7 @@ class AutoTrader:
             # 🆕 추가 조건: RSI가 과매도가 아니고 수익이 나는 경우
             daily_df = self.api_client.get_daily_data(symbol, days=20)
             if not daily_df.empty:
-                daily_df_with_rsi = self.hybrid_strategy.calculate_daily_indicators(daily_df)
+                daily_df_with_rsi = self.hybrid_strategy.calculate_daily_indicators(daily_df, symbol)
                 current_rsi = daily_df_with_rsi['rsi'].iloc[-1]
     
                 # RSI 50 이상이고 수익이 2% 이상인 경우 D등급이어도 보호
@@ -398,8 +416,9 @@ class AutoTrader:
             
             # 매우 낮은 점수 + 큰 손실인 경우만 매도 (기준 강화)
             if combined_score < 30 and current_return < -12:  # 30점 미만 + 12% 이상 손실
+                # 분석 중 실시간 급락 매도로 이미 정리됐을 수 있으므로 다시 확인
                 position = self.all_positions.get(symbol)
-                if position:
+                if position and position.get('quantity', 0) > 0:
                     quantity = position['quantity']
                     can_sell, sell_reason = self.position_manager.can_sell_symbol(symbol, quantity)
                     
@@ -428,10 +447,17 @@ class AutoTrader:
             portfolio_analysis = {}
             sell_candidates = []
             
-            # 모든 보유 종목의 미래 상승 가능성 분석
-            for symbol, position in self.all_positions.items():
-                # 미래 상승 가능성 점수 계산
-                future_potential = self.future_analyzer.calculate_future_potential(symbol)
+            # 실시간 매도 스레드가 보유 종목을 지울 수 있으므로 사본으로 순회
+            positions = list(self.all_positions.items())
+
+            # 모든 보유 종목의 미래 상승 가능성 동시 분석 (종목당 일봉 1회 조회)
+            potentials = self.future_analyzer.evaluate_symbols([symbol for symbol, _ in positions],
+                                                               max_workers=self.prefetch_workers)
+
+            for symbol, position in positions:
+                future_potential = potentials.get(symbol)
+                if not future_potential:
+                    continue
                 
                 # 현재 수익률 정보
                 current_return = position['profit_loss_pct']
@@ -546,7 +572,7 @@ class AutoTrader:
             
             # 3. RSI 과매도 확인
             if not daily_df.empty:
-                daily_df_with_rsi = self.hybrid_strategy.calculate_daily_indicators(daily_df)
+                daily_df_with_rsi = self.hybrid_strategy.calculate_daily_indicators(daily_df, symbol)
                 current_rsi = daily_df_with_rsi['rsi'].iloc[-1]
                 
                 if current_rsi < 30:  # 과매도
@@ -579,7 +605,7 @@ class AutoTrader:
             
             # 5. 시장 상황 고려 (KOSPI/KOSDAQ 상승시 가점)
             try:
-                kospi_data = self.api_client.get_daily_data('000001', days=2)  # KOSPI
+                kospi_data = self.api_client.get_kospi_daily()
                 if not kospi_data.empty and len(kospi_data) >= 2:
                     kospi_change = (kospi_data['stck_prpr'].iloc[-1] / kospi_data['stck_prpr'].iloc[-2] - 1) * 100
                     if kospi_change > 0.5:  # KOSPI 0.5% 이상 상승
@@ -615,10 +641,12 @@ class AutoTrader:
             }
     
     
-    def check_rapid_drop(self, symbol: str, current_price: float) -> Dict:
-        """개선된 급락 감지 시스템 - 회복 가능성도 고려"""
+    def check_rapid_drop(self, symbol: str, current_price: float,
+                         minute_df: Optional[pd.DataFrame] = None) -> Dict:
+        """개선된 급락 감지 시스템 - 회복 가능성도 고려 (minute_df: 실시간 분봉, 없으면 API 조회)"""
         try:
-            minute_df = self.api_client.get_minute_data(symbol, minutes=120)
+            if minute_df is None:
+                minute_df = self.api_client.get_minute_data(symbol, minutes=120)
             
             if minute_df.empty or len(minute_df) < 10:
                 return {'should_sell': False, 'reason': '데이터부족'}
@@ -662,6 +690,57 @@ class AutoTrader:
         except Exception as e:
             return {'should_sell': False, 'reason': f'오류:{e}'}
     
+    def start_realtime_feed(self) -> bool:
+        """실시간 체결가 구독 시작 (실계좌 매도에 쓰이므로 웹소켓 시세만 허용)"""
+        if self.realtime_config.get('transport', 'websocket') != 'websocket':
+            self.logger.warning("⚠️ 자동매매 실시간 구독은 websocket 전송만 지원 - 사이클 점검만 사용")
+            return False
+
+        try:
+            self.feed = create_realtime_feed(self.realtime_config, self.config_manager.get_kis_config(),
+                                             logger=self.logger)
+            self.feed.on_bar(self.on_realtime_bar)
+            self.feed.start()
+            self.logger.info("📡 실시간 체결가 구독 시작 (보유 종목 급락 감시)")
+            return True
+        except Exception as e:
+            self.logger.error(f"❌ 실시간 구독 시작 실패 - 사이클 점검만 사용: {e}")
+            self.feed = None
+            return False
+
+    def sync_realtime_subscriptions(self):
+        """실시간 구독을 현재 보유 종목으로 맞춤"""
+        if not self.feed:
+            return
+        self.feed.unsubscribe([code for code in self.feed.subscribed if code not in self.all_positions])
+        self.feed.subscribe(list(self.all_positions))
+
+    def on_realtime_bar(self, bar: Dict):
+        """보유 종목 분봉 완성 이벤트: 급락이면 회복 신호 확인 후 즉시 매도"""
+        symbol = bar['stock_code']
+        with self.sell_lock:
+            position = self.all_positions.get(symbol)
+            if not position or position.get('quantity', 0) <= 0:
+                return
+
+            # 구독 이후 분봉이 1시간 이상 쌓였으면 실시간 분봉 사용, 아니면 분봉 API
+            bars = self.feed.buffer.latest(symbol, 120)
+            minute_df = pd.DataFrame({'stck_prpr': [b['close_price'] for b in bars]}) if len(bars) >= 60 else None
+
+            current_price = bar['close_price']
+            rapid_drop = self.check_rapid_drop(symbol, current_price, minute_df)
+            if not rapid_drop['should_sell']:
+                return
+
+            stock_name = self.get_stock_name(symbol)
+            recovery_analysis = self.analyze_recovery_potential(symbol, current_price)
+            if recovery_analysis['strong_recovery_signal']:
+                self.logger.info(f"🔄 {stock_name}({symbol}) 실시간 급락이지만 회복 신호로 보유: {recovery_analysis['reason']}")
+                return
+
+            self.logger.warning(f"💥 {stock_name}({symbol}) 실시간 급락 매도: {rapid_drop['reason']}")
+            self.execute_sell(symbol, position['quantity'], "urgent", rapid_drop['reason'])
+
     def load_symbols_and_names(self):
         """종목 및 종목명 로드 - 환경파일 + trading_list.json 합치기"""
         try:
@@ -807,12 +886,49 @@ class AutoTrader:
         except Exception as e:
             self.logger.error(f"포지션 업데이트 실패: {e}")
 
+    def prefetch_market_data(self) -> Dict:
+        """사이클 시작 시 보유·매수후보 종목 시세 선조회
+
+        보유 종목은 한 번만 조회하고, 종목별 일봉(1년)/분봉/현재가를 공유 호출 한도 안에서 동시 조회하여
+        응답 캐시에 적재 (이후 매도/매수 판단의 같은 조회는 사이클 스냅샷에서 바로 반환)
+        KOSPI 일봉은 시장 상황 판단 사용처와 같은 get_kospi_daily로 1회 조회
+
+        Returns:
+            Dict: {'symbols': 조회 종목 수, 'failed': 실패 종목 수, 'elapsed': 초}
+        """
+        started = time.perf_counter()
+        self.api_client.begin_snapshot()
+        self.update_all_positions()
+
+        symbols = list(dict.fromkeys(list(self.all_positions) + list(self.symbols)))
+
+        def fetch(symbol):
+            self.api_client.get_daily_data(symbol, days=252)
+            self.api_client.get_minute_data(symbol)
+            self.api_client.get_current_price(symbol)
+
+        failed = 0
+        with ThreadPoolExecutor(max_workers=self.prefetch_workers) as executor:
+            futures = {executor.submit(fetch, symbol): symbol for symbol in symbols}
+            futures[executor.submit(self.api_client.get_kospi_daily)] = 'KOSPI'
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    failed += 1
+                    self.logger.warning(f"⚠️ {futures[future]} 시세 선조회 실패: {e}")
+
+        elapsed = time.perf_counter() - started
+        self.logger.info(f"⚡ 시세 선조회 완료: {len(symbols)}종목 (실패 {failed}), {elapsed:.1f}초")
+        return {'symbols': len(symbols), 'failed': failed, 'elapsed': elapsed}
+
     def execute_sell(self, symbol: str, quantity: int, order_strategy: str, reason: str):
         """개선된 매도 실행 - 시장가 우선 사용"""
         stock_name = self.get_stock_name(symbol)
         
         # 🔥 긴급 매도는 시장가로 즉시 처리
         if reason in ['손절매', '급락감지', '연속하락'] or order_strategy == "urgent":
+            order_strategy = 'market'  # 실제 주문 방식 (아래 포지션 즉시 제거 판단에 사용)
             result = self.order_manager.place_order_with_tracking(
                 symbol, 'SELL', quantity, 'market', self.order_tracker  # 시장가로 변경
             )
@@ -824,8 +940,8 @@ class AutoTrader:
         
         if result['success']:
             executed_price = result.get('limit_price', 0)
-            if executed_price == 0:  # 시장가인 경우 현재가로 추정
-                current_price_data = self.api_client.get_current_price(symbol)
+            if executed_price == 0:  # 시장가인 경우 주문 시점 현재가로 추정
+                current_price_data = self.api_client.get_current_price(symbol, use_cache=False)
                 if current_price_data and current_price_data.get('output'):
                     executed_price = float(current_price_data['output'].get('stck_prpr', 0))
             
@@ -845,7 +961,8 @@ class AutoTrader:
                         symbol, 'SELL', quantity, executed_price, reason, stock_name
                     )
 
-            # 시장가는 즉시 포지션에서 제거
+            # 시장가(긴급 매도 포함)는 즉시 포지션에서 제거
+            # (다음 사이클 전 실시간 급락 매도/사이클 매도가 같은 종목을 다시 팔지 않도록)
             if order_strategy == 'market':
                 self.position_manager.record_sale(symbol, quantity, executed_price, reason)
                 
@@ -950,6 +1067,9 @@ class AutoTrader:
         
         daily_trades = 0
         last_daily_summary = datetime.now().date()
+
+        if self.realtime_config.get('enabled'):
+            self.start_realtime_feed()
         
         try:
             while True:
@@ -978,15 +1098,16 @@ class AutoTrader:
                     cycle_start_trades = self.trade_count
                     
                     try:
-                        # 🆕 매도 분석 전에 포지션 업데이트 실행
-                        self.logger.info("🔄 포지션 업데이트 중...")
-                        self.update_all_positions()
-
                         if (current_time.hour % 2 == 0 and 
                             0 <= current_time.minute <= 5 and 
                             self.check_symbol_list_update()):
                             self.logger.info("🔄 종목 리스트 업데이트 시작")
                             self.reload_symbols_from_discovery()
+
+                        # 🆕 보유 종목 1회 조회 + 보유/매수후보 시세 동시 선조회 (이번 사이클 판단은 이 스냅샷 사용)
+                        self.logger.info("🔄 포지션 업데이트 및 시세 선조회 중...")
+                        self.prefetch_market_data()
+                        self.sync_realtime_subscriptions()
                         
                         # 개선된 매도 로직 먼저 실행
                         self.logger.info("💼 개선된 손절/익절 시스템 실행...")
@@ -995,20 +1116,22 @@ class AutoTrader:
                             try:
                                 stock_name = self.get_stock_name(symbol)
                                 self.logger.info(f"🔍 {stock_name}({symbol}) 매도 분석: {position['profit_loss']:+.2f}%")
-                                self.process_sell_for_symbol(symbol, position)
-                                time.sleep(0.2)
+                                with self.sell_lock:
+                                    self.process_sell_for_symbol(symbol, position)
                             except Exception as e:
                                 self.logger.error(f"{symbol} 매도 처리 오류: {e}")
 
                         # 🆕 포트폴리오 최적화 매도 (주 2회)
-                        self.execute_portfolio_optimization_sell()
+                        with self.sell_lock:
+                            self.execute_portfolio_optimization_sell()
                         
                         # 종목별 하이브리드 매수
                         self.logger.info(f"🎯 고점 방지 매수 분석 시작 (총 {len(self.symbols)}개)")
                         
+                        realtime_positions = dict(self.all_positions)  # 선조회한 보유 종목 사본 (매수 체결 시에만 다시 조회)
+
                         for i, symbol in enumerate(self.symbols, 1):
 
-                            realtime_positions = self.api_client.get_all_holdings()
                             current_holdings = len([s for s, p in realtime_positions.items() 
                                                  if p.get('quantity', 0) > 0])
                             stock_name = self.get_stock_name(symbol)
@@ -1034,10 +1157,9 @@ class AutoTrader:
                                     daily_trades += 1
                                     self.trade_count += 1
                                     self.logger.info(f"  🎉 {stock_name}({symbol}) 매수 완료!")
+                                    realtime_positions = self.api_client.get_all_holdings()
                                 else:
                                     self.logger.debug(f"  ⏸️ {stock_name}({symbol}) 타이밍 부적절")
-            
-                                time.sleep(2)
                                 
                             except Exception as e:
                                 self.logger.error(f"❌ {stock_name}({symbol}) 분석 오류: {e}")
@@ -1045,10 +1167,17 @@ class AutoTrader:
                         cycle_end_trades = self.trade_count
                         cycle_trades = cycle_end_trades - cycle_start_trades
                         self.logger.info(f"✅ 간소화된 사이클 완료 (거래: {cycle_trades}회)")
+
+                        cache_stats = self.api_client.get_cache_stats()
+                        self.logger.info(f"📦 시세 캐시: 적중 {cache_stats['hits']}회 (일봉 기간 잘라쓰기 {cache_stats['window_hits']}회 포함) "
+                                         f"/ 조회 {cache_stats['misses']}회 "
+                                         f"(적중률 {cache_stats['hit_rate']:.1f}%, 항목 {cache_stats['entries']}개)")
                         
                     except Exception as e:
                         self.logger.error(f"❌ 사이클 실행 오류: {e}")
                         self.notifier.notify_error("개선된 시스템 오류", str(e))
+                    finally:
+                        self.api_client.end_snapshot()
                 
                 else:
                     self.logger.info(f"⏰ 장 외 시간: {market_info['message']}")
@@ -1108,6 +1237,8 @@ class AutoTrader:
             self.notifier.notify_error("개선된 시스템 오류", str(e))
             self.send_daily_summary()
         finally:
+            if self.feed:
+                self.feed.stop()
             self.logger.info("🔚 개선된 하이브리드 시스템 종료")
 
     def send_daily_summary(self):
@@ -8,6 +8,8 @@ import sys
 import time
 import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, date
 from typing import Dict, List, Optional
 from pathlib import Path
@@ -31,6 +33,8 @@ try:
     # analyze 디렉토리의 utils 및 db_manager import
     from utils import setup_logger
     from db_manager import DBManager
+    from realtime_feed import create_realtime_feed
+    from http_client import configure_http_client
 except ImportError as e:
     print(f"❌ 모듈 임포트 실패: {e}")
     sys.exit(1)
@@ -118,6 +122,28 @@ class SharpDeclineTrader:
         # 제외 종목 목록 로드
         self.exclude_stocks = self.load_exclude_list()
 
+        # 실시간 체결가 구독 (구독 종목은 폴링 대신 체결 틱마다 즉시 하락률 체크)
+        self.realtime_config = self.config_manager.get_realtime_config()
+        self.feed = None
+        self.target_stocks = {}
+        if self.realtime_config.get('enabled') and self.realtime_config.get('transport') == 'replay' and not self.dry_run:
+            self.logger.warning("⚠️ 리플레이 시세로는 실제 주문하지 않음 - 드라이런 모드로 전환")
+            self.dry_run = True
+
+        # 고빈도 하락 스캔 (현재가 병렬 조회, 많이 빠진 종목은 매 스윕, 나머지는 순환 조회)
+        scan_config = self.config_manager.get_decline_scan_config()
+        self.scan_workers = scan_config.get('workers', 8)
+        self.scan_batch_size = scan_config.get('batch_size', 30)  # 스윕당 조회 종목 수 (초당 한도 x 목표 스윕 시간)
+        self.scan_interval = scan_config.get('interval', 0.5)
+        self.hot_ratio = scan_config.get('hot_ratio', 0.5)  # 하락 기준의 이 비율 이상 빠진 종목은 매 스윕 조회
+        if scan_config.get('rate'):
+            configure_http_client(rate=scan_config['rate'])
+        self.scan_executor = None
+        self.last_decline = {}    # {종목코드: 최근 조회 하락률}
+        self.last_scanned = {}    # {종목코드: 최근 조회 스윕 시작 시각}
+        self.sweep_latencies = []
+        self.buy_lock = threading.Lock()  # 스캔/체결 이벤트 매수 직렬화
+
         self.logger.info("✅ 급락 매수 전략 시스템 초기화 완료")
         self.logger.info(f"📊 매수 시간: {self.buy_time_start[0]:02d}:{self.buy_time_start[1]:02d} ~ {self.buy_time_end[0]:02d}:{self.buy_time_end[1]:02d}")
         self.logger.info(f"📊 매도 시간: {self.sell_time[0]:02d}:{self.sell_time[1]:02d}")
@@ -253,55 +279,24 @@ class SharpDeclineTrader:
             self.logger.error(f"❌ 종목 리스트 조회 실패: {e}")
             return {}
 
-    def load_previous_close_prices(self, stock_codes: List[str]) -> Dict[str, int]:
-        """전일 종가 데이터 DB에서 로드"""
+    def load_previous_close_prices(self, stock_codes: List[str], as_of: date = None) -> Dict[str, int]:
+        """전일 종가 데이터 DB에서 로드 (as_of: 기준일 포함 이전 마지막 종가, 기본 오늘)"""
         self.logger.info(f"📊 전일 종가 데이터 로드 시작 ({len(stock_codes)}개 종목)...")
 
         prev_close_prices = {}
 
         try:
-            # DB 연결
-            if not self.db_manager.connect():
-                raise Exception("DB 연결 실패")
-
-            # 각 종목별 전일 종가 조회
-            success_count = 0
-            fail_count = 0
-
-            for stock_code in stock_codes:
-                try:
-                    # 최근 7일치 데이터 조회 (주말 고려)
-                    daily_data = self.db_manager.get_daily_prices(stock_code, days=7)
-
-                    if daily_data and len(daily_data) >= 1:
-                        # 가장 최근 데이터가 전일 종가
-                        latest_data = daily_data[-1]
-                        close_price = latest_data.get('stck_clpr')
-
-                        if close_price:
-                            prev_close_prices[stock_code] = int(close_price)
-                            success_count += 1
-                        else:
-                            fail_count += 1
-                    else:
-                        fail_count += 1
-
-                    # API 제한 고려
-                    if len(prev_close_prices) % 50 == 0:
-                        self.logger.info(f"  진행: {len(prev_close_prices)}/{len(stock_codes)}")
+            # DB 연결 (커넥션 풀에서 재사용)
+            with self.db_manager.session():
+                # 전 종목의 최근 종가를 단일 쿼리로 조회 (최근 7일, 주말 고려)
+                prev_close_prices = self.db_manager.get_latest_close_bulk(stock_codes, as_of=as_of, lookback_days=7)
 
-                except Exception as e:
-                    self.logger.debug(f"  {stock_code} 전일 종가 조회 실패: {e}")
-                    fail_count += 1
-
-            self.logger.info(f"✅ 전일 종가 로드 완료: 성공 {success_count}개, 실패 {fail_count}개")
+            fail_count = len(set(stock_codes)) - len(prev_close_prices)
+            self.logger.info(f"✅ 전일 종가 로드 완료: 성공 {len(prev_close_prices)}개, 실패 {fail_count}개")
 
         except Exception as e:
             self.logger.error(f"❌ 전일 종가 로드 실패: {e}")
 
-        finally:
-            self.db_manager.disconnect()
-
         return prev_close_prices
 
     def is_in_buy_time_window(self, current_time: datetime = None) -> bool:
@@ -330,19 +325,25 @@ class SharpDeclineTrader:
 
         return current_time.hour == sell_hour and current_time.minute == sell_minute
 
-    def check_decline_and_buy(self, stock_code: str, stock_name: str, prev_close: int):
-        """하락률 체크 및 매수 실행"""
+    def check_decline_and_buy(self, stock_code: str, stock_name: str, prev_close: int,
+                              current_price: int = None):
+        """하락률 체크 및 매수 실행
+
+        Args:
+            current_price: 실시간 체결가 (None이면 현재가 API 조회)
+        """
         try:
             # 이미 매수한 종목은 스킵
             if stock_code in self.purchased_stocks:
                 return
 
             # 현재가 조회
-            price_data = self.api_client.get_current_price(stock_code)
-            if not price_data or not price_data.get('output'):
-                return
+            if current_price is None:
+                price_data = self.api_client.get_current_price(stock_code)
+                if not price_data or not price_data.get('output'):
+                    return
+                current_price = int(price_data['output'].get('stck_prpr', 0))
 
-            current_price = int(price_data['output'].get('stck_prpr', 0))
             if current_price == 0:
                 return
 
@@ -408,6 +409,150 @@ class SharpDeclineTrader:
         except Exception as e:
             self.logger.error(f"❌ {stock_code} 하락 체크/매수 실패: {e}")
 
+    def start_realtime_feed(self) -> bool:
+        """실시간 체결가 구독 시작 (구독 한도가 있으면 시가총액 순으로 앞쪽 종목만)
+
+        Returns:
+            bool: 시작 여부
+        """
+        try:
+            self.feed = create_realtime_feed(
+                self.realtime_config, self.config_manager.get_kis_config(),
+                db_manager=self.db_manager, prev_closes=self.prev_close_prices, logger=self.logger
+            )
+            self.feed.on_tick(self.on_realtime_tick)
+
+            with self.db_manager.session():  # 리플레이는 구독 시 분봉 조회
+                codes = self.feed.subscribe(self.prev_close_prices.keys())
+            self.feed.start()
+
+            self.logger.info(f"📡 실시간 감시: {len(codes)}종목 체결 이벤트, "
+                             f"{len(self.prev_close_prices) - len(codes)}종목 폴링")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"❌ 실시간 구독 시작 실패 - 폴링으로 진행: {e}")
+            self.feed = None
+            return False
+
+    def on_realtime_tick(self, tick: Dict):
+        """체결 틱 이벤트: 매수 시간대면 틱 가격으로 바로 하락률 체크"""
+        stock_code = tick['stock_code']
+        prev_close = self.prev_close_prices.get(stock_code)
+
+        if not prev_close or stock_code in self.purchased_stocks:
+            return
+        if not self.is_in_buy_time_window(tick['time']):
+            return
+
+        stock_name = self.target_stocks.get(stock_code, stock_code)
+        with self.buy_lock:
+            self.check_decline_and_buy(stock_code, stock_name, prev_close, current_price=tick['price'])
+
+    def select_scan_codes(self, stock_codes: List[str]) -> List[str]:
+        """이번 스윕에서 조회할 종목 선택 (조회 순서대로)
+
+        하락 기준의 hot_ratio 이상 빠진 종목은 하락폭 큰 순으로 매 스윕 조회하고,
+        남은 조회 수만큼 오래 전에 조회한 종목부터 순환 조회 (최소 batch_size의 1/4은 순환분)
+        """
+        hot_cut = -self.decline_threshold * self.hot_ratio
+        hot = sorted((code for code in stock_codes if self.last_decline.get(code, 0) <= hot_cut),
+                     key=lambda code: self.last_decline[code])
+        hot_set = set(hot)
+
+        cold = sorted((code for code in stock_codes if code not in hot_set),
+                      key=lambda code: (self.last_scanned.get(code, 0), self.last_decline.get(code, 0)))
+        cold_quota = max(self.scan_batch_size - len(hot), self.scan_batch_size // 4)
+
+        return hot + cold[:cold_quota]
+
+    def fetch_current_price(self, stock_code: str) -> int:
+        """스캔용 현재가 조회 (캐시 미사용, 실패 시 0)"""
+        try:
+            price_data = self.api_client.get_current_price(stock_code, use_cache=False)
+            if not price_data or not price_data.get('output'):
+                return 0
+            return int(price_data['output'].get('stck_prpr', 0))
+        except Exception:
+            return 0
+
+    def scan_declines(self, stock_codes: List[str]) -> int:
+        """현재가 병렬 조회 후 도착 순서대로 하락률 체크/매수 (1회 스윕)
+
+        호출 속도는 공유 HTTP 클라이언트의 초당 한도로 제한되며, 매수는 메인 스레드에서 직렬 실행
+
+        Returns:
+            int: 조회 종목 수
+        """
+        scan_codes = self.select_scan_codes(stock_codes)
+        if not scan_codes:
+            return 0
+
+        if self.scan_executor is None:
+            self.scan_executor = ThreadPoolExecutor(max_workers=self.scan_workers,
+                                                    thread_name_prefix='decline-scan')
+
+        started = time.time()
+        futures = {self.scan_executor.submit(self.fetch_current_price, code): code for code in scan_codes}
+        for future in as_completed(futures):
+            stock_code = futures[future]
+            current_price = future.result()
+            self.last_scanned[stock_code] = started
+            if not current_price:
+                continue
+
+            prev_close = self.prev_close_prices[stock_code]
+            self.last_decline[stock_code] = (current_price - prev_close) / prev_close
+
+            stock_name = self.target_stocks.get(stock_code, stock_code)
+            with self.buy_lock:
+                self.check_decline_and_buy(stock_code, stock_name, prev_close, current_price=current_price)
+
+        self.sweep_latencies.append(time.time() - started)
+        return len(scan_codes)
+
+    def get_sweep_stats(self, stock_codes: List[str]) -> Dict:
+        """스윕 지연 통계 (sweeps, avg, max, last: 스윕 소요 초, rotation: 전 종목이 한 번씩 조회되는 주기 초)"""
+        latencies = self.sweep_latencies
+        if not latencies:
+            return {'sweeps': 0, 'avg': 0.0, 'max': 0.0, 'last': 0.0, 'rotation': None}
+
+        scanned = [self.last_scanned.get(code) for code in stock_codes]
+        rotation = time.time() - min(scanned) if scanned and all(scanned) else None
+
+        return {
+            'sweeps': len(latencies),
+            'avg': sum(latencies) / len(latencies),
+            'max': max(latencies),
+            'last': latencies[-1],
+            'rotation': rotation
+        }
+
+    def log_sweep_stats(self, stock_codes: List[str]):
+        """스윕 지연 통계 로그"""
+        stats = self.get_sweep_stats(stock_codes)
+        if not stats['sweeps']:
+            return
+
+        hot_cut = -self.decline_threshold * self.hot_ratio
+        hot_count = sum(1 for code in stock_codes if self.last_decline.get(code, 0) <= hot_cut)
+        rotation = f"{stats['rotation']:.1f}초" if stats['rotation'] is not None else "첫 순환 중"
+        self.logger.info(f"⏱️ 스윕 {stats['sweeps']}회: 평균 {stats['avg']:.2f}초, 최대 {stats['max']:.2f}초, "
+                         f"최근 {stats['last']:.2f}초 | 집중감시 {hot_count}종목, 전종목 순환 {rotation}")
+
+    def run_replay(self):
+        """저장된 분봉 재생으로 급락 감지 흐름 확인 (드라이런, 매도 없음)"""
+        self.logger.info("🧪 리플레이 시작 - 체결 이벤트로 급락 감지 (드라이런)")
+        self.feed.wait()
+        self.feed.stop()
+
+        stats = self.feed.get_stats()
+        self.logger.info(f"✅ 리플레이 완료: 틱 {stats['ticks']}건, 분봉 {stats['bars']}개, "
+                         f"급락매수 {len(self.purchased_stocks)}종목")
+        for stock_code, position in self.purchased_stocks.items():
+            self.logger.info(f"  - {self.get_stock_name(stock_code)}({stock_code}): "
+                             f"{position['price']:,}원 ({position['decline_rate']*100:.2f}%)")
+
     def sell_purchased_today(self):
         """당일 급락시 매수한 종목만 전량 매도 (오후 3시)"""
         self.logger.info(f"🔔 오후 3시 도달 - 당일 급락매수 종목 매도 시작")
@@ -591,17 +736,28 @@ class SharpDeclineTrader:
             self.logger.error("❌ 종목 리스트 조회 실패 - 프로그램 종료")
             return
 
-        # 전일 종가 데이터 로드
-        self.prev_close_prices = self.load_previous_close_prices(list(target_stocks.keys()))
+        # 전일 종가 데이터 로드 (리플레이는 재생 거래일의 전일 기준)
+        as_of = None
+        if self.realtime_config.get('enabled') and self.realtime_config.get('transport') == 'replay':
+            replay_date = self.realtime_config.get('replay_date')
+            replay_date = datetime.strptime(str(replay_date), '%Y-%m-%d').date() if replay_date else date.today() - timedelta(days=1)
+            as_of = replay_date - timedelta(days=1)
+        self.prev_close_prices = self.load_previous_close_prices(list(target_stocks.keys()), as_of=as_of)
 
         if not self.prev_close_prices:
             self.logger.error("❌ 전일 종가 데이터 로드 실패 - 프로그램 종료")
             return
 
         self.logger.info(f"📊 모니터링 종목: {len(self.prev_close_prices)}개")
+        self.target_stocks = target_stocks
+
+        if self.realtime_config.get('enabled') and self.start_realtime_feed() and self.feed.is_replay:
+            self.run_replay()
+            return
 
         try:
             sold_today = False  # 당일 매도 완료 플래그
+            last_report = 0     # 스캔 진행 로그 시각
 
             while True:
                 current_time = datetime.now()
@@ -614,28 +770,20 @@ class SharpDeclineTrader:
 
                 # 매수 시간대 (9:00~9:30)
                 if self.is_in_buy_time_window(current_time):
-                    self.logger.info(f"🔍 매수 모니터링 중... ({current_time.strftime('%H:%M:%S')})")
-
-                    # 전일 종가가 있는 종목만 체크
-                    check_count = 0
-                    for stock_code, prev_close in self.prev_close_prices.items():
-                        if stock_code in self.purchased_stocks:
-                            continue
-
-                        stock_name = target_stocks.get(stock_code, stock_code)
-                        self.check_decline_and_buy(stock_code, stock_name, prev_close)
-
-                        check_count += 1
-
-                        # 일부 종목만 체크 후 짧은 대기 (API 제한)
-                        if check_count % 10 == 0:
-                            time.sleep(1)
+                    # 전일 종가가 있는 종목만 체크 (실시간 구독 종목은 체결 이벤트에서 체크)
+                    realtime_codes = set(self.feed.subscribed) if self.feed else set()
+                    scan_codes = [code for code in self.prev_close_prices
+                                  if code not in self.purchased_stocks and code not in realtime_codes]
+                    self.scan_declines(scan_codes)
 
-                    self.logger.info(f"  체크 완료: {len(self.prev_close_prices)}개 종목, "
-                                   f"매수: {len(self.purchased_stocks)}개")
+                    if time.time() - last_report >= 30:
+                        self.logger.info(f"🔍 매수 모니터링 중... ({current_time.strftime('%H:%M:%S')}) "
+                                         f"{len(scan_codes)}개 종목, 매수: {len(self.purchased_stocks)}개")
+                        self.log_sweep_stats(scan_codes)
+                        last_report = time.time()
 
-                    # 다음 체크까지 대기
-                    time.sleep(30)
+                    # 다음 스윕까지 짧은 대기 (호출 속도는 초당 한도가 제한)
+                    time.sleep(self.scan_interval)
 
                 # 매도 시간 (오후 3시)
                 elif self.is_sell_time(current_time) and not sold_today:
@@ -668,6 +816,12 @@ class SharpDeclineTrader:
             self.logger.error(traceback.format_exc())
 
         finally:
+            if self.feed:
+                self.feed.stop()
+            if self.scan_executor:
+                self.scan_executor.shutdown(wait=False)
+            if self.sweep_latencies:
+                self.log_sweep_stats([code for code in self.prev_close_prices if code not in self.purchased_stocks])
             self.logger.info("🔚 급락 매수 전략 종료")
 
 
@@ -4,17 +4,28 @@ strategy/hybrid_strategy.py에서 분리된 독립 모듈
 """
 
 import pandas as pd
-from datetime import datetime
-from typing import Dict, List 
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
 import logging
 
+DAILY_LOOKBACK = 120  # 점수 계산에 쓰는 가장 긴 일봉 기간(일) - 종목당 이 기간 1회만 조회
+
 class FuturePotentialAnalyzer:
     """미래 상승 가능성 분석 전담 클래스"""
     
-    def __init__(self, api_client, logger=None):
+    # daily_indicators 컬럼 → 기술적 지표 컬럼 (_calculate_daily_indicators가 만드는 컬럼 전부)
+    STORED_DAILY_COLUMNS = (
+        ('rsi14', 'rsi'), ('ma20', 'ma20'), ('ma60', 'ma60'),
+        ('macd', 'macd'), ('macd_signal', 'macd_signal'),
+        ('ma20', 'bb_middle'), ('bb_upper', 'bb_upper'), ('bb_lower', 'bb_lower')
+    )
+    
+    def __init__(self, api_client, logger=None, indicator_store=None):
         self.api_client = api_client
         self.logger = logger or logging.getLogger(__name__)
         self.enabled = True
+        self.indicator_store = indicator_store  # 저장된 일봉 지표 (DailyIndicatorStore, None이면 항상 계산)
         
     def get_stock_name(self, symbol: str) -> str:
         """종목명 조회"""
@@ -28,10 +39,63 @@ class FuturePotentialAnalyzer:
             self.logger.debug(f"종목명 조회 실패 ({symbol}): {e}")
         return symbol
 
-    def calculate_future_potential(self, symbol: str) -> Dict:
+    def build_scoring_context(self, symbol: str, kospi_df: Optional[pd.DataFrame] = None) -> Dict:
+        """
+        점수 계산 공통 데이터 (일봉 1회 조회 + 기술적 지표 1회 계산)
+
+        Args:
+            symbol: 종목코드
+            kospi_df: 미리 조회한 KOSPI 일봉 (None이면 조회)
+
+        Returns:
+            dict: daily(DAILY_LOOKBACK일 일봉), indicators(지표 추가 일봉), kospi(KOSPI 일봉)
+        """
+        daily_df = self.api_client.get_daily_data(symbol, days=DAILY_LOOKBACK)
+        indicators_df = self._calculate_daily_indicators(daily_df.copy(), symbol) if not daily_df.empty else daily_df
+
+        return {
+            'symbol': symbol,
+            'daily': daily_df,
+            'indicators': indicators_df,
+            'kospi': kospi_df if kospi_df is not None else self.api_client.get_kospi_daily()
+        }
+
+    @staticmethod
+    def _daily_window(daily_df: pd.DataFrame, days: int) -> pd.DataFrame:
+        """공통 일봉에서 최근 days일(달력 기준)만 잘라서 반환 (get_daily_data(days=days) 조회 범위와 동일)"""
+        if daily_df.empty or 'stck_bsop_date' not in daily_df.columns:
+            return daily_df
+
+        start_date = (datetime.now() - timedelta(days=days)).strftime("%Y%m%d")
+        return daily_df[daily_df['stck_bsop_date'] >= start_date].reset_index(drop=True)
+
+    def evaluate_symbols(self, symbols: List[str], max_workers: int = 4) -> Dict[str, Dict]:
+        """
+        여러 종목 미래 상승 가능성 동시 평가 (KOSPI 일봉은 1회만 조회해서 공유)
+
+        Args:
+            symbols: 종목코드 리스트
+            max_workers: 동시 평가 종목 수 (호출 속도는 API 클라이언트 초당 한도가 제한)
+
+        Returns:
+            dict: {종목코드: calculate_future_potential 결과}
+        """
+        if not symbols:
+            return {}
+
+        kospi_df = self.api_client.get_kospi_daily()  # 시장 환경 점수용, 전 종목 공유
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(symbols)))) as executor:
+            results = executor.map(lambda symbol: self.calculate_future_potential(symbol, kospi_df=kospi_df), symbols)
+            return dict(zip(symbols, results))
+
+    def calculate_future_potential(self, symbol: str, kospi_df: Optional[pd.DataFrame] = None) -> Dict:
         """
         종목별 미래 상승 가능성 점수화 (0~100점)
         포트폴리오 최적화를 위한 종합 평가 시스템
+
+        Args:
+            symbol: 종목코드
+            kospi_df: 미리 조회한 KOSPI 일봉 (여러 종목 평가 시 공유, None이면 조회)
         """
         try:
             stock_name = self.get_stock_name(symbol)
@@ -41,33 +105,36 @@ class FuturePotentialAnalyzer:
             total_score = 0
             score_details = {}
             reasons = []
+
+            # 일봉 1회 조회 후 모든 점수 계산에 공유
+            context = self.build_scoring_context(symbol, kospi_df)
             
             # 1. 기술적 분석 점수 (30점 만점)
-            tech_score = self._calculate_technical_score(symbol)
+            tech_score = self._calculate_technical_score(context)
             total_score += tech_score['score']
             score_details['technical'] = tech_score
             reasons.extend(tech_score['reasons'])
             
             # 2. 가격 위치 점수 (25점 만점)
-            price_score = self._calculate_price_position_score(symbol)
+            price_score = self._calculate_price_position_score(context)
             total_score += price_score['score']
             score_details['price_position'] = price_score
             reasons.extend(price_score['reasons'])
             
             # 3. 모멘텀 점수 (20점 만점)
-            momentum_score = self._calculate_momentum_score(symbol)
+            momentum_score = self._calculate_momentum_score(context)
             total_score += momentum_score['score']
             score_details['momentum'] = momentum_score
             reasons.extend(momentum_score['reasons'])
             
             # 4. 거래량 분석 점수 (15점 만점)
-            volume_score = self._calculate_volume_score(symbol)
+            volume_score = self._calculate_volume_score(context)
             total_score += volume_score['score']
             score_details['volume'] = volume_score
             reasons.extend(volume_score['reasons'])
             
             # 5. 시장 환경 점수 (10점 만점)
-            market_score = self._calculate_market_environment_score(symbol)
+            market_score = self._calculate_market_environment_score(context)
             total_score += market_score['score']
             score_details['market'] = market_score
             reasons.extend(market_score['reasons'])
@@ -109,8 +176,15 @@ class FuturePotentialAnalyzer:
                 'error': str(e)
             }
 
-    def _calculate_daily_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
-        """일봉 기술적 지표 계산 (기본 지표만)"""
+    def _calculate_daily_indicators(self, df: pd.DataFrame, symbol: Optional[str] = None) -> pd.DataFrame:
+        """일봉 기술적 지표 계산 (기본 지표만, symbol이 있고 모든 거래일이 daily_indicators에 있으면 저장값 사용)"""
+        if symbol and self.indicator_store is not None:
+            stored = self.indicator_store.get_frame_indicators(symbol, df)
+            if stored is not None:
+                for column, target in self.STORED_DAILY_COLUMNS:
+                    df[target] = stored[column]
+                return df
+        
         try:
             # RSI 계산
             delta = df['stck_prpr'].diff()
@@ -141,19 +215,17 @@ class FuturePotentialAnalyzer:
             self.logger.error(f"기술적 지표 계산 오류: {e}")
             return df
 
-    def _calculate_technical_score(self, symbol: str) -> Dict:
-        """기술적 분석 점수 (30점 만점)"""
+    def _calculate_technical_score(self, context: Dict) -> Dict:
+        """기술적 분석 점수 (30점 만점, 120일 일봉)"""
         score = 0
         reasons = []
         
         try:
-            # 일봉 데이터 조회
-            daily_df = self.api_client.get_daily_data(symbol, days=120)
+            # 공통 데이터에서 미리 계산한 기술적 지표 사용
+            daily_df = context['indicators']
             if daily_df.empty:
                 return {'score': 15, 'reasons': ['데이터부족']}
             
-            # 기술적 지표 계산
-            daily_df = self._calculate_daily_indicators(daily_df)
             latest = daily_df.iloc[-1]
             current_price = latest['stck_prpr']
             
@@ -215,13 +287,13 @@ class FuturePotentialAnalyzer:
         except Exception as e:
             return {'score': 15, 'reasons': [f'기술분석오류: {e}']}
 
-    def _calculate_price_position_score(self, symbol: str) -> Dict:
-        """가격 위치 점수 (25점 만점)"""
+    def _calculate_price_position_score(self, context: Dict) -> Dict:
+        """가격 위치 점수 (25점 만점, 120일 일봉)"""
         score = 0
         reasons = []
         
         try:
-            daily_df = self.api_client.get_daily_data(symbol, days=120)
+            daily_df = self._daily_window(context['daily'], 120)
             if daily_df.empty or len(daily_df) < 60:
                 return {'score': 12, 'reasons': ['데이터부족']}
             
@@ -267,13 +339,13 @@ class FuturePotentialAnalyzer:
         except Exception as e:
             return {'score': 12, 'reasons': [f'가격위치분석오류: {e}']}
 
-    def _calculate_momentum_score(self, symbol: str) -> Dict:
-        """모멘텀 점수 (20점 만점)"""
+    def _calculate_momentum_score(self, context: Dict) -> Dict:
+        """모멘텀 점수 (20점 만점, 60일 일봉)"""
         score = 0
         reasons = []
         
         try:
-            daily_df = self.api_client.get_daily_data(symbol, days=60)
+            daily_df = self._daily_window(context['daily'], 60)
             if daily_df.empty or len(daily_df) < 10:
                 return {'score': 10, 'reasons': ['데이터부족']}
             
@@ -347,13 +419,13 @@ class FuturePotentialAnalyzer:
         except Exception as e:
             return {'score': 10, 'reasons': [f'모멘텀분석오류: {e}']}
 
-    def _calculate_volume_score(self, symbol: str) -> Dict:
-        """거래량 분석 점수 (15점 만점)"""
+    def _calculate_volume_score(self, context: Dict) -> Dict:
+        """거래량 분석 점수 (15점 만점, 60일 일봉)"""
         score = 0
         reasons = []
         
         try:
-            daily_df = self.api_client.get_daily_data(symbol, days=60)
+            daily_df = self._daily_window(context['daily'], 60)
             if daily_df.empty or len(daily_df) < 20:
                 return {'score': 7, 'reasons': ['데이터부족']}
             
@@ -404,14 +476,14 @@ class FuturePotentialAnalyzer:
         except Exception as e:
             return {'score': 7, 'reasons': [f'거래량분석오류: {e}']}
 
-    def _calculate_market_environment_score(self, symbol: str) -> Dict:
-        """시장 환경 점수 (10점 만점)"""
+    def _calculate_market_environment_score(self, context: Dict) -> Dict:
+        """시장 환경 점수 (10점 만점, KOSPI 10일 + 종목 5일 일봉)"""
         score = 0
         reasons = []
         
         try:
             # 1) KOSPI 지수 동향 (6점)
-            kospi_data = self.api_client.get_daily_data('0001', days=10)  # KOSPI
+            kospi_data = context['kospi']
             if not kospi_data.empty and len(kospi_data) >= 2:
                 kospi_change = (kospi_data['stck_prpr'].iloc[-1] / kospi_data['stck_prpr'].iloc[-2] - 1) * 100
                 
@@ -430,7 +502,7 @@ class FuturePotentialAnalyzer:
                     reasons.append(f"시장약세({kospi_change:.1f}%)")
             
             # 2) 섹터 상대 강도 (4점) - 단순화
-            daily_df = self.api_client.get_daily_data(symbol, days=5)
+            daily_df = self._daily_window(context['daily'], 5)
             if not daily_df.empty and len(daily_df) >= 2:
                 stock_change = (daily_df['stck_prpr'].iloc[-1] / daily_df['stck_prpr'].iloc[-2] - 1) * 100
                 
@@ -1,16 +1,32 @@
 """
 하이브리드 전략 모듈 (일봉 분석 + 분봉 실행) - 종목명 로그 개선
 """
+import os
+import sys
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict
 from .technical_indicators import TechnicalIndicators
 
+# analyze 디렉토리의 증분 지표 상태 사용 (trading_system의 utils/config 패키지가 가려지지 않도록 뒤에 추가)
+analyze_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'analyze')
+if analyze_dir not in sys.path:
+    sys.path.append(analyze_dir)
+
+from indicator_state import IndicatorBook, RSIState, SMAState
+
 class HybridStrategy:
     """일봉 전략 + 분봉 실행 하이브리드 시스템"""
     
+    # daily_indicators 컬럼 → 일봉 지표 컬럼 (계산식이 같은 지표만, MACD는 저장값이 12/26/9라 제외)
+    STORED_DAILY_COLUMNS = (
+        ('ma5', 'ma5'), ('ma20', 'ma20'), ('ma60', 'ma60'), ('rsi14', 'rsi'),
+        ('ma20', 'bb_middle'), ('bb_upper', 'bb_upper'), ('bb_lower', 'bb_lower')
+    )
+
     def __init__(self, api_client, order_manager, position_manager, notifier, logger, 
-                       order_tracker=None, get_stock_name_func=None, daily_tracker=None):
+                       order_tracker=None, get_stock_name_func=None, daily_tracker=None,
+                       indicator_store=None):
         self.api_client = api_client
         self.order_manager = order_manager
         self.position_manager = position_manager
@@ -24,6 +40,15 @@ class HybridStrategy:
 
         self.order_tracker = order_tracker
         self.daily_tracker = daily_tracker
+        self.indicator_store = indicator_store  # 저장된 일봉 지표 (DailyIndicatorStore, None이면 항상 계산)
+
+        # 종목별 분봉 지표 상태 (타이밍 분석 시 새 분봉만 반영)
+        self.minute_indicators = IndicatorBook(lambda: {
+            'ma5': SMAState(5),
+            'ma20': SMAState(20),
+            'rsi': RSIState(14, wilder=False),
+            'volume_ma10': SMAState(10, source='volume')
+        })
         
     def evaluate_buy_timing(self, df: pd.DataFrame, latest: pd.Series, 
                            current_price: float, symbol: str = None) -> Dict:
@@ -36,7 +61,7 @@ class HybridStrategy:
         
         # 1. 개선된 고점 매수 방지 필터 (20일 평균선 기준)
         if len(df) >= 20:
-            ma20 = df['stck_prpr'].rolling(20).mean().iloc[-1]
+            ma20 = latest['ma20'] if 'ma20' in latest else df['stck_prpr'].rolling(20).mean().iloc[-1]
             #high_20 = df['stck_prpr'].rolling(20).max().iloc[-1]
             high_60 = df['stck_prpr'].rolling(60).max().iloc[-1]
             
@@ -91,7 +116,7 @@ class HybridStrategy:
         
         # 4. 개선된 가격 위치 평가
         if len(df) >= 20:
-            ma20 = df['stck_prpr'].rolling(20).mean().iloc[-1]
+            ma20 = latest['ma20'] if 'ma20' in latest else df['stck_prpr'].rolling(20).mean().iloc[-1]
             ma20_ratio = current_price / ma20
             
             # 20일선 기준 점수
@@ -173,7 +198,7 @@ class HybridStrategy:
             current_price = float(df['stck_prpr'].iloc[-1])
             
             # 기술 지표 계산
-            df = self.calculate_daily_indicators(df)
+            df = self.calculate_daily_indicators(df, symbol)
             latest = df.iloc[-1]
             
             # 개선된 신호 생성
@@ -370,22 +395,31 @@ class HybridStrategy:
             return "limit"
 
     
-    def calculate_daily_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
-        """일봉 기술 지표 계산"""
+    def calculate_daily_indicators(self, df: pd.DataFrame, symbol: str = None) -> pd.DataFrame:
+        """일봉 기술 지표 계산 (symbol이 있고 모든 거래일이 daily_indicators에 있으면 이동평균/RSI/볼린저는 저장값 사용)"""
         
-        # 이동평균선
-        df = TechnicalIndicators.calculate_moving_averages(df)
+        stored = None
+        if symbol and self.indicator_store is not None:
+            stored = self.indicator_store.get_frame_indicators(symbol, df)
         
-        # MACD
-        df = TechnicalIndicators.calculate_macd(df)
-        
-        # RSI
-        df = TechnicalIndicators.calculate_rsi(df)
+        if stored is not None:
+            for column, target in self.STORED_DAILY_COLUMNS:
+                df[target] = stored[column]
+            df['ma120'] = df['stck_prpr'].rolling(120).mean()
+        else:
+            # 이동평균선
+            df = TechnicalIndicators.calculate_moving_averages(df)
+            
+            # RSI
+            df = TechnicalIndicators.calculate_rsi(df)
+            
+            # 볼린저 밴드
+            df = TechnicalIndicators.calculate_bollinger_bands(df)
         
-        # 볼린저 밴드
-        df = TechnicalIndicators.calculate_bollinger_bands(df)
+        # MACD (5/12/9, 저장되지 않음)
+        df = TechnicalIndicators.calculate_macd(df)
         
-        # 스토캐스틱
+        # 스토캐스틱 (고가/저가 필요, 저장되지 않음)
         df = TechnicalIndicators.calculate_stochastic(df)
         
         return df
@@ -450,14 +484,10 @@ class HybridStrategy:
         try:
             current_price = float(minute_df['stck_prpr'].iloc[-1])
             
-            # 분봉 기술지표
-            minute_df['ma5'] = minute_df['stck_prpr'].rolling(5).mean()
-            minute_df['ma20'] = minute_df['stck_prpr'].rolling(20).mean()
-            
-            # 분봉 RSI
-            minute_df = TechnicalIndicators.calculate_rsi(minute_df, period=14)
-            
-            latest_minute = minute_df.iloc[-1]
+            # 분봉 기술지표 (이동평균, RSI, 평균 거래량 - 종목별 상태에 새 분봉만 반영)
+            latest_minute = minute_df.iloc[-1].copy()
+            for name, value in self.minute_indicators.sync_frame(symbol, minute_df).items():
+                latest_minute[name] = value
             
             if target_signal == 'BUY':
                 result = self.evaluate_buy_timing(minute_df, latest_minute, current_price, symbol)
@@ -503,7 +533,7 @@ class HybridStrategy:
             reasons.append("급락감지")
         
         # 4. 거래량 급증
-        avg_volume = df['cntg_vol'].rolling(10).mean().iloc[-1]
+        avg_volume = latest['volume_ma10'] if 'volume_ma10' in latest else df['cntg_vol'].rolling(10).mean().iloc[-1]
         current_volume = df['cntg_vol'].iloc[-1]
         volume_ratio = current_volume / avg_volume if avg_volume > 0 else 1
         
@@ -600,7 +630,7 @@ class HybridStrategy:
             
             # 시장가 주문인 경우 즉시 포지션에 기록
             if executed_price == 0:
-                executed_price = current_price
+                executed_price = self.get_order_time_price(symbol, current_price)
                 self.position_manager.record_purchase(symbol, quantity, executed_price, "timing_strategy")
             
             if self.daily_tracker:
@@ -631,6 +661,15 @@ class HybridStrategy:
             return False
     
     
+    def get_order_time_price(self, symbol: str, fallback: float) -> float:
+        """시장가 체결가 추정용 주문 시점 현재가 (사이클 스냅샷 시세 대신 새로 조회, 실패 시 fallback)"""
+        price_data = self.api_client.get_current_price(symbol, use_cache=False)
+        if price_data and price_data.get('output'):
+            price = float(price_data['output'].get('stck_prpr', 0))
+            if price > 0:
+                return price
+        return fallback
+
     def perform_basic_risk_check(self, symbol: str, current_price: float) -> Dict:
         """
         기본 리스크 체크 (일봉 분석 없이 기본적인 위험 요소만 확인)
@@ -804,7 +843,7 @@ class HybridStrategy:
         
         try:
             # KOSPI 체크
-            kospi_data = self.api_client.get_daily_data('000001', days=5)  # KOSPI 지수
+            kospi_data = self.api_client.get_kospi_daily()  # KOSPI 지수
             if not kospi_data.empty:
                 kospi_change = kospi_data['stck_prpr'].pct_change().iloc[-1]
                 
@@ -921,7 +960,7 @@ class HybridStrategy:
                 self.logger.info(f"⏳ {symbol}({stock_name}) 지정가 매도 주문 접수됨, 체결 대기 중")
             else:
                 # 시장가 주문 - 즉시 포지션에 기록
-                executed_price = result.get('limit_price', current_price)
+                executed_price = self.get_order_time_price(symbol, current_price)
                 self.position_manager.record_sale(
                     symbol, quantity, executed_price, "hybrid_strategy"
                 )
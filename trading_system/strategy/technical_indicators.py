@@ -28,15 +28,12 @@ class TechnicalIndicators:
             df['macd_signal'] = df['macd_line'].ewm(span=signal).mean()
             df['macd_histogram'] = df['macd_line'] - df['macd_signal']
             
-            # 골든크로스/데드크로스 감지
-            df['macd_cross'] = 0
-            for i in range(1, len(df)):
-                if (df['macd_line'].iloc[i] > df['macd_signal'].iloc[i] and 
-                    df['macd_line'].iloc[i-1] <= df['macd_signal'].iloc[i-1]):
-                    df.iloc[i, df.columns.get_loc('macd_cross')] = 1
-                elif (df['macd_line'].iloc[i] < df['macd_signal'].iloc[i] and 
-                      df['macd_line'].iloc[i-1] >= df['macd_signal'].iloc[i-1]):
-                    df.iloc[i, df.columns.get_loc('macd_cross')] = -1
+            # 골든크로스/데드크로스 감지 (봉별 반복 대신 직전 봉과 벡터 비교)
+            line, signal_line = df['macd_line'], df['macd_signal']
+            prev_line, prev_signal = line.shift(1), signal_line.shift(1)
+            golden = (line > signal_line) & (prev_line <= prev_signal)
+            dead = (line < signal_line) & (prev_line >= prev_signal)
+            df['macd_cross'] = np.where(golden, 1, np.where(dead, -1, 0))
             
             return df
             
@@ -151,9 +151,9 @@ class OrderManager:
             if not bid_ask or bid_ask.get('current_price', 0) == 0:
                 self.logger.warning(f"⚠️ {symbol}({stock_name}) 호가 조회 실패, 현재가 기준으로 계산")
                 
-                # 호가 조회 실패 시 현재가 기반
+                # 호가 조회 실패 시 현재가 기반 (사이클 스냅샷 시세가 아닌 주문 시점 시세)
                 try:
-                    current_price_data = self.api_client.get_current_price(symbol)
+                    current_price_data = self.api_client.get_current_price(symbol, use_cache=False)
                     if current_price_data and current_price_data.get('output'):
                         current_price = float(current_price_data['output'].get('stck_prpr', 0))
                         